@@ -0,0 +1,44 @@
+"""add forecast residuals table
+
+Revision ID: 20261019_0011
+Revises: 20260302_0010
+Create Date: 2026-10-19 09:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0011"
+down_revision = "20260302_0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "forecast_residuals",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("product_id", sa.Integer(), sa.ForeignKey("products.id"), nullable=False),
+        sa.Column("model_type", sa.String(length=50), nullable=False),
+        sa.Column("horizon_step", sa.Integer(), nullable=False),
+        sa.Column("scores_json", sa.Text(), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint(
+            "product_id",
+            "model_type",
+            "horizon_step",
+            name="uq_forecast_residuals_product_model_step",
+        ),
+    )
+
+    op.create_index("ix_forecast_residuals_id", "forecast_residuals", ["id"], unique=False)
+    op.create_index("ix_forecast_residuals_product_id", "forecast_residuals", ["product_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_forecast_residuals_product_id", table_name="forecast_residuals")
+    op.drop_index("ix_forecast_residuals_id", table_name="forecast_residuals")
+    op.drop_table("forecast_residuals")
@@ -0,0 +1,59 @@
+"""add forecast input fingerprints and job model params
+
+Revision ID: 20261019_0012
+Revises: 20261019_0011
+Create Date: 2026-10-19 10:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0012"
+down_revision = "20261019_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("forecast_jobs", sa.Column("model_params_json", sa.Text(), nullable=True))
+
+    op.create_table(
+        "forecast_input_fingerprints",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("product_id", sa.Integer(), sa.ForeignKey("products.id"), nullable=False),
+        sa.Column("fingerprint", sa.String(length=64), nullable=True),
+        sa.Column("actuals_watermark", sa.String(length=128), nullable=True),
+        sa.Column("lead_time_days", sa.Integer(), nullable=True),
+        sa.Column("model_type", sa.String(length=50), nullable=True),
+        sa.Column("model_params_json", sa.Text(), nullable=True),
+        sa.Column("horizon", sa.Integer(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=True),
+        sa.Column("pending_fingerprint", sa.String(length=64), nullable=True),
+        sa.Column("pending_job_id", sa.String(length=64), nullable=True),
+        sa.Column("pending_inputs_json", sa.Text(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+
+    op.create_index("ix_forecast_input_fingerprints_id", "forecast_input_fingerprints", ["id"], unique=False)
+    op.create_index(
+        "ix_forecast_input_fingerprints_product_id",
+        "forecast_input_fingerprints",
+        ["product_id"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_forecast_input_fingerprints_pending_job_id",
+        "forecast_input_fingerprints",
+        ["pending_job_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_forecast_input_fingerprints_pending_job_id", table_name="forecast_input_fingerprints")
+    op.drop_index("ix_forecast_input_fingerprints_product_id", table_name="forecast_input_fingerprints")
+    op.drop_index("ix_forecast_input_fingerprints_id", table_name="forecast_input_fingerprints")
+    op.drop_table("forecast_input_fingerprints")
+    op.drop_column("forecast_jobs", "model_params_json")
@@ -0,0 +1,111 @@
+"""add batch scheduler tables
+
+Revision ID: 20261019_0013
+Revises: 20261019_0012
+Create Date: 2026-10-19 11:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0013"
+down_revision = "20261019_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "batch_schedules",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("job_type", sa.String(length=40), nullable=False),
+        sa.Column("cron_expression", sa.String(length=100), nullable=False),
+        sa.Column("parameters_json", sa.Text(), nullable=True),
+        sa.Column("enabled", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("window_start", sa.String(length=5), nullable=True),
+        sa.Column("window_end", sa.String(length=5), nullable=True),
+        sa.Column("max_concurrency", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("max_cpu_percent", sa.Integer(), nullable=True),
+        sa.Column("max_runtime_minutes", sa.Integer(), nullable=False, server_default="240"),
+        sa.Column("next_run_at", sa.DateTime(), nullable=True),
+        sa.Column("last_run_at", sa.DateTime(), nullable=True),
+        sa.Column("last_status", sa.String(length=20), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("name", name="uq_batch_schedules_name"),
+        sa.CheckConstraint(
+            "job_type IN ('forecast_refresh', 'inventory_optimization', 'forecast_job_cleanup')",
+            name="ck_batch_schedules_job_type",
+        ),
+        sa.CheckConstraint("max_concurrency >= 1", name="ck_batch_schedules_max_concurrency_min_1"),
+        sa.CheckConstraint(
+            "max_cpu_percent IS NULL OR (max_cpu_percent > 0 AND max_cpu_percent <= 100)",
+            name="ck_batch_schedules_max_cpu_percent_range",
+        ),
+    )
+    op.create_index("ix_batch_schedules_id", "batch_schedules", ["id"], unique=False)
+    op.create_index("ix_batch_schedules_created_by", "batch_schedules", ["created_by"], unique=False)
+    op.create_index("ix_batch_schedules_enabled_next_run", "batch_schedules", ["enabled", "next_run_at"], unique=False)
+
+    op.create_table(
+        "batch_schedule_runs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "schedule_id",
+            sa.Integer(),
+            sa.ForeignKey("batch_schedules.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("trigger", sa.String(length=20), nullable=False, server_default="cron"),
+        sa.Column("scheduled_for", sa.DateTime(), nullable=True),
+        sa.Column("worker_id", sa.String(length=100), nullable=True),
+        sa.Column("result_json", sa.Text(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.CheckConstraint(
+            "status IN ('running', 'completed', 'failed', 'skipped')",
+            name="ck_batch_schedule_runs_status",
+        ),
+    )
+    op.create_index("ix_batch_schedule_runs_id", "batch_schedule_runs", ["id"], unique=False)
+    op.create_index("ix_batch_schedule_runs_schedule_id", "batch_schedule_runs", ["schedule_id"], unique=False)
+    op.create_index(
+        "ix_batch_schedule_runs_schedule_status",
+        "batch_schedule_runs",
+        ["schedule_id", "status"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_batch_schedule_runs_status_started",
+        "batch_schedule_runs",
+        ["status", "started_at"],
+        unique=False,
+    )
+
+    op.create_table(
+        "scheduler_locks",
+        sa.Column("name", sa.String(length=100), primary_key=True),
+        sa.Column("owner", sa.String(length=100), nullable=False),
+        sa.Column("acquired_at", sa.DateTime(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduler_locks")
+    op.drop_index("ix_batch_schedule_runs_status_started", table_name="batch_schedule_runs")
+    op.drop_index("ix_batch_schedule_runs_schedule_status", table_name="batch_schedule_runs")
+    op.drop_index("ix_batch_schedule_runs_schedule_id", table_name="batch_schedule_runs")
+    op.drop_index("ix_batch_schedule_runs_id", table_name="batch_schedule_runs")
+    op.drop_table("batch_schedule_runs")
+    op.drop_index("ix_batch_schedules_enabled_next_run", table_name="batch_schedules")
+    op.drop_index("ix_batch_schedules_created_by", table_name="batch_schedules")
+    op.drop_index("ix_batch_schedules_id", table_name="batch_schedules")
+    op.drop_table("batch_schedules")
@@ -0,0 +1,37 @@
+"""add worker lease columns to forecast jobs
+
+Revision ID: 20261019_0014
+Revises: 20261019_0013
+Create Date: 2026-10-19 12:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0014"
+down_revision = "20261019_0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("forecast_jobs", sa.Column("worker_id", sa.String(length=128), nullable=True))
+    op.add_column("forecast_jobs", sa.Column("attempts", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("forecast_jobs", sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+    op.add_column("forecast_jobs", sa.Column("lease_expires_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "ix_forecast_jobs_status_lease_expires_at",
+        "forecast_jobs",
+        ["status", "lease_expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_forecast_jobs_status_lease_expires_at", table_name="forecast_jobs")
+    op.drop_column("forecast_jobs", "lease_expires_at")
+    op.drop_column("forecast_jobs", "heartbeat_at")
+    op.drop_column("forecast_jobs", "attempts")
+    op.drop_column("forecast_jobs", "worker_id")
@@ -0,0 +1,38 @@
+"""add priority lanes and coalescing to forecast jobs
+
+Revision ID: 20261019_0015
+Revises: 20261019_0014
+Create Date: 2026-10-19 13:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0015"
+down_revision = "20261019_0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "forecast_jobs",
+        sa.Column("lane", sa.String(length=20), server_default="interactive", nullable=False),
+    )
+    op.add_column("forecast_jobs", sa.Column("coalesced_into", sa.String(length=64), nullable=True))
+    op.create_index("ix_forecast_jobs_coalesced_into", "forecast_jobs", ["coalesced_into"], unique=False)
+    op.create_index(
+        "ix_forecast_jobs_status_lane_created_at",
+        "forecast_jobs",
+        ["status", "lane", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_forecast_jobs_status_lane_created_at", table_name="forecast_jobs")
+    op.drop_index("ix_forecast_jobs_coalesced_into", table_name="forecast_jobs")
+    op.drop_column("forecast_jobs", "coalesced_into")
+    op.drop_column("forecast_jobs", "lane")
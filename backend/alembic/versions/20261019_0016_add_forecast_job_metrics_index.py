@@ -0,0 +1,28 @@
+"""add forecast job status/completed_at index for metrics
+
+Revision ID: 20261019_0016
+Revises: 20261019_0015
+Create Date: 2026-10-19 14:00:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0016"
+down_revision = "20261019_0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_forecast_jobs_status_completed_at",
+        "forecast_jobs",
+        ["status", "completed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_forecast_jobs_status_completed_at", table_name="forecast_jobs")
@@ -0,0 +1,34 @@
+"""add resource usage accounting to forecast runs and jobs
+
+Revision ID: 20261019_0017
+Revises: 20261019_0016
+Create Date: 2026-10-19 15:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0017"
+down_revision = "20261019_0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("forecast_run_audits", sa.Column("duration_ms", sa.Numeric(14, 2), nullable=True))
+    op.add_column("forecast_run_audits", sa.Column("cpu_ms", sa.Numeric(14, 2), nullable=True))
+    op.add_column("forecast_run_audits", sa.Column("fit_count", sa.Integer(), nullable=True))
+    op.add_column("forecast_run_audits", sa.Column("peak_memory_kb", sa.Integer(), nullable=True))
+    op.add_column("forecast_run_audits", sa.Column("resource_usage_json", sa.Text(), nullable=True))
+    op.add_column("forecast_jobs", sa.Column("resource_usage_json", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("forecast_jobs", "resource_usage_json")
+    op.drop_column("forecast_run_audits", "resource_usage_json")
+    op.drop_column("forecast_run_audits", "peak_memory_kb")
+    op.drop_column("forecast_run_audits", "fit_count")
+    op.drop_column("forecast_run_audits", "cpu_ms")
+    op.drop_column("forecast_run_audits", "duration_ms")
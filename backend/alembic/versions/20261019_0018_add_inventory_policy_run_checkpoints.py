@@ -0,0 +1,58 @@
+"""add checkpoint and lease columns to inventory policy runs
+
+Revision ID: 20261019_0018
+Revises: 20261019_0017
+Create Date: 2026-10-19 16:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0018"
+down_revision = "20261019_0017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("inventory_policy_runs") as batch_op:
+        batch_op.add_column(sa.Column("total_count", sa.Integer(), server_default="0", nullable=False))
+        batch_op.add_column(sa.Column("last_inventory_id", sa.Integer(), server_default="0", nullable=False))
+        batch_op.add_column(sa.Column("worker_id", sa.String(length=128), nullable=True))
+        batch_op.add_column(sa.Column("attempts", sa.Integer(), server_default="0", nullable=False))
+        batch_op.add_column(sa.Column("active_seconds", sa.Float(), server_default="0", nullable=False))
+        batch_op.add_column(sa.Column("checkpoint_at", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("lease_expires_at", sa.DateTime(), nullable=True))
+        batch_op.drop_constraint("ck_inventory_policy_runs_status", type_="check")
+        batch_op.create_check_constraint(
+            "ck_inventory_policy_runs_status",
+            "status IN ('queued', 'running', 'completed', 'failed')",
+        )
+    op.create_index(
+        "ix_inventory_policy_runs_status_lease_expires_at",
+        "inventory_policy_runs",
+        ["status", "lease_expires_at"],
+        unique=False,
+    )
+    # Runs finished before checkpointing existed recorded the scope size as processed_count.
+    op.execute("UPDATE inventory_policy_runs SET total_count = processed_count")
+
+
+def downgrade() -> None:
+    op.execute("UPDATE inventory_policy_runs SET status = 'failed' WHERE status = 'queued'")
+    op.drop_index("ix_inventory_policy_runs_status_lease_expires_at", table_name="inventory_policy_runs")
+    with op.batch_alter_table("inventory_policy_runs") as batch_op:
+        batch_op.drop_constraint("ck_inventory_policy_runs_status", type_="check")
+        batch_op.create_check_constraint(
+            "ck_inventory_policy_runs_status",
+            "status IN ('running', 'completed', 'failed')",
+        )
+        batch_op.drop_column("lease_expires_at")
+        batch_op.drop_column("checkpoint_at")
+        batch_op.drop_column("active_seconds")
+        batch_op.drop_column("attempts")
+        batch_op.drop_column("worker_id")
+        batch_op.drop_column("last_inventory_id")
+        batch_op.drop_column("total_count")
@@ -0,0 +1,65 @@
+"""add inventory projections table
+
+Revision ID: 20261019_0019
+Revises: 20261019_0018
+Create Date: 2026-10-19 19:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0019"
+down_revision = "20261019_0018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "inventory_projections",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("product_id", sa.Integer(), sa.ForeignKey("products.id"), nullable=False),
+        sa.Column("location", sa.String(length=100), nullable=False),
+        sa.Column("horizon_start", sa.Date(), nullable=False),
+        sa.Column("horizon_months", sa.Integer(), nullable=False),
+        sa.Column("opening_available", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("safety_stock", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        sa.Column("max_stock", sa.Numeric(12, 2), nullable=True),
+        sa.Column("total_demand", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("total_supply", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("min_projected_available", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("ending_projected_available", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("first_stockout_period", sa.Date(), nullable=True),
+        sa.Column("stockout_periods", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("below_safety_periods", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("excess_periods", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("periods_json", sa.Text(), nullable=False),
+        sa.Column("input_fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("product_id", "location", name="uq_inventory_projections_product_location"),
+        sa.CheckConstraint(
+            "status IN ('stockout', 'below_safety', 'excess', 'ok')",
+            name="ck_inventory_projections_status",
+        ),
+    )
+
+    op.create_index("ix_inventory_projections_id", "inventory_projections", ["id"], unique=False)
+    op.create_index("ix_inventory_projections_product_id", "inventory_projections", ["product_id"], unique=False)
+    op.create_index("ix_inventory_projections_status", "inventory_projections", ["status"], unique=False)
+    op.create_index(
+        "ix_inventory_projections_status_first_stockout",
+        "inventory_projections",
+        ["status", "first_stockout_period"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_inventory_projections_status_first_stockout", table_name="inventory_projections")
+    op.drop_index("ix_inventory_projections_status", table_name="inventory_projections")
+    op.drop_index("ix_inventory_projections_product_id", table_name="inventory_projections")
+    op.drop_index("ix_inventory_projections_id", table_name="inventory_projections")
+    op.drop_table("inventory_projections")
@@ -0,0 +1,78 @@
+"""add inventory status rollups table
+
+Revision ID: 20261019_0020
+Revises: 20261019_0019
+Create Date: 2026-10-19 20:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0020"
+down_revision = "20261019_0019"
+branch_labels = None
+depends_on = None
+
+_STATUSES = ("normal", "low", "critical", "excess")
+_COLUMNS = ", ".join(
+    [f"{status}_count" for status in _STATUSES] + [f"{status}_value" for status in _STATUSES]
+)
+_AGGREGATES = ", ".join(
+    [f"SUM(CASE WHEN status = '{status}' THEN 1 ELSE 0 END)" for status in _STATUSES]
+    + [f"SUM(CASE WHEN status = '{status}' THEN COALESCE(valuation, 0) ELSE 0 END)" for status in _STATUSES]
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "inventory_status_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("scope", sa.String(length=20), nullable=False),
+        sa.Column("location", sa.String(length=100), nullable=False, server_default=""),
+        sa.Column("normal_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("low_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("critical_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("excess_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("normal_value", sa.Numeric(16, 2), nullable=False, server_default="0"),
+        sa.Column("low_value", sa.Numeric(16, 2), nullable=False, server_default="0"),
+        sa.Column("critical_value", sa.Numeric(16, 2), nullable=False, server_default="0"),
+        sa.Column("excess_value", sa.Numeric(16, 2), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column("reconciled_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("scope", "location", name="uq_inventory_status_rollups_scope_location"),
+        sa.CheckConstraint("scope IN ('overall', 'location')", name="ck_inventory_status_rollups_scope"),
+    )
+    op.create_index("ix_inventory_status_rollups_id", "inventory_status_rollups", ["id"], unique=False)
+
+    # Seed from the current inventory so incremental maintenance starts from the truth.
+    op.execute(
+        f"INSERT INTO inventory_status_rollups (scope, location, {_COLUMNS}, reconciled_at) "
+        f"SELECT 'overall', '', {_AGGREGATES}, CURRENT_TIMESTAMP FROM inventory HAVING COUNT(*) > 0"
+    )
+    op.execute(
+        f"INSERT INTO inventory_status_rollups (scope, location, {_COLUMNS}, reconciled_at) "
+        f"SELECT 'location', COALESCE(location, ''), {_AGGREGATES}, CURRENT_TIMESTAMP "
+        "FROM inventory GROUP BY COALESCE(location, '')"
+    )
+
+    with op.batch_alter_table("batch_schedules") as batch_op:
+        batch_op.drop_constraint("ck_batch_schedules_job_type", type_="check")
+        batch_op.create_check_constraint(
+            "ck_batch_schedules_job_type",
+            "job_type IN ('forecast_refresh', 'inventory_optimization', 'forecast_job_cleanup', "
+            "'inventory_rollup_reconcile')",
+        )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM batch_schedules WHERE job_type = 'inventory_rollup_reconcile'")
+    with op.batch_alter_table("batch_schedules") as batch_op:
+        batch_op.drop_constraint("ck_batch_schedules_job_type", type_="check")
+        batch_op.create_check_constraint(
+            "ck_batch_schedules_job_type",
+            "job_type IN ('forecast_refresh', 'inventory_optimization', 'forecast_job_cleanup')",
+        )
+    op.drop_index("ix_inventory_status_rollups_id", table_name="inventory_status_rollups")
+    op.drop_table("inventory_status_rollups")
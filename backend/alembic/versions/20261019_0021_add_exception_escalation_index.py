@@ -0,0 +1,31 @@
+"""add inventory policy exception escalation index
+
+Revision ID: 20261019_0021
+Revises: 20261019_0020
+Create Date: 2026-10-19 21:00:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0021"
+down_revision = "20261019_0020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_inventory_policy_exceptions_status_severity_due",
+        "inventory_policy_exceptions",
+        ["status", "severity", "due_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_inventory_policy_exceptions_status_severity_due",
+        table_name="inventory_policy_exceptions",
+    )
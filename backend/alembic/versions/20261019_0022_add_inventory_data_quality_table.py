@@ -0,0 +1,49 @@
+"""add inventory data quality table
+
+Revision ID: 20261019_0022
+Revises: 20261019_0021
+Create Date: 2026-10-19 22:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0022"
+down_revision = "20261019_0021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Scores are computed on first read; no backfill is needed.
+    op.create_table(
+        "inventory_data_quality",
+        sa.Column(
+            "inventory_id",
+            sa.Integer(),
+            sa.ForeignKey("inventory.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("completeness_score", sa.Float(), nullable=False),
+        sa.Column("freshness_score", sa.Float(), nullable=False),
+        sa.Column("consistency_score", sa.Float(), nullable=False),
+        sa.Column("overall_score", sa.Float(), nullable=False),
+        sa.Column("quality_tier", sa.String(length=10), nullable=False),
+        sa.Column("source_updated_at", sa.DateTime(), nullable=True),
+        sa.Column("fresh_until", sa.DateTime(), nullable=True),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.CheckConstraint(
+            "quality_tier IN ('high', 'medium', 'low')",
+            name="ck_inventory_data_quality_tier",
+        ),
+    )
+    op.create_index("ix_inventory_data_quality_overall", "inventory_data_quality", ["overall_score"], unique=False)
+    op.create_index("ix_inventory_data_quality_fresh_until", "inventory_data_quality", ["fresh_until"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_inventory_data_quality_fresh_until", table_name="inventory_data_quality")
+    op.drop_index("ix_inventory_data_quality_overall", table_name="inventory_data_quality")
+    op.drop_table("inventory_data_quality")
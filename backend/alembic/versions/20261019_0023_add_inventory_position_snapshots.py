@@ -0,0 +1,69 @@
+"""add inventory position snapshots table
+
+Revision ID: 20261019_0023
+Revises: 20261019_0022
+Create Date: 2026-10-19 23:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0023"
+down_revision = "20261019_0022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # History starts with the first capture; there is nothing to backfill.
+    op.create_table(
+        "inventory_position_snapshots",
+        sa.Column("snapshot_day", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("inventory_id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("status_code", sa.SmallInteger(), nullable=False),
+        sa.Column("on_hand_hundredths", sa.BigInteger(), nullable=False),
+        sa.Column("allocated_hundredths", sa.BigInteger(), nullable=False),
+        sa.Column("in_transit_hundredths", sa.BigInteger(), nullable=False),
+        sa.Column("safety_stock_hundredths", sa.BigInteger(), nullable=False),
+        sa.Column("valuation_cents", sa.BigInteger(), nullable=True),
+        sa.Column("days_of_supply_hundredths", sa.Integer(), nullable=True),
+        sa.CheckConstraint("status_code BETWEEN 0 AND 3", name="ck_inventory_position_snapshots_status_code"),
+        sqlite_with_rowid=False,
+    )
+    op.create_index(
+        "ix_inventory_position_snapshots_inventory_day",
+        "inventory_position_snapshots",
+        ["inventory_id", "snapshot_day"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_inventory_position_snapshots_product_day",
+        "inventory_position_snapshots",
+        ["product_id", "snapshot_day"],
+        unique=False,
+    )
+
+    with op.batch_alter_table("batch_schedules") as batch_op:
+        batch_op.drop_constraint("ck_batch_schedules_job_type", type_="check")
+        batch_op.create_check_constraint(
+            "ck_batch_schedules_job_type",
+            "job_type IN ('forecast_refresh', 'inventory_optimization', 'forecast_job_cleanup', "
+            "'inventory_rollup_reconcile', 'inventory_position_snapshot')",
+        )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM batch_schedules WHERE job_type = 'inventory_position_snapshot'")
+    with op.batch_alter_table("batch_schedules") as batch_op:
+        batch_op.drop_constraint("ck_batch_schedules_job_type", type_="check")
+        batch_op.create_check_constraint(
+            "ck_batch_schedules_job_type",
+            "job_type IN ('forecast_refresh', 'inventory_optimization', 'forecast_job_cleanup', "
+            "'inventory_rollup_reconcile')",
+        )
+    op.drop_index("ix_inventory_position_snapshots_product_day", table_name="inventory_position_snapshots")
+    op.drop_index("ix_inventory_position_snapshots_inventory_day", table_name="inventory_position_snapshots")
+    op.drop_table("inventory_position_snapshots")
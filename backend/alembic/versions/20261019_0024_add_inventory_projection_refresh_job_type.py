@@ -0,0 +1,36 @@
+"""add inventory_projection_refresh batch job type
+
+Revision ID: 20261019_0024
+Revises: 20261019_0023
+Create Date: 2026-10-19 23:30:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0024"
+down_revision = "20261019_0023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("batch_schedules") as batch_op:
+        batch_op.drop_constraint("ck_batch_schedules_job_type", type_="check")
+        batch_op.create_check_constraint(
+            "ck_batch_schedules_job_type",
+            "job_type IN ('forecast_refresh', 'inventory_optimization', 'forecast_job_cleanup', "
+            "'inventory_rollup_reconcile', 'inventory_position_snapshot', 'inventory_projection_refresh')",
+        )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM batch_schedules WHERE job_type = 'inventory_projection_refresh'")
+    with op.batch_alter_table("batch_schedules") as batch_op:
+        batch_op.drop_constraint("ck_batch_schedules_job_type", type_="check")
+        batch_op.create_check_constraint(
+            "ck_batch_schedules_job_type",
+            "job_type IN ('forecast_refresh', 'inventory_optimization', 'forecast_job_cleanup', "
+            "'inventory_rollup_reconcile', 'inventory_position_snapshot')",
+        )
@@ -0,0 +1,30 @@
+"""allow an unknown status code in inventory position snapshots
+
+Revision ID: 20261019_0025
+Revises: 20261019_0024
+Create Date: 2026-10-19 23:45:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0025"
+down_revision = "20261019_0024"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Statuses outside normal/low/critical/excess (or none) are stored as -1.
+    with op.batch_alter_table("inventory_position_snapshots", table_kwargs={"sqlite_with_rowid": False}) as batch_op:
+        batch_op.drop_constraint("ck_inventory_position_snapshots_status_code", type_="check")
+        batch_op.create_check_constraint("ck_inventory_position_snapshots_status_code", "status_code BETWEEN -1 AND 3")
+
+
+def downgrade() -> None:
+    # Unknown-status rows cannot be represented by the old constraint.
+    op.execute("DELETE FROM inventory_position_snapshots WHERE status_code = -1")
+    with op.batch_alter_table("inventory_position_snapshots", table_kwargs={"sqlite_with_rowid": False}) as batch_op:
+        batch_op.drop_constraint("ck_inventory_position_snapshots_status_code", type_="check")
+        batch_op.create_check_constraint("ck_inventory_position_snapshots_status_code", "status_code BETWEEN 0 AND 3")
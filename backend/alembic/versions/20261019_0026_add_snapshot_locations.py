@@ -0,0 +1,48 @@
+"""record each inventory position snapshot's location
+
+Revision ID: 20261019_0026
+Revises: 20261019_0025
+Create Date: 2026-10-20 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0026"
+down_revision = "20261019_0025"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "inventory_snapshot_locations",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.UniqueConstraint("name", name="uq_inventory_snapshot_locations_name"),
+    )
+    with op.batch_alter_table("inventory_position_snapshots", table_kwargs={"sqlite_with_rowid": False}) as batch_op:
+        batch_op.add_column(sa.Column("location_id", sa.Integer(), nullable=True))
+        batch_op.create_index("ix_inventory_position_snapshots_location_day", ["location_id", "snapshot_day"], unique=False)
+
+    # Earlier days did not record a location; the rows' current one is the best
+    # available guess. Days of rows that no longer exist stay without a location.
+    op.execute(
+        "INSERT INTO inventory_snapshot_locations (name) "
+        "SELECT DISTINCT COALESCE(location, '') FROM inventory"
+    )
+    op.execute(
+        "UPDATE inventory_position_snapshots SET location_id = ("
+        "SELECT l.id FROM inventory i "
+        "JOIN inventory_snapshot_locations l ON l.name = COALESCE(i.location, '') "
+        "WHERE i.id = inventory_position_snapshots.inventory_id)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("inventory_position_snapshots", table_kwargs={"sqlite_with_rowid": False}) as batch_op:
+        batch_op.drop_index("ix_inventory_position_snapshots_location_day")
+        batch_op.drop_column("location_id")
+    op.drop_table("inventory_snapshot_locations")
@@ -23,6 +23,29 @@ class Settings(BaseSettings):
     STRICT_TRANSPORT_SECURITY_SECONDS: int = 31536000
     READINESS_CHECK_DATABASE: bool = True
     FORECAST_JOB_RETENTION_DAYS: int = 30
+    FORECAST_JOB_EMBEDDED_WORKER: bool = True
+    FORECAST_JOB_LEASE_SECONDS: int = 120
+    FORECAST_JOB_HEARTBEAT_SECONDS: int = 30
+    FORECAST_JOB_MAX_ATTEMPTS: int = 3
+    FORECAST_WORKER_POLL_SECONDS: float = 2.0
+    FORECAST_JOB_EVENTS_POLL_SECONDS: float = 5.0
+    MODEL_ARTIFACTS_ENABLED: bool = True
+    MODEL_ARTIFACT_DIR: str = "./model_artifacts"
+    MODEL_ARTIFACT_MAX_MB: int = 512
+    FORECAST_PROFILE_TRACEMALLOC: bool = False
+    SCHEDULER_ENABLED: bool = False
+    SCHEDULER_POLL_SECONDS: int = 30
+    SCHEDULER_LEASE_SECONDS: int = 90
+    SCHEDULER_MAX_CONCURRENT_RUNS: int = 1
+    INVENTORY_OPTIMIZATION_CHUNK_SIZE: int = 1000
+    INVENTORY_OPTIMIZATION_LEASE_SECONDS: int = 300
+    INVENTORY_OPTIMIZATION_MAX_ATTEMPTS: int = 3
+    INVENTORY_OPTIMIZATION_BACKGROUND: bool = True
+    INVENTORY_OPTIMIZATION_SWEEP_SECONDS: float = 60.0
+    INVENTORY_OPTIMIZATION_SIMULATION_CHUNK_PATH_DAYS: int = 40_000_000
+    INVENTORY_PROJECTION_HORIZON_MONTHS: int = 6
+    INVENTORY_PROJECTION_CHUNK_SIZE: int = 500
+    INVENTORY_STATS_CACHE_TTL_SECONDS: int = 900
     OPENAI_API_KEY: str = ""
     GENXAI_LLM_MODEL: str = "gpt-4o-mini"
     GENXAI_LLM_TEMPERATURE: float = 0.2
@@ -18,11 +18,18 @@ from app.config import settings
 from app.database import create_tables, SessionLocal, engine
 from app.core.exceptions import GenXSOPException, to_http_exception
 from app.utils.events import configure_event_bus
+from app.services.batch_scheduler import batch_scheduler
+from app.services.forecast_job_service import forecast_job_service
+from app.services.inventory_optimization_runner import inventory_optimization_runner
+from app.services.inventory_rollup_service import InventoryRollupService, register_inventory_rollup_hooks
+from app.services.inventory_stats_cache import register_inventory_stats_invalidation
 from app.utils.logging import configure_logging
-from app.routers import auth, products, demand, supply, inventory, scenarios, sop_cycles, kpi, forecasting, dashboard, integrations, production_scheduling
+from app.routers import auth, products, demand, supply, inventory, scenarios, sop_cycles, kpi, forecasting, dashboard, integrations, production_scheduling, scheduler
 
 configure_logging(log_level=settings.LOG_LEVEL, log_format=settings.LOG_FORMAT)
 logger = logging.getLogger(__name__)
+# Inventory status rollups follow every inventory write made through a Session.
+register_inventory_rollup_hooks()
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -121,6 +128,7 @@ app.include_router(sop_cycles.router, prefix=API_PREFIX)
 app.include_router(kpi.router, prefix=API_PREFIX)
 app.include_router(integrations.router, prefix=API_PREFIX)
 app.include_router(production_scheduling.router, prefix=API_PREFIX)
+app.include_router(scheduler.router, prefix=API_PREFIX)
 
 
 # ── Lifecycle Events ──────────────────────────────────────────────────────────
@@ -130,22 +138,48 @@ def startup_event():
     """
     Application startup:
     1. Create database tables
-    2. Initialize EventBus with AuditLogHandler (Observer Pattern)
+    2. Initialize EventBus with AuditLogHandler (Observer Pattern) and subscribe the
+       inventory statistics cache to it
+    3. Start the in-app batch scheduler when SCHEDULER_ENABLED=true
+    4. Resume interrupted inventory optimization runs from their checkpoints
+    5. Start polling the forecast job queue when FORECAST_JOB_EMBEDDED_WORKER=true, so
+       queued and lease-expired jobs are recovered after a restart
+
+    Tables created over existing inventory get their status rollups built in step 1.
     """
     logger.info("Starting %s v%s", settings.APP_NAME, settings.APP_VERSION)
     if settings.AUTO_CREATE_TABLES:
         create_tables()
         logger.info("Database tables ensured via SQLAlchemy metadata (AUTO_CREATE_TABLES=true)")
+        db = SessionLocal()
+        try:
+            if InventoryRollupService(db).ensure_seeded():
+                logger.info("Inventory status rollups built from existing inventory")
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not build inventory status rollups: %s", exc)
+        finally:
+            db.close()
     else:
         logger.info("AUTO_CREATE_TABLES=false; expecting schema managed by Alembic migrations")
     # Configure Observer Pattern: EventBus with AuditLog + Logging handlers
-    configure_event_bus(db_session_factory=SessionLocal)
-    logger.info("EventBus initialized with AuditLogHandler and LoggingHandler")
+    bus = configure_event_bus(db_session_factory=SessionLocal)
+    register_inventory_stats_invalidation(bus)
+    logger.info("EventBus initialized with AuditLogHandler, LoggingHandler and inventory stats invalidation")
+    if settings.SCHEDULER_ENABLED:
+        batch_scheduler.start()
+    if inventory_optimization_runner.start_sweeper():
+        logger.info("Inventory optimization sweeper resuming queued and stalled runs")
+    if forecast_job_service.start_embedded_worker():
+        logger.info("Embedded forecast worker polling the job queue")
     logger.info("API available at http://localhost:8000/docs")
 
 
 @app.on_event("shutdown")
 def shutdown_event():
+    if batch_scheduler.running:
+        batch_scheduler.stop()
+    forecast_job_service.stop_embedded_worker(timeout=5)
+    inventory_optimization_runner.stop_sweeper(timeout=5)
     logger.info("%s shutting down.", settings.APP_NAME)
 
 
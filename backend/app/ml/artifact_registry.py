@@ -0,0 +1,238 @@
+"""
+Model Artifact Registry — persisted fitted models shared across workers
+
+Principles applied:
+- Single Responsibility Principle (SRP): Only stores, loads and evicts fitted model artifacts.
+- Open/Closed Principle (OCP): Strategies opt in via `artifact_format`; the registry never
+  needs to know about concrete algorithms.
+- Dependency Inversion Principle (DIP): ForecastContext depends on this registry abstraction,
+  not on joblib/pickle/torch directly.
+
+Artifacts are keyed by (product, model, params, data fingerprint), written atomically so
+several uvicorn workers can share one directory, and evicted least-recently-used once the
+directory grows beyond the configured size budget.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_EXTENSIONS = {"pickle": ".joblib", "torch": ".pt", "json": ".json"}
+
+
+def data_fingerprint(df: pd.DataFrame) -> str:
+    """Stable digest of a ['ds', 'y'] history frame."""
+    digest = hashlib.sha256()
+    if len(df) > 0:
+        digest.update(pd.to_datetime(df["ds"]).values.astype("datetime64[ns]").astype(np.int64).tobytes())
+        digest.update(df["y"].astype(float).values.tobytes())
+    return digest.hexdigest()
+
+
+class ModelArtifactRegistry:
+    """
+    Size-bounded, LRU-evicted on-disk store for fitted forecasting models.
+
+    Usage:
+        registry = get_model_artifact_registry()
+        key = registry.build_key(product_id, "arima", params, data_fingerprint(df))
+        payload = registry.load(key, "pickle")
+    """
+
+    def __init__(self, root: str, max_bytes: int, enabled: bool = True):
+        self._root = Path(root)
+        self._max_bytes = max(0, int(max_bytes))
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @staticmethod
+    def build_key(product_id: int, model_id: str, params: Optional[Dict[str, Any]], fingerprint: str) -> str:
+        raw = json.dumps(
+            {"product_id": product_id, "model_id": model_id, "params": params or {}, "data": fingerprint},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def model_version(model_id: str, key: str) -> str:
+        """Short identifier persisted on Forecast.model_version (fits String(50))."""
+        return f"{model_id}:{key[:32]}"
+
+    def load(self, key: str, fmt: str) -> Optional[Any]:
+        if not self._enabled:
+            return None
+        path = self._path(key, fmt)
+        try:
+            payload = self._read(path, fmt)
+        except FileNotFoundError:
+            self._bump("misses")
+            return None
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Discarding unreadable model artifact %s: %s", path.name, exc)
+            self._bump("errors")
+            self.discard(key, fmt)
+            return None
+        try:
+            # mtime doubles as the LRU clock, shared by every worker using this directory.
+            os.utime(path, None)
+        except OSError:
+            pass
+        self._bump("hits")
+        return payload
+
+    def save(self, key: str, payload: Any, fmt: str) -> bool:
+        if not self._enabled:
+            return False
+        path = self._path(key, fmt)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+            os.close(fd)
+            try:
+                self._write(Path(tmp_name), payload, fmt)
+                os.replace(tmp_name, path)
+            finally:
+                if os.path.exists(tmp_name):
+                    os.remove(tmp_name)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to persist model artifact %s: %s", path.name, exc)
+            self._bump("errors")
+            return False
+        self._bump("writes")
+        self._evict()
+        return True
+
+    def discard(self, key: str, fmt: str) -> None:
+        try:
+            self._path(key, fmt).unlink()
+        except OSError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        files = self._artifact_files()
+        with self._lock:
+            counters = dict(self._stats)
+        return {
+            "enabled": self._enabled,
+            "root": str(self._root),
+            "artifact_count": len(files),
+            "total_bytes": sum(size for _, size, _ in files),
+            "max_bytes": self._max_bytes,
+            **counters,
+        }
+
+    def clear(self) -> int:
+        removed = 0
+        for path, _, _ in self._artifact_files():
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    def _path(self, key: str, fmt: str) -> Path:
+        return self._root / key[:2] / f"{key}{_EXTENSIONS.get(fmt, '.bin')}"
+
+    def _read(self, path: Path, fmt: str) -> Any:
+        if fmt == "json":
+            return path.read_text(encoding="utf-8")
+        if fmt == "torch":
+            import torch
+            return torch.load(str(path), mmap=True, weights_only=True)
+        try:
+            import joblib
+            # Memory-map numpy buffers instead of copying them into each worker.
+            return joblib.load(str(path), mmap_mode="r")
+        except ImportError:
+            with open(path, "rb") as fh:
+                return pickle.load(fh)
+
+    def _write(self, path: Path, payload: Any, fmt: str) -> None:
+        if fmt == "json":
+            path.write_text(payload, encoding="utf-8")
+            return
+        if fmt == "torch":
+            import torch
+            torch.save(payload, str(path))
+            return
+        try:
+            import joblib
+            joblib.dump(payload, str(path))
+        except ImportError:
+            with open(path, "wb") as fh:
+                pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _artifact_files(self):
+        if not self._root.exists():
+            return []
+        files = []
+        for path in self._root.glob("*/*"):
+            if path.suffix not in _EXTENSIONS.values():
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((path, st.st_size, st.st_mtime))
+        return files
+
+    def _evict(self) -> None:
+        if self._max_bytes <= 0:
+            return
+        files = self._artifact_files()
+        total = sum(size for _, size, _ in files)
+        if total <= self._max_bytes:
+            return
+        for path, size, _ in sorted(files, key=lambda f: f[2]):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            self._bump("evictions")
+            if total <= self._max_bytes:
+                break
+
+    def _bump(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+
+
+# ── Singleton Registry ───────────────────────────────────────────────────────
+
+_registry: Optional[ModelArtifactRegistry] = None
+
+
+def get_model_artifact_registry() -> ModelArtifactRegistry:
+    """Return the process-wide registry configured from settings."""
+    global _registry
+    if _registry is None:
+        _registry = ModelArtifactRegistry(
+            root=settings.MODEL_ARTIFACT_DIR,
+            max_bytes=settings.MODEL_ARTIFACT_MAX_MB * 1024 * 1024,
+            enabled=settings.MODEL_ARTIFACTS_ENABLED,
+        )
+    return _registry
@@ -9,7 +9,7 @@ Principles applied:
 - Dependency Inversion Principle (DIP): ForecastContext depends on the abstraction, not concrete algorithms.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 import pandas as pd
 from datetime import date
@@ -55,10 +55,40 @@ class BaseForecastStrategy(ABC):
             List of dicts with keys:
                 period (date), predicted_qty (float),
                 lower_bound (float), upper_bound (float),
-                confidence (float), mape (float | None)
+                confidence (float), mape (float | None),
+                fallback_model (str, only when another strategy produced the rows)
         """
         ...
 
+    # ── Optional fit/predict split (persistable strategies) ─────────────────
+    # Strategies with an expensive fit set `artifact_format` ("pickle", "json" or "torch")
+    # and implement fit()/predict() so the fitted model can be stored in the
+    # ModelArtifactRegistry and reused without refitting.
+    artifact_format: Optional[str] = None
+
+    def fit(self, df: pd.DataFrame, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Fit the underlying model. Raises ValueError when history is insufficient."""
+        raise NotImplementedError(f"{self.model_id} does not expose a separate fit step")
+
+    def predict(self, fitted: Any, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Produce forecast rows (same shape as `forecast()`) from a fitted model."""
+        raise NotImplementedError(f"{self.model_id} does not expose a separate predict step")
+
+    def to_artifact(self, fitted: Any) -> Any:
+        """Convert a fitted model into its persisted representation."""
+        return fitted
+
+    def from_artifact(self, payload: Any) -> Any:
+        """Rebuild a fitted model from its persisted representation."""
+        return payload
+
+    def _fallback(
+        self, strategy: "BaseForecastStrategy", df: pd.DataFrame, horizon: int, params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Forecast with `strategy` instead; rows record the model that produced them."""
+        rows = strategy.forecast(df, horizon, params=params)
+        return [{**row, "fallback_model": row.get("fallback_model", strategy.model_id)} for row in rows]
+
     def _build_future_periods(self, df: pd.DataFrame, horizon: int) -> List[date]:
         """Helper: generate future monthly periods starting after the last data point."""
         last_period = df["ds"].iloc[-1].date() if len(df) > 0 else date.today().replace(day=1)
@@ -131,37 +161,47 @@ class ExponentialSmoothingStrategy(BaseForecastStrategy):
     def min_data_months(self) -> int:
         return 12
 
+    artifact_format = "pickle"
+
     def forecast(self, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         params = params or {}
         if len(df) < 4:
-            return MovingAverageStrategy().forecast(df, horizon, params=params)
+            return self._fallback(MovingAverageStrategy(), df, horizon, params)
         try:
-            from statsmodels.tsa.holtwinters import ExponentialSmoothing
-            damped_trend = bool(params.get("damped_trend", True))
-            model = ExponentialSmoothing(
-                df["y"].values,
-                trend="add",
-                seasonal="add" if len(df) >= 24 else None,
-                seasonal_periods=12 if len(df) >= 24 else None,
-                damped_trend=damped_trend,
-            )
-            fit = model.fit(optimized=True)
-            forecast_values = fit.forecast(horizon)
-            std = float(np.std(fit.resid))
-            future_periods = self._build_future_periods(df, horizon)
-            return [
-                {
-                    "period": p,
-                    "predicted_qty": round(max(0.0, float(v)), 2),
-                    "lower_bound": round(max(0.0, float(v) - 1.96 * std * self._horizon_interval_scale(i)), 2),
-                    "upper_bound": round(float(v) + 1.96 * std * self._horizon_interval_scale(i), 2),
-                    "confidence": 85.0,
-                    "mape": None,
-                }
-                for i, (p, v) in enumerate(zip(future_periods, forecast_values), 1)
-            ]
+            return self.predict(self.fit(df, params), df, horizon, params)
         except Exception:
-            return MovingAverageStrategy().forecast(df, horizon, params=params)
+            return self._fallback(MovingAverageStrategy(), df, horizon, params)
+
+    def fit(self, df: pd.DataFrame, params: Optional[Dict[str, Any]] = None) -> Any:
+        params = params or {}
+        if len(df) < 4:
+            raise ValueError("Exponential smoothing requires at least 4 observations")
+        from statsmodels.tsa.holtwinters import ExponentialSmoothing
+        damped_trend = bool(params.get("damped_trend", True))
+        model = ExponentialSmoothing(
+            df["y"].values,
+            trend="add",
+            seasonal="add" if len(df) >= 24 else None,
+            seasonal_periods=12 if len(df) >= 24 else None,
+            damped_trend=damped_trend,
+        )
+        return model.fit(optimized=True)
+
+    def predict(self, fitted: Any, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        forecast_values = fitted.forecast(horizon)
+        std = float(np.std(fitted.resid))
+        future_periods = self._build_future_periods(df, horizon)
+        return [
+            {
+                "period": p,
+                "predicted_qty": round(max(0.0, float(v)), 2),
+                "lower_bound": round(max(0.0, float(v) - 1.96 * std * self._horizon_interval_scale(i)), 2),
+                "upper_bound": round(float(v) + 1.96 * std * self._horizon_interval_scale(i), 2),
+                "confidence": 85.0,
+                "mape": None,
+            }
+            for i, (p, v) in enumerate(zip(future_periods, forecast_values), 1)
+        ]
 
 
 class EWMAStrategy(BaseForecastStrategy):
@@ -219,7 +259,7 @@ class SeasonalNaiveStrategy(BaseForecastStrategy):
 
     def forecast(self, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         if len(df) < 12:
-            return EWMAStrategy().forecast(df, horizon, params=params)
+            return self._fallback(EWMAStrategy(), df, horizon, params)
         y = df["y"].values
         std = float(df["y"].std()) if len(df) > 1 else max(1.0, float(np.mean(y)) * 0.1)
         future_periods = self._build_future_periods(df, horizon)
@@ -255,38 +295,48 @@ class ARIMAStrategy(BaseForecastStrategy):
     def min_data_months(self) -> int:
         return 12
 
+    artifact_format = "pickle"
+
     def forecast(self, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         params = params or {}
         if len(df) < self.min_data_months:
-            return ExponentialSmoothingStrategy().forecast(df, horizon, params=params)
+            return self._fallback(ExponentialSmoothingStrategy(), df, horizon, params)
 
         try:
-            from statsmodels.tsa.arima.model import ARIMA
-            p = int(params.get("p", 1)) if str(params.get("p", "")).strip() else 1
-            d = int(params.get("d", 1)) if str(params.get("d", "")).strip() else 1
-            q = int(params.get("q", 1)) if str(params.get("q", "")).strip() else 1
-            p = max(0, min(3, p))
-            d = max(0, min(2, d))
-            q = max(0, min(3, q))
-            model = ARIMA(df["y"].astype(float).values, order=(p, d, q))
-            fit = model.fit()
-            pred = fit.get_forecast(steps=horizon)
-            vals = pred.predicted_mean
-            ci = pred.conf_int(alpha=0.05)
-            future_periods = self._build_future_periods(df, horizon)
-            return [
-                {
-                    "period": p,
-                    "predicted_qty": round(max(0.0, float(vals[i])), 2),
-                    "lower_bound": round(max(0.0, float(ci[i][0])), 2),
-                    "upper_bound": round(max(0.0, float(ci[i][1])), 2),
-                    "confidence": 88.0,
-                    "mape": None,
-                }
-                for i, p in enumerate(future_periods)
-            ]
+            return self.predict(self.fit(df, params), df, horizon, params)
         except Exception:
-            return ExponentialSmoothingStrategy().forecast(df, horizon, params=params)
+            return self._fallback(ExponentialSmoothingStrategy(), df, horizon, params)
+
+    def fit(self, df: pd.DataFrame, params: Optional[Dict[str, Any]] = None) -> Any:
+        params = params or {}
+        if len(df) < self.min_data_months:
+            raise ValueError(f"ARIMA requires at least {self.min_data_months} observations")
+        from statsmodels.tsa.arima.model import ARIMA
+        p = int(params.get("p", 1)) if str(params.get("p", "")).strip() else 1
+        d = int(params.get("d", 1)) if str(params.get("d", "")).strip() else 1
+        q = int(params.get("q", 1)) if str(params.get("q", "")).strip() else 1
+        p = max(0, min(3, p))
+        d = max(0, min(2, d))
+        q = max(0, min(3, q))
+        model = ARIMA(df["y"].astype(float).values, order=(p, d, q))
+        return model.fit()
+
+    def predict(self, fitted: Any, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        pred = fitted.get_forecast(steps=horizon)
+        vals = pred.predicted_mean
+        ci = pred.conf_int(alpha=0.05)
+        future_periods = self._build_future_periods(df, horizon)
+        return [
+            {
+                "period": p,
+                "predicted_qty": round(max(0.0, float(vals[i])), 2),
+                "lower_bound": round(max(0.0, float(ci[i][0])), 2),
+                "upper_bound": round(max(0.0, float(ci[i][1])), 2),
+                "confidence": 88.0,
+                "mape": None,
+            }
+            for i, p in enumerate(future_periods)
+        ]
 
 
 # ── Concrete Strategy 3: Prophet ─────────────────────────────────────────────
@@ -306,42 +356,62 @@ class ProphetStrategy(BaseForecastStrategy):
     def min_data_months(self) -> int:
         return 24
 
+    artifact_format = "json"
+
     def forecast(self, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         params = params or {}
         if len(df) < 12:
-            return ExponentialSmoothingStrategy().forecast(df, horizon, params=params)
+            return self._fallback(ExponentialSmoothingStrategy(), df, horizon, params)
         try:
-            from prophet import Prophet
-            changepoint_prior_scale = float(params.get("changepoint_prior_scale", 0.05))
-            changepoint_prior_scale = max(0.001, min(0.5, changepoint_prior_scale))
-            seasonality_mode = str(params.get("seasonality_mode", "multiplicative"))
-            if seasonality_mode not in {"multiplicative", "additive"}:
-                seasonality_mode = "multiplicative"
-            model = Prophet(
-                yearly_seasonality=True,
-                weekly_seasonality=False,
-                daily_seasonality=False,
-                seasonality_mode=seasonality_mode,
-                changepoint_prior_scale=changepoint_prior_scale,
-                interval_width=0.95,
-            )
-            model.fit(df)
-            future_periods = self._build_future_periods(df, horizon)
-            future_df = pd.DataFrame({"ds": [pd.Timestamp(p) for p in future_periods]})
-            forecast = model.predict(future_df)
-            return [
-                {
-                    "period": future_periods[i],
-                    "predicted_qty": round(max(0.0, float(row["yhat"])), 2),
-                    "lower_bound": round(max(0.0, float(row["yhat_lower"])), 2),
-                    "upper_bound": round(max(0.0, float(row["yhat_upper"])), 2),
-                    "confidence": 95.0,
-                    "mape": None,
-                }
-                for i, (_, row) in enumerate(forecast.iterrows())
-            ]
+            return self.predict(self.fit(df, params), df, horizon, params)
         except Exception:
-            return ExponentialSmoothingStrategy().forecast(df, horizon, params=params)
+            return self._fallback(ExponentialSmoothingStrategy(), df, horizon, params)
+
+    def fit(self, df: pd.DataFrame, params: Optional[Dict[str, Any]] = None) -> Any:
+        params = params or {}
+        if len(df) < 12:
+            raise ValueError("Prophet requires at least 12 observations")
+        from prophet import Prophet
+        changepoint_prior_scale = float(params.get("changepoint_prior_scale", 0.05))
+        changepoint_prior_scale = max(0.001, min(0.5, changepoint_prior_scale))
+        seasonality_mode = str(params.get("seasonality_mode", "multiplicative"))
+        if seasonality_mode not in {"multiplicative", "additive"}:
+            seasonality_mode = "multiplicative"
+        model = Prophet(
+            yearly_seasonality=True,
+            weekly_seasonality=False,
+            daily_seasonality=False,
+            seasonality_mode=seasonality_mode,
+            changepoint_prior_scale=changepoint_prior_scale,
+            interval_width=0.95,
+        )
+        model.fit(df)
+        return model
+
+    def predict(self, fitted: Any, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        future_periods = self._build_future_periods(df, horizon)
+        future_df = pd.DataFrame({"ds": [pd.Timestamp(p) for p in future_periods]})
+        forecast = fitted.predict(future_df)
+        return [
+            {
+                "period": future_periods[i],
+                "predicted_qty": round(max(0.0, float(row["yhat"])), 2),
+                "lower_bound": round(max(0.0, float(row["yhat_lower"])), 2),
+                "upper_bound": round(max(0.0, float(row["yhat_upper"])), 2),
+                "confidence": 95.0,
+                "mape": None,
+            }
+            for i, (_, row) in enumerate(forecast.iterrows())
+        ]
+
+    def to_artifact(self, fitted: Any) -> Any:
+        # Prophet's supported serialization path; pickling the Stan backend is not portable.
+        from prophet.serialize import model_to_json
+        return model_to_json(fitted)
+
+    def from_artifact(self, payload: Any) -> Any:
+        from prophet.serialize import model_from_json
+        return model_from_json(payload)
 
 
 class LSTMStrategy(BaseForecastStrategy):
@@ -359,106 +429,168 @@ class LSTMStrategy(BaseForecastStrategy):
     def min_data_months(self) -> int:
         return 18
 
-    def forecast(self, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        params = params or {}
+    artifact_format = "torch"
+
+    @staticmethod
+    def _resolve_params(params: Dict[str, Any]) -> Dict[str, Any]:
         lookback_window = int(params.get("lookback_window", 12)) if str(params.get("lookback_window", "")).strip() else 12
-        lookback_window = max(3, min(24, lookback_window))
         hidden_size = int(params.get("hidden_size", 32)) if str(params.get("hidden_size", "")).strip() else 32
-        hidden_size = max(8, min(256, hidden_size))
         num_layers = int(params.get("num_layers", 1)) if str(params.get("num_layers", "")).strip() else 1
-        num_layers = max(1, min(4, num_layers))
-        dropout = float(params.get("dropout", 0.1))
-        dropout = max(0.0, min(0.6, dropout))
         epochs = int(params.get("epochs", 120)) if str(params.get("epochs", "")).strip() else 120
-        epochs = max(20, min(400, epochs))
-        learning_rate = float(params.get("learning_rate", 0.01))
-        learning_rate = max(0.0001, min(0.1, learning_rate))
+        return {
+            "lookback_window": max(3, min(24, lookback_window)),
+            "hidden_size": max(8, min(256, hidden_size)),
+            "num_layers": max(1, min(4, num_layers)),
+            "dropout": max(0.0, min(0.6, float(params.get("dropout", 0.1)))),
+            "epochs": max(20, min(400, epochs)),
+            "learning_rate": max(0.0001, min(0.1, float(params.get("learning_rate", 0.01)))),
+        }
 
+    def forecast(self, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        params = params or {}
+        lookback_window = self._resolve_params(params)["lookback_window"]
         if len(df) < max(8, lookback_window + 1):
-            return ExponentialSmoothingStrategy().forecast(df, horizon, params=params)
+            return self._fallback(ExponentialSmoothingStrategy(), df, horizon, params)
 
         try:
-            import torch
-            import torch.nn as nn
-
-            class _LSTMRegressor(nn.Module):
-                def __init__(self, in_features: int, hidden: int, layers: int, drop: float):
-                    super().__init__()
-                    self.lstm = nn.LSTM(
-                        input_size=in_features,
-                        hidden_size=hidden,
-                        num_layers=layers,
-                        dropout=drop if layers > 1 else 0.0,
-                        batch_first=True,
-                    )
-                    self.fc = nn.Linear(hidden, 1)
-
-                def forward(self, x):
-                    out, _ = self.lstm(x)
-                    return self.fc(out[:, -1, :])
-
-            torch.manual_seed(42)
-            y = df["y"].astype(float).values
-            y_mean = float(np.mean(y))
-            y_std = float(np.std(y))
-            scale = y_std if y_std > 1e-8 else max(1.0, abs(y_mean) * 0.1)
-            y_norm = (y - y_mean) / scale
-
-            X_vals, y_targets = [], []
-            for i in range(lookback_window, len(y_norm)):
-                X_vals.append(y_norm[i - lookback_window:i])
-                y_targets.append(y_norm[i])
-
-            if not X_vals:
-                return ExponentialSmoothingStrategy().forecast(df, horizon, params=params)
-
-            x_tensor = torch.tensor(np.array(X_vals), dtype=torch.float32).unsqueeze(-1)
-            y_tensor = torch.tensor(np.array(y_targets), dtype=torch.float32).unsqueeze(-1)
-
-            model = _LSTMRegressor(1, hidden_size, num_layers, dropout)
-            criterion = nn.MSELoss()
-            optimizer = torch.optim.Adam(model.parameters(), lr=learning_rate)
-
-            model.train()
-            for _ in range(epochs):
-                optimizer.zero_grad()
-                output = model(x_tensor)
-                loss = criterion(output, y_tensor)
-                loss.backward()
-                optimizer.step()
-
-            model.eval()
-            history_window = list(y_norm[-lookback_window:])
-            preds_norm: List[float] = []
-            with torch.no_grad():
-                for _ in range(horizon):
-                    seq = torch.tensor(np.array(history_window[-lookback_window:]), dtype=torch.float32).view(1, lookback_window, 1)
-                    next_norm = float(model(seq).item())
-                    preds_norm.append(next_norm)
-                    history_window.append(next_norm)
-
-                train_preds = model(x_tensor).squeeze(-1).numpy()
-
-            preds = [max(0.0, (p * scale) + y_mean) for p in preds_norm]
-            residuals = (train_preds - np.array(y_targets, dtype=float)) * scale
-            resid_std = float(np.std(residuals))
-            if resid_std <= 1e-8:
-                resid_std = float(np.std(y)) if len(y) > 1 else max(1.0, float(np.mean(y)) * 0.1)
-
-            future_periods = self._build_future_periods(df, horizon)
-            return [
-                {
-                    "period": p,
-                    "predicted_qty": round(v, 2),
-                    "lower_bound": round(max(0.0, v - 1.64 * resid_std * self._horizon_interval_scale(i)), 2),
-                    "upper_bound": round(max(0.0, v + 1.64 * resid_std * self._horizon_interval_scale(i)), 2),
-                    "confidence": 86.0,
-                    "mape": None,
-                }
-                for i, (p, v) in enumerate(zip(future_periods, preds), 1)
-            ]
+            return self.predict(self.fit(df, params), df, horizon, params)
         except Exception:
-            return ExponentialSmoothingStrategy().forecast(df, horizon, params=params)
+            return self._fallback(ExponentialSmoothingStrategy(), df, horizon, params)
+
+    def fit(self, df: pd.DataFrame, params: Optional[Dict[str, Any]] = None) -> Any:
+        cfg = self._resolve_params(params or {})
+        lookback_window = cfg["lookback_window"]
+        if len(df) < max(8, lookback_window + 1):
+            raise ValueError(f"LSTM requires at least {max(8, lookback_window + 1)} observations")
+
+        import torch
+        import torch.nn as nn
+
+        torch.manual_seed(42)
+        y = df["y"].astype(float).values
+        y_mean = float(np.mean(y))
+        y_std = float(np.std(y))
+        scale = y_std if y_std > 1e-8 else max(1.0, abs(y_mean) * 0.1)
+        y_norm = (y - y_mean) / scale
+
+        X_vals, y_targets = [], []
+        for i in range(lookback_window, len(y_norm)):
+            X_vals.append(y_norm[i - lookback_window:i])
+            y_targets.append(y_norm[i])
+
+        if not X_vals:
+            raise ValueError("LSTM training window is empty")
+
+        x_tensor = torch.tensor(np.array(X_vals), dtype=torch.float32).unsqueeze(-1)
+        y_tensor = torch.tensor(np.array(y_targets), dtype=torch.float32).unsqueeze(-1)
+
+        model = _build_lstm_regressor(1, cfg["hidden_size"], cfg["num_layers"], cfg["dropout"])
+        criterion = nn.MSELoss()
+        optimizer = torch.optim.Adam(model.parameters(), lr=cfg["learning_rate"])
+
+        model.train()
+        for _ in range(cfg["epochs"]):
+            optimizer.zero_grad()
+            output = model(x_tensor)
+            loss = criterion(output, y_tensor)
+            loss.backward()
+            optimizer.step()
+
+        model.eval()
+        with torch.no_grad():
+            train_preds = model(x_tensor).squeeze(-1).numpy()
+        residuals = (train_preds - np.array(y_targets, dtype=float)) * scale
+        resid_std = float(np.std(residuals))
+        if resid_std <= 1e-8:
+            resid_std = float(np.std(y)) if len(y) > 1 else max(1.0, float(np.mean(y)) * 0.1)
+
+        return {
+            "model": model,
+            "config": cfg,
+            "y_mean": y_mean,
+            "scale": scale,
+            "resid_std": resid_std,
+        }
+
+    def predict(self, fitted: Any, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        import torch
+
+        model = fitted["model"]
+        lookback_window = fitted["config"]["lookback_window"]
+        y_mean = fitted["y_mean"]
+        scale = fitted["scale"]
+        resid_std = fitted["resid_std"]
+
+        y_norm = (df["y"].astype(float).values - y_mean) / scale
+        history_window = list(y_norm[-lookback_window:])
+        preds_norm: List[float] = []
+        model.eval()
+        with torch.no_grad():
+            for _ in range(horizon):
+                seq = torch.tensor(np.array(history_window[-lookback_window:]), dtype=torch.float32).view(1, lookback_window, 1)
+                next_norm = float(model(seq).item())
+                preds_norm.append(next_norm)
+                history_window.append(next_norm)
+
+        preds = [max(0.0, (p * scale) + y_mean) for p in preds_norm]
+        future_periods = self._build_future_periods(df, horizon)
+        return [
+            {
+                "period": p,
+                "predicted_qty": round(v, 2),
+                "lower_bound": round(max(0.0, v - 1.64 * resid_std * self._horizon_interval_scale(i)), 2),
+                "upper_bound": round(max(0.0, v + 1.64 * resid_std * self._horizon_interval_scale(i)), 2),
+                "confidence": 86.0,
+                "mape": None,
+            }
+            for i, (p, v) in enumerate(zip(future_periods, preds), 1)
+        ]
+
+    def to_artifact(self, fitted: Any) -> Any:
+        # Only tensors and plain scalars so the artifact loads with weights_only=True.
+        return {
+            "state_dict": fitted["model"].state_dict(),
+            "config": dict(fitted["config"]),
+            "y_mean": fitted["y_mean"],
+            "scale": fitted["scale"],
+            "resid_std": fitted["resid_std"],
+        }
+
+    def from_artifact(self, payload: Any) -> Any:
+        cfg = payload["config"]
+        model = _build_lstm_regressor(1, cfg["hidden_size"], cfg["num_layers"], cfg["dropout"])
+        model.load_state_dict(payload["state_dict"])
+        model.eval()
+        return {
+            "model": model,
+            "config": cfg,
+            "y_mean": float(payload["y_mean"]),
+            "scale": float(payload["scale"]),
+            "resid_std": float(payload["resid_std"]),
+        }
+
+
+def _build_lstm_regressor(in_features: int, hidden: int, layers: int, drop: float):
+    """Construct the LSTM network lazily so torch stays an optional dependency."""
+    import torch.nn as nn
+
+    class _LSTMRegressor(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.lstm = nn.LSTM(
+                input_size=in_features,
+                hidden_size=hidden,
+                num_layers=layers,
+                dropout=drop if layers > 1 else 0.0,
+                batch_first=True,
+            )
+            self.fc = nn.Linear(hidden, 1)
+
+        def forward(self, x):
+            out, _ = self.lstm(x)
+            return self.fc(out[:, -1, :])
+
+    return _LSTMRegressor()
 
 
 # ── Context (uses a strategy) ─────────────────────────────────────────────────
@@ -483,3 +615,43 @@ class ForecastContext:
     def execute(self, df: pd.DataFrame, horizon: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Run the current strategy."""
         return self._strategy.forecast(df, horizon, params=params)
+
+    def execute_with_artifacts(
+        self,
+        df: pd.DataFrame,
+        horizon: int,
+        params: Optional[Dict[str, Any]],
+        registry: Any,
+        key: str,
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Run the current strategy, reusing a persisted fit when one exists for `key`.
+
+        Returns (rows, artifact_status) where artifact_status is "reused", "fitted"
+        or "none" (strategy not persistable, registry disabled, or fallback path taken).
+        Any failure degrades to `execute()` so results never depend on the cache.
+        """
+        strategy = self._strategy
+        fmt = strategy.artifact_format
+        if fmt is None or registry is None or not registry.enabled:
+            return self.execute(df, horizon, params=params), "none"
+
+        payload = registry.load(key, fmt)
+        if payload is not None:
+            try:
+                fitted = strategy.from_artifact(payload)
+                return strategy.predict(fitted, df, horizon, params or {}), "reused"
+            except Exception:
+                registry.discard(key, fmt)
+
+        try:
+            fitted = strategy.fit(df, params or {})
+            rows = strategy.predict(fitted, df, horizon, params or {})
+        except Exception:
+            return self.execute(df, horizon, params=params), "none"
+
+        try:
+            registry.save(key, strategy.to_artifact(fitted), fmt)
+        except Exception:
+            return rows, "none"
+        return rows, "fitted"
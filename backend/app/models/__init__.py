@@ -7,6 +7,8 @@ from app.models.forecast import Forecast
 from app.models.forecast_consensus import ForecastConsensus
 from app.models.forecast_run_audit import ForecastRunAudit
 from app.models.forecast_job import ForecastJob
+from app.models.forecast_residual import ForecastResidual
+from app.models.forecast_input_fingerprint import ForecastInputFingerprint
 from app.models.scenario import Scenario
 from app.models.sop_cycle import SOPCycle
 from app.models.kpi_metric import KPIMetric
@@ -14,6 +16,11 @@ from app.models.production_schedule import ProductionSchedule
 from app.models.inventory_policy_exception import InventoryPolicyException
 from app.models.inventory_policy_recommendation import InventoryPolicyRecommendation
 from app.models.inventory_policy_run import InventoryPolicyRun
+from app.models.inventory_projection import InventoryProjection
+from app.models.inventory_status_rollup import InventoryStatusRollup
+from app.models.inventory_data_quality import InventoryDataQuality
+from app.models.inventory_position_snapshot import InventoryPositionSnapshot, InventorySnapshotLocation
+from app.models.batch_schedule import BatchSchedule, BatchScheduleRun, SchedulerLock
 from app.models.comment import Comment, AuditLog
 
 __all__ = [
@@ -27,6 +34,8 @@ __all__ = [
     "ForecastConsensus",
     "ForecastRunAudit",
     "ForecastJob",
+    "ForecastResidual",
+    "ForecastInputFingerprint",
     "Scenario",
     "SOPCycle",
     "KPIMetric",
@@ -34,6 +43,14 @@ __all__ = [
     "InventoryPolicyException",
     "InventoryPolicyRecommendation",
     "InventoryPolicyRun",
+    "InventoryProjection",
+    "InventoryStatusRollup",
+    "InventoryDataQuality",
+    "InventoryPositionSnapshot",
+    "InventorySnapshotLocation",
+    "BatchSchedule",
+    "BatchScheduleRun",
+    "SchedulerLock",
     "Comment",
     "AuditLog",
 ]
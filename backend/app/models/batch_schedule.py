@@ -0,0 +1,93 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    CheckConstraint,
+    Index,
+    func,
+)
+
+from app.database import Base
+
+
+class BatchSchedule(Base):
+    """Recurring batch work (forecast refresh, inventory optimization, job cleanup, rollup
+    reconciliation, inventory position snapshots, inventory projection refresh)."""
+
+    __tablename__ = "batch_schedules"
+    __table_args__ = (
+        CheckConstraint(
+            "job_type IN ('forecast_refresh', 'inventory_optimization', 'forecast_job_cleanup', "
+            "'inventory_rollup_reconcile', 'inventory_position_snapshot', 'inventory_projection_refresh')",
+            name="ck_batch_schedules_job_type",
+        ),
+        CheckConstraint("max_concurrency >= 1", name="ck_batch_schedules_max_concurrency_min_1"),
+        CheckConstraint(
+            "max_cpu_percent IS NULL OR (max_cpu_percent > 0 AND max_cpu_percent <= 100)",
+            name="ck_batch_schedules_max_cpu_percent_range",
+        ),
+        Index("ix_batch_schedules_enabled_next_run", "enabled", "next_run_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False, unique=True)
+    job_type = Column(String(40), nullable=False)
+    cron_expression = Column(String(100), nullable=False)
+    parameters_json = Column(Text, nullable=True)
+    enabled = Column(Boolean, nullable=False, default=True)
+
+    # Optional UTC run window ("HH:MM"); a window may wrap midnight (e.g. 22:00-04:00).
+    window_start = Column(String(5), nullable=True)
+    window_end = Column(String(5), nullable=True)
+    max_concurrency = Column(Integer, nullable=False, default=1)
+    # Load gate, checked only when a run starts: the 1-minute load average per core
+    # must not exceed this percentage. It does not cap a running job's CPU use.
+    max_cpu_percent = Column(Integer, nullable=True)
+    max_runtime_minutes = Column(Integer, nullable=False, default=240)
+
+    next_run_at = Column(DateTime, nullable=True)
+    last_run_at = Column(DateTime, nullable=True)
+    last_status = Column(String(20), nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class BatchScheduleRun(Base):
+    __tablename__ = "batch_schedule_runs"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('running', 'completed', 'failed', 'skipped')",
+            name="ck_batch_schedule_runs_status",
+        ),
+        Index("ix_batch_schedule_runs_schedule_status", "schedule_id", "status"),
+        Index("ix_batch_schedule_runs_status_started", "status", "started_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    schedule_id = Column(Integer, ForeignKey("batch_schedules.id", ondelete="CASCADE"), nullable=False, index=True)
+    status = Column(String(20), nullable=False)
+    trigger = Column(String(20), nullable=False, default="cron")
+    scheduled_for = Column(DateTime, nullable=True)
+    worker_id = Column(String(100), nullable=True)
+    result_json = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime, default=func.now(), nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+
+
+class SchedulerLock(Base):
+    """Lease row used to elect a single scheduler leader across workers."""
+
+    __tablename__ = "scheduler_locks"
+
+    name = Column(String(100), primary_key=True)
+    owner = Column(String(100), nullable=False)
+    acquired_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, func
+
+from app.database import Base
+
+
+class ForecastInputFingerprint(Base):
+    """
+    Last forecast inputs per product, used by delta refresh runs.
+
+    `fingerprint` and the component columns describe the inputs of the last
+    successfully completed refresh; `pending_*` track a refresh still in flight.
+    """
+
+    __tablename__ = "forecast_input_fingerprints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, unique=True, index=True)
+
+    fingerprint = Column(String(64), nullable=True)
+    actuals_watermark = Column(String(128), nullable=True)
+    lead_time_days = Column(Integer, nullable=True)
+    model_type = Column(String(50), nullable=True)
+    model_params_json = Column(Text, nullable=True)
+    horizon = Column(Integer, nullable=True)
+    refreshed_at = Column(DateTime, nullable=True)
+
+    pending_fingerprint = Column(String(64), nullable=True)
+    pending_job_id = Column(String(64), nullable=True, index=True)
+    pending_inputs_json = Column(Text, nullable=True)
+
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
@@ -1,6 +1,10 @@
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, CheckConstraint, Index, func
 from app.database import Base
 
+# Priority lanes, highest priority first. Interactive single-product requests are
+# claimed ahead of bulk catalog refreshes.
+JOB_LANES = ("interactive", "bulk")
+
 
 class ForecastJob(Base):
     __tablename__ = "forecast_jobs"
@@ -11,6 +15,9 @@ class ForecastJob(Base):
         ),
         CheckConstraint("horizon >= 1", name="ck_forecast_jobs_horizon_min_1"),
         Index("ix_forecast_jobs_status_created_at", "status", "created_at"),
+        Index("ix_forecast_jobs_status_lease_expires_at", "status", "lease_expires_at"),
+        Index("ix_forecast_jobs_status_lane_created_at", "status", "lane", "created_at"),
+        Index("ix_forecast_jobs_status_completed_at", "status", "completed_at"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -21,9 +28,21 @@ class ForecastJob(Base):
     horizon = Column(Integer, nullable=False)
     model_type = Column(String(50), nullable=True)
     requested_by = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    model_params_json = Column(Text, nullable=True)
+    lane = Column(String(20), nullable=False, default="interactive", server_default="interactive")
+    # Set on follower jobs that share the result of an identical in-flight job.
+    coalesced_into = Column(String(64), nullable=True, index=True)
+
+    # Durable queue claim: the worker holding the job renews the lease via heartbeat;
+    # an expired lease lets another worker requeue it.
+    worker_id = Column(String(128), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    heartbeat_at = Column(DateTime, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
 
     error = Column(Text, nullable=True)
     result_json = Column(Text, nullable=True)
+    resource_usage_json = Column(Text, nullable=True)
 
     created_at = Column(DateTime, default=func.now(), nullable=False)
     started_at = Column(DateTime, nullable=True)
@@ -0,0 +1,37 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    ForeignKey,
+    UniqueConstraint,
+    func,
+)
+
+from app.database import Base
+
+
+class ForecastResidual(Base):
+    """Out-of-sample backtest residual scores per (product, model, horizon step)."""
+
+    __tablename__ = "forecast_residuals"
+    __table_args__ = (
+        UniqueConstraint(
+            "product_id",
+            "model_type",
+            "horizon_step",
+            name="uq_forecast_residuals_product_model_step",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
+    model_type = Column(String(50), nullable=False)
+    horizon_step = Column(Integer, nullable=False)
+
+    # Sorted absolute residuals (JSON list) — the conformal calibration set.
+    scores_json = Column(Text, nullable=False)
+    sample_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
@@ -41,4 +41,11 @@ class ForecastRunAudit(Base):
     candidate_metrics_json = Column(Text, nullable=True)
     data_quality_flags_json = Column(Text, nullable=True)
 
+    # Resource accounting: totals as columns for aggregation, stage breakdown as JSON.
+    duration_ms = Column(Numeric(14, 2), nullable=True)
+    cpu_ms = Column(Numeric(14, 2), nullable=True)
+    fit_count = Column(Integer, nullable=True)
+    peak_memory_kb = Column(Integer, nullable=True)
+    resource_usage_json = Column(Text, nullable=True)
+
     created_at = Column(DateTime, default=func.now(), nullable=False)
\ No newline at end of file
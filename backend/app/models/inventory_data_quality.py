@@ -0,0 +1,41 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Float,
+    DateTime,
+    ForeignKey,
+    CheckConstraint,
+    Index,
+)
+
+from app.database import Base
+
+
+class InventoryDataQuality(Base):
+    """Persisted data quality score per inventory row.
+
+    `source_updated_at` is the inventory row's `updated_at` the score was computed
+    from; a row is rescored when that watermark moves. Freshness also decays with
+    age, so `fresh_until` records when the freshness score next drops (NULL when it
+    can no longer change) and the row is rescored once that time has passed.
+    """
+
+    __tablename__ = "inventory_data_quality"
+    __table_args__ = (
+        CheckConstraint(
+            "quality_tier IN ('high', 'medium', 'low')",
+            name="ck_inventory_data_quality_tier",
+        ),
+        Index("ix_inventory_data_quality_overall", "overall_score"),
+    )
+
+    inventory_id = Column(Integer, ForeignKey("inventory.id", ondelete="CASCADE"), primary_key=True)
+    completeness_score = Column(Float, nullable=False)
+    freshness_score = Column(Float, nullable=False)
+    consistency_score = Column(Float, nullable=False)
+    overall_score = Column(Float, nullable=False)
+    quality_tier = Column(String(10), nullable=False)
+    source_updated_at = Column(DateTime, nullable=True)
+    fresh_until = Column(DateTime, nullable=True, index=True)
+    computed_at = Column(DateTime, nullable=False)
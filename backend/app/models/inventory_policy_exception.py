@@ -29,6 +29,7 @@ class InventoryPolicyException(Base):
             name="ck_inventory_policy_exception_status",
         ),
         Index("ix_inventory_policy_exceptions_status_due", "status", "due_date"),
+        Index("ix_inventory_policy_exceptions_status_severity_due", "status", "severity", "due_date"),
         Index("ix_inventory_policy_exceptions_inventory_type", "inventory_id", "exception_type"),
     )
 
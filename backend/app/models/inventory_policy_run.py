@@ -3,6 +3,7 @@ from sqlalchemy import (
     Integer,
     String,
     DateTime,
+    Float,
     ForeignKey,
     Text,
     CheckConstraint,
@@ -18,17 +19,21 @@ class InventoryPolicyRun(Base):
 
     This is intentionally similar to ForecastJob to provide:
     - run history (who/when/what scope)
-    - operational status (running/completed/failed)
+    - operational status (queued/running/completed/failed)
     - replay/debug metadata (parameters + results summary)
+
+    Runs process their scope in inventory-id order and checkpoint after every chunk
+    (`last_inventory_id` plus counters), so an interrupted run resumes where it stopped.
     """
 
     __tablename__ = "inventory_policy_runs"
     __table_args__ = (
         CheckConstraint(
-            "status IN ('running', 'completed', 'failed')",
+            "status IN ('queued', 'running', 'completed', 'failed')",
             name="ck_inventory_policy_runs_status",
         ),
         Index("ix_inventory_policy_runs_status_created", "status", "created_at"),
+        Index("ix_inventory_policy_runs_status_lease_expires_at", "status", "lease_expires_at"),
         Index("ix_inventory_policy_runs_requested_by_created", "requested_by", "created_at"),
     )
 
@@ -49,6 +54,16 @@ class InventoryPolicyRun(Base):
     processed_count = Column(Integer, nullable=False, default=0)
     updated_count = Column(Integer, nullable=False, default=0)
     exception_count = Column(Integer, nullable=False, default=0)
+    total_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Checkpoint / ownership: the last inventory id committed and the process holding the run.
+    last_inventory_id = Column(Integer, nullable=False, default=0, server_default="0")
+    worker_id = Column(String(128), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    # Wall time spent processing chunks, across attempts; downtime between attempts is excluded.
+    active_seconds = Column(Float, nullable=False, default=0.0, server_default="0")
+    checkpoint_at = Column(DateTime, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
 
     created_at = Column(DateTime, default=func.now(), nullable=False)
     started_at = Column(DateTime, nullable=True)
@@ -0,0 +1,65 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    SmallInteger,
+    BigInteger,
+    CheckConstraint,
+    Index,
+    String,
+)
+
+from app.database import Base
+
+# `status_code` is the index of the inventory status in this tuple. Any other status
+# (including none) is stored as UNKNOWN_STATUS_CODE and reported as "unknown".
+SNAPSHOT_STATUSES = ("normal", "low", "critical", "excess")
+UNKNOWN_STATUS_CODE = -1
+UNKNOWN_STATUS = "unknown"
+
+
+class InventorySnapshotLocation(Base):
+    """Integer code of an inventory location name, as stored in position snapshots.
+
+    Codes are assigned on first capture and never reused, so a snapshot keeps the
+    location its row had that day. A row without a location is recorded under "".
+    """
+
+    __tablename__ = "inventory_snapshot_locations"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100), nullable=False, unique=True)
+
+
+class InventoryPositionSnapshot(Base):
+    """Append-only daily position of one inventory row.
+
+    Rows are compact: `snapshot_day` is days since 1970-01-01, `status_code` indexes
+    `SNAPSHOT_STATUSES` (or is `UNKNOWN_STATUS_CODE`), `location_id` is the row's
+    location that day as an `InventorySnapshotLocation` code, and quantities, valuation
+    and days of supply are fixed-point integers in hundredths (the inventory columns'
+    two decimals). The primary key leads with the day, so a day's rows are contiguous
+    (and, on SQLite, stored without a rowid). There is no foreign key to inventory:
+    history outlives deleted inventory and keeps the locations rows had.
+    """
+
+    __tablename__ = "inventory_position_snapshots"
+    __table_args__ = (
+        CheckConstraint("status_code BETWEEN -1 AND 3", name="ck_inventory_position_snapshots_status_code"),
+        Index("ix_inventory_position_snapshots_inventory_day", "inventory_id", "snapshot_day"),
+        Index("ix_inventory_position_snapshots_product_day", "product_id", "snapshot_day"),
+        Index("ix_inventory_position_snapshots_location_day", "location_id", "snapshot_day"),
+        {"sqlite_with_rowid": False},
+    )
+
+    snapshot_day = Column(Integer, primary_key=True, autoincrement=False)
+    inventory_id = Column(Integer, primary_key=True, autoincrement=False)
+    product_id = Column(Integer, nullable=False)
+    # Null only for days captured before locations were recorded whose row was gone.
+    location_id = Column(Integer, nullable=True)
+    status_code = Column(SmallInteger, nullable=False)
+    on_hand_hundredths = Column(BigInteger, nullable=False)
+    allocated_hundredths = Column(BigInteger, nullable=False)
+    in_transit_hundredths = Column(BigInteger, nullable=False)
+    safety_stock_hundredths = Column(BigInteger, nullable=False)
+    valuation_cents = Column(BigInteger, nullable=True)
+    days_of_supply_hundredths = Column(Integer, nullable=True)
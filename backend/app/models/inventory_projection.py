@@ -0,0 +1,62 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Numeric,
+    Date,
+    DateTime,
+    ForeignKey,
+    Text,
+    CheckConstraint,
+    UniqueConstraint,
+    Index,
+    func,
+)
+
+from app.database import Base
+
+
+class InventoryProjection(Base):
+    """Time-phased projected available balance per product-location.
+
+    Summary columns describe the whole horizon; `periods_json` holds the
+    period-by-period netting. `input_fingerprint` is shared by all rows of a
+    product and identifies the inputs (inventory, supply plans, demand plans and
+    horizon) they were computed from, so only products whose inputs changed are
+    recomputed.
+    """
+
+    __tablename__ = "inventory_projections"
+    __table_args__ = (
+        UniqueConstraint("product_id", "location", name="uq_inventory_projections_product_location"),
+        CheckConstraint(
+            "status IN ('stockout', 'below_safety', 'excess', 'ok')",
+            name="ck_inventory_projections_status",
+        ),
+        Index("ix_inventory_projections_status_first_stockout", "status", "first_stockout_period"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
+    location = Column(String(100), nullable=False)
+
+    horizon_start = Column(Date, nullable=False)
+    horizon_months = Column(Integer, nullable=False)
+    opening_available = Column(Numeric(14, 2), nullable=False, default=0)
+    safety_stock = Column(Numeric(12, 2), nullable=False, default=0)
+    max_stock = Column(Numeric(12, 2), nullable=True)
+    total_demand = Column(Numeric(14, 2), nullable=False, default=0)
+    total_supply = Column(Numeric(14, 2), nullable=False, default=0)
+    min_projected_available = Column(Numeric(14, 2), nullable=False, default=0)
+    ending_projected_available = Column(Numeric(14, 2), nullable=False, default=0)
+
+    # Worst status over the horizon: stockout > below_safety > excess > ok.
+    status = Column(String(20), nullable=False, index=True)
+    first_stockout_period = Column(Date, nullable=True)
+    stockout_periods = Column(Integer, nullable=False, default=0)
+    below_safety_periods = Column(Integer, nullable=False, default=0)
+    excess_periods = Column(Integer, nullable=False, default=0)
+    periods_json = Column(Text, nullable=False)
+
+    input_fingerprint = Column(String(64), nullable=False)
+    computed_at = Column(DateTime, default=func.now(), nullable=False)
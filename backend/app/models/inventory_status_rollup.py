@@ -0,0 +1,42 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Numeric,
+    DateTime,
+    CheckConstraint,
+    UniqueConstraint,
+    func,
+)
+
+from app.database import Base
+
+
+class InventoryStatusRollup(Base):
+    """Inventory row counts and valuation per status, overall and per location.
+
+    One `overall` row plus one `location` row per inventory location (an inventory
+    row without a location rolls up under ""). Rows are adjusted incrementally in the
+    same transaction as every inventory write, so dashboard reads are single-row
+    lookups; a periodic reconciliation rebuilds them from the inventory table.
+    """
+
+    __tablename__ = "inventory_status_rollups"
+    __table_args__ = (
+        UniqueConstraint("scope", "location", name="uq_inventory_status_rollups_scope_location"),
+        CheckConstraint("scope IN ('overall', 'location')", name="ck_inventory_status_rollups_scope"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    scope = Column(String(20), nullable=False)
+    location = Column(String(100), nullable=False, default="")
+    normal_count = Column(Integer, nullable=False, default=0)
+    low_count = Column(Integer, nullable=False, default=0)
+    critical_count = Column(Integer, nullable=False, default=0)
+    excess_count = Column(Integer, nullable=False, default=0)
+    normal_value = Column(Numeric(16, 2), nullable=False, default=0)
+    low_value = Column(Numeric(16, 2), nullable=False, default=0)
+    critical_value = Column(Numeric(16, 2), nullable=False, default=0)
+    excess_value = Column(Numeric(16, 2), nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    reconciled_at = Column(DateTime, nullable=True)
@@ -8,11 +8,16 @@ Principles applied:
 - Dependency Inversion Principle (DIP): Routers/services depend on this abstraction, not SQLAlchemy directly.
 """
 from typing import Generic, TypeVar, Type, Optional, List, Any, Dict
+from sqlalchemy import exists
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from app.database import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Dialect `insert` constructs that support INSERT ... ON CONFLICT DO UPDATE.
+UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
 
 class BaseRepository(Generic[ModelType]):
     """
@@ -42,6 +47,10 @@ class BaseRepository(Generic[ModelType]):
         """Check if a record exists by primary key."""
         return self.db.query(self.model).filter(self.model.id == entity_id).first() is not None
 
+    def any_where(self, *criteria: Any) -> bool:
+        """EXISTS probe: True when at least one record matches every criterion."""
+        return bool(self.db.query(exists().where(*criteria).select_from(self.model)).scalar())
+
     # ── Write ────────────────────────────────────────────────────────────────
 
     def create(self, obj: ModelType) -> ModelType:
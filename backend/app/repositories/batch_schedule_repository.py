@@ -0,0 +1,71 @@
+"""
+Batch Schedule Repository — Repository Pattern (GoF)
+"""
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from app.repositories.base import BaseRepository
+from app.models.batch_schedule import BatchSchedule, BatchScheduleRun
+
+
+class BatchScheduleRepository(BaseRepository[BatchSchedule]):
+
+    def __init__(self, db: Session):
+        super().__init__(BatchSchedule, db)
+
+    def get_by_name(self, name: str) -> Optional[BatchSchedule]:
+        return self.db.query(BatchSchedule).filter(BatchSchedule.name == name).first()
+
+    def list_all(self) -> List[BatchSchedule]:
+        return self.db.query(BatchSchedule).order_by(BatchSchedule.name.asc()).all()
+
+    def list_due(self, now: datetime) -> List[BatchSchedule]:
+        return (
+            self.db.query(BatchSchedule)
+            .filter(BatchSchedule.enabled.is_(True))
+            .filter(BatchSchedule.next_run_at.isnot(None))
+            .filter(BatchSchedule.next_run_at <= now)
+            .order_by(BatchSchedule.next_run_at.asc())
+            .all()
+        )
+
+    def claim_next_run(self, schedule_id: int, expected_next_run_at: datetime, new_next_run_at: datetime) -> bool:
+        """Compare-and-set on next_run_at so a due occurrence fires at most once. Caller commits."""
+        updated = (
+            self.db.query(BatchSchedule)
+            .filter(BatchSchedule.id == schedule_id)
+            .filter(BatchSchedule.next_run_at == expected_next_run_at)
+            .update({BatchSchedule.next_run_at: new_next_run_at}, synchronize_session=False)
+        )
+        return bool(updated)
+
+    def delete_with_runs(self, schedule: BatchSchedule) -> None:
+        self.db.query(BatchScheduleRun).filter(
+            BatchScheduleRun.schedule_id == schedule.id
+        ).delete(synchronize_session=False)
+        self.db.delete(schedule)
+        self.db.commit()
+
+
+class BatchScheduleRunRepository(BaseRepository[BatchScheduleRun]):
+
+    def __init__(self, db: Session):
+        super().__init__(BatchScheduleRun, db)
+
+    def list_for_schedule(self, schedule_id: int, limit: int = 50) -> List[BatchScheduleRun]:
+        return (
+            self.db.query(BatchScheduleRun)
+            .filter(BatchScheduleRun.schedule_id == schedule_id)
+            .order_by(BatchScheduleRun.started_at.desc(), BatchScheduleRun.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def count_running(self, schedule_id: Optional[int] = None) -> int:
+        q = self.db.query(BatchScheduleRun).filter(BatchScheduleRun.status == "running")
+        if schedule_id is not None:
+            q = q.filter(BatchScheduleRun.schedule_id == schedule_id)
+        return q.count()
+
+    def list_running(self) -> List[BatchScheduleRun]:
+        return self.db.query(BatchScheduleRun).filter(BatchScheduleRun.status == "running").all()
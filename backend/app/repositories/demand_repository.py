@@ -2,9 +2,12 @@
 Demand Plan Repository — Repository Pattern (GoF)
 Encapsulates all demand-plan data access logic.
 """
-from typing import Optional, List, Tuple
+from typing import Dict, Iterable, Optional, List, Tuple
 from datetime import date
+from decimal import Decimal
 from math import ceil
+from sqlalchemy import func
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from app.repositories.base import BaseRepository
 from app.models.demand_plan import DemandPlan
@@ -100,6 +103,88 @@ class DemandPlanRepository(BaseRepository[DemandPlan]):
             .all()
         )
 
+    def recent_actuals(self, product_ids: Iterable[int], limit: int = 12) -> Dict[int, List[Decimal]]:
+        """Last `limit` actual quantities per product, oldest first (batch get_with_actuals)."""
+        ids = list(set(product_ids))
+        if not ids:
+            return {}
+        ranked = (
+            self.db.query(
+                DemandPlan.product_id.label("product_id"),
+                DemandPlan.period.label("period"),
+                DemandPlan.id.label("id"),
+                DemandPlan.actual_qty.label("actual_qty"),
+                func.row_number()
+                .over(
+                    partition_by=DemandPlan.product_id,
+                    order_by=(DemandPlan.period.desc(), DemandPlan.id.desc()),
+                )
+                .label("rank"),
+            )
+            .filter(DemandPlan.product_id.in_(ids), DemandPlan.actual_qty.isnot(None))
+            .subquery()
+        )
+        rows = (
+            self.db.query(ranked.c.product_id, ranked.c.actual_qty)
+            .filter(ranked.c.rank <= limit)
+            .order_by(ranked.c.product_id, ranked.c.period.asc(), ranked.c.id.asc())
+            .all()
+        )
+        actuals: Dict[int, List[Decimal]] = {}
+        for row in rows:
+            actuals.setdefault(row.product_id, []).append(Decimal(str(row.actual_qty)))
+        return actuals
+
+    def planned_demand(self, product_ids: Iterable[int], period_from: date, period_to: date) -> List[Row]:
+        """
+        (product_id, period, qty) per product and period, summed over regions and
+        channels using the latest version of each plan. The quantity is consensus,
+        else adjusted, else forecast (as in gap analysis).
+        """
+        ids = list(set(product_ids))
+        if not ids:
+            return []
+        ranked = (
+            self.db.query(
+                DemandPlan.product_id.label("product_id"),
+                DemandPlan.period.label("period"),
+                func.coalesce(DemandPlan.consensus_qty, DemandPlan.adjusted_qty, DemandPlan.forecast_qty).label("qty"),
+                func.row_number()
+                .over(
+                    partition_by=(DemandPlan.product_id, DemandPlan.period, DemandPlan.region, DemandPlan.channel),
+                    order_by=DemandPlan.version.desc(),
+                )
+                .label("rank"),
+            )
+            .filter(
+                DemandPlan.product_id.in_(ids),
+                DemandPlan.period >= period_from,
+                DemandPlan.period < period_to,
+            )
+            .subquery()
+        )
+        return (
+            self.db.query(ranked.c.product_id, ranked.c.period, func.sum(ranked.c.qty).label("qty"))
+            .filter(ranked.c.rank == 1)
+            .group_by(ranked.c.product_id, ranked.c.period)
+            .all()
+        )
+
+    def projection_signatures(
+        self, period_from: date, period_to: date, product_id: Optional[int] = None
+    ) -> Dict[int, Tuple]:
+        """Per product: plan count, planned quantity and last update within [period_from, period_to)."""
+        q = self.db.query(
+            DemandPlan.product_id,
+            func.count(DemandPlan.id),
+            func.sum(func.coalesce(DemandPlan.consensus_qty, DemandPlan.adjusted_qty, DemandPlan.forecast_qty)),
+            func.max(DemandPlan.version),
+            func.max(DemandPlan.updated_at),
+        ).filter(DemandPlan.period >= period_from, DemandPlan.period < period_to)
+        if product_id:
+            q = q.filter(DemandPlan.product_id == product_id)
+        return {row[0]: tuple(row[1:]) for row in q.group_by(DemandPlan.product_id).all()}
+
     def get_all_for_product(self, product_id: int) -> List[DemandPlan]:
         """Fetch all demand plans for a product ordered by period."""
         return (
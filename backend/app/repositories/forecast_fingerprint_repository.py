@@ -0,0 +1,63 @@
+"""
+Forecast Input Fingerprint Repository — Repository Pattern (GoF)
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+from sqlalchemy.orm import Session
+from app.repositories.base import BaseRepository
+from app.models.forecast_input_fingerprint import ForecastInputFingerprint
+
+
+class ForecastFingerprintRepository(BaseRepository[ForecastInputFingerprint]):
+
+    def __init__(self, db: Session):
+        super().__init__(ForecastInputFingerprint, db)
+
+    def get_by_product_map(self) -> Dict[int, ForecastInputFingerprint]:
+        return {row.product_id: row for row in self.db.query(ForecastInputFingerprint).all()}
+
+    def set_pending(self, product_id: int, fingerprint: str, job_id: str, inputs: Dict[str, Any]) -> None:
+        """Record an in-flight refresh. Caller owns the commit."""
+        row = self.db.query(ForecastInputFingerprint).filter(
+            ForecastInputFingerprint.product_id == product_id
+        ).first()
+        if row is None:
+            row = ForecastInputFingerprint(product_id=product_id)
+            self.db.add(row)
+        row.pending_fingerprint = fingerprint
+        row.pending_job_id = job_id
+        row.pending_inputs_json = json.dumps(inputs, sort_keys=True, default=str)
+
+    def mark_applied(self, job_id: str) -> Optional[ForecastInputFingerprint]:
+        """Promote the pending inputs of a completed job to the applied fingerprint."""
+        row = self._get_by_pending_job(job_id)
+        if row is None:
+            return None
+        inputs = json.loads(row.pending_inputs_json or "{}")
+        row.fingerprint = row.pending_fingerprint
+        row.actuals_watermark = inputs.get("actuals_watermark")
+        row.lead_time_days = inputs.get("lead_time_days")
+        row.model_type = inputs.get("model_type")
+        row.model_params_json = json.dumps(inputs.get("model_params") or {}, sort_keys=True)
+        row.horizon = inputs.get("horizon")
+        row.refreshed_at = datetime.utcnow()
+        self._clear_pending(row)
+        return row
+
+    def clear_pending(self, job_id: str) -> None:
+        """Drop the pending marker of a failed/cancelled job so the next delta run retries."""
+        row = self._get_by_pending_job(job_id)
+        if row is not None:
+            self._clear_pending(row)
+
+    def _get_by_pending_job(self, job_id: str) -> Optional[ForecastInputFingerprint]:
+        return self.db.query(ForecastInputFingerprint).filter(
+            ForecastInputFingerprint.pending_job_id == job_id
+        ).first()
+
+    @staticmethod
+    def _clear_pending(row: ForecastInputFingerprint) -> None:
+        row.pending_fingerprint = None
+        row.pending_job_id = None
+        row.pending_inputs_json = None
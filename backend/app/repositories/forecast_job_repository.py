@@ -0,0 +1,317 @@
+"""
+Forecast Job Repository — Repository Pattern (GoF)
+
+Queue operations on `forecast_jobs`. Claiming is a compare-and-set: a candidate is
+selected (`FOR UPDATE SKIP LOCKED` on PostgreSQL) and moved to `running` with an
+UPDATE guarded on `status = 'queued'`, so concurrent workers never share a job.
+Jobs are claimed lane by lane (see `JOB_LANES`). Follower jobs coalesced onto an
+identical in-flight job are never claimed; they mirror their leader's status and
+receive its result. Callers own the commit.
+"""
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import and_, case, func, or_
+from sqlalchemy.orm import Session
+
+from app.models.forecast_job import JOB_LANES, ForecastJob
+from app.repositories.base import BaseRepository
+
+_CLAIM_CANDIDATES = 5
+_ACTIVE_STATUSES = ("queued", "running")
+PERCENTILES = (50, 95, 99)
+
+
+class ForecastJobRepository(BaseRepository[ForecastJob]):
+
+    def __init__(self, db: Session):
+        super().__init__(ForecastJob, db)
+
+    def get_by_job_id(self, job_id: str) -> Optional[ForecastJob]:
+        return self.db.query(ForecastJob).filter(ForecastJob.job_id == job_id).first()
+
+    def find_active_leader(
+        self,
+        product_id: int,
+        horizon: int,
+        model_type: Optional[str],
+        model_params_json: Optional[str],
+    ) -> Optional[ForecastJob]:
+        """Queued or running job with the same inputs that new requests can coalesce onto."""
+        return (
+            self.db.query(ForecastJob)
+            .filter(
+                ForecastJob.status.in_(_ACTIVE_STATUSES),
+                ForecastJob.coalesced_into.is_(None),
+                ForecastJob.product_id == product_id,
+                ForecastJob.horizon == horizon,
+                _null_safe_eq(ForecastJob.model_type, model_type),
+                _null_safe_eq(ForecastJob.model_params_json, model_params_json),
+            )
+            .order_by(ForecastJob.created_at.asc(), ForecastJob.id.asc())
+            .first()
+        )
+
+    def list_active_followers(self, leader_job_id: str) -> List[ForecastJob]:
+        return (
+            self.db.query(ForecastJob)
+            .filter(ForecastJob.coalesced_into == leader_job_id, ForecastJob.status.in_(_ACTIVE_STATUSES))
+            .order_by(ForecastJob.created_at.asc(), ForecastJob.id.asc())
+            .all()
+        )
+
+    def update_followers(self, leader_job_ids: Iterable[str], values: Dict[str, Any]) -> List[str]:
+        """Apply `values` to the active followers of the given leaders; returns their job ids."""
+        leader_job_ids = list(leader_job_ids)
+        if not leader_job_ids:
+            return []
+        active = and_(ForecastJob.coalesced_into.in_(leader_job_ids), ForecastJob.status.in_(_ACTIVE_STATUSES))
+        follower_ids = [job_id for (job_id,) in self.db.query(ForecastJob.job_id).filter(active).all()]
+        if follower_ids:
+            updates = {getattr(ForecastJob, field): value for field, value in values.items()}
+            self.db.query(ForecastJob).filter(active).update(updates, synchronize_session=False)
+        return follower_ids
+
+    def claim_next(
+        self,
+        worker_id: str,
+        lease_seconds: int,
+        now: Optional[datetime] = None,
+        lanes: Optional[Sequence[str]] = None,
+    ) -> Optional[ForecastJob]:
+        """Atomically move the highest-priority queued job to `running` for `worker_id`."""
+        now = now or datetime.utcnow()
+        lane_rank = case(
+            *[(ForecastJob.lane == lane, rank) for rank, lane in enumerate(JOB_LANES)],
+            else_=len(JOB_LANES),
+        )
+        query = self.db.query(ForecastJob.id).filter(
+            ForecastJob.status == "queued", ForecastJob.coalesced_into.is_(None)
+        )
+        if lanes:
+            query = query.filter(ForecastJob.lane.in_(list(lanes)))
+        query = query.order_by(lane_rank, ForecastJob.created_at.asc(), ForecastJob.id.asc()).limit(_CLAIM_CANDIDATES)
+        if self.db.get_bind().dialect.name == "postgresql":
+            query = query.with_for_update(skip_locked=True)
+
+        for (candidate_id,) in query.all():
+            claimed = (
+                self.db.query(ForecastJob)
+                .filter(ForecastJob.id == candidate_id, ForecastJob.status == "queued")
+                .update(
+                    {
+                        ForecastJob.status: "running",
+                        ForecastJob.worker_id: worker_id,
+                        ForecastJob.attempts: ForecastJob.attempts + 1,
+                        ForecastJob.started_at: now,
+                        ForecastJob.heartbeat_at: now,
+                        ForecastJob.lease_expires_at: now + timedelta(seconds=lease_seconds),
+                    },
+                    synchronize_session=False,
+                )
+            )
+            if claimed == 1:
+                job = self.db.query(ForecastJob).filter(ForecastJob.id == candidate_id).first()
+                self.update_followers([job.job_id], {"status": "running", "started_at": now})
+                return job
+        return None
+
+    def renew_lease(self, job_id: str, worker_id: str, lease_seconds: int, now: Optional[datetime] = None) -> bool:
+        """Heartbeat. False when the job was cancelled or requeued away from this worker."""
+        now = now or datetime.utcnow()
+        renewed = (
+            self._owned(job_id, worker_id)
+            .update(
+                {
+                    ForecastJob.heartbeat_at: now,
+                    ForecastJob.lease_expires_at: now + timedelta(seconds=lease_seconds),
+                },
+                synchronize_session=False,
+            )
+        )
+        return renewed == 1
+
+    def finish(self, job_id: str, worker_id: str, values: Dict[str, Any]) -> bool:
+        """Terminal transition, applied only while this worker still owns the running job."""
+        updates = {getattr(ForecastJob, field): value for field, value in values.items()}
+        updates[ForecastJob.lease_expires_at] = None
+        return self._owned(job_id, worker_id).update(updates, synchronize_session=False) == 1
+
+    def requeue_expired(self, max_attempts: int, lease_seconds: int, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Return stalled jobs to the queue, failing those out of attempts."""
+        now = now or datetime.utcnow()
+        # Rows claimed before leases existed have no expiry; treat them as stale
+        # once they have been running for a full lease.
+        expired = self.db.query(ForecastJob.id, ForecastJob.job_id, ForecastJob.attempts).filter(
+            ForecastJob.status == "running",
+            ForecastJob.coalesced_into.is_(None),
+            or_(
+                ForecastJob.lease_expires_at < now,
+                and_(
+                    ForecastJob.lease_expires_at.is_(None),
+                    ForecastJob.started_at < now - timedelta(seconds=lease_seconds),
+                ),
+            ),
+        ).all()
+        to_fail = [row for row in expired if (row.attempts or 0) >= max_attempts]
+        to_requeue = [row for row in expired if (row.attempts or 0) < max_attempts]
+
+        if to_fail:
+            failed_values = {
+                "status": "failed",
+                "error": f"Worker lease expired after {max_attempts} attempts",
+                "completed_at": now,
+            }
+            self._update_running([row.id for row in to_fail], {**failed_values, "lease_expires_at": None})
+            self.update_followers([row.job_id for row in to_fail], failed_values)
+        if to_requeue:
+            self._update_running([row.id for row in to_requeue], {
+                "status": "queued", "worker_id": None, "lease_expires_at": None, "started_at": None,
+            })
+            self.update_followers([row.job_id for row in to_requeue], {"status": "queued", "started_at": None})
+        return {"requeued": len(to_requeue), "failed": len(to_fail)}
+
+    # ── Metrics (grouped aggregates; no rows are loaded) ─────────────────────
+
+    def count_by_status(self) -> Dict[str, int]:
+        rows = self.db.query(ForecastJob.status, func.count(ForecastJob.id)).group_by(ForecastJob.status).all()
+        return {status: int(count) for status, count in rows}
+
+    def count_failed_since(self, cutoff: datetime) -> int:
+        return int(
+            self.db.query(func.count(ForecastJob.id))
+            .filter(ForecastJob.status == "failed", ForecastJob.completed_at >= cutoff)
+            .scalar() or 0
+        )
+
+    def count_coalesced(self) -> int:
+        return int(self.db.query(func.count(ForecastJob.id)).filter(ForecastJob.coalesced_into.isnot(None)).scalar() or 0)
+
+    def oldest_queued_created_at(self) -> Optional[datetime]:
+        return self.db.query(func.min(ForecastJob.created_at)).filter(ForecastJob.status == "queued").scalar()
+
+    def lane_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per lane: queued/running counts, oldest queued job and average queue wait (ms)."""
+        wait_ms = self._duration_ms(ForecastJob.started_at, ForecastJob.created_at)
+        rows = (
+            self.db.query(
+                ForecastJob.lane,
+                func.sum(case((ForecastJob.status == "queued", 1), else_=0)),
+                func.sum(case((ForecastJob.status == "running", 1), else_=0)),
+                func.min(case((ForecastJob.status == "queued", ForecastJob.created_at), else_=None)),
+                func.avg(case((ForecastJob.started_at.isnot(None), wait_ms), else_=None)),
+            )
+            .filter(ForecastJob.coalesced_into.is_(None))
+            .group_by(ForecastJob.lane)
+            .all()
+        )
+        return {
+            lane: {
+                "queued": int(queued or 0),
+                "running": int(running or 0),
+                "oldest_queued_at": _as_datetime(oldest),
+                "avg_wait_ms": float(avg_wait) if avg_wait is not None else None,
+            }
+            for lane, queued, running, oldest, avg_wait in rows
+        }
+
+    def processing_stats(self) -> Dict[str, Any]:
+        """Count, average and p50/p95/p99 processing time (ms) over finished leader jobs."""
+        duration = self._duration_ms(ForecastJob.completed_at, ForecastJob.started_at)
+        count, avg = self.db.query(func.count(ForecastJob.id), func.avg(duration)).filter(*self._processed()).one()
+        return {
+            "count": int(count or 0),
+            "avg_ms": float(avg) if avg is not None else None,
+            **self._percentiles(duration, int(count or 0)),
+        }
+
+    def model_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per requested model type ("auto" when the advisor picks): counts and processing times."""
+        model_key = func.coalesce(ForecastJob.model_type, "auto")
+        duration = self._duration_ms(ForecastJob.completed_at, ForecastJob.started_at)
+        processed = and_(*self._processed())
+        rows = (
+            self.db.query(
+                model_key,
+                func.count(ForecastJob.id),
+                func.sum(case((ForecastJob.status == "completed", 1), else_=0)),
+                func.sum(case((ForecastJob.status == "failed", 1), else_=0)),
+                func.sum(case((processed, 1), else_=0)),
+                func.avg(case((processed, duration), else_=None)),
+            )
+            .filter(ForecastJob.coalesced_into.is_(None))
+            .group_by(model_key)
+            .all()
+        )
+        stats: Dict[str, Dict[str, Any]] = {}
+        for model, total, completed, failed, processed_count, avg in rows:
+            stats[model] = {
+                "total_jobs": int(total or 0),
+                "completed": int(completed or 0),
+                "failed": int(failed or 0),
+                "avg_processing_time_ms": float(avg) if avg is not None else None,
+                **self._percentiles(duration, int(processed_count or 0), model_key == model),
+            }
+        return stats
+
+    def _processed(self) -> List[Any]:
+        return [
+            ForecastJob.coalesced_into.is_(None),
+            ForecastJob.started_at.isnot(None),
+            ForecastJob.completed_at.isnot(None),
+        ]
+
+    def _percentiles(self, duration, count: int, *extra_filters) -> Dict[str, Optional[float]]:
+        keys = [f"p{p}_ms" for p in PERCENTILES]
+        if count == 0:
+            return dict.fromkeys(keys)
+        filters = [*self._processed(), *extra_filters]
+        if self._dialect() == "postgresql":
+            values = self.db.query(
+                *[func.percentile_disc(p / 100).within_group(duration) for p in PERCENTILES]
+            ).filter(*filters).one()
+            return {key: float(value) if value is not None else None for key, value in zip(keys, values)}
+        # Nearest-rank percentile via ORDER BY ... OFFSET — the same definition as
+        # percentile_disc, for backends without ordered-set aggregates.
+        result: Dict[str, Optional[float]] = {}
+        for key, p in zip(keys, PERCENTILES):
+            offset = max(math.ceil(p / 100 * count) - 1, 0)
+            value = (
+                self.db.query(duration).filter(*filters).order_by(duration.asc()).offset(offset).limit(1).scalar()
+            )
+            result[key] = float(value) if value is not None else None
+        return result
+
+    def _duration_ms(self, end, start):
+        if self._dialect() == "postgresql":
+            return func.extract("epoch", end - start) * 1000.0
+        # julianday() is a float day count; round away its sub-millisecond noise.
+        return func.round((func.julianday(end) - func.julianday(start)) * 86400000.0)
+
+    def _dialect(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    def _update_running(self, ids: List[int], values: Dict[str, Any]) -> None:
+        updates = {getattr(ForecastJob, field): value for field, value in values.items()}
+        self.db.query(ForecastJob).filter(
+            ForecastJob.id.in_(ids), ForecastJob.status == "running"
+        ).update(updates, synchronize_session=False)
+
+    def _owned(self, job_id: str, worker_id: str):
+        return self.db.query(ForecastJob).filter(
+            ForecastJob.job_id == job_id,
+            ForecastJob.status == "running",
+            ForecastJob.worker_id == worker_id,
+        )
+
+
+def _null_safe_eq(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    # min() over a CASE expression loses the column type on SQLite and comes back as text.
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
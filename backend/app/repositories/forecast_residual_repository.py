@@ -0,0 +1,39 @@
+"""
+Forecast Residual Repository — Repository Pattern (GoF)
+"""
+import json
+from typing import Dict, List
+from sqlalchemy.orm import Session
+from app.repositories.base import BaseRepository
+from app.models.forecast_residual import ForecastResidual
+
+
+class ForecastResidualRepository(BaseRepository[ForecastResidual]):
+
+    def __init__(self, db: Session):
+        super().__init__(ForecastResidual, db)
+
+    def get_scores(self, product_id: int, model_type: str) -> Dict[int, List[float]]:
+        rows = self.db.query(ForecastResidual).filter(
+            ForecastResidual.product_id == product_id,
+            ForecastResidual.model_type == model_type,
+        ).all()
+        return {int(r.horizon_step): json.loads(r.scores_json or "[]") for r in rows}
+
+    def replace_scores(self, product_id: int, model_type: str, scores_by_step: Dict[int, List[float]]) -> None:
+        """Replace the calibration set for one product/model. Caller owns the commit."""
+        self.db.query(ForecastResidual).filter(
+            ForecastResidual.product_id == product_id,
+            ForecastResidual.model_type == model_type,
+        ).delete(synchronize_session=False)
+        for step, scores in sorted(scores_by_step.items()):
+            ordered = sorted(abs(float(s)) for s in scores)
+            if not ordered:
+                continue
+            self.db.add(ForecastResidual(
+                product_id=product_id,
+                model_type=model_type,
+                horizon_step=int(step),
+                scores_json=json.dumps([round(s, 4) for s in ordered]),
+                sample_count=len(ordered),
+            ))
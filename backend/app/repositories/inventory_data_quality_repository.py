@@ -0,0 +1,121 @@
+"""
+Inventory Data Quality Repository — Repository Pattern (GoF)
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import insert, or_, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from app.repositories.base import UPSERT_INSERTS, BaseRepository
+from app.models.inventory import Inventory
+from app.models.inventory_data_quality import InventoryDataQuality
+
+
+class InventoryDataQualityRepository(BaseRepository[InventoryDataQuality]):
+
+    def __init__(self, db: Session):
+        super().__init__(InventoryDataQuality, db)
+
+    def list_stale_inputs(
+        self,
+        now: datetime,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+        inventory_ids: Optional[Sequence[int]] = None,
+        after_id: int = 0,
+        limit: int = 5000,
+    ) -> List[Row]:
+        """
+        Next chunk (keyset on inventory id) of rows whose score is missing, was computed
+        from an older `updated_at`, or has outlived its `fresh_until`, with the columns
+        scoring needs. `scored` is False for rows that have no score yet.
+        """
+        q = (
+            self.db.query(
+                Inventory.id,
+                Inventory.on_hand_qty,
+                Inventory.safety_stock,
+                Inventory.reorder_point,
+                Inventory.max_stock,
+                Inventory.valuation,
+                Inventory.updated_at,
+                InventoryDataQuality.inventory_id.isnot(None).label("scored"),
+            )
+            .outerjoin(InventoryDataQuality, InventoryDataQuality.inventory_id == Inventory.id)
+            .filter(
+                or_(
+                    InventoryDataQuality.inventory_id.is_(None),
+                    Inventory.updated_at.is_distinct_from(InventoryDataQuality.source_updated_at),
+                    InventoryDataQuality.fresh_until < now,
+                ),
+                Inventory.id > after_id,
+            )
+        )
+        q = self._scope(q, product_id, location, inventory_ids)
+        return q.order_by(Inventory.id).limit(limit).all()
+
+    def list_with_inventory(
+        self,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+    ) -> List[Row]:
+        """(score, product_id, location) for every row in scope, by inventory id."""
+        q = (
+            self.db.query(InventoryDataQuality, Inventory.product_id, Inventory.location)
+            .populate_existing()
+            .join(Inventory, Inventory.id == InventoryDataQuality.inventory_id)
+        )
+        q = self._scope(q, product_id, location, None)
+        return q.order_by(Inventory.id).all()
+
+    def scores_for(self, inventory_ids: Iterable[int]) -> Dict[int, Tuple[float, str]]:
+        """(overall_score, quality_tier) per inventory row, in one query."""
+        ids = list(set(inventory_ids))
+        if not ids:
+            return {}
+        rows = (
+            self.db.query(
+                InventoryDataQuality.inventory_id,
+                InventoryDataQuality.overall_score,
+                InventoryDataQuality.quality_tier,
+            )
+            .filter(InventoryDataQuality.inventory_id.in_(ids))
+            .all()
+        )
+        return {row.inventory_id: (row.overall_score, row.quality_tier) for row in rows}
+
+    def bulk_upsert(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """
+        INSERT many rows in one executemany, overwriting rows another writer inserted
+        first (ON CONFLICT on `inventory_id`) where the backend supports it; the caller commits.
+        """
+        if not rows:
+            return
+        table = InventoryDataQuality.__table__
+        dialect_insert = UPSERT_INSERTS.get(self.db.connection().dialect.name)
+        if dialect_insert is None:
+            self.db.execute(insert(table), list(rows))
+            return
+        statement = dialect_insert(table)
+        self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[table.c.inventory_id],
+                set_={column: statement.excluded[column] for column in rows[0] if column != "inventory_id"},
+            ),
+            list(rows),
+        )
+
+    def bulk_update(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """UPDATE many rows by primary key (`inventory_id`) in one executemany; the caller commits."""
+        if rows:
+            self.db.execute(update(InventoryDataQuality), list(rows))
+
+    @staticmethod
+    def _scope(q, product_id: Optional[int], location: Optional[str], inventory_ids: Optional[Sequence[int]]):
+        if product_id:
+            q = q.filter(Inventory.product_id == product_id)
+        if location:
+            q = q.filter(Inventory.location == location)
+        if inventory_ids is not None:
+            q = q.filter(Inventory.id.in_(list(inventory_ids)))
+        return q
@@ -1,12 +1,18 @@
 """
 Inventory Policy Exception Repository
 """
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import and_, case, func, insert, or_, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from app.repositories.base import BaseRepository
+from app.models.inventory import Inventory
 from app.models.inventory_policy_exception import InventoryPolicyException
 
+ACTIVE_STATUSES = ("open", "in_progress")
+
 
 class InventoryExceptionRepository(BaseRepository[InventoryPolicyException]):
 
@@ -28,18 +34,150 @@ class InventoryExceptionRepository(BaseRepository[InventoryPolicyException]):
             q = q.filter(InventoryPolicyException.inventory_id == inventory_id)
         return q.all()
 
-    def get_open_by_inventory_and_type(
+    def any_filtered(self, status: Optional[str] = None, owner_user_id: Optional[int] = None) -> bool:
+        """EXISTS probe with the `list_filtered` filters."""
+        criteria = []
+        if status:
+            criteria.append(InventoryPolicyException.status == status)
+        if owner_user_id:
+            criteria.append(InventoryPolicyException.owner_user_id == owner_user_id)
+        return self.any_where(*criteria)
+
+    def active_counts(self, today: date) -> Tuple[int, int]:
+        """(open or in-progress exceptions, of which due before `today`) in one aggregate query."""
+        ex = InventoryPolicyException
+        total, overdue = (
+            self.db.query(func.count(ex.id), func.sum(case((ex.due_date < today, 1), else_=0)))
+            .filter(ex.status.in_(ACTIVE_STATUSES))
+            .one()
+        )
+        return int(total or 0), int(overdue or 0)
+
+    def any_active(self, exception_types: Optional[Sequence[str]] = None) -> bool:
+        """EXISTS probe for an open or in-progress exception, optionally of the given types."""
+        criteria = [InventoryPolicyException.status.in_(ACTIVE_STATUSES)]
+        if exception_types:
+            criteria.append(InventoryPolicyException.exception_type.in_(list(exception_types)))
+        return self.any_where(*criteria)
+
+    def latest_active_by_inventory(
         self,
-        inventory_id: int,
-        exception_type: str,
-    ) -> Optional[InventoryPolicyException]:
-        return (
-            self.db.query(InventoryPolicyException)
+        inventory_ids: Iterable[int],
+        exception_types: Sequence[str],
+    ) -> Dict[Tuple[int, str], Row]:
+        """Most recently updated open or in-progress exception per (inventory_id, exception_type), in one query."""
+        ids = list(set(inventory_ids))
+        if not ids:
+            return {}
+        rows = (
+            self.db.query(
+                InventoryPolicyException.id,
+                InventoryPolicyException.inventory_id,
+                InventoryPolicyException.exception_type,
+                InventoryPolicyException.severity,
+                InventoryPolicyException.status,
+                InventoryPolicyException.recommended_action,
+                InventoryPolicyException.owner_user_id,
+                InventoryPolicyException.due_date,
+                InventoryPolicyException.notes,
+            )
             .filter(
-                InventoryPolicyException.inventory_id == inventory_id,
-                InventoryPolicyException.exception_type == exception_type,
-                InventoryPolicyException.status.in_(["open", "in_progress"]),
+                InventoryPolicyException.inventory_id.in_(ids),
+                InventoryPolicyException.exception_type.in_(list(exception_types)),
+                InventoryPolicyException.status.in_(ACTIVE_STATUSES),
             )
-            .order_by(InventoryPolicyException.updated_at.desc())
-            .first()
+            .order_by(InventoryPolicyException.updated_at.desc(), InventoryPolicyException.id.desc())
+            .all()
+        )
+        latest: Dict[Tuple[int, str], Row] = {}
+        for row in rows:
+            latest.setdefault((row.inventory_id, row.exception_type), row)
+        return latest
+
+    def bulk_insert(self, rows: Sequence[Dict[str, Any]]) -> List[int]:
+        """INSERT many rows in one executemany; returns their ids in order. The caller commits."""
+        if not rows:
+            return []
+        stmt = insert(InventoryPolicyException).returning(InventoryPolicyException.id, sort_by_parameter_order=True)
+        return list(self.db.scalars(stmt, list(rows)).all())
+
+    def bulk_update(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """UPDATE many rows by primary key in one executemany; the caller commits."""
+        if rows:
+            self.db.execute(update(InventoryPolicyException), list(rows))
+
+    def list_with_inventory(
+        self,
+        status: Optional[str] = None,
+        owner_user_id: Optional[int] = None,
+        severity: Optional[str] = None,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+        after_id: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Row]:
+        """Next page (keyset on id) of (exception, product_id, location), joined to inventory in one query."""
+        q = self._joined(
+            self.db.query(InventoryPolicyException, Inventory.product_id, Inventory.location),
+            owner_user_id, severity, product_id, location,
+        )
+        if status:
+            q = q.filter(InventoryPolicyException.status == status)
+        q = q.filter(InventoryPolicyException.id > after_id)
+        return q.order_by(InventoryPolicyException.id).limit(limit).all()
+
+    def list_escalations(
+        self,
+        today: date,
+        level: Optional[str] = None,
+        severity: Optional[str] = None,
+        owner_user_id: Optional[int] = None,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+        after_id: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Row]:
+        """
+        Next page (keyset on id) of open or in-progress exceptions that escalate, with
+        the escalation level computed in SQL: L2 for high severity due today or earlier
+        (or undated) and for anything 3+ days overdue, L1 for anything else overdue.
+        """
+        ex = InventoryPolicyException
+        high_now = and_(ex.severity == "high", or_(ex.due_date.is_(None), ex.due_date <= today))
+        level_expr = case(
+            (high_now, "L2"),
+            (ex.due_date <= today - timedelta(days=3), "L2"),
+            else_="L1",
         )
+        q = self._joined(
+            self.db.query(
+                ex.id,
+                ex.inventory_id,
+                ex.severity,
+                ex.status,
+                ex.owner_user_id,
+                ex.due_date,
+                Inventory.product_id,
+                Inventory.location,
+                level_expr.label("escalation_level"),
+                high_now.label("high_severity_due"),
+            ),
+            owner_user_id, severity, product_id, location,
+        ).filter(ex.status.in_(ACTIVE_STATUSES), or_(high_now, ex.due_date < today))
+        if level:
+            q = q.filter(level_expr == level)
+        q = q.filter(ex.id > after_id)
+        return q.order_by(ex.id).limit(limit).all()
+
+    @staticmethod
+    def _joined(q, owner_user_id: Optional[int], severity: Optional[str], product_id: Optional[int], location: Optional[str]):
+        q = q.join(Inventory, Inventory.id == InventoryPolicyException.inventory_id)
+        if owner_user_id:
+            q = q.filter(InventoryPolicyException.owner_user_id == owner_user_id)
+        if severity:
+            q = q.filter(InventoryPolicyException.severity == severity)
+        if product_id:
+            q = q.filter(Inventory.product_id == product_id)
+        if location:
+            q = q.filter(Inventory.location == location)
+        return q
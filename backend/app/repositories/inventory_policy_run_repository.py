@@ -1,10 +1,17 @@
 """Inventory Policy Run Repository
 
 Provides persisted inventory optimization run history.
+
+Ownership works like forecast jobs: a run is claimed with an UPDATE guarded on its
+status (queued, or running with an expired lease), and lease renewals, checkpoints and
+the final transition only apply while the claiming worker still owns it. Callers own
+the commit.
 """
 
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from app.models.inventory_policy_run import InventoryPolicyRun
@@ -23,3 +30,97 @@ class InventoryPolicyRunRepository(BaseRepository[InventoryPolicyRun]):
         if status:
             q = q.filter(InventoryPolicyRun.status == status)
         return q.order_by(InventoryPolicyRun.created_at.desc()).limit(limit).all()
+
+    def list_resumable(self, now: Optional[datetime] = None, limit: int = 100) -> List[InventoryPolicyRun]:
+        """Queued runs and running runs whose owner stopped renewing the lease."""
+        now = now or datetime.utcnow()
+        return (
+            self.db.query(InventoryPolicyRun)
+            .filter(self._claimable(now))
+            .order_by(InventoryPolicyRun.created_at.asc(), InventoryPolicyRun.id.asc())
+            .limit(limit)
+            .all()
+        )
+
+    def claim(self, run_id: str, worker_id: str, lease_seconds: int, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.utcnow()
+        claimed = (
+            self.db.query(InventoryPolicyRun)
+            .filter(InventoryPolicyRun.run_id == run_id, self._claimable(now))
+            .update(
+                {
+                    InventoryPolicyRun.status: "running",
+                    InventoryPolicyRun.worker_id: worker_id,
+                    InventoryPolicyRun.attempts: InventoryPolicyRun.attempts + 1,
+                    InventoryPolicyRun.started_at: func.coalesce(InventoryPolicyRun.started_at, now),
+                    InventoryPolicyRun.lease_expires_at: now + timedelta(seconds=lease_seconds),
+                },
+                synchronize_session=False,
+            )
+        )
+        return claimed == 1
+
+    def checkpoint(
+        self,
+        run_id: str,
+        worker_id: str,
+        values: Dict[str, Any],
+        lease_seconds: int,
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """Record progress and renew the lease. False when another worker took the run over."""
+        now = now or datetime.utcnow()
+        updates = {getattr(InventoryPolicyRun, field): value for field, value in values.items()}
+        updates[InventoryPolicyRun.checkpoint_at] = now
+        updates[InventoryPolicyRun.lease_expires_at] = now + timedelta(seconds=lease_seconds)
+        return self._owned(run_id, worker_id).update(updates, synchronize_session=False) == 1
+
+    def renew_lease(self, run_id: str, worker_id: str, lease_seconds: int, now: Optional[datetime] = None) -> bool:
+        """Extend the lease mid-chunk. False when another worker took the run over."""
+        now = now or datetime.utcnow()
+        renewed = self._owned(run_id, worker_id).update(
+            {InventoryPolicyRun.lease_expires_at: now + timedelta(seconds=lease_seconds)},
+            synchronize_session=False,
+        )
+        return renewed == 1
+
+    def finish(self, run_id: str, worker_id: str, values: Dict[str, Any]) -> bool:
+        updates = {getattr(InventoryPolicyRun, field): value for field, value in values.items()}
+        updates[InventoryPolicyRun.lease_expires_at] = None
+        return self._owned(run_id, worker_id).update(updates, synchronize_session=False) == 1
+
+    def abandon(self, run_id: str, error: str, now: Optional[datetime] = None) -> bool:
+        """Fail a running run whose lease expired, unless another worker claimed it first."""
+        now = now or datetime.utcnow()
+        abandoned = (
+            self.db.query(InventoryPolicyRun)
+            .filter(
+                InventoryPolicyRun.run_id == run_id,
+                InventoryPolicyRun.status == "running",
+                InventoryPolicyRun.lease_expires_at < now,
+            )
+            .update(
+                {
+                    InventoryPolicyRun.status: "failed",
+                    InventoryPolicyRun.error: error,
+                    InventoryPolicyRun.lease_expires_at: None,
+                    InventoryPolicyRun.completed_at: now,
+                },
+                synchronize_session=False,
+            )
+        )
+        return abandoned == 1
+
+    def _owned(self, run_id: str, worker_id: str):
+        return self.db.query(InventoryPolicyRun).filter(
+            InventoryPolicyRun.run_id == run_id,
+            InventoryPolicyRun.status == "running",
+            InventoryPolicyRun.worker_id == worker_id,
+        )
+
+    @staticmethod
+    def _claimable(now: datetime):
+        return or_(
+            InventoryPolicyRun.status == "queued",
+            and_(InventoryPolicyRun.status == "running", InventoryPolicyRun.lease_expires_at < now),
+        )
@@ -0,0 +1,166 @@
+"""
+Inventory Position Snapshot Repository — Repository Pattern (GoF)
+"""
+from typing import List, Optional
+from sqlalchemy import BigInteger, Float, case, cast, delete, func, insert, literal, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from app.repositories.base import UPSERT_INSERTS, BaseRepository
+from app.models.inventory import Inventory
+from app.models.inventory_position_snapshot import (
+    SNAPSHOT_STATUSES,
+    UNKNOWN_STATUS,
+    UNKNOWN_STATUS_CODE,
+    InventoryPositionSnapshot,
+    InventorySnapshotLocation,
+)
+
+
+# (code, status) for every status code a snapshot row can hold.
+_STATUS_CODES = [*enumerate(SNAPSHOT_STATUSES), (UNKNOWN_STATUS_CODE, UNKNOWN_STATUS)]
+
+
+def _hundredths(column):
+    return cast(func.round(func.coalesce(column, 0) * 100), BigInteger)
+
+
+class InventoryPositionSnapshotRepository(BaseRepository[InventoryPositionSnapshot]):
+
+    def __init__(self, db: Session):
+        super().__init__(InventoryPositionSnapshot, db)
+
+    def day_exists(self, snapshot_day: int) -> bool:
+        return self.any_where(InventoryPositionSnapshot.snapshot_day == snapshot_day)
+
+    def capture_day(self, snapshot_day: int, replace: bool = False) -> int:
+        """
+        Copy every inventory row's current position, location code included, into
+        `snapshot_day` with one INSERT ... SELECT; `replace` first deletes the day.
+        Locations without a code get one first. The caller commits.
+        """
+        if replace:
+            self.db.execute(delete(InventoryPositionSnapshot).where(InventoryPositionSnapshot.snapshot_day == snapshot_day))
+        self._register_locations()
+        location_name = func.coalesce(Inventory.location, "")
+        status_code = case(
+            {status: code for code, status in enumerate(SNAPSHOT_STATUSES)},
+            value=Inventory.status,
+            else_=UNKNOWN_STATUS_CODE,
+        )
+        source = select(
+            literal(snapshot_day),
+            Inventory.id,
+            Inventory.product_id,
+            InventorySnapshotLocation.id,
+            status_code,
+            _hundredths(Inventory.on_hand_qty),
+            _hundredths(Inventory.allocated_qty),
+            _hundredths(Inventory.in_transit_qty),
+            _hundredths(Inventory.safety_stock),
+            case((Inventory.valuation.is_(None), None), else_=_hundredths(Inventory.valuation)),
+            case((Inventory.days_of_supply.is_(None), None), else_=_hundredths(Inventory.days_of_supply)),
+        ).join(InventorySnapshotLocation, InventorySnapshotLocation.name == location_name)
+        result = self.db.execute(
+            insert(InventoryPositionSnapshot).from_select(
+                [
+                    "snapshot_day",
+                    "inventory_id",
+                    "product_id",
+                    "location_id",
+                    "status_code",
+                    "on_hand_hundredths",
+                    "allocated_hundredths",
+                    "in_transit_hundredths",
+                    "safety_stock_hundredths",
+                    "valuation_cents",
+                    "days_of_supply_hundredths",
+                ],
+                source,
+            )
+        )
+        return result.rowcount
+
+    def _register_locations(self) -> None:
+        """Give every current inventory location a code, skipping ones already coded."""
+        location_name = func.coalesce(Inventory.location, "")
+        missing = (
+            select(location_name)
+            .where(location_name.not_in(select(InventorySnapshotLocation.name)))
+            .distinct()
+        )
+        dialect_insert = UPSERT_INSERTS.get(self.db.connection().dialect.name)
+        if dialect_insert is None:
+            self.db.execute(insert(InventorySnapshotLocation).from_select(["name"], missing))
+            return
+        # A concurrent capture may code the same location first.
+        self.db.execute(
+            dialect_insert(InventorySnapshotLocation)
+            .from_select(["name"], missing)
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+
+    def bucketed_history(
+        self,
+        start_day: int,
+        end_day: int,
+        bucket_days: int,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+        inventory_id: Optional[int] = None,
+    ) -> List[Row]:
+        """
+        Scope totals per day, then averaged (on hand also min/max) per bucket of
+        `bucket_days` days from `start_day`. Both levels are grouped in SQL, so the
+        result has at most one row per bucket. Values stay in hundredths, except the days
+        of supply weighting, which is a float: hundredths times hundredths can pass
+        the 64-bit integer range of SQLite's SUM.
+        """
+        s = InventoryPositionSnapshot
+        daily = select(
+            s.snapshot_day.label("day"),
+            func.count().label("rows"),
+            func.sum(s.on_hand_hundredths).label("on_hand"),
+            func.sum(s.on_hand_hundredths - s.allocated_hundredths).label("available"),
+            func.sum(s.in_transit_hundredths).label("in_transit"),
+            func.sum(s.safety_stock_hundredths).label("safety_stock"),
+            func.sum(s.valuation_cents).label("valuation"),
+            func.sum(cast(s.days_of_supply_hundredths, Float) * s.on_hand_hundredths).label("dos_weighted"),
+            func.sum(case((s.days_of_supply_hundredths.is_not(None), s.on_hand_hundredths), else_=0)).label("dos_weight"),
+            *[
+                func.sum(case((s.status_code == code, 1), else_=0)).label(f"{status}_rows")
+                for code, status in _STATUS_CODES
+            ],
+        ).where(s.snapshot_day.between(start_day, end_day))
+        if product_id is not None:
+            daily = daily.where(s.product_id == product_id)
+        if inventory_id is not None:
+            daily = daily.where(s.inventory_id == inventory_id)
+        if location:
+            # The location each row had on the day, not its current one.
+            location_id = select(InventorySnapshotLocation.id).where(InventorySnapshotLocation.name == location)
+            daily = daily.where(s.location_id == location_id.scalar_subquery())
+        daily = daily.group_by(s.snapshot_day).subquery()
+
+        bucket = ((daily.c.day - start_day) // bucket_days).label("bucket")
+        query = (
+            select(
+                bucket,
+                func.min(daily.c.day).label("first_day"),
+                func.max(daily.c.day).label("last_day"),
+                func.count().label("days"),
+                func.avg(daily.c.rows).label("rows"),
+                func.avg(daily.c.on_hand).label("on_hand"),
+                func.min(daily.c.on_hand).label("on_hand_min"),
+                func.max(daily.c.on_hand).label("on_hand_max"),
+                func.avg(daily.c.available).label("available"),
+                func.avg(daily.c.in_transit).label("in_transit"),
+                func.avg(daily.c.safety_stock).label("safety_stock"),
+                func.avg(daily.c.valuation).label("valuation"),
+                func.sum(daily.c.dos_weighted).label("dos_weighted"),
+                func.sum(daily.c.dos_weight).label("dos_weight"),
+                *[func.avg(daily.c[f"{status}_rows"]).label(f"{status}_rows") for _, status in _STATUS_CODES],
+            )
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        return self.db.execute(query).all()
@@ -0,0 +1,70 @@
+"""
+Inventory Projection Repository — Repository Pattern (GoF)
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.repositories.base import BaseRepository
+from app.models.inventory_projection import InventoryProjection
+
+
+class InventoryProjectionRepository(BaseRepository[InventoryProjection]):
+
+    def __init__(self, db: Session):
+        super().__init__(InventoryProjection, db)
+
+    def fingerprints(self, product_id: Optional[int] = None) -> Dict[int, str]:
+        """Stored input fingerprint per product."""
+        q = self.db.query(InventoryProjection.product_id, func.max(InventoryProjection.input_fingerprint))
+        if product_id:
+            q = q.filter(InventoryProjection.product_id == product_id)
+        return {row[0]: row[1] for row in q.group_by(InventoryProjection.product_id).all()}
+
+    def replace_for_products(self, product_ids: Iterable[int], rows: Sequence[InventoryProjection]) -> None:
+        """Replace every projection of `product_ids` with `rows`. Caller owns the commit."""
+        ids = list(set(product_ids))
+        if ids:
+            self.db.query(InventoryProjection).filter(
+                InventoryProjection.product_id.in_(ids)
+            ).delete(synchronize_session=False)
+        self.db.add_all(rows)
+
+    def list_paginated(
+        self,
+        page: int = 1,
+        page_size: int = 50,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[InventoryProjection], int]:
+        """Earliest projected stockouts first, then by product and location."""
+        q = self._scope(self.db.query(InventoryProjection), product_id, location)
+        if status:
+            q = q.filter(InventoryProjection.status == status)
+        total = q.count()
+        items = (
+            q.order_by(
+                InventoryProjection.first_stockout_period.is_(None),
+                InventoryProjection.first_stockout_period.asc(),
+                InventoryProjection.product_id.asc(),
+                InventoryProjection.location.asc(),
+            )
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
+        return items, total
+
+    def status_counts(self, product_id: Optional[int] = None, location: Optional[str] = None) -> Dict[str, int]:
+        q = self._scope(
+            self.db.query(InventoryProjection.status, func.count(InventoryProjection.id)), product_id, location
+        )
+        return {status: count for status, count in q.group_by(InventoryProjection.status).all()}
+
+    @staticmethod
+    def _scope(q, product_id: Optional[int], location: Optional[str]):
+        if product_id:
+            q = q.filter(InventoryProjection.product_id == product_id)
+        if location:
+            q = q.filter(InventoryProjection.location == location)
+        return q
@@ -1,10 +1,14 @@
 """
 Inventory Policy Recommendation Repository
 """
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from sqlalchemy import func, insert, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from app.repositories.base import BaseRepository
+from app.models.inventory import Inventory
 from app.models.inventory_policy_recommendation import InventoryPolicyRecommendation
 
 
@@ -25,6 +29,72 @@ class InventoryRecommendationRepository(BaseRepository[InventoryPolicyRecommenda
             q = q.filter(InventoryPolicyRecommendation.inventory_id == inventory_id)
         return q.order_by(InventoryPolicyRecommendation.created_at.desc()).all()
 
+    def status_counts(self) -> Dict[str, int]:
+        """Number of recommendations per status, in one grouped query."""
+        rows = (
+            self.db.query(InventoryPolicyRecommendation.status, func.count(InventoryPolicyRecommendation.id))
+            .group_by(InventoryPolicyRecommendation.status)
+            .all()
+        )
+        return {status: count for status, count in rows}
+
+    def count_applied_since(self, since: datetime, notes_containing: str) -> int:
+        """Applied recommendations decided at or after `since` whose decision notes contain the text."""
+        return (
+            self.db.query(func.count(InventoryPolicyRecommendation.id))
+            .filter(
+                InventoryPolicyRecommendation.status == "applied",
+                InventoryPolicyRecommendation.decided_at >= since,
+                InventoryPolicyRecommendation.decision_notes.contains(notes_containing, autoescape=True),
+            )
+            .scalar()
+        )
+
+    def list_with_inventory(
+        self,
+        status: Optional[str] = None,
+        inventory_id: Optional[int] = None,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+        before_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Row]:
+        """Next page, newest first (keyset on id), of (recommendation, product_id, location) in one joined query."""
+        q = self.db.query(InventoryPolicyRecommendation, Inventory.product_id, Inventory.location).join(
+            Inventory, Inventory.id == InventoryPolicyRecommendation.inventory_id
+        )
+        if status:
+            q = q.filter(InventoryPolicyRecommendation.status == status)
+        if inventory_id:
+            q = q.filter(InventoryPolicyRecommendation.inventory_id == inventory_id)
+        if product_id:
+            q = q.filter(Inventory.product_id == product_id)
+        if location:
+            q = q.filter(Inventory.location == location)
+        if before_id:
+            q = q.filter(InventoryPolicyRecommendation.id < before_id)
+        return q.order_by(InventoryPolicyRecommendation.id.desc()).limit(limit).all()
+
+    def any_in_statuses(
+        self,
+        statuses: Sequence[str],
+        signal: Optional[str] = None,
+        scored: bool = False,
+        decided: bool = False,
+        with_notes: bool = False,
+    ) -> bool:
+        """EXISTS probe over recommendations in `statuses` matching every requested trait."""
+        criteria = [InventoryPolicyRecommendation.status.in_(list(statuses))]
+        if signal:
+            criteria.append(InventoryPolicyRecommendation.signals_json.contains(signal, autoescape=True))
+        if scored:
+            criteria.append(InventoryPolicyRecommendation.confidence_score.isnot(None))
+        if decided:
+            criteria.append(InventoryPolicyRecommendation.decided_by.isnot(None))
+        if with_notes:
+            criteria.append(func.coalesce(InventoryPolicyRecommendation.decision_notes, "") != "")
+        return self.any_where(*criteria)
+
     def get_latest_pending_by_inventory(
         self,
         inventory_id: int,
@@ -38,3 +108,78 @@ class InventoryRecommendationRepository(BaseRepository[InventoryPolicyRecommenda
             .order_by(InventoryPolicyRecommendation.created_at.desc())
             .first()
         )
+
+    def list_pending_apply_inputs(self, limit: int) -> List[Row]:
+        """Newest pending recommendations as plain columns, with their inventory row's quantities joined in."""
+        return (
+            self.db.query(
+                InventoryPolicyRecommendation.id,
+                InventoryPolicyRecommendation.inventory_id,
+                InventoryPolicyRecommendation.recommended_safety_stock,
+                InventoryPolicyRecommendation.recommended_reorder_point,
+                InventoryPolicyRecommendation.recommended_max_stock,
+                InventoryPolicyRecommendation.confidence_score,
+                InventoryPolicyRecommendation.signals_json,
+                Inventory.on_hand_qty,
+                Inventory.reorder_point.label("inventory_reorder_point"),
+            )
+            .join(Inventory, Inventory.id == InventoryPolicyRecommendation.inventory_id)
+            .filter(InventoryPolicyRecommendation.status == "pending")
+            .order_by(InventoryPolicyRecommendation.created_at.desc(), InventoryPolicyRecommendation.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def latest_pending_ids(self, inventory_ids: Iterable[int]) -> Dict[int, int]:
+        """Latest pending recommendation id per inventory row, in one query."""
+        ids = list(set(inventory_ids))
+        if not ids:
+            return {}
+        ranked = (
+            self.db.query(
+                InventoryPolicyRecommendation.id.label("id"),
+                InventoryPolicyRecommendation.inventory_id.label("inventory_id"),
+                func.row_number()
+                .over(
+                    partition_by=InventoryPolicyRecommendation.inventory_id,
+                    order_by=(
+                        InventoryPolicyRecommendation.created_at.desc(),
+                        InventoryPolicyRecommendation.id.desc(),
+                    ),
+                )
+                .label("rn"),
+            )
+            .filter(
+                InventoryPolicyRecommendation.inventory_id.in_(ids),
+                InventoryPolicyRecommendation.status == "pending",
+            )
+            .subquery()
+        )
+        rows = self.db.query(ranked.c.inventory_id, ranked.c.id).filter(ranked.c.rn == 1).all()
+        return {row[0]: row[1] for row in rows}
+
+    def get_many(self, ids: Sequence[int]) -> List[InventoryPolicyRecommendation]:
+        """Recommendations by id, in the order given."""
+        if not ids:
+            return []
+        found = {
+            rec.id: rec
+            for rec in self.db.query(InventoryPolicyRecommendation)
+            .filter(InventoryPolicyRecommendation.id.in_(list(ids)))
+            .all()
+        }
+        return [found[i] for i in ids if i in found]
+
+    def bulk_insert(self, rows: Sequence[Dict[str, Any]]) -> List[int]:
+        """INSERT many rows in one executemany; returns their ids in order. The caller commits."""
+        if not rows:
+            return []
+        stmt = insert(InventoryPolicyRecommendation).returning(
+            InventoryPolicyRecommendation.id, sort_by_parameter_order=True
+        )
+        return list(self.db.scalars(stmt, list(rows)).all())
+
+    def bulk_update(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """UPDATE many rows by primary key in one executemany; the caller commits."""
+        if rows:
+            self.db.execute(update(InventoryPolicyRecommendation), list(rows))
@@ -1,10 +1,13 @@
 """
 Inventory Repository — Repository Pattern (GoF)
 """
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Iterable, Optional, List, Sequence, Tuple
+from sqlalchemy import func, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from app.repositories.base import BaseRepository
 from app.models.inventory import Inventory
+from app.models.product import Product
 
 
 class InventoryRepository(BaseRepository[Inventory]):
@@ -53,14 +56,102 @@ class InventoryRepository(BaseRepository[Inventory]):
     def get_all_inventory(self) -> List[Inventory]:
         return self.db.query(Inventory).all()
 
+    def location_status_totals(self, location: Optional[str] = None) -> List[Row]:
+        """(location, status, count, value) for every location and status present."""
+        q = self.db.query(
+            Inventory.location,
+            Inventory.status,
+            func.count(Inventory.id).label("count"),
+            func.sum(Inventory.valuation).label("value"),
+        )
+        if location:
+            q = q.filter(Inventory.location == location)
+        return q.group_by(Inventory.location, Inventory.status).order_by(Inventory.location, Inventory.status).all()
+
+    def any_positive(self, column: str) -> bool:
+        """EXISTS probe for a row whose `column` (a policy quantity) is above zero."""
+        return self.any_where(getattr(Inventory, column) > 0)
+
+    def list_alert_rows(self, status: str, page: int = 1, page_size: int = 100) -> List[Row]:
+        """One page of rows in `status`, projected to the columns an alert shows."""
+        return (
+            self.db.query(Inventory.id, Inventory.product_id, Inventory.location, Inventory.on_hand_qty)
+            .filter(Inventory.status == status)
+            .order_by(Inventory.id)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
+
     def list_for_policy(
         self,
         product_id: Optional[int] = None,
         location: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[Inventory]:
-        q = self.db.query(Inventory)
+        q = self._policy_scope(self.db.query(Inventory), product_id, location).order_by(Inventory.id)
+        if limit is not None:
+            q = q.limit(limit)
+        return q.all()
+
+    def count_for_policy(self, product_id: Optional[int] = None, location: Optional[str] = None) -> int:
+        return self._policy_scope(self.db.query(Inventory), product_id, location).count()
+
+    def list_policy_inputs(
+        self,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+        after_id: int = 0,
+        limit: int = 1000,
+    ) -> List[Row]:
+        """Next chunk of policy inputs (keyset on id), with the product unit cost joined in."""
+        q = self.db.query(
+            Inventory.id,
+            Inventory.product_id,
+            Inventory.location,
+            Inventory.on_hand_qty,
+            Inventory.allocated_qty,
+            Inventory.in_transit_qty,
+            Inventory.safety_stock,
+            Inventory.reorder_point,
+            Inventory.max_stock,
+            Inventory.status,
+            Product.unit_cost.label("product_unit_cost"),
+        ).outerjoin(Product, Product.id == Inventory.product_id)
+        q = self._policy_scope(q, product_id, location).filter(Inventory.id > after_id)
+        return q.order_by(Inventory.id).limit(limit).all()
+
+    def list_for_products(self, product_ids: Iterable[int]) -> List[Inventory]:
+        ids = list(set(product_ids))
+        if not ids:
+            return []
+        return self.db.query(Inventory).filter(Inventory.product_id.in_(ids)).all()
+
+    def projection_signatures(self, product_id: Optional[int] = None) -> Dict[int, Tuple]:
+        """Per product: row count, quantity sums and last update — changes whenever a row does."""
+        q = self.db.query(
+            Inventory.product_id,
+            func.count(Inventory.id),
+            func.sum(Inventory.on_hand_qty),
+            func.sum(Inventory.allocated_qty),
+            func.sum(Inventory.in_transit_qty),
+            func.sum(Inventory.safety_stock),
+            func.sum(Inventory.max_stock),
+            func.max(Inventory.updated_at),
+        )
+        if product_id:
+            q = q.filter(Inventory.product_id == product_id)
+        return {row[0]: tuple(row[1:]) for row in q.group_by(Inventory.product_id).all()}
+
+    def bulk_update_policies(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """UPDATE many rows by primary key in one executemany; the caller commits."""
+        if rows:
+            self.db.execute(update(Inventory), list(rows))
+
+    @staticmethod
+    def _policy_scope(q, product_id: Optional[int], location: Optional[str]):
         if product_id:
             q = q.filter(Inventory.product_id == product_id)
         if location:
             q = q.filter(Inventory.location == location)
-        return q.all()
+        return q
@@ -0,0 +1,95 @@
+"""
+Inventory Status Rollup Repository — Repository Pattern (GoF)
+"""
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from sqlalchemy import delete, func, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.repositories.base import UPSERT_INSERTS, BaseRepository
+from app.models.inventory_status_rollup import InventoryStatusRollup
+
+RollupKey = Tuple[str, str]  # (scope, location)
+RollupDeltas = Dict[RollupKey, Dict[str, Union[int, Decimal]]]
+
+
+class InventoryRollupRepository(BaseRepository[InventoryStatusRollup]):
+
+    def __init__(self, db: Session):
+        super().__init__(InventoryStatusRollup, db)
+
+    # Rollup rows change through Core statements, so reads refresh identity-mapped rows.
+
+    def get_scope(self, scope: str, location: str = "") -> Optional[InventoryStatusRollup]:
+        return (
+            self.db.query(InventoryStatusRollup)
+            .populate_existing()
+            .filter(InventoryStatusRollup.scope == scope, InventoryStatusRollup.location == location)
+            .first()
+        )
+
+    def list_scope(self, scope: str) -> List[InventoryStatusRollup]:
+        return (
+            self.db.query(InventoryStatusRollup)
+            .populate_existing()
+            .filter(InventoryStatusRollup.scope == scope)
+            .order_by(InventoryStatusRollup.location)
+            .all()
+        )
+
+    def list_all(self) -> List[InventoryStatusRollup]:
+        return self.db.query(InventoryStatusRollup).populate_existing().all()
+
+    def apply_deltas(self, deltas: RollupDeltas) -> None:
+        """
+        Add per-column deltas to each rollup row, creating missing rows. Runs on the
+        session's connection inside the current transaction; the caller commits.
+
+        Each row is one atomic upsert on UNIQUE(scope, location), so concurrent
+        writers creating the same row add up instead of one failing on the insert.
+        """
+        table = InventoryStatusRollup.__table__
+        connection = self.db.connection()
+        dialect_insert = UPSERT_INSERTS.get(connection.dialect.name)
+        for (scope, location), changes in deltas.items():
+            changes = {column: value for column, value in changes.items() if value}
+            if not changes:
+                continue
+            if dialect_insert is None:
+                self._update_or_insert(connection, scope, location, changes)
+                continue
+            statement = dialect_insert(table).values(scope=scope, location=location, **changes)
+            connection.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[table.c.scope, table.c.location],
+                    set_={
+                        **{column: table.c[column] + statement.excluded[column] for column in changes},
+                        "updated_at": func.now(),
+                    },
+                )
+            )
+
+    def _update_or_insert(self, connection, scope: str, location: str, changes: Dict) -> None:
+        """UPDATE, else INSERT in a savepoint; a concurrent insert of the row falls back to the UPDATE."""
+        table = InventoryStatusRollup.__table__
+        add = update(table).where(table.c.scope == scope, table.c.location == location).values(
+            {**{column: table.c[column] + value for column, value in changes.items()}, "updated_at": func.now()}
+        )
+        if connection.execute(add).rowcount:
+            return
+        try:
+            with connection.begin_nested():
+                connection.execute(insert(table).values(scope=scope, location=location, **changes))
+        except IntegrityError:
+            connection.execute(add)
+
+    def replace_all(self, rows: Sequence[Dict], reconciled_at: datetime) -> None:
+        """Swap every rollup row for `rows`; the caller commits."""
+        table = InventoryStatusRollup.__table__
+        self.db.execute(delete(table))
+        if rows:
+            self.db.execute(
+                insert(table),
+                [{**row, "updated_at": reconciled_at, "reconciled_at": reconciled_at} for row in rows],
+            )
@@ -1,7 +1,7 @@
 """
 Product Repository — Repository Pattern (GoF)
 """
-from typing import Optional, List, Tuple
+from typing import Dict, Iterable, Optional, List, Tuple
 from sqlalchemy.orm import Session
 from app.repositories.base import BaseRepository
 from app.models.product import Product, Category
@@ -39,6 +39,20 @@ class ProductRepository(BaseRepository[Product]):
     def get_active(self) -> List[Product]:
         return self.db.query(Product).filter(Product.status == "active").all()
 
+    def lead_times(self, product_ids: Iterable[int]) -> Dict[int, Optional[int]]:
+        ids = list(set(product_ids))
+        if not ids:
+            return {}
+        rows = self.db.query(Product.id, Product.lead_time_days).filter(Product.id.in_(ids)).all()
+        return {row[0]: row[1] for row in rows}
+
+    def names(self, product_ids: Iterable[int]) -> Dict[int, str]:
+        ids = list(set(product_ids))
+        if not ids:
+            return {}
+        rows = self.db.query(Product.id, Product.name).filter(Product.id.in_(ids)).all()
+        return {row[0]: row[1] for row in rows}
+
 
 class CategoryRepository(BaseRepository[Category]):
 
@@ -1,8 +1,10 @@
 """
 Supply Plan Repository — Repository Pattern (GoF)
 """
-from typing import Optional, List, Tuple
+from typing import Dict, Iterable, Optional, List, Tuple
+from sqlalchemy.engine import Row
 from datetime import date
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.repositories.base import BaseRepository
 from app.models.supply_plan import SupplyPlan
@@ -60,3 +62,75 @@ class SupplyPlanRepository(BaseRepository[SupplyPlan]):
             .order_by(SupplyPlan.period.desc(), SupplyPlan.version.desc())
             .first()
         )
+
+    def latest_lead_times(self, product_ids: Iterable[int]) -> Dict[int, Optional[int]]:
+        """Lead time of each product's latest plan (same ordering as get_latest_by_product)."""
+        ids = list(set(product_ids))
+        if not ids:
+            return {}
+        ranked = (
+            self.db.query(
+                SupplyPlan.product_id.label("product_id"),
+                SupplyPlan.lead_time_days.label("lead_time_days"),
+                func.row_number()
+                .over(
+                    partition_by=SupplyPlan.product_id,
+                    order_by=(SupplyPlan.period.desc(), SupplyPlan.version.desc()),
+                )
+                .label("rank"),
+            )
+            .filter(SupplyPlan.product_id.in_(ids))
+            .subquery()
+        )
+        rows = (
+            self.db.query(ranked.c.product_id, ranked.c.lead_time_days)
+            .filter(ranked.c.rank == 1)
+            .all()
+        )
+        return {row.product_id: row.lead_time_days for row in rows}
+
+    def scheduled_supply(self, product_ids: Iterable[int], period_from: date, period_to: date) -> List[Row]:
+        """(product_id, location, period, planned_prod_qty) of the latest version per product/period/location."""
+        ids = list(set(product_ids))
+        if not ids:
+            return []
+        ranked = (
+            self.db.query(
+                SupplyPlan.product_id.label("product_id"),
+                SupplyPlan.location.label("location"),
+                SupplyPlan.period.label("period"),
+                SupplyPlan.planned_prod_qty.label("planned_prod_qty"),
+                func.row_number()
+                .over(
+                    partition_by=(SupplyPlan.product_id, SupplyPlan.period, SupplyPlan.location),
+                    order_by=SupplyPlan.version.desc(),
+                )
+                .label("rank"),
+            )
+            .filter(
+                SupplyPlan.product_id.in_(ids),
+                SupplyPlan.period >= period_from,
+                SupplyPlan.period < period_to,
+            )
+            .subquery()
+        )
+        return (
+            self.db.query(ranked.c.product_id, ranked.c.location, ranked.c.period, ranked.c.planned_prod_qty)
+            .filter(ranked.c.rank == 1)
+            .all()
+        )
+
+    def projection_signatures(
+        self, period_from: date, period_to: date, product_id: Optional[int] = None
+    ) -> Dict[int, Tuple]:
+        """Per product: plan count, planned quantity and last update within [period_from, period_to)."""
+        q = self.db.query(
+            SupplyPlan.product_id,
+            func.count(SupplyPlan.id),
+            func.sum(SupplyPlan.planned_prod_qty),
+            func.max(SupplyPlan.version),
+            func.max(SupplyPlan.updated_at),
+        ).filter(SupplyPlan.period >= period_from, SupplyPlan.period < period_to)
+        if product_id:
+            q = q.filter(SupplyPlan.product_id == product_id)
+        return {row[0]: tuple(row[1:]) for row in q.group_by(SupplyPlan.product_id).all()}
@@ -1,7 +1,7 @@
 """
 Dashboard Router — Thin Controller (SRP / DIP)
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -26,10 +26,11 @@ def dashboard_summary(
 
 @router.get("/alerts")
 def dashboard_alerts(
+    limit: int = Query(100, ge=1, le=1000),
     service: DashboardService = Depends(get_dashboard_service),
     _: User = Depends(get_current_user),
 ):
-    return service.get_alerts()
+    return service.get_alerts(limit=limit)
 
 
 @router.get("/sop-status")
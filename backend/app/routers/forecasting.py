@@ -3,11 +3,13 @@ Forecasting Router — Thin Controller (SRP / DIP)
 Uses ForecastService which internally uses Strategy + Factory patterns.
 """
 from fastapi import APIRouter, Depends, Query, Response, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
 from datetime import date
 import json
 
+from app.config import settings
 from app.database import get_db
 from app.models.user import User
 from app.dependencies import get_current_user, require_roles
@@ -20,9 +22,13 @@ from app.schemas.forecast_consensus import (
 from app.services.forecast_consensus_service import ForecastConsensusService
 from app.services.forecast_service import ForecastService
 from app.services.forecast_job_service import forecast_job_service
+from app.services.forecast_delta_service import ForecastDeltaService
+from app.services.forecast_job_events import stream_job_events
+from app.ml.artifact_registry import get_model_artifact_registry
 
 router = APIRouter(prefix="/forecasting", tags=["AI Forecasting"])
 
+MAX_STREAMED_JOBS = 100
 PLANNER_ROLES = ["admin", "demand_planner", "supply_planner", "finance_analyst", "sop_coordinator"]
 OPS_ROLES = ["admin", "sop_coordinator", "executive"]
 
@@ -65,6 +71,12 @@ def generate_forecast(
         None,
         description="Optional JSON object string with model parameters for selected model",
     ),
+    interval_mode: str = Query(
+        "model",
+        pattern="^(model|conformal)$",
+        description="'model' keeps each strategy's own bounds; 'conformal' uses backtest-calibrated intervals",
+    ),
+    coverage: float = Query(0.9, ge=0.5, lt=1.0),
     service: ForecastService = Depends(get_forecast_service),
     current_user: User = Depends(require_roles(PLANNER_ROLES)),
 ):
@@ -76,6 +88,8 @@ def generate_forecast(
         horizon=horizon,
         user_id=current_user.id,
         model_params=parsed_model_params,
+        interval_mode=interval_mode,
+        coverage=coverage,
     )
     results = payload["forecasts"]
     return {
@@ -91,6 +105,7 @@ def generate_forecast(
                 "upper_bound": float(f.upper_bound) if f.upper_bound else None,
                 "confidence": float(f.confidence) if f.confidence else None,
                 "model_type": f.model_type,
+                "model_version": f.model_version,
             }
             for f in results
         ],
@@ -117,21 +132,26 @@ def generate_forecast_job(
     product_id: int,
     horizon: int = Query(6, ge=1, le=24),
     model_type: Optional[str] = None,
+    lane: str = Query("interactive", pattern="^(interactive|bulk)$"),
     current_user: User = Depends(require_roles(PLANNER_ROLES)),
 ):
     """
     Enqueue asynchronous forecast generation job.
-    Returns immediately with a job identifier.
+    Returns immediately with a job identifier. An identical queued/running job is
+    reused: the new job follows it (`coalesced_into`) and receives its result.
     """
     job = forecast_job_service.enqueue_forecast(
         product_id=product_id,
         horizon=horizon,
         model_type=model_type,
         requested_by=current_user.id,
+        lane=lane,
     )
     return {
         "job_id": job.job_id,
         "status": job.status,
+        "lane": job.lane,
+        "coalesced_into": job.coalesced_into,
         "product_id": job.product_id,
         "horizon": job.horizon,
         "model_type": job.model_type,
@@ -140,6 +160,32 @@ def generate_forecast_job(
     }
 
 
+@router.post("/jobs/delta-run")
+def run_delta_forecast_refresh(
+    horizon: int = Query(6, ge=1, le=24),
+    model_type: Optional[str] = None,
+    model_params: Optional[str] = Query(
+        None,
+        description="Optional JSON object string with model parameters for selected model",
+    ),
+    force: bool = Query(False, description="Enqueue every eligible product regardless of fingerprint"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_roles(OPS_ROLES)),
+):
+    """
+    Enqueue forecast jobs only for products whose inputs (actuals, lead time,
+    model params, horizon) changed since their last completed refresh.
+    """
+    parsed_model_params = _parse_json_query(model_params, "model_params")
+    return ForecastDeltaService(db).run(
+        horizon=horizon,
+        model_type=model_type,
+        requested_by=current_user.id,
+        model_params=parsed_model_params,
+        force=force,
+    )
+
+
 @router.get("/jobs")
 def list_forecast_jobs(
     limit: int = Query(50, ge=1, le=200),
@@ -151,6 +197,8 @@ def list_forecast_jobs(
         {
             "job_id": job.job_id,
             "status": job.status,
+            "lane": job.lane,
+            "coalesced_into": job.coalesced_into,
             "product_id": job.product_id,
             "horizon": job.horizon,
             "model_type": job.model_type,
@@ -221,6 +269,59 @@ def cleanup_forecast_jobs(
     )
 
 
+@router.get("/resource-usage")
+def forecast_resource_usage(
+    days: int = Query(7, ge=1, le=90),
+    service: ForecastService = Depends(get_forecast_service),
+    _: User = Depends(require_roles(OPS_ROLES)),
+):
+    """Forecast compute by selected model, backtested model and stage over recent runs."""
+    return service.get_resource_usage_summary(days=days)
+
+
+@router.get("/artifacts/stats")
+def model_artifact_stats(
+    _: User = Depends(require_roles(OPS_ROLES)),
+):
+    """Size, hit/miss and eviction counters for the persisted model artifact registry."""
+    return get_model_artifact_registry().stats()
+
+
+def _job_event_stream(job_ids: List[str]) -> StreamingResponse:
+    return StreamingResponse(
+        stream_job_events(
+            job_ids,
+            forecast_job_service,
+            poll_seconds=settings.FORECAST_JOB_EVENTS_POLL_SECONDS,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/jobs/events")
+def stream_forecast_jobs_events(
+    job_ids: str = Query(..., description="Comma-separated job ids"),
+    _: User = Depends(get_current_user),
+):
+    """Server-Sent Events for several jobs on one connection (status and progress)."""
+    ids = list(dict.fromkeys(j.strip() for j in job_ids.split(",") if j.strip()))
+    if not ids:
+        raise HTTPException(status_code=422, detail="job_ids must contain at least one job id")
+    if len(ids) > MAX_STREAMED_JOBS:
+        raise HTTPException(status_code=422, detail=f"At most {MAX_STREAMED_JOBS} job ids per stream")
+    return _job_event_stream(ids)
+
+
+@router.get("/jobs/{job_id}/events")
+def stream_forecast_job_events(
+    job_id: str,
+    _: User = Depends(get_current_user),
+):
+    """Server-Sent Events for one job: status transitions and backtest/fit progress."""
+    return _job_event_stream([job_id])
+
+
 @router.get("/jobs/{job_id}")
 def get_forecast_job(
     job_id: str,
@@ -241,6 +342,8 @@ def get_forecast_job(
     return {
         "job_id": job.job_id,
         "status": job.status,
+        "lane": job.lane,
+        "coalesced_into": job.coalesced_into,
         "product_id": job.product_id,
         "horizon": job.horizon,
         "model_type": job.model_type,
@@ -250,6 +353,7 @@ def get_forecast_job(
         "completed_at": job.completed_at.isoformat() if job.completed_at else None,
         "error": job.error,
         "result": result_payload,
+        "resource_usage": json.loads(job.resource_usage_json) if job.resource_usage_json else None,
     }
 
 
@@ -286,6 +390,7 @@ def list_forecast_results(
             "upper_bound": float(f.upper_bound) if f.upper_bound else None,
             "confidence": float(f.confidence) if f.confidence else None,
             "mape": float(f.mape) if f.mape else None,
+            "model_version": f.model_version,
         } | {
             "run_audit_id": _parse_features(f.features_used).get("run_audit_id"),
             "selection_reason": _parse_features(f.features_used).get("selection_reason"),
@@ -293,6 +398,7 @@ def list_forecast_results(
             "advisor_enabled": _parse_features(f.features_used).get("advisor_enabled"),
             "fallback_used": _parse_features(f.features_used).get("fallback_used"),
             "model_params": _parse_features(f.features_used).get("model_params"),
+            "interval_mode": _parse_features(f.features_used).get("interval_mode"),
             "warnings": _parse_features(f.features_used).get("warnings"),
         })
         for f in results
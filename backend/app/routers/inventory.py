@@ -4,6 +4,7 @@ Inventory Router — Thin Controller (SRP / DIP)
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import Optional
+from datetime import date
 from decimal import Decimal
 
 from app.database import get_db
@@ -25,6 +26,8 @@ from app.schemas.inventory import (
     InventoryRebalanceRecommendationView,
     InventoryAutoApplyRequest,
     InventoryAutoApplyResponse,
+    InventoryRebalancePlanResponse,
+    InventoryRebalanceRequest,
     InventoryControlTowerSummary,
     InventoryDataQualityView,
     InventoryEscalationItem,
@@ -32,10 +35,24 @@ from app.schemas.inventory import (
     InventoryAssessmentScorecard,
     InventoryServiceLevelAnalyticsRequest,
     InventoryServiceLevelAnalyticsResponse,
+    InventoryStatsCacheMetrics,
+    InventoryNetworkServiceLevelRequest,
+    InventoryNetworkServiceLevelResponse,
     InventoryPolicyRunView,
+    InventoryProjectionListResponse,
+    InventoryProjectionRefreshRequest,
+    InventoryProjectionRefreshResponse,
+    InventoryRollupReconcileResponse,
+    InventoryPositionCaptureRequest,
+    InventoryPositionCaptureResponse,
+    InventoryPositionHistoryResponse,
 )
 from app.dependencies import get_current_user, require_roles
 from app.services.inventory_service import InventoryService
+from app.services.inventory_optimization_runner import inventory_optimization_runner
+from app.services.inventory_projection_service import InventoryProjectionService
+from app.services.inventory_position_history_service import InventoryPositionHistoryService
+from app.services.inventory_rollup_service import InventoryRollupService
 
 router = APIRouter(prefix="/inventory", tags=["Inventory Management"])
 
@@ -46,6 +63,18 @@ def get_inventory_service(db: Session = Depends(get_db)) -> InventoryService:
     return InventoryService(db)
 
 
+def get_inventory_projection_service(db: Session = Depends(get_db)) -> InventoryProjectionService:
+    return InventoryProjectionService(db)
+
+
+def get_inventory_rollup_service(db: Session = Depends(get_db)) -> InventoryRollupService:
+    return InventoryRollupService(db)
+
+
+def get_inventory_position_history_service(db: Session = Depends(get_db)) -> InventoryPositionHistoryService:
+    return InventoryPositionHistoryService(db)
+
+
 @router.get("", response_model=InventoryListResponse)
 def list_inventory(
     page: int = Query(1, ge=1),
@@ -64,18 +93,22 @@ def list_inventory(
 
 @router.get("/health", response_model=InventoryHealthSummary)
 def inventory_health(
+    location: Optional[str] = None,
+    by_location: bool = False,
     service: InventoryService = Depends(get_inventory_service),
     _: User = Depends(get_current_user),
 ):
-    return service.get_health_summary()
+    return service.get_health_summary(location=location, by_location=by_location)
 
 
 @router.get("/alerts")
 def inventory_alerts(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(100, ge=1, le=1000),
     service: InventoryService = Depends(get_inventory_service),
     _: User = Depends(get_current_user),
 ):
-    return service.get_alerts()
+    return service.get_alerts(page=page, page_size=page_size)
 
 
 @router.post("/optimization/runs", response_model=InventoryOptimizationRunResponse)
@@ -87,10 +120,35 @@ def run_inventory_optimization(
     return service.run_optimization(payload, user_id=current_user.id)
 
 
+@router.post("/optimization/runs/async", response_model=InventoryPolicyRunView, status_code=202)
+def submit_inventory_optimization(
+    payload: InventoryOptimizationRunRequest,
+    service: InventoryService = Depends(get_inventory_service),
+    current_user: User = Depends(require_roles(MANAGER_ROLES)),
+):
+    """
+    Queue an optimization run and return immediately. The scope is processed in
+    checkpointed chunks; poll `/optimization/runs/{run_id}` for progress.
+    """
+    run = inventory_optimization_runner.enqueue(payload, user_id=current_user.id)
+    return service.get_optimization_run(run_id=run.run_id)
+
+
+@router.post("/optimization/runs/{run_id}/resume", response_model=InventoryPolicyRunView, status_code=202)
+def resume_inventory_optimization_run(
+    run_id: str,
+    service: InventoryService = Depends(get_inventory_service),
+    _: User = Depends(require_roles(MANAGER_ROLES)),
+):
+    """Resume a failed or stalled run from its last checkpoint."""
+    inventory_optimization_runner.resume(run_id)
+    return service.get_optimization_run(run_id=run_id)
+
+
 @router.get("/optimization/runs", response_model=list[InventoryPolicyRunView])
 def list_inventory_optimization_runs(
     limit: int = Query(50, ge=1, le=200),
-    status: Optional[str] = Query(None, description="Filter by status: running|completed|failed"),
+    status: Optional[str] = Query(None, description="Filter by status: queued|running|completed|failed"),
     service: InventoryService = Depends(get_inventory_service),
     _: User = Depends(require_roles(MANAGER_ROLES)),
 ):
@@ -112,6 +170,9 @@ def get_inventory_policy_exceptions(
     location: Optional[str] = None,
     status: Optional[str] = None,
     owner_user_id: Optional[int] = None,
+    severity: Optional[str] = None,
+    after_id: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=5000, description="Page size; omit for the full list"),
     service: InventoryService = Depends(get_inventory_service),
     _: User = Depends(get_current_user),
 ):
@@ -120,6 +181,9 @@ def get_inventory_policy_exceptions(
         location=location,
         status=status,
         owner_user_id=owner_user_id,
+        severity=severity,
+        after_id=after_id,
+        limit=limit,
     )
 
 
@@ -148,6 +212,8 @@ def list_inventory_policy_recommendations(
     inventory_id: Optional[int] = None,
     product_id: Optional[int] = None,
     location: Optional[str] = None,
+    before_id: Optional[int] = Query(None, ge=1),
+    limit: Optional[int] = Query(None, ge=1, le=5000, description="Page size; omit for the full list"),
     service: InventoryService = Depends(get_inventory_service),
     _: User = Depends(get_current_user),
 ):
@@ -156,6 +222,8 @@ def list_inventory_policy_recommendations(
         inventory_id=inventory_id,
         product_id=product_id,
         location=location,
+        before_id=before_id,
+        limit=limit,
     )
 
 
@@ -192,6 +260,15 @@ def get_inventory_rebalance_recommendations(
     )
 
 
+@router.post("/rebalance/optimize", response_model=InventoryRebalancePlanResponse)
+def optimize_inventory_rebalance(
+    payload: InventoryRebalanceRequest,
+    service: InventoryService = Depends(get_inventory_service),
+    _: User = Depends(get_current_user),
+):
+    return service.plan_rebalance(payload)
+
+
 @router.post("/recommendations/auto-apply", response_model=InventoryAutoApplyResponse)
 def auto_apply_inventory_recommendations(
     payload: InventoryAutoApplyRequest,
@@ -221,18 +298,34 @@ def get_inventory_data_quality(
 
 @router.get("/control-tower/escalations", response_model=list[InventoryEscalationItem])
 def get_inventory_control_tower_escalations(
+    level: Optional[str] = Query(None, pattern="^L[12]$"),
+    severity: Optional[str] = None,
+    owner_user_id: Optional[int] = None,
+    product_id: Optional[int] = None,
+    location: Optional[str] = None,
+    after_id: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=5000, description="Page size; omit for the full list"),
     service: InventoryService = Depends(get_inventory_service),
     _: User = Depends(get_current_user),
 ):
-    return service.get_escalations()
+    return service.get_escalations(
+        level=level,
+        severity=severity,
+        owner_user_id=owner_user_id,
+        product_id=product_id,
+        location=location,
+        after_id=after_id,
+        limit=limit,
+    )
 
 
 @router.get("/finance/working-capital", response_model=InventoryWorkingCapitalSummary)
 def get_inventory_working_capital_summary(
+    location: Optional[str] = None,
     service: InventoryService = Depends(get_inventory_service),
     _: User = Depends(get_current_user),
 ):
-    return service.get_working_capital_summary()
+    return service.get_working_capital_summary(location=location)
 
 
 @router.get("/assessment/scorecard", response_model=InventoryAssessmentScorecard)
@@ -252,6 +345,90 @@ def get_inventory_service_level_analytics(
     return service.analyze_service_level_under_uncertainty(payload)
 
 
+@router.post("/analytics/service-level/network", response_model=InventoryNetworkServiceLevelResponse)
+def get_inventory_network_service_levels(
+    payload: InventoryNetworkServiceLevelRequest,
+    service: InventoryService = Depends(get_inventory_service),
+    _: User = Depends(get_current_user),
+):
+    return service.analyze_network_service_levels(payload)
+
+
+@router.get("/analytics/stats-cache", response_model=InventoryStatsCacheMetrics)
+def get_inventory_stats_cache_metrics(
+    service: InventoryService = Depends(get_inventory_service),
+    _: User = Depends(require_roles(MANAGER_ROLES)),
+):
+    """Size, hit rate and invalidation count of the per-product statistics cache."""
+    return service.get_stats_cache_metrics()
+
+
+@router.get("/projections", response_model=InventoryProjectionListResponse)
+def list_inventory_projections(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+    product_id: Optional[int] = None,
+    location: Optional[str] = None,
+    status: Optional[str] = Query(None, pattern="^(stockout|below_safety|excess|ok)$"),
+    service: InventoryProjectionService = Depends(get_inventory_projection_service),
+    _: User = Depends(get_current_user),
+):
+    """Stored projected available balance per product-location, as of the last refresh."""
+    return service.list_projections(
+        page=page, page_size=page_size, product_id=product_id, location=location, status=status
+    )
+
+
+@router.post("/projections/refresh", response_model=InventoryProjectionRefreshResponse)
+def refresh_inventory_projections(
+    payload: InventoryProjectionRefreshRequest,
+    service: InventoryProjectionService = Depends(get_inventory_projection_service),
+    _: User = Depends(require_roles(MANAGER_ROLES)),
+):
+    return service.refresh(product_id=payload.product_id, force=payload.force)
+
+
+@router.post("/rollups/reconcile", response_model=InventoryRollupReconcileResponse)
+def reconcile_inventory_rollups(
+    service: InventoryRollupService = Depends(get_inventory_rollup_service),
+    _: User = Depends(require_roles(MANAGER_ROLES)),
+):
+    """Rebuild the status rollups from the inventory table and report any drift found."""
+    return service.reconcile()
+
+
+@router.post("/positions/snapshots", response_model=InventoryPositionCaptureResponse)
+def capture_inventory_positions(
+    payload: InventoryPositionCaptureRequest,
+    service: InventoryPositionHistoryService = Depends(get_inventory_position_history_service),
+    _: User = Depends(require_roles(MANAGER_ROLES)),
+):
+    """Snapshot every inventory row's position for today; skipped when today is already captured unless forced."""
+    return service.capture(force=payload.force)
+
+
+@router.get("/positions/history", response_model=InventoryPositionHistoryResponse)
+def get_inventory_position_history(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    max_points: int = Query(300, ge=2, le=2000),
+    product_id: Optional[int] = None,
+    location: Optional[str] = None,
+    inventory_id: Optional[int] = None,
+    service: InventoryPositionHistoryService = Depends(get_inventory_position_history_service),
+    _: User = Depends(get_current_user),
+):
+    """Daily position totals for the scope, averaged into at most `max_points` equal buckets."""
+    return service.history(
+        start_date=start_date,
+        end_date=end_date,
+        max_points=max_points,
+        product_id=product_id,
+        location=location,
+        inventory_id=inventory_id,
+    )
+
+
 @router.get("/{inventory_id}", response_model=InventoryResponse)
 def get_inventory(
     inventory_id: int,
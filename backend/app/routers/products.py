@@ -10,6 +10,7 @@ from app.schemas.product import (
     CategoryCreate, CategoryResponse
 )
 from app.dependencies import get_current_user, require_roles
+from app.utils.events import EntityUpdatedEvent, get_event_bus
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
@@ -93,15 +94,20 @@ def update_product(
     product_id: int,
     data: ProductUpdate,
     db: Session = Depends(get_db),
-    _: User = Depends(require_roles(["admin"])),
+    current_user: User = Depends(require_roles(["admin"])),
 ):
     product = db.query(Product).filter(Product.id == product_id).first()
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    for field, value in data.model_dump(exclude_unset=True).items():
+    updates = data.model_dump(exclude_unset=True)
+    for field, value in updates.items():
         setattr(product, field, value)
     db.commit()
     db.refresh(product)
+    get_event_bus().publish(EntityUpdatedEvent(
+        entity_type="product", entity_id=product_id, user_id=current_user.id,
+        new_values={field: str(value) for field, value in updates.items()},
+    ))
     return product
 
 
@@ -0,0 +1,101 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.dependencies import require_roles
+from app.models.user import User
+from app.schemas.batch_schedule import (
+    BatchScheduleCreateRequest,
+    BatchScheduleResponse,
+    BatchScheduleRunResponse,
+    BatchScheduleUpdateRequest,
+    SchedulerStatusResponse,
+)
+from app.services.batch_schedule_service import BatchScheduleService
+
+
+router = APIRouter(prefix="/scheduler", tags=["Batch Scheduler"])
+
+OPS_ROLES = ["admin", "sop_coordinator", "executive"]
+ADMIN_ROLES = ["admin", "sop_coordinator"]
+
+
+def get_batch_schedule_service(db: Session = Depends(get_db)) -> BatchScheduleService:
+    return BatchScheduleService(db)
+
+
+@router.get("/status", response_model=SchedulerStatusResponse)
+def scheduler_status(
+    service: BatchScheduleService = Depends(get_batch_schedule_service),
+    _: User = Depends(require_roles(OPS_ROLES)),
+):
+    """Leader lease, in-process loop state and running batch count."""
+    return service.get_status()
+
+
+@router.get("/schedules", response_model=List[BatchScheduleResponse])
+def list_schedules(
+    service: BatchScheduleService = Depends(get_batch_schedule_service),
+    _: User = Depends(require_roles(OPS_ROLES)),
+):
+    return service.list_schedules()
+
+
+@router.post("/schedules", response_model=BatchScheduleResponse, status_code=201)
+def create_schedule(
+    body: BatchScheduleCreateRequest,
+    service: BatchScheduleService = Depends(get_batch_schedule_service),
+    current_user: User = Depends(require_roles(ADMIN_ROLES)),
+):
+    return service.create_schedule(body=body, user_id=current_user.id)
+
+
+@router.get("/schedules/{schedule_id}", response_model=BatchScheduleResponse)
+def get_schedule(
+    schedule_id: int,
+    service: BatchScheduleService = Depends(get_batch_schedule_service),
+    _: User = Depends(require_roles(OPS_ROLES)),
+):
+    return service.get_schedule(schedule_id)
+
+
+@router.patch("/schedules/{schedule_id}", response_model=BatchScheduleResponse)
+def update_schedule(
+    schedule_id: int,
+    body: BatchScheduleUpdateRequest,
+    service: BatchScheduleService = Depends(get_batch_schedule_service),
+    _: User = Depends(require_roles(ADMIN_ROLES)),
+):
+    return service.update_schedule(schedule_id=schedule_id, body=body)
+
+
+@router.delete("/schedules/{schedule_id}", status_code=204)
+def delete_schedule(
+    schedule_id: int,
+    service: BatchScheduleService = Depends(get_batch_schedule_service),
+    _: User = Depends(require_roles(ADMIN_ROLES)),
+):
+    service.delete_schedule(schedule_id)
+    return Response(status_code=204)
+
+
+@router.post("/schedules/{schedule_id}/run", response_model=BatchScheduleRunResponse, status_code=202)
+def run_schedule_now(
+    schedule_id: int,
+    service: BatchScheduleService = Depends(get_batch_schedule_service),
+    _: User = Depends(require_roles(ADMIN_ROLES)),
+):
+    """Trigger a schedule immediately (subject to its concurrency caps and load gate)."""
+    return service.run_now(schedule_id)
+
+
+@router.get("/schedules/{schedule_id}/runs", response_model=List[BatchScheduleRunResponse])
+def list_schedule_runs(
+    schedule_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    service: BatchScheduleService = Depends(get_batch_schedule_service),
+    _: User = Depends(require_roles(OPS_ROLES)),
+):
+    return service.list_runs(schedule_id=schedule_id, limit=limit)
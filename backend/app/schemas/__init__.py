@@ -7,6 +7,13 @@ from app.schemas.inventory import (
     InventoryResponse,
     InventoryListResponse,
     InventoryHealthSummary,
+    InventoryLocationHealth,
+    InventoryRollupReconcileResponse,
+    InventoryStatsCacheMetrics,
+    InventoryPositionCaptureRequest,
+    InventoryPositionCaptureResponse,
+    InventoryPositionHistoryPoint,
+    InventoryPositionHistoryResponse,
     InventoryOptimizationRunRequest,
     InventoryOptimizationRunResponse,
     InventoryPolicyOverride,
@@ -17,7 +24,11 @@ from app.schemas.inventory import (
     InventoryRecommendationDecisionRequest,
     InventoryRecommendationApproveRequest,
     InventoryRebalanceRecommendationView,
+    InventoryRebalanceLane,
+    InventoryRebalanceRequest,
+    InventoryRebalancePlanResponse,
     InventoryAutoApplyRequest,
+    InventoryAutoApplyItem,
     InventoryAutoApplyResponse,
     InventoryControlTowerSummary,
     InventoryDataQualityView,
@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.utils.cron import CronExpression
+
+JOB_TYPE_PATTERN = "^(forecast_refresh|inventory_optimization|forecast_job_cleanup|inventory_rollup_reconcile|inventory_position_snapshot|inventory_projection_refresh)$"
+WINDOW_PATTERN = r"^([01]\d|2[0-3]):[0-5]\d$"
+
+
+def _validate_cron(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return value
+    CronExpression(value)
+    return value.strip()
+
+
+class BatchScheduleCreateRequest(BaseModel):
+    name: str = Field(min_length=1, max_length=100)
+    job_type: str = Field(pattern=JOB_TYPE_PATTERN)
+    cron_expression: str = Field(min_length=1, max_length=100)
+    parameters: Dict[str, Any] = Field(default_factory=dict)
+    enabled: bool = True
+    window_start: Optional[str] = Field(None, pattern=WINDOW_PATTERN)
+    window_end: Optional[str] = Field(None, pattern=WINDOW_PATTERN)
+    max_concurrency: int = Field(1, ge=1, le=8)
+    max_cpu_percent: Optional[int] = Field(None, ge=1, le=100)
+    max_runtime_minutes: int = Field(240, ge=1, le=1440)
+
+    _cron = field_validator("cron_expression")(_validate_cron)
+
+
+class BatchScheduleUpdateRequest(BaseModel):
+    cron_expression: Optional[str] = Field(None, min_length=1, max_length=100)
+    parameters: Optional[Dict[str, Any]] = None
+    enabled: Optional[bool] = None
+    window_start: Optional[str] = Field(None, pattern=WINDOW_PATTERN)
+    window_end: Optional[str] = Field(None, pattern=WINDOW_PATTERN)
+    max_concurrency: Optional[int] = Field(None, ge=1, le=8)
+    max_cpu_percent: Optional[int] = Field(None, ge=1, le=100)
+    max_runtime_minutes: Optional[int] = Field(None, ge=1, le=1440)
+
+    _cron = field_validator("cron_expression")(_validate_cron)
+
+
+class BatchScheduleResponse(BaseModel):
+    id: int
+    name: str
+    job_type: str
+    cron_expression: str
+    parameters: Dict[str, Any]
+    enabled: bool
+    window_start: Optional[str] = None
+    window_end: Optional[str] = None
+    max_concurrency: int
+    max_cpu_percent: Optional[int] = None
+    max_runtime_minutes: int
+    next_run_at: Optional[datetime] = None
+    last_run_at: Optional[datetime] = None
+    last_status: Optional[str] = None
+    last_error: Optional[str] = None
+    created_by: int
+    created_at: datetime
+    updated_at: datetime
+    upcoming_runs: List[datetime] = Field(default_factory=list)
+
+
+class BatchScheduleRunResponse(BaseModel):
+    id: int
+    schedule_id: int
+    status: str
+    trigger: str
+    scheduled_for: Optional[datetime] = None
+    worker_id: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    started_at: datetime
+    completed_at: Optional[datetime] = None
+
+
+class SchedulerStatusResponse(BaseModel):
+    enabled: bool
+    running_in_process: bool
+    worker_id: str
+    leader: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    running_runs: int
+    max_concurrent_runs: int
@@ -48,6 +48,16 @@ class InventoryOptimizationRunRequest(BaseModel):
     lot_size_units: Optional[Decimal] = Field(None, ge=0)
     capacity_max_units: Optional[Decimal] = Field(None, ge=0)
     lead_time_variability_days: Optional[Decimal] = Field(None, ge=0)
+    method: str = Field(
+        "formula",
+        pattern="^(formula|simulation)$",
+        description="formula: closed-form z * sigma * sqrt(LT); simulation: search (s, S) candidates by simulation",
+    )
+    simulation_paths: int = Field(100, ge=10, le=2000)
+    simulation_horizon_days: int = Field(180, ge=30, le=730)
+    holding_cost_rate: float = Field(0.25, ge=0, le=5, description="Annual holding cost as a fraction of unit cost")
+    ordering_cost: float = Field(0.0, ge=0, description="Fixed cost per replenishment order")
+    seed: Optional[int] = Field(None, ge=0, le=2**32 - 1, description="Seed for reproducible simulations")
 
 
 class InventoryExceptionView(BaseModel):
@@ -117,11 +127,24 @@ class InventoryAutoApplyRequest(BaseModel):
     dry_run: bool = False
 
 
+class InventoryAutoApplyItem(BaseModel):
+    recommendation_id: int
+    inventory_id: int
+    eligible: bool
+    requires_maker_checker: bool
+    # applied | maker_checker_required | ineligible | dry_run
+    outcome: str
+    # Failed eligibility checks: confidence, demand_pressure, quality_score.
+    reasons: List[str] = []
+
+
 class InventoryAutoApplyResponse(BaseModel):
     eligible_count: int
     applied_count: int
     skipped_count: int
     recommendation_ids: List[int]
+    maker_checker_count: int = 0
+    items: List[InventoryAutoApplyItem] = []
 
 
 class InventoryRebalanceRecommendationView(BaseModel):
@@ -133,6 +156,41 @@ class InventoryRebalanceRecommendationView(BaseModel):
     to_location: str
     transfer_qty: Decimal
     estimated_service_uplift_pct: float
+    lane_cost_per_unit: Optional[Decimal] = None
+    lead_time_days: Optional[int] = None
+    transfer_cost: Optional[Decimal] = None
+
+
+class InventoryRebalanceLane(BaseModel):
+    from_location: str
+    to_location: str
+    cost_per_unit: Decimal = Field(Decimal("0"), ge=0)
+    lead_time_days: Optional[int] = Field(None, ge=0, le=365)
+
+
+class InventoryRebalanceRequest(BaseModel):
+    product_id: Optional[int] = None
+    min_transfer_qty: Decimal = Field(Decimal("1"), ge=0)
+    lanes: List[InventoryRebalanceLane] = Field(default_factory=list, max_length=100_000)
+    # Only listed lanes may carry transfers; otherwise unlisted lanes use the defaults.
+    restrict_to_lanes: bool = False
+    default_cost_per_unit: Decimal = Field(Decimal("0"), ge=0)
+    max_lead_time_days: Optional[int] = Field(None, ge=0, le=365)
+    # Added to a lane's cost per unit for each day of its lead time.
+    lead_time_cost_per_day: Decimal = Field(Decimal("0"), ge=0)
+
+
+class InventoryRebalancePlanResponse(BaseModel):
+    transfers: List[InventoryRebalanceRecommendationView]
+    products_solved: int
+    donor_count: int
+    receiver_count: int
+    total_excess_qty: Decimal
+    total_shortage_qty: Decimal
+    total_transfer_qty: Decimal
+    unmet_shortage_qty: Decimal
+    total_transfer_cost: Decimal
+    solve_time_ms: float
 
 
 class InventoryControlTowerSummary(BaseModel):
@@ -200,7 +258,8 @@ class InventoryServiceLevelAnalyticsRequest(BaseModel):
     location: Optional[str] = None
     target_service_level: float = Field(0.95, ge=0.50, le=0.999)
     method: str = Field("analytical", pattern="^(analytical|monte_carlo)$")
-    simulation_runs: int = Field(5000, ge=100, le=50000)
+    simulation_runs: int = Field(5000, ge=100, le=5_000_000)
+    seed: Optional[int] = Field(None, ge=0, le=2**32 - 1, description="Seed for reproducible simulations")
     demand_std_override: Optional[float] = Field(None, ge=0)
     lead_time_std_override: Optional[float] = Field(None, ge=0)
     bucket_count: int = Field(20, ge=5, le=50)
@@ -241,6 +300,61 @@ class InventoryServiceLevelAnalyticsResponse(BaseModel):
     recommended_reorder_point: Decimal
     service_level_curve: List[InventoryServiceLevelSuggestion]
     distribution: List[InventoryServiceLevelDistributionPoint]
+    simulation_seed: Optional[int] = None
+
+
+class InventoryNetworkServiceLevelRequest(BaseModel):
+    product_id: Optional[int] = None
+    location: Optional[str] = None
+    target_service_level: float = Field(0.95, ge=0.50, le=0.999)
+    method: str = Field("analytical", pattern="^(analytical|monte_carlo)$")
+    simulation_runs: int = Field(10000, ge=100, le=5_000_000)
+    seed: Optional[int] = Field(None, ge=0, le=2**32 - 1, description="Seed for reproducible simulations")
+    lead_time_std_override: Optional[float] = Field(None, ge=0)
+    sort_by: str = Field(
+        "stockout_probability",
+        pattern="^(stockout_probability|expected_shortage_units|fill_rate|cycle_service_level)$",
+        description="Risk ranking: highest stockout probability / shortage first, lowest fill rate / service first",
+    )
+    page: int = Field(1, ge=1)
+    page_size: int = Field(50, ge=1, le=500)
+
+
+class InventoryNetworkServiceLevelRow(BaseModel):
+    inventory_id: int
+    product_id: int
+    location: str
+    current_on_hand_qty: Decimal
+    current_reorder_point: Decimal
+    current_safety_stock: Decimal
+    demand_mean_daily: Decimal
+    demand_std_daily: Decimal
+    lead_time_mean_days: Decimal
+    lead_time_std_days: Decimal
+    mean_demand_during_lead_time: Decimal
+    std_demand_during_lead_time: Decimal
+    cycle_service_level: float
+    fill_rate: float
+    stockout_probability: float
+    expected_shortage_units: Decimal
+    recommended_safety_stock: Decimal
+    recommended_reorder_point: Decimal
+    service_level_curve: List[InventoryServiceLevelSuggestion]
+
+
+class InventoryNetworkServiceLevelResponse(BaseModel):
+    method: str
+    target_service_level: float
+    sort_by: str
+    simulation_seed: Optional[int] = None
+    below_target_count: int
+    average_cycle_service_level: Optional[float] = None
+    total_expected_shortage_units: Decimal
+    items: List[InventoryNetworkServiceLevelRow]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
 
 
 class InventoryOptimizationRunResponse(BaseModel):
@@ -261,8 +375,14 @@ class InventoryPolicyRunView(BaseModel):
     processed_count: int
     updated_count: int
     exception_count: int
+    total_count: int = 0
+    progress_pct: float = 0.0
+    rows_per_second: Optional[float] = None
+    eta_seconds: Optional[float] = None
+    attempts: int = 0
     created_at: datetime
     started_at: Optional[datetime] = None
+    checkpoint_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
     parameters: Optional[Dict[str, Any]] = None
@@ -286,6 +406,16 @@ class InventoryListResponse(BaseModel):
     total_pages: int
 
 
+class InventoryLocationHealth(BaseModel):
+    location: Optional[str] = None
+    total_products: int
+    normal_count: int
+    low_count: int
+    critical_count: int
+    excess_count: int
+    total_value: Decimal
+
+
 class InventoryHealthSummary(BaseModel):
     total_products: int
     normal_count: int
@@ -297,3 +427,105 @@ class InventoryHealthSummary(BaseModel):
     low_pct: float
     critical_pct: float
     excess_pct: float
+    locations: Optional[List[InventoryLocationHealth]] = None
+
+
+class InventoryRollupReconcileResponse(BaseModel):
+    rollup_rows: int
+    drifted_rows: List[str] = []
+    reconciled_at: datetime
+
+
+class InventoryStatsCacheMetrics(BaseModel):
+    entries: int
+    hits: int
+    misses: int
+    hit_rate: float
+    invalidations: int
+    ttl_seconds: int
+
+
+class InventoryPositionCaptureRequest(BaseModel):
+    force: bool = False
+
+
+class InventoryPositionCaptureResponse(BaseModel):
+    snapshot_date: date
+    rows_written: int
+    skipped: bool
+    captured_at: datetime
+
+
+class InventoryPositionHistoryPoint(BaseModel):
+    period_start: date
+    period_end: date
+    snapshot_days: int
+    rows: float
+    on_hand_qty: Decimal
+    on_hand_min_qty: Decimal
+    on_hand_max_qty: Decimal
+    available_qty: Decimal
+    in_transit_qty: Decimal
+    safety_stock_qty: Decimal
+    valuation: Decimal
+    days_of_supply: Optional[Decimal] = None
+    status_rows: Dict[str, float]
+
+
+class InventoryPositionHistoryResponse(BaseModel):
+    start_date: date
+    end_date: date
+    bucket_days: int
+    points: List[InventoryPositionHistoryPoint]
+
+
+class InventoryProjectionPeriod(BaseModel):
+    period: date
+    opening_available: Decimal
+    demand_qty: Decimal
+    supply_qty: Decimal
+    projected_available: Decimal
+    status: str
+
+
+class InventoryProjectionView(BaseModel):
+    product_id: int
+    location: str
+    horizon_start: date
+    horizon_months: int
+    opening_available: Decimal
+    safety_stock: Decimal
+    max_stock: Optional[Decimal] = None
+    total_demand: Decimal
+    total_supply: Decimal
+    min_projected_available: Decimal
+    ending_projected_available: Decimal
+    status: str
+    first_stockout_period: Optional[date] = None
+    stockout_periods: int
+    below_safety_periods: int
+    excess_periods: int
+    periods: List[InventoryProjectionPeriod]
+    computed_at: datetime
+
+
+class InventoryProjectionListResponse(BaseModel):
+    items: List[InventoryProjectionView]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
+    status_counts: Dict[str, int]
+
+
+class InventoryProjectionRefreshRequest(BaseModel):
+    product_id: Optional[int] = None
+    force: bool = False
+
+
+class InventoryProjectionRefreshResponse(BaseModel):
+    horizon_start: date
+    horizon_months: int
+    products_checked: int
+    products_recomputed: int
+    rows_written: int
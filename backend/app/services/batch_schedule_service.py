@@ -0,0 +1,177 @@
+"""
+Batch Schedule Service
+
+CRUD and manual triggering for recurring batch schedules executed by the
+in-app `BatchScheduler`.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.exceptions import DuplicateEntityException, EntityNotFoundException, to_http_exception
+from app.models.batch_schedule import BatchSchedule, BatchScheduleRun
+from app.repositories.batch_schedule_repository import BatchScheduleRepository, BatchScheduleRunRepository
+from app.schemas.batch_schedule import (
+    BatchScheduleCreateRequest,
+    BatchScheduleResponse,
+    BatchScheduleRunResponse,
+    BatchScheduleUpdateRequest,
+    SchedulerStatusResponse,
+)
+from app.schemas.inventory import InventoryOptimizationRunRequest
+from app.services.batch_scheduler import BatchScheduler, batch_scheduler
+from app.utils.cron import CronExpression, next_fire_times
+
+
+class BatchScheduleService:
+    def __init__(self, db: Session, scheduler: Optional[BatchScheduler] = None):
+        self._db = db
+        self._repo = BatchScheduleRepository(db)
+        self._run_repo = BatchScheduleRunRepository(db)
+        self._scheduler = scheduler or batch_scheduler
+
+    def list_schedules(self) -> List[BatchScheduleResponse]:
+        return [self._to_response(s) for s in self._repo.list_all()]
+
+    def get_schedule(self, schedule_id: int) -> BatchScheduleResponse:
+        return self._to_response(self._get_or_404(schedule_id))
+
+    def create_schedule(self, body: BatchScheduleCreateRequest, user_id: int) -> BatchScheduleResponse:
+        if self._repo.get_by_name(body.name):
+            raise to_http_exception(DuplicateEntityException("BatchSchedule", "name", body.name))
+        self._validate_parameters(body.job_type, body.parameters)
+
+        schedule = BatchSchedule(
+            name=body.name,
+            job_type=body.job_type,
+            cron_expression=body.cron_expression,
+            parameters_json=json.dumps(body.parameters),
+            enabled=body.enabled,
+            window_start=body.window_start,
+            window_end=body.window_end,
+            max_concurrency=body.max_concurrency,
+            max_cpu_percent=body.max_cpu_percent,
+            max_runtime_minutes=body.max_runtime_minutes,
+            next_run_at=self._next_run(body.cron_expression) if body.enabled else None,
+            created_by=user_id,
+        )
+        return self._to_response(self._repo.create(schedule))
+
+    def update_schedule(self, schedule_id: int, body: BatchScheduleUpdateRequest) -> BatchScheduleResponse:
+        schedule = self._get_or_404(schedule_id)
+        updates: Dict[str, Any] = body.model_dump(exclude_unset=True)
+        if "parameters" in updates:
+            params = updates.pop("parameters") or {}
+            self._validate_parameters(schedule.job_type, params)
+            updates["parameters_json"] = json.dumps(params)
+
+        cron_expression = updates.get("cron_expression", schedule.cron_expression)
+        enabled = updates.get("enabled", schedule.enabled)
+        if "cron_expression" in updates or "enabled" in updates:
+            updates["next_run_at"] = self._next_run(cron_expression) if enabled else None
+        return self._to_response(self._repo.update(schedule, updates))
+
+    def delete_schedule(self, schedule_id: int) -> None:
+        self._repo.delete_with_runs(self._get_or_404(schedule_id))
+
+    def run_now(self, schedule_id: int) -> BatchScheduleRunResponse:
+        run = self._scheduler.run_now(self._db, self._get_or_404(schedule_id))
+        return self._to_run_response(run)
+
+    def list_runs(self, schedule_id: int, limit: int = 50) -> List[BatchScheduleRunResponse]:
+        self._get_or_404(schedule_id)
+        return [self._to_run_response(r) for r in self._run_repo.list_for_schedule(schedule_id, limit=limit)]
+
+    def get_status(self) -> SchedulerStatusResponse:
+        leader = self._scheduler.leader_status(self._db)
+        return SchedulerStatusResponse(
+            enabled=settings.SCHEDULER_ENABLED,
+            running_in_process=self._scheduler.running,
+            worker_id=self._scheduler.worker_id,
+            leader=leader["leader"],
+            lease_expires_at=leader["lease_expires_at"],
+            running_runs=self._run_repo.count_running(),
+            max_concurrent_runs=settings.SCHEDULER_MAX_CONCURRENT_RUNS,
+        )
+
+    # ── Helpers ──────────────────────────────────────────────────────────────
+
+    def _get_or_404(self, schedule_id: int) -> BatchSchedule:
+        schedule = self._repo.get_by_id(schedule_id)
+        if not schedule:
+            raise to_http_exception(EntityNotFoundException("BatchSchedule", schedule_id))
+        return schedule
+
+    @staticmethod
+    def _next_run(cron_expression: str) -> datetime:
+        return CronExpression(cron_expression).next_after(datetime.utcnow())
+
+    @staticmethod
+    def _validate_parameters(job_type: str, params: Dict[str, Any]) -> None:
+        if job_type == "forecast_refresh":
+            horizon = params.get("horizon", 6)
+            if not isinstance(horizon, int) or not 1 <= horizon <= 24:
+                raise ValueError("forecast_refresh.horizon must be an integer in [1, 24]")
+            if params.get("model_params") is not None and not isinstance(params["model_params"], dict):
+                raise ValueError("forecast_refresh.model_params must be an object")
+        elif job_type == "inventory_optimization":
+            InventoryOptimizationRunRequest.model_validate(params)
+        elif job_type == "forecast_job_cleanup":
+            retention_days = params.get("retention_days")
+            if retention_days is not None and (not isinstance(retention_days, int) or not 1 <= retention_days <= 3650):
+                raise ValueError("forecast_job_cleanup.retention_days must be an integer in [1, 3650]")
+        elif job_type == "inventory_position_snapshot":
+            if not isinstance(params.get("force", False), bool):
+                raise ValueError("inventory_position_snapshot.force must be a boolean")
+        elif job_type == "inventory_projection_refresh":
+            product_id = params.get("product_id")
+            if product_id is not None and (not isinstance(product_id, int) or isinstance(product_id, bool)):
+                raise ValueError("inventory_projection_refresh.product_id must be an integer")
+            if not isinstance(params.get("force", False), bool):
+                raise ValueError("inventory_projection_refresh.force must be a boolean")
+
+    @staticmethod
+    def _to_response(schedule: BatchSchedule) -> BatchScheduleResponse:
+        upcoming = next_fire_times(schedule.cron_expression, datetime.utcnow(), count=3) if schedule.enabled else []
+        return BatchScheduleResponse(
+            id=schedule.id,
+            name=schedule.name,
+            job_type=schedule.job_type,
+            cron_expression=schedule.cron_expression,
+            parameters=json.loads(schedule.parameters_json) if schedule.parameters_json else {},
+            enabled=schedule.enabled,
+            window_start=schedule.window_start,
+            window_end=schedule.window_end,
+            max_concurrency=schedule.max_concurrency,
+            max_cpu_percent=schedule.max_cpu_percent,
+            max_runtime_minutes=schedule.max_runtime_minutes,
+            next_run_at=schedule.next_run_at,
+            last_run_at=schedule.last_run_at,
+            last_status=schedule.last_status,
+            last_error=schedule.last_error,
+            created_by=schedule.created_by,
+            created_at=schedule.created_at,
+            updated_at=schedule.updated_at,
+            upcoming_runs=upcoming,
+        )
+
+    @staticmethod
+    def _to_run_response(run: BatchScheduleRun) -> BatchScheduleRunResponse:
+        return BatchScheduleRunResponse(
+            id=run.id,
+            schedule_id=run.schedule_id,
+            status=run.status,
+            trigger=run.trigger,
+            scheduled_for=run.scheduled_for,
+            worker_id=run.worker_id,
+            result=json.loads(run.result_json) if run.result_json else None,
+            error=run.error,
+            started_at=run.started_at,
+            completed_at=run.completed_at,
+        )
@@ -0,0 +1,368 @@
+"""
+Batch Scheduler
+
+In-app cron scheduler for recurring batch work (nightly forecast refresh,
+inventory optimization, forecast job retention cleanup, inventory rollup
+reconciliation, daily inventory position snapshots, inventory projection refresh).
+
+- Schedules live in `batch_schedules`; every run is recorded in `batch_schedule_runs`.
+- Every worker may run the scheduler loop, but only the holder of the
+  `scheduler_locks` lease dispatches, so each occurrence fires once.
+- A due occurrence is claimed with a compare-and-set on `next_run_at`.
+- Admission control per schedule: UTC run window, per-schedule concurrency,
+  a global concurrency cap (heavy batches never overlap) and a load gate.
+  The load gate (`max_cpu_percent`) only checks the 1-minute load average per
+  core when a run starts; it does not limit the CPU a running job uses.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+from uuid import uuid4
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.batch_schedule import BatchSchedule, BatchScheduleRun, SchedulerLock
+from app.repositories.batch_schedule_repository import BatchScheduleRepository, BatchScheduleRunRepository
+from app.schemas.inventory import InventoryOptimizationRunRequest
+from app.services.forecast_delta_service import ForecastDeltaService
+from app.services.forecast_job_maintenance import run_forecast_job_cleanup
+from app.services.inventory_position_history_service import InventoryPositionHistoryService
+from app.services.inventory_projection_service import InventoryProjectionService
+from app.services.inventory_rollup_service import InventoryRollupService
+from app.services.inventory_service import InventoryService
+from app.utils.cron import CronExpression
+
+logger = logging.getLogger(__name__)
+
+LEADER_LOCK_NAME = "batch-scheduler"
+
+
+def in_run_window(now: datetime, window_start: Optional[str], window_end: Optional[str]) -> bool:
+    """True when `now` (UTC) falls inside [start, end); windows may wrap midnight."""
+    if not window_start or not window_end:
+        return True
+    current = now.strftime("%H:%M")
+    if window_start <= window_end:
+        return window_start <= current < window_end
+    return current >= window_start or current < window_end
+
+
+def cpu_load_percent() -> Optional[float]:
+    """1-minute load average as a percentage of available cores (None if unsupported)."""
+    try:
+        load_1m = os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+    return round(load_1m / max(1, os.cpu_count() or 1) * 100.0, 2)
+
+
+class BatchScheduler:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        worker_id: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        inline: bool = False,
+    ):
+        self._session_factory = session_factory
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._inline = inline
+        self._executor = None if inline else ThreadPoolExecutor(
+            max_workers=max_workers or max(1, settings.SCHEDULER_MAX_CONCURRENT_RUNS),
+            thread_name_prefix="batch-scheduler",
+        )
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._handlers: Dict[str, Callable[[Session, BatchSchedule], Dict[str, Any]]] = {
+            "forecast_refresh": self._run_forecast_refresh,
+            "inventory_optimization": self._run_inventory_optimization,
+            "forecast_job_cleanup": self._run_forecast_job_cleanup,
+            "inventory_rollup_reconcile": self._run_inventory_rollup_reconcile,
+            "inventory_position_snapshot": self._run_inventory_position_snapshot,
+            "inventory_projection_refresh": self._run_inventory_projection_refresh,
+        }
+
+    # ── Lifecycle ────────────────────────────────────────────────────────────
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="batch-scheduler-loop", daemon=True)
+        self._thread.start()
+        logger.info("Batch scheduler started worker_id=%s", self.worker_id)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        db = self._session_factory()
+        try:
+            db.query(SchedulerLock).filter(
+                SchedulerLock.name == LEADER_LOCK_NAME,
+                SchedulerLock.owner == self.worker_id,
+            ).update({SchedulerLock.expires_at: datetime.utcnow()}, synchronize_session=False)
+            db.commit()
+        except Exception:  # noqa: BLE001
+            db.rollback()
+        finally:
+            db.close()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception:  # noqa: BLE001
+                logger.exception("Batch scheduler tick failed")
+            self._stop.wait(max(1, settings.SCHEDULER_POLL_SECONDS))
+
+    # ── Scheduling ───────────────────────────────────────────────────────────
+
+    def tick(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Fire due schedules if this worker holds the leader lease."""
+        now = now or datetime.utcnow()
+        summary: Dict[str, Any] = {"leader": False, "dispatched": [], "deferred": [], "skipped": []}
+        db = self._session_factory()
+        try:
+            if not self._acquire_leadership(db, now):
+                return summary
+            summary["leader"] = True
+
+            schedules = BatchScheduleRepository(db)
+            runs = BatchScheduleRunRepository(db)
+            self._expire_stale_runs(db, runs, now)
+
+            for schedule in schedules.list_due(now):
+                cron = CronExpression(schedule.cron_expression)
+                due_at = schedule.next_run_at
+                if not in_run_window(now, schedule.window_start, schedule.window_end):
+                    # Missed its window (e.g. the app was down): skip to the next occurrence.
+                    if schedules.claim_next_run(schedule.id, due_at, cron.next_after(now)):
+                        db.add(self._new_run(schedule, "skipped", "cron", due_at, error="outside_run_window", now=now))
+                        db.commit()
+                        summary["skipped"].append({"schedule_id": schedule.id, "reason": "outside_run_window"})
+                    continue
+
+                reason = self._admission_block_reason(runs, schedule)
+                if reason:
+                    # Leave next_run_at in place; the occurrence is retried on the next tick.
+                    summary["deferred"].append({"schedule_id": schedule.id, "reason": reason})
+                    continue
+
+                if not schedules.claim_next_run(schedule.id, due_at, cron.next_after(now)):
+                    db.rollback()
+                    continue
+                run = self._new_run(schedule, "running", "cron", due_at, now=now)
+                db.add(run)
+                db.commit()
+                summary["dispatched"].append({"schedule_id": schedule.id, "run_id": run.id})
+                self._submit(run.id)
+            return summary
+        finally:
+            db.close()
+
+    def run_now(self, db: Session, schedule: BatchSchedule) -> BatchScheduleRun:
+        """Manually trigger a schedule, honouring its concurrency caps and load gate."""
+        reason = self._admission_block_reason(BatchScheduleRunRepository(db), schedule)
+        if reason:
+            raise ValueError(f"Schedule '{schedule.name}' cannot start now: {reason}")
+        run = self._new_run(schedule, "running", "manual", datetime.utcnow())
+        db.add(run)
+        db.commit()
+        db.refresh(run)
+        self._submit(run.id)
+        db.refresh(run)
+        return run
+
+    def leader_status(self, db: Session) -> Dict[str, Any]:
+        lock = db.query(SchedulerLock).filter(SchedulerLock.name == LEADER_LOCK_NAME).first()
+        active = lock is not None and lock.expires_at >= datetime.utcnow()
+        return {
+            "leader": lock.owner if active else None,
+            "lease_expires_at": lock.expires_at if active else None,
+        }
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    def _acquire_leadership(self, db: Session, now: datetime) -> bool:
+        expires_at = now + timedelta(seconds=max(1, settings.SCHEDULER_LEASE_SECONDS))
+        renewed = (
+            db.query(SchedulerLock)
+            .filter(SchedulerLock.name == LEADER_LOCK_NAME)
+            .filter(or_(SchedulerLock.owner == self.worker_id, SchedulerLock.expires_at < now))
+            .update(
+                {SchedulerLock.owner: self.worker_id, SchedulerLock.expires_at: expires_at},
+                synchronize_session=False,
+            )
+        )
+        if renewed:
+            db.commit()
+            return True
+        if db.query(SchedulerLock.name).filter(SchedulerLock.name == LEADER_LOCK_NAME).first():
+            db.rollback()
+            return False
+        try:
+            db.add(SchedulerLock(name=LEADER_LOCK_NAME, owner=self.worker_id, acquired_at=now, expires_at=expires_at))
+            db.commit()
+            return True
+        except IntegrityError:
+            db.rollback()
+            return False
+
+    def _admission_block_reason(self, runs: BatchScheduleRunRepository, schedule: BatchSchedule) -> Optional[str]:
+        if runs.count_running(schedule.id) >= max(1, schedule.max_concurrency or 1):
+            return "schedule_concurrency_limit"
+        if runs.count_running() >= max(1, settings.SCHEDULER_MAX_CONCURRENT_RUNS):
+            return "global_concurrency_limit"
+        if schedule.max_cpu_percent:
+            load = cpu_load_percent()
+            if load is not None and load > schedule.max_cpu_percent:
+                return "load_gate"
+        return None
+
+    def _expire_stale_runs(self, db: Session, runs: BatchScheduleRunRepository, now: datetime) -> None:
+        """Fail runs whose worker died so they stop holding concurrency slots."""
+        changed = False
+        for run in runs.list_running():
+            schedule = db.query(BatchSchedule).filter(BatchSchedule.id == run.schedule_id).first()
+            limit = timedelta(minutes=(schedule.max_runtime_minutes if schedule else 240))
+            if run.started_at and run.started_at + limit < now:
+                run.status = "failed"
+                run.error = "Exceeded max_runtime_minutes; presumed lost"
+                run.completed_at = now
+                changed = True
+        if changed:
+            db.commit()
+
+    def _new_run(
+        self,
+        schedule: BatchSchedule,
+        status: str,
+        trigger: str,
+        scheduled_for: Optional[datetime],
+        error: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> BatchScheduleRun:
+        now = now or datetime.utcnow()
+        return BatchScheduleRun(
+            schedule_id=schedule.id,
+            status=status,
+            trigger=trigger,
+            scheduled_for=scheduled_for,
+            worker_id=self.worker_id,
+            error=error,
+            started_at=now,
+            completed_at=now if status != "running" else None,
+        )
+
+    def _submit(self, run_id: int) -> None:
+        if self._inline or self._executor is None:
+            self._execute(run_id)
+        else:
+            self._executor.submit(self._execute, run_id)
+
+    def _execute(self, run_id: int) -> None:
+        db = self._session_factory()
+        try:
+            run = db.query(BatchScheduleRun).filter(BatchScheduleRun.id == run_id).first()
+            if not run:
+                return
+            schedule = db.query(BatchSchedule).filter(BatchSchedule.id == run.schedule_id).first()
+            if not schedule:
+                return
+            try:
+                result = self._handlers[schedule.job_type](db, schedule)
+                status, error = "completed", None
+            except Exception as exc:  # noqa: BLE001
+                db.rollback()
+                logger.exception("Scheduled run failed schedule=%s run_id=%s", schedule.name, run_id)
+                result, status, error = None, "failed", str(exc)
+
+            run = db.query(BatchScheduleRun).filter(BatchScheduleRun.id == run_id).first()
+            schedule = db.query(BatchSchedule).filter(BatchSchedule.id == run.schedule_id).first()
+            completed_at = datetime.utcnow()
+            run.status = status
+            run.error = error
+            run.result_json = json.dumps(result, default=str) if result is not None else None
+            run.completed_at = completed_at
+            if schedule:
+                schedule.last_run_at = completed_at
+                schedule.last_status = status
+                schedule.last_error = error
+            db.commit()
+        finally:
+            db.close()
+
+    # ── Dispatch targets ─────────────────────────────────────────────────────
+
+    @staticmethod
+    def _params(schedule: BatchSchedule) -> Dict[str, Any]:
+        return json.loads(schedule.parameters_json) if schedule.parameters_json else {}
+
+    def _run_forecast_refresh(self, db: Session, schedule: BatchSchedule) -> Dict[str, Any]:
+        params = self._params(schedule)
+        result = ForecastDeltaService(db).run(
+            horizon=int(params.get("horizon", 6)),
+            model_type=params.get("model_type"),
+            requested_by=schedule.created_by,
+            model_params=params.get("model_params"),
+            force=bool(params.get("force", False)),
+        )
+        # Job ids are queryable from /forecasting/jobs; keep the run record compact.
+        result["job_ids"] = [row["job_id"] for row in result.pop("jobs", [])]
+        return result
+
+    def _run_inventory_optimization(self, db: Session, schedule: BatchSchedule) -> Dict[str, Any]:
+        payload = InventoryOptimizationRunRequest.model_validate(self._params(schedule))
+        response = InventoryService(db).run_optimization(payload, user_id=schedule.created_by)
+        return {
+            "run_id": response.run_id,
+            "processed_count": response.processed_count,
+            "updated_count": response.updated_count,
+            "exception_count": response.exception_count,
+        }
+
+    def _run_forecast_job_cleanup(self, db: Session, schedule: BatchSchedule) -> Dict[str, Any]:
+        params = self._params(schedule)
+        return run_forecast_job_cleanup(
+            retention_days=params.get("retention_days"),
+            requested_by=schedule.created_by,
+        )
+
+    def _run_inventory_rollup_reconcile(self, db: Session, schedule: BatchSchedule) -> Dict[str, Any]:
+        result = InventoryRollupService(db).reconcile()
+        if result.drifted_rows:
+            logger.warning("Inventory status rollups had drifted: %s", ", ".join(result.drifted_rows))
+        return result.model_dump(mode="json")
+
+    def _run_inventory_position_snapshot(self, db: Session, schedule: BatchSchedule) -> Dict[str, Any]:
+        params = self._params(schedule)
+        result = InventoryPositionHistoryService(db).capture(force=bool(params.get("force", False)))
+        return result.model_dump(mode="json")
+
+    def _run_inventory_projection_refresh(self, db: Session, schedule: BatchSchedule) -> Dict[str, Any]:
+        params = self._params(schedule)
+        result = InventoryProjectionService(db).refresh(
+            product_id=params.get("product_id"), force=bool(params.get("force", False))
+        )
+        return result.model_dump(mode="json")
+
+
+batch_scheduler = BatchScheduler()
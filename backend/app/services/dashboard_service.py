@@ -10,6 +10,8 @@ from app.repositories.supply_repository import SupplyPlanRepository
 from app.repositories.inventory_repository import InventoryRepository
 from app.repositories.kpi_repository import KPIMetricRepository
 from app.repositories.sop_cycle_repository import SOPCycleRepository
+from app.services.inventory_policy_engine import INVENTORY_STATUSES
+from app.services.inventory_rollup_service import InventoryRollupService
 
 
 class DashboardService:
@@ -20,6 +22,7 @@ class DashboardService:
         self._inventory_repo = InventoryRepository(db)
         self._kpi_repo = KPIMetricRepository(db)
         self._sop_repo = SOPCycleRepository(db)
+        self._inventory_rollups = InventoryRollupService(db)
 
     def get_summary(self) -> dict:
         """Executive dashboard summary — KPIs, plan counts, inventory health."""
@@ -28,14 +31,11 @@ class DashboardService:
         demand_submitted = self._demand_repo.count_by_status("submitted")
         demand_approved = self._demand_repo.count_by_status("approved")
 
-        # Inventory health
-        all_inv = self._inventory_repo.get_all_inventory()
-        total_inv = len(all_inv)
-        inv_counts = {"normal": 0, "low": 0, "critical": 0, "excess": 0}
-        total_value = Decimal("0")
-        for inv in all_inv:
-            inv_counts[inv.status] = inv_counts.get(inv.status, 0) + 1
-            total_value += inv.valuation or Decimal("0")
+        # Inventory health, from the overall status rollup row
+        inv_totals = self._inventory_rollups.status_totals()
+        total_inv = sum(count for count, _ in inv_totals.values())
+        inv_counts = {status: inv_totals.get(status, (0, Decimal("0")))[0] for status in INVENTORY_STATUSES}
+        total_value = sum((value for _, value in inv_totals.values()), Decimal("0"))
 
         # Latest KPIs
         forecast_accuracy = self._kpi_repo.get_latest_by_name("Forecast Accuracy")
@@ -71,10 +71,14 @@ class DashboardService:
             } if active_cycle else None,
         }
 
-    def get_alerts(self) -> dict:
-        """Aggregate all active alerts across modules."""
-        critical_inv = self._inventory_repo.get_critical()
-        low_inv = self._inventory_repo.get_low()
+    def get_alerts(self, limit: int = 100) -> dict:
+        """
+        Aggregate all active alerts across modules. Inventory alerts list at most `limit`
+        rows per status; `total_alerts` counts every one.
+        """
+        inv_totals = self._inventory_rollups.status_totals()
+        critical_inv = self._inventory_repo.list_alert_rows("critical", page_size=limit)
+        low_inv = self._inventory_repo.list_alert_rows("low", page_size=limit)
         kpi_alerts = []
         for m in self._kpi_repo.get_with_targets():
             if m.target and m.value:
@@ -98,7 +102,7 @@ class DashboardService:
                 for i in low_inv
             ],
             "kpi_alerts": kpi_alerts,
-            "total_alerts": len(critical_inv) + len(low_inv) + len(kpi_alerts),
+            "total_alerts": sum(inv_totals.get(status, (0, 0))[0] for status in ("critical", "low")) + len(kpi_alerts),
         }
 
     def get_sop_status(self) -> dict:
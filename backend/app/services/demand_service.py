@@ -87,7 +87,7 @@ class DemandService:
         result = self._repo.update(plan, updates)
         self._bus.publish(EntityUpdatedEvent(
             entity_type="demand_plan", entity_id=plan_id, user_id=user_id,
-            old_values=old_vals, new_values=updates,
+            old_values=old_vals, new_values={**updates, "product_id": result.product_id},
         ))
         return result
 
@@ -100,7 +100,7 @@ class DemandService:
         self._bus.publish(EntityUpdatedEvent(
             entity_type="demand_plan", entity_id=plan_id, user_id=user_id,
             old_values={"adjusted_qty": str(plan.adjusted_qty)},
-            new_values={"adjusted_qty": str(body.adjusted_qty)},
+            new_values={"adjusted_qty": str(body.adjusted_qty), "product_id": result.product_id},
         ))
         return result
 
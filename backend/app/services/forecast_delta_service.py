@@ -0,0 +1,181 @@
+"""
+Forecast Delta Service
+
+Change-tracked forecast refresh: compares each product's current forecast inputs
+(actuals watermark, lead time, model type/params, horizon) against the inputs of
+its last completed refresh and enqueues forecast jobs only where they moved.
+Each job runs the advisor backtests, the forecast and anomaly detection.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.demand_plan import DemandPlan
+from app.models.forecast_job import ForecastJob
+from app.models.product import Product
+from app.repositories.forecast_fingerprint_repository import ForecastFingerprintRepository
+from app.services.forecast_job_service import ForecastJobService, forecast_job_service
+
+MIN_ACTUALS_FOR_FORECAST = 3
+
+
+class ForecastDeltaService:
+    def __init__(self, db: Session, job_service: Optional[ForecastJobService] = None):
+        self._db = db
+        self._fingerprints = ForecastFingerprintRepository(db)
+        self._jobs = job_service or forecast_job_service
+
+    def run(
+        self,
+        *,
+        horizon: int,
+        model_type: Optional[str],
+        requested_by: int,
+        model_params: Optional[Dict[str, Any]] = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """Enqueue forecast jobs for products whose input fingerprint changed."""
+        inputs_by_product = self._current_inputs(horizon, model_type, model_params)
+        stored = self._fingerprints.get_by_product_map()
+        in_flight_jobs = {
+            job_id
+            for (job_id,) in self._db.query(ForecastJob.job_id)
+            .filter(ForecastJob.status.in_(["queued", "running"]))
+            .all()
+        }
+
+        skipped_unchanged = 0
+        skipped_in_flight = 0
+        skipped_insufficient_history = 0
+        change_reasons: Dict[str, int] = {}
+        jobs: List[Dict[str, Any]] = []
+
+        for product_id, inputs in inputs_by_product.items():
+            if inputs["actuals_count"] < MIN_ACTUALS_FOR_FORECAST:
+                skipped_insufficient_history += 1
+                continue
+
+            fingerprint = self.compute_fingerprint(inputs)
+            previous = stored.get(product_id)
+            if not force and previous is not None and previous.fingerprint == fingerprint:
+                skipped_unchanged += 1
+                continue
+            if (
+                previous is not None
+                and previous.pending_fingerprint == fingerprint
+                and previous.pending_job_id in in_flight_jobs
+            ):
+                skipped_in_flight += 1
+                continue
+
+            reasons = self._change_reasons(previous, inputs) if not force else ["forced"]
+            for reason in reasons:
+                change_reasons[reason] = change_reasons.get(reason, 0) + 1
+
+            job = self._jobs.enqueue_forecast(
+                product_id=product_id,
+                horizon=horizon,
+                model_type=model_type,
+                requested_by=requested_by,
+                model_params=model_params,
+                input_fingerprint=fingerprint,
+                fingerprint_inputs=inputs,
+                lane="bulk",
+            )
+            jobs.append({"product_id": product_id, "job_id": job.job_id, "reasons": reasons})
+
+        evaluated = len(inputs_by_product)
+        return {
+            "mode": "full" if force else "delta",
+            "horizon": horizon,
+            "model_type": model_type,
+            "evaluated_products": evaluated,
+            "enqueued": len(jobs),
+            "skipped": evaluated - len(jobs),
+            "skipped_unchanged": skipped_unchanged,
+            "skipped_in_flight": skipped_in_flight,
+            "skipped_insufficient_history": skipped_insufficient_history,
+            "change_reasons": change_reasons,
+            "jobs": jobs,
+        }
+
+    @staticmethod
+    def compute_fingerprint(inputs: Dict[str, Any]) -> str:
+        raw = json.dumps(
+            {
+                "actuals_watermark": inputs["actuals_watermark"],
+                "lead_time_days": inputs["lead_time_days"],
+                "model_type": inputs["model_type"],
+                "model_params": inputs["model_params"],
+                "horizon": inputs["horizon"],
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _current_inputs(
+        self,
+        horizon: int,
+        model_type: Optional[str],
+        model_params: Optional[Dict[str, Any]],
+    ) -> Dict[int, Dict[str, Any]]:
+        """One grouped query: per-product actuals watermark joined with product master data."""
+        rows = (
+            self._db.query(
+                Product.id,
+                Product.lead_time_days,
+                func.count(DemandPlan.id),
+                func.max(DemandPlan.period),
+                func.max(DemandPlan.updated_at),
+                func.sum(DemandPlan.actual_qty),
+            )
+            .join(DemandPlan, DemandPlan.product_id == Product.id)
+            .filter(DemandPlan.actual_qty.isnot(None))
+            .filter(Product.status != "discontinued")
+            .group_by(Product.id, Product.lead_time_days)
+            .all()
+        )
+
+        inputs: Dict[int, Dict[str, Any]] = {}
+        for product_id, lead_time_days, count, last_period, last_updated, actual_sum in rows:
+            # Count + last period catch new months; max(updated_at) and the sum catch
+            # restated actuals on existing periods.
+            watermark = "|".join([
+                str(int(count or 0)),
+                str(last_period or ""),
+                last_updated.isoformat(timespec="seconds") if last_updated else "",
+                f"{float(actual_sum or 0):.2f}",
+            ])
+            inputs[product_id] = {
+                "actuals_count": int(count or 0),
+                "actuals_watermark": watermark,
+                "lead_time_days": int(lead_time_days or 0),
+                "model_type": model_type,
+                "model_params": model_params or {},
+                "horizon": horizon,
+            }
+        return inputs
+
+    @staticmethod
+    def _change_reasons(previous, inputs: Dict[str, Any]) -> List[str]:
+        if previous is None or previous.fingerprint is None:
+            return ["new_product"]
+        reasons: List[str] = []
+        if previous.actuals_watermark != inputs["actuals_watermark"]:
+            reasons.append("actuals")
+        if previous.lead_time_days != inputs["lead_time_days"]:
+            reasons.append("lead_time")
+        if previous.model_type != inputs["model_type"]:
+            reasons.append("model_type")
+        if json.loads(previous.model_params_json or "{}") != inputs["model_params"]:
+            reasons.append("model_params")
+        if previous.horizon != inputs["horizon"]:
+            reasons.append("horizon")
+        return reasons
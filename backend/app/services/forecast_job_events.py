@@ -0,0 +1,73 @@
+"""
+Forecast Job Event Streams
+
+Builds the Server-Sent Event stream for one or many forecast jobs. Live events come
+from the in-process `JobEventHub`. Jobs run by a worker in another process do not
+publish here, so the stream also polls job status every `poll_seconds` (a single
+query for all watched jobs). Each poll that finds no changes sends a keep-alive
+comment. The stream ends once every watched job is terminal.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.services.forecast_job_service import ForecastJobService
+from app.utils.job_events import JobEventHub, format_sse, get_job_event_hub
+
+ACTIVE_STATUSES = {"queued", "running"}
+
+
+async def stream_job_events(
+    job_ids: List[str],
+    job_service: ForecastJobService,
+    *,
+    hub: Optional[JobEventHub] = None,
+    poll_seconds: float = 5.0,
+) -> AsyncIterator[str]:
+    hub = hub or get_job_event_hub()
+    # Subscribe before the initial snapshot so no transition falls in between.
+    subscription = hub.subscribe(job_ids)
+    try:
+        known: Dict[str, str] = await run_in_threadpool(job_service.get_job_states, job_ids)
+        for job_id in job_ids:
+            status = known.get(job_id, "not_found")
+            yield format_sse("status", {"job_id": job_id, "status": status, "source": "snapshot"})
+            latest = hub.latest(job_id)
+            if status == "running" and latest and latest["event"] == "progress":
+                yield format_sse("progress", latest)
+
+        pending = {job_id for job_id, status in known.items() if status in ACTIVE_STATUSES}
+        last_poll = time.monotonic()
+        while pending:
+            event = await subscription.get(timeout=poll_seconds)
+            if event is not None:
+                job_id = event["job_id"]
+                if event["event"] == "status":
+                    known[job_id] = event["status"]
+                    if event["status"] not in ACTIVE_STATUSES:
+                        pending.discard(job_id)
+                yield format_sse(event["event"], event)
+
+            if time.monotonic() - last_poll < poll_seconds:
+                continue
+            last_poll = time.monotonic()
+            changed = False
+            current = await run_in_threadpool(job_service.get_job_states, sorted(pending))
+            for job_id in sorted(pending):
+                status = current.get(job_id, "not_found")
+                if status != known.get(job_id):
+                    changed = True
+                    known[job_id] = status
+                    yield format_sse("status", {"job_id": job_id, "status": status, "source": "poll"})
+                if status not in ACTIVE_STATUSES:
+                    pending.discard(job_id)
+            if not changed and event is None:
+                yield ": keep-alive\n\n"
+
+        yield format_sse("end", {"job_ids": job_ids, "statuses": {j: known.get(j, "not_found") for j in job_ids}})
+    finally:
+        hub.unsubscribe(subscription)
@@ -1,32 +1,82 @@
 """
 Forecast Job Service
 
-Provides a lightweight async job orchestration layer for forecast generation.
+Provides the async job orchestration layer for forecast generation.
 
-Note:
-- This is an in-process implementation intended as an enterprise transition step.
-- For full production scale, migrate this interface to a durable queue (Celery/RQ + Redis/RabbitMQ).
+Jobs are durable rows in `forecast_jobs`. Workers (`app.services.forecast_worker`)
+claim them atomically, so any number of API or worker processes can share the queue
+and queued jobs survive restarts. Cancellation is a status change in the database
+and is observed by the owning worker on its next heartbeat.
+
+With the embedded worker enabled, the API process also polls the queue from a daemon
+thread (`start_embedded_worker`), so jobs queued before a restart and jobs whose lease
+expired are picked up without waiting for the next enqueue.
 """
 
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor
+import threading
 from datetime import datetime, timedelta
 import json
-from typing import Optional, List
+import logging
+from typing import Any, Callable, Dict, Optional, List
 from uuid import uuid4
 
+from sqlalchemy.orm import Session
+
 from app.database import SessionLocal
 from app.config import settings
-from app.models.forecast_job import ForecastJob
-from app.services.forecast_service import ForecastService
+from app.models.forecast_job import JOB_LANES, ForecastJob
+from app.repositories.forecast_fingerprint_repository import ForecastFingerprintRepository
+from app.repositories.forecast_job_repository import ForecastJobRepository
+from app.services.forecast_worker import ForecastWorker, default_worker_id
 from app.utils.events import get_event_bus, ForecastJobsCleanedEvent
+from app.utils.job_events import publish_status
+
+logger = logging.getLogger(__name__)
 
 
 class ForecastJobService:
-    def __init__(self, max_workers: int = 2):
-        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="forecast-worker")
+    def __init__(
+        self,
+        max_workers: int = 2,
+        session_factory: Callable[[], Session] = SessionLocal,
+        embedded_worker: Optional[bool] = None,
+    ):
+        self._session_factory = session_factory
         self._bus = get_event_bus()
+        embedded = settings.FORECAST_JOB_EMBEDDED_WORKER if embedded_worker is None else embedded_worker
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="forecast-worker") if embedded else None
+        )
+        self._worker = (
+            ForecastWorker(session_factory=session_factory, worker_id=default_worker_id("embedded"))
+            if embedded else None
+        )
+        self._poller: Optional[ForecastWorker] = None
+        self._poller_thread: Optional[threading.Thread] = None
+
+    def start_embedded_worker(self, poll_seconds: Optional[float] = None) -> bool:
+        """Poll the queue from a daemon thread (requeueing expired leases). False when disabled or running."""
+        if self._worker is None or (self._poller_thread is not None and self._poller_thread.is_alive()):
+            return False
+        self._poller = ForecastWorker(
+            session_factory=self._session_factory, worker_id=self._worker.worker_id, poll_seconds=poll_seconds
+        )
+        self._poller_thread = threading.Thread(
+            target=self._poller.run_forever, name="forecast-worker-poller", daemon=True
+        )
+        self._poller_thread.start()
+        return True
+
+    def stop_embedded_worker(self, timeout: Optional[float] = None) -> None:
+        """Stop polling; the job in progress (if any) finishes first when `timeout` allows."""
+        if self._poller is not None:
+            self._poller.stop()
+        if self._poller_thread is not None:
+            self._poller_thread.join(timeout)
+        self._poller = self._poller_thread = None
 
     def enqueue_forecast(
         self,
@@ -35,35 +85,83 @@ class ForecastJobService:
         horizon: int,
         model_type: Optional[str],
         requested_by: int,
+        model_params: Optional[Dict[str, Any]] = None,
+        input_fingerprint: Optional[str] = None,
+        fingerprint_inputs: Optional[Dict[str, Any]] = None,
+        lane: str = "interactive",
+        coalesce: bool = True,
     ) -> ForecastJob:
-        db = SessionLocal()
+        """
+        Queue a forecast job. When an identical job (product, horizon, model type and
+        params) is already queued or running, the new job follows it and receives its
+        result instead of repeating the backtests.
+        """
+        if lane not in JOB_LANES:
+            raise ValueError(f"Unknown job lane '{lane}'. Expected one of: {', '.join(JOB_LANES)}")
+        model_params_json = json.dumps(model_params, sort_keys=True) if model_params else None
+
+        db = self._session_factory()
         try:
+            leader = (
+                ForecastJobRepository(db).find_active_leader(product_id, horizon, model_type, model_params_json)
+                if coalesce else None
+            )
             job = ForecastJob(
                 job_id=str(uuid4()),
-                status="queued",
+                status=leader.status if leader else "queued",
                 product_id=product_id,
                 horizon=horizon,
                 model_type=model_type,
                 requested_by=requested_by,
+                model_params_json=model_params_json,
+                lane=lane,
+                coalesced_into=leader.job_id if leader else None,
+                started_at=leader.started_at if leader else None,
             )
+            if leader and leader.status == "queued" and JOB_LANES.index(lane) < JOB_LANES.index(leader.lane):
+                # An interactive request waiting on a bulk job lifts it into the faster lane.
+                leader.lane = lane
             db.add(job)
+            if input_fingerprint:
+                # Recorded in the same transaction so a fast worker can never complete
+                # the job before its pending fingerprint exists.
+                ForecastFingerprintRepository(db).set_pending(
+                    product_id, input_fingerprint, job.job_id, fingerprint_inputs or {}
+                )
             db.commit()
             db.refresh(job)
         finally:
             db.close()
 
-        self._executor.submit(self._run_forecast_job, job.job_id)
+        publish_status([job.job_id], job.status, coalesced_into=job.coalesced_into)
+        if job.coalesced_into is None:
+            self._wake_worker()
         return job
 
     def get_job(self, job_id: str) -> Optional[ForecastJob]:
-        db = SessionLocal()
+        db = self._session_factory()
         try:
             return db.query(ForecastJob).filter(ForecastJob.job_id == job_id).first()
         finally:
             db.close()
 
+    def get_job_states(self, job_ids: List[str]) -> Dict[str, str]:
+        """Current status per job id in one query; unknown ids are omitted."""
+        if not job_ids:
+            return {}
+        db = self._session_factory()
+        try:
+            rows = (
+                db.query(ForecastJob.job_id, ForecastJob.status)
+                .filter(ForecastJob.job_id.in_(list(job_ids)))
+                .all()
+            )
+            return {job_id: status for job_id, status in rows}
+        finally:
+            db.close()
+
     def list_jobs(self, limit: int = 50) -> List[ForecastJob]:
-        db = SessionLocal()
+        db = self._session_factory()
         try:
             return (
                 db.query(ForecastJob)
@@ -75,7 +173,7 @@ class ForecastJobService:
             db.close()
 
     def cancel_job(self, job_id: str) -> Optional[ForecastJob]:
-        db = SessionLocal()
+        db = self._session_factory()
         try:
             job = db.query(ForecastJob).filter(ForecastJob.job_id == job_id).first()
             if not job:
@@ -84,14 +182,37 @@ class ForecastJobService:
                 job.status = "cancelled"
                 job.completed_at = datetime.utcnow()
                 job.error = "Cancelled by user"
+                job.lease_expires_at = None
+                ForecastFingerprintRepository(db).clear_pending(job.job_id)
+                promoted = self._promote_follower(db, job) if job.coalesced_into is None else None
                 db.commit()
                 db.refresh(job)
+                publish_status([job.job_id], "cancelled")
+                if promoted:
+                    self._wake_worker()
             return job
         finally:
             db.close()
 
+    @staticmethod
+    def _promote_follower(db: Session, leader: ForecastJob) -> Optional[ForecastJob]:
+        """Hand a cancelled leader's followers to the oldest of them, requeued as the new leader."""
+        followers = ForecastJobRepository(db).list_active_followers(leader.job_id)
+        if not followers:
+            return None
+        successor, rest = followers[0], followers[1:]
+        successor.coalesced_into = None
+        successor.status = "queued"
+        successor.started_at = None
+        successor.lane = min((f.lane for f in followers), key=JOB_LANES.index)
+        for follower in rest:
+            follower.coalesced_into = successor.job_id
+            follower.status = "queued"
+            follower.started_at = None
+        return successor
+
     def retry_job(self, job_id: str) -> Optional[ForecastJob]:
-        db = SessionLocal()
+        db = self._session_factory()
         try:
             source_job = db.query(ForecastJob).filter(ForecastJob.job_id == job_id).first()
             if not source_job:
@@ -106,6 +227,8 @@ class ForecastJobService:
                 horizon=source_job.horizon,
                 model_type=source_job.model_type,
                 requested_by=source_job.requested_by,
+                model_params_json=source_job.model_params_json,
+                lane=source_job.lane,
             )
             db.add(new_job)
             db.commit()
@@ -113,51 +236,64 @@ class ForecastJobService:
         finally:
             db.close()
 
-        self._executor.submit(self._run_forecast_job, new_job.job_id)
+        publish_status([new_job.job_id], "queued", retry_of=job_id)
+        self._wake_worker()
         return new_job
 
     def get_job_metrics(self) -> dict:
-        db = SessionLocal()
+        """
+        Queue and processing metrics computed with grouped SQL aggregates, so the cost
+        does not grow with retained job rows. Processing times cover leader jobs only;
+        coalesced followers share their leader's run.
+        """
+        db = self._session_factory()
         try:
-            jobs = db.query(ForecastJob).all()
-            total = len(jobs)
-
-            by_status = {
-                "queued": 0,
-                "running": 0,
-                "completed": 0,
-                "failed": 0,
-                "cancelled": 0,
-            }
-            for job in jobs:
-                if job.status in by_status:
-                    by_status[job.status] += 1
-
-            durations_ms = []
-            for job in jobs:
-                if job.started_at and job.completed_at:
-                    durations_ms.append((job.completed_at - job.started_at).total_seconds() * 1000)
-
-            avg_duration_ms = round(sum(durations_ms) / len(durations_ms), 2) if durations_ms else None
-
-            cutoff = datetime.utcnow() - timedelta(hours=24)
-            failed_last_24h = sum(
-                1 for job in jobs
-                if job.status == "failed" and job.completed_at and job.completed_at >= cutoff
-            )
-
-            queued_jobs = [job for job in jobs if job.status == "queued" and job.created_at]
-            oldest_queued_age_seconds = None
-            if queued_jobs:
-                oldest_queued = min(queued_jobs, key=lambda j: j.created_at)
-                oldest_queued_age_seconds = round((datetime.utcnow() - oldest_queued.created_at).total_seconds(), 2)
+            repo = ForecastJobRepository(db)
+            now = datetime.utcnow()
+
+            counts = repo.count_by_status()
+            by_status = {status: counts.get(status, 0) for status in ("queued", "running", "completed", "failed", "cancelled")}
+            processing = repo.processing_stats()
+            oldest_queued = repo.oldest_queued_created_at()
+            lane_rows = repo.lane_stats()
+
+            lanes: Dict[str, Dict[str, Any]] = {}
+            for lane in JOB_LANES:
+                row = lane_rows.get(lane, {})
+                oldest = row.get("oldest_queued_at")
+                lanes[lane] = {
+                    "queued": row.get("queued", 0),
+                    "running": row.get("running", 0),
+                    "oldest_queued_age_seconds": _age_seconds(now, oldest),
+                    "avg_wait_ms": _round(row.get("avg_wait_ms")),
+                }
 
             return {
-                "total_jobs": total,
+                "total_jobs": sum(counts.values()),
                 "by_status": by_status,
-                "avg_processing_time_ms": avg_duration_ms,
-                "failed_last_24h": failed_last_24h,
-                "oldest_queued_age_seconds": oldest_queued_age_seconds,
+                "avg_processing_time_ms": _round(processing["avg_ms"]),
+                "processing_time_ms": {
+                    "samples": processing["count"],
+                    "p50": _round(processing["p50_ms"]),
+                    "p95": _round(processing["p95_ms"]),
+                    "p99": _round(processing["p99_ms"]),
+                },
+                "failed_last_24h": repo.count_failed_since(now - timedelta(hours=24)),
+                "oldest_queued_age_seconds": _age_seconds(now, oldest_queued),
+                "coalesced_jobs": repo.count_coalesced(),
+                "lanes": lanes,
+                "by_model": {
+                    model: {
+                        "total_jobs": row["total_jobs"],
+                        "completed": row["completed"],
+                        "failed": row["failed"],
+                        "avg_processing_time_ms": _round(row["avg_processing_time_ms"]),
+                        "p50_ms": _round(row["p50_ms"]),
+                        "p95_ms": _round(row["p95_ms"]),
+                        "p99_ms": _round(row["p99_ms"]),
+                    }
+                    for model, row in sorted(repo.model_stats().items())
+                },
             }
         finally:
             db.close()
@@ -167,7 +303,7 @@ class ForecastJobService:
         cutoff = datetime.utcnow() - timedelta(days=days)
         removable_statuses = ["completed", "failed", "cancelled"]
 
-        db = SessionLocal()
+        db = self._session_factory()
         try:
             query = (
                 db.query(ForecastJob)
@@ -196,57 +332,24 @@ class ForecastJobService:
         finally:
             db.close()
 
-    def _run_forecast_job(self, job_id: str) -> None:
-        db = SessionLocal()
+    def _wake_worker(self) -> None:
+        """Let the embedded worker claim from the shared queue; standalone workers poll."""
+        if self._executor is not None:
+            self._executor.submit(self._drain_embedded)
+
+    def _drain_embedded(self) -> None:
         try:
-            job = db.query(ForecastJob).filter(ForecastJob.job_id == job_id).first()
-            if not job:
-                return
-            if job.status == "cancelled":
-                return
+            self._worker.drain()
+        except Exception:  # noqa: BLE001
+            logger.exception("Embedded forecast worker failed")
 
-            job.status = "running"
-            job.started_at = datetime.utcnow()
-            db.commit()
 
-            service = ForecastService(db)
-            forecasts = service.generate_forecast(
-                product_id=job.product_id,
-                model_type=job.model_type,
-                horizon=job.horizon,
-                user_id=job.requested_by,
-            )
-            result_payload = {
-                "product_id": job.product_id,
-                "horizon": job.horizon,
-                "model_type": forecasts[0].model_type if forecasts else job.model_type,
-                "records_created": len(forecasts),
-                "forecasts": [
-                    {
-                        "period": str(f.period),
-                        "predicted_qty": float(f.predicted_qty),
-                        "lower_bound": float(f.lower_bound) if f.lower_bound else None,
-                        "upper_bound": float(f.upper_bound) if f.upper_bound else None,
-                        "confidence": float(f.confidence) if f.confidence else None,
-                    }
-                    for f in forecasts
-                ],
-            }
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
 
-            job.status = "completed"
-            job.error = None
-            job.result_json = json.dumps(result_payload)
-            job.completed_at = datetime.utcnow()
-            db.commit()
-        except Exception as exc:  # noqa: BLE001
-            job = db.query(ForecastJob).filter(ForecastJob.job_id == job_id).first()
-            if job:
-                job.status = "failed"
-                job.error = str(exc)
-                job.completed_at = datetime.utcnow()
-                db.commit()
-        finally:
-            db.close()
+
+def _age_seconds(now: datetime, since: Optional[datetime]) -> Optional[float]:
+    return round((now - since).total_seconds(), 2) if since else None
 
 
 forecast_job_service = ForecastJobService()
@@ -2,26 +2,43 @@
 Forecast Service — Service Layer (SRP / DIP)
 Uses Strategy + Factory patterns for ML model selection.
 """
-from typing import Optional, List, Dict, Any
-from datetime import date
+from typing import Optional, List, Dict, Any, Callable, ContextManager
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta
+import logging
+import time
 from math import sqrt
 import json
 from statistics import median
 from decimal import Decimal
 import pandas as pd
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.repositories.forecast_repository import ForecastRepository
 from app.repositories.forecast_consensus_repository import ForecastConsensusRepository
 from app.repositories.demand_repository import DemandPlanRepository
+from app.repositories.forecast_residual_repository import ForecastResidualRepository
 from app.models.forecast import Forecast
 from app.models.demand_plan import DemandPlan
 from app.models.forecast_run_audit import ForecastRunAudit
 from app.ml.factory import ForecastModelFactory
+from app.ml.artifact_registry import ModelArtifactRegistry, data_fingerprint, get_model_artifact_registry
+from app.ml.conformal import INTERVAL_MODES, ConformalCalibration, empirical_coverage
 from app.ml.anomaly_detection import AnomalyDetector
 from app.services.forecast_advisor_service import ForecastAdvisorService
 from app.core.exceptions import EntityNotFoundException, InsufficientDataException, to_http_exception
+from app.config import settings
 from app.utils.events import get_event_bus, ForecastGeneratedEvent
+from app.utils.run_profiler import RunProfiler
+
+logger = logging.getLogger(__name__)
+
+# progress(stage, **detail) — e.g. progress("backtest", model="arima", split=2, splits=6)
+ProgressCallback = Callable[..., None]
+
+# Forecast.model_version of runs whose fit is not stored in the artifact registry.
+ADVISOR_MODEL_VERSION = "genxai-advisor-v1"
 
 
 class ForecastService:
@@ -57,13 +74,17 @@ class ForecastService:
         },
     }
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, progress: Optional[ProgressCallback] = None):
         self._db = db
+        self._progress = progress
+        self._profile: Optional[RunProfiler] = None
         self._repo = ForecastRepository(db)
         self._consensus_repo = ForecastConsensusRepository(db)
         self._demand_repo = DemandPlanRepository(db)
+        self._residual_repo = ForecastResidualRepository(db)
         self._bus = get_event_bus()
         self._advisor = ForecastAdvisorService()
+        self._artifacts = get_model_artifact_registry()
 
     def list_forecasts(
         self,
@@ -109,6 +130,8 @@ class ForecastService:
         horizon: int,
         user_id: int,
         model_params: Optional[Dict[str, Any]] = None,
+        interval_mode: str = "model",
+        coverage: float = 0.9,
     ) -> List[Forecast]:
         """Compatibility method returning only saved forecast records."""
         return self.generate_forecast_with_diagnostics(
@@ -117,6 +140,8 @@ class ForecastService:
             horizon=horizon,
             user_id=user_id,
             model_params=model_params,
+            interval_mode=interval_mode,
+            coverage=coverage,
         )["forecasts"]
 
     def generate_forecast_with_diagnostics(
@@ -126,12 +151,42 @@ class ForecastService:
         horizon: int,
         user_id: int,
         model_params: Optional[Dict[str, Any]] = None,
+        interval_mode: str = "model",
+        coverage: float = 0.9,
     ) -> Dict[str, Any]:
         """
         Generate forecast with model diagnostics and advisor metadata.
+
+        interval_mode="conformal" replaces each strategy's own bounds with split-conformal
+        intervals at the requested coverage, calibrated on stored backtest residuals.
         """
+        if interval_mode not in INTERVAL_MODES:
+            raise ValueError(f"interval_mode must be one of {sorted(INTERVAL_MODES)}")
+        if not 0.5 <= coverage < 1.0:
+            raise ValueError("coverage must be in [0.5, 1.0)")
+
+        self._profile = RunProfiler(trace_memory=settings.FORECAST_PROFILE_TRACEMALLOC).start()
+        try:
+            return self._generate_profiled(
+                product_id, model_type, horizon, user_id, model_params, interval_mode, coverage
+            )
+        finally:
+            self._profile.finish()
+            self._profile = None
+
+    def _generate_profiled(
+        self,
+        product_id: int,
+        model_type: Optional[str],
+        horizon: int,
+        user_id: int,
+        model_params: Optional[Dict[str, Any]],
+        interval_mode: str,
+        coverage: float,
+    ) -> Dict[str, Any]:
         advisor_payload = self.recommend_model(product_id=product_id, model_type=model_type)
         advisor = advisor_payload["advisor"]
+        self._report("advisor", selected_model=advisor.recommended_model)
 
         context = ForecastModelFactory.create_context(advisor.recommended_model)
         history_df = advisor_payload["history_df"]
@@ -156,7 +211,45 @@ class ForecastService:
         self._db.add(run_audit)
         self._db.flush()
 
-        predictions = context.execute(history_df, horizon, params=selected_model_params)
+        # Horizon is deliberately not part of the key: a longer-horizon rerun on the
+        # same history and params reuses the persisted fit.
+        artifact_key = ModelArtifactRegistry.build_key(
+            product_id, context.strategy.model_id, selected_model_params, data_fingerprint(history_df)
+        )
+        with self._stage("final_fit"):
+            predictions, artifact_status = context.execute_with_artifacts(
+                history_df, horizon, selected_model_params, self._artifacts, artifact_key
+            )
+        # Only a fit that is in the registry gets its artifact version.
+        model_version = (
+            ModelArtifactRegistry.model_version(context.strategy.model_id, artifact_key)
+            if artifact_status in ("reused", "fitted")
+            else ADVISOR_MODEL_VERSION
+        )
+        if artifact_status != "reused":
+            self._profile.record_fits(1)
+        self._report("fit", model=context.strategy.model_id, artifact_status=artifact_status)
+
+        applied_interval_mode = "model"
+        calibration_samples: Dict[str, int] = {}
+        if interval_mode == "conformal":
+            # Calibrate on the residuals of the model that produced the predictions.
+            produced_by = next(
+                (row["fallback_model"] for row in predictions if "fallback_model" in row), context.strategy.model_id
+            )
+            if produced_by != context.strategy.model_id:
+                advisor.warnings.append(f"conformal_calibrated_on_fallback_model:{produced_by}")
+            calibration = ConformalCalibration(self._residual_repo.get_scores(product_id, produced_by))
+            if calibration.is_empty():
+                advisor.warnings.append("conformal_calibration_unavailable")
+            else:
+                predictions = calibration.apply(predictions, coverage)
+                applied_interval_mode = "conformal"
+                calibration_samples = {
+                    str(step): calibration.sample_count(step) for step in range(1, len(predictions) + 1)
+                }
+
+        persist_started = time.perf_counter()
         created = []
         for pred in predictions:
             # Upsert: delete existing forecast for same product/model/period
@@ -172,9 +265,11 @@ class ForecastService:
                 upper_bound=pred["upper_bound"],
                 confidence=pred["confidence"],
                 mape=pred.get("mape"),
-                model_version="genxai-advisor-v1",
+                model_version=model_version,
                 features_used=json.dumps({
                     "run_audit_id": run_audit.id,
+                    "artifact_status": artifact_status,
+                    "interval_mode": applied_interval_mode,
                     "selection_reason": advisor.reason,
                     "advisor_confidence": advisor.confidence,
                     "advisor_enabled": advisor.advisor_enabled,
@@ -197,10 +292,24 @@ class ForecastService:
             "candidate_metrics": advisor_payload["candidate_metrics"],
             "data_quality_flags": advisor_payload["data_quality_flags"],
             "run_audit_id": run_audit.id,
+            "model_version": model_version,
+            "artifact_status": artifact_status,
+            "interval_mode": applied_interval_mode,
+            "interval_coverage_target": coverage if applied_interval_mode == "conformal" else None,
+            "calibration_samples": calibration_samples,
         }
 
+        self._profile.add_stage("persist", (time.perf_counter() - persist_started) * 1000)
+        resource_usage = self._profile.finish()
+        diagnostics["resource_usage"] = resource_usage
         run_audit.records_created = len(created)
+        run_audit.resource_usage_json = json.dumps(resource_usage)
+        run_audit.duration_ms = resource_usage["total_ms"]
+        run_audit.cpu_ms = resource_usage["cpu_ms"]
+        run_audit.fit_count = resource_usage["fit_count"]
+        run_audit.peak_memory_kb = resource_usage["peak_memory_kb"]
         self._db.commit()
+        self._report("persist", records_created=len(created))
 
         self._bus.publish(ForecastGeneratedEvent(
             product_id=product_id,
@@ -218,27 +327,34 @@ class ForecastService:
         """
         Return advisor recommendation diagnostics without generating forecast records.
         """
-        history = self._demand_repo.get_with_actuals(product_id)
-        if len(history) < 3:
-            raise to_http_exception(
-                InsufficientDataException(required=3, available=len(history), operation="forecast recommendation")
-            )
-
-        df = pd.DataFrame([
-            {"ds": pd.Timestamp(h.period), "y": float(h.actual_qty)}
-            for h in history
-        ])
+        with self._stage("history_load"):
+            history = self._demand_repo.get_with_actuals(product_id)
+            if len(history) < 3:
+                raise to_http_exception(
+                    InsufficientDataException(required=3, available=len(history), operation="forecast recommendation")
+                )
 
-        candidate_metrics = self._run_backtests(df)
+            df = pd.DataFrame([
+                {"ds": pd.Timestamp(h.period), "y": float(h.actual_qty)}
+                for h in history
+            ])
+        self._report("history_loaded", history_months=len(history))
+
+        residuals: Dict[str, Dict[int, List[float]]] = {}
+        with self._stage("backtest"):
+            candidate_metrics = self._run_backtests(df, residual_sink=residuals, residual_steps=6)
+        with self._stage("calibration_store"):
+            self._store_residuals(product_id, residuals)
         default_model = self._select_default_model(len(history), candidate_metrics)
         data_quality_flags = self._data_quality_flags(df)
-        advisor = self._advisor.recommend_model(
-            requested_model=model_type,
-            default_model=default_model,
-            candidate_metrics=candidate_metrics,
-            history_months=len(history),
-            data_quality_flags=data_quality_flags,
-        )
+        with self._stage("advisor"):
+            advisor = self._advisor.recommend_model(
+                requested_model=model_type,
+                default_model=default_model,
+                candidate_metrics=candidate_metrics,
+                history_months=len(history),
+                data_quality_flags=data_quality_flags,
+            )
 
         diagnostics = {
             "selected_model": advisor.recommended_model,
@@ -406,6 +522,8 @@ class ForecastService:
         for model_id, samples in by_model.items():
             if not samples:
                 continue
+            interval_samples = sum(s["interval_samples"] for s in samples)
+            covered = sum((s["interval_coverage"] or 0.0) * s["interval_samples"] for s in samples)
             rows.append({
                 "product_id": 0,
                 "model_type": model_id,
@@ -418,6 +536,8 @@ class ForecastService:
                 "period_count": int(sum(s["period_count"] for s in samples)),
                 "sample_count": int(sum(s["period_count"] for s in samples)),
                 "avg_mape": round(sum(s["mape"] for s in samples) / len(samples), 4),
+                "interval_coverage": round(covered / interval_samples, 4) if interval_samples else None,
+                "interval_samples": int(interval_samples),
             })
         return rows
 
@@ -443,6 +563,67 @@ class ForecastService:
         """Return all available forecasting models."""
         return ForecastModelFactory.list_models()
 
+    def get_resource_usage_summary(self, days: int = 7) -> Dict[str, Any]:
+        """
+        Compute spent on forecast runs over the last `days`, by selected model (totals from
+        audit columns) and by backtested candidate model and stage (from the run breakdowns).
+        """
+        since = datetime.utcnow() - timedelta(days=days)
+        in_window = (ForecastRunAudit.created_at >= since, ForecastRunAudit.duration_ms.isnot(None))
+
+        rows = (
+            self._db.query(
+                ForecastRunAudit.selected_model,
+                func.count(ForecastRunAudit.id),
+                func.sum(ForecastRunAudit.duration_ms),
+                func.avg(ForecastRunAudit.duration_ms),
+                func.sum(ForecastRunAudit.cpu_ms),
+                func.sum(ForecastRunAudit.fit_count),
+                func.max(ForecastRunAudit.peak_memory_kb),
+            )
+            .filter(*in_window)
+            .group_by(ForecastRunAudit.selected_model)
+            .all()
+        )
+        total_ms = sum(float(row[2] or 0) for row in rows)
+        by_selected_model = {
+            model: {
+                "runs": int(runs),
+                "total_ms": round(float(sum_ms or 0), 2),
+                "avg_ms": round(float(avg_ms), 2) if avg_ms is not None else None,
+                "cpu_ms": round(float(cpu_ms or 0), 2),
+                "fits": int(fits or 0),
+                "max_peak_memory_kb": int(peak) if peak is not None else None,
+                "share_pct": round(float(sum_ms or 0) / total_ms * 100, 2) if total_ms else 0.0,
+            }
+            for model, runs, sum_ms, avg_ms, cpu_ms, fits, peak in rows
+        }
+
+        stage_ms: Dict[str, float] = {}
+        backtest_ms: Dict[str, float] = {}
+        for (raw,) in self._db.query(ForecastRunAudit.resource_usage_json).filter(*in_window).all():
+            usage = json.loads(raw or "{}")
+            for stage, ms in (usage.get("stages_ms") or {}).items():
+                stage_ms[stage] = stage_ms.get(stage, 0.0) + float(ms or 0)
+            for model_id, ms in (usage.get("backtest_ms_by_model") or {}).items():
+                backtest_ms[model_id] = backtest_ms.get(model_id, 0.0) + float(ms or 0)
+        backtest_total = sum(backtest_ms.values())
+
+        return {
+            "window_days": days,
+            "runs": sum(entry["runs"] for entry in by_selected_model.values()),
+            "total_ms": round(total_ms, 2),
+            "by_selected_model": dict(sorted(by_selected_model.items(), key=lambda kv: -kv[1]["total_ms"])),
+            "backtest_by_model": {
+                model_id: {
+                    "total_ms": round(ms, 2),
+                    "share_pct": round(ms / backtest_total * 100, 2) if backtest_total else 0.0,
+                }
+                for model_id, ms in sorted(backtest_ms.items(), key=lambda kv: -kv[1])
+            },
+            "stages_ms": {stage: round(ms, 2) for stage, ms in sorted(stage_ms.items(), key=lambda kv: -kv[1])},
+        }
+
     def get_accuracy_drift_alerts(self, threshold_pct: float = 10.0, min_points: int = 6) -> List[dict]:
         """Detect month-over-month degradation by comparing recent vs prior error windows."""
         alerts: List[dict] = []
@@ -495,14 +676,24 @@ class ForecastService:
         include_series: bool = False,
         parameter_grid: Optional[Dict[str, Any]] = None,
         include_parameter_results: bool = False,
+        residual_sink: Optional[Dict[str, Dict[int, List[float]]]] = None,
+        residual_steps: int = 1,
     ) -> List[dict]:
+        """
+        Walk-forward backtests. When `residual_sink` is given, each split forecasts up to
+        `residual_steps` ahead and the out-of-sample residuals of the winning parameter set
+        are collected per horizon step (model_id -> step -> residuals) for conformal
+        calibration. Point metrics always use the one-step-ahead prediction.
+        """
         metrics: List[dict] = []
         available_model_ids = [m["id"] for m in ForecastModelFactory.list_models()]
         model_ids = [m for m in (models or available_model_ids) if m in available_model_ids]
         n = len(df)
         parameter_grid = parameter_grid or {}
 
-        for model_id in model_ids:
+        for models_completed, model_id in enumerate(model_ids):
+            model_started = time.perf_counter()
+            model_fits = 0
             # Backtesting should benchmark *all* registered models, not only those
             # whose strict minimum history threshold is met. Each strategy already
             # has guarded fallback behavior (e.g., ARIMA -> exp smoothing -> moving
@@ -531,14 +722,27 @@ class ForecastService:
                 actual_values: List[float] = []
                 predicted_values: List[float] = []
                 series_points: List[dict] = []
+                step_residuals: Dict[int, List[float]] = {}
 
                 for split in range(start, n):
+                    self._report(
+                        "backtest",
+                        model=model_id,
+                        split=split - start + 1,
+                        splits=n - start,
+                        models_completed=models_completed,
+                        models_total=len(model_ids),
+                    )
                     train = df.iloc[:split]
                     actual = float(df.iloc[split]["y"])
-                    pred = float(
-                        ForecastModelFactory.create_context(model_id)
-                        .execute(train, 1, params=param_set)[0]["predicted_qty"]
-                    )
+                    steps = max(1, min(residual_steps, n - split)) if residual_sink is not None else 1
+                    step_preds = ForecastModelFactory.create_context(model_id).execute(train, steps, params=param_set)
+                    model_fits += 1
+                    pred = float(step_preds[0]["predicted_qty"])
+                    if residual_sink is not None:
+                        for step, row in enumerate(step_preds[:steps], 1):
+                            step_actual = float(df.iloc[split + step - 1]["y"])
+                            step_residuals.setdefault(step, []).append(step_actual - float(row["predicted_qty"]))
                     err = pred - actual
                     abs_err = abs(err)
                     abs_errors.append(abs_err)
@@ -586,12 +790,19 @@ class ForecastService:
                     "period_count": samples,
                     "score": score,
                     **({"series": series_points} if include_series else {}),
+                    "_residuals": step_residuals,
                 })
 
+            if self._profile is not None:
+                self._profile.add_backtest(model_id, (time.perf_counter() - model_started) * 1000, model_fits)
             if not candidate_results:
                 continue
 
             best = sorted(candidate_results, key=lambda row: row["score"])[0]
+            if residual_sink is not None and best["_residuals"]:
+                residual_sink[model_id] = best["_residuals"]
+            for row in candidate_results:
+                row.pop("_residuals", None)
             best_row = {
                 **best,
                 "best_params": best.get("model_params", {}),
@@ -602,6 +813,25 @@ class ForecastService:
 
         return sorted(metrics, key=lambda m: m["score"])
 
+    def _stage(self, name: str) -> ContextManager[None]:
+        return self._profile.stage(name) if self._profile is not None else nullcontext()
+
+    def _report(self, stage: str, **detail: Any) -> None:
+        if self._progress is None:
+            return
+        try:
+            self._progress(stage, **detail)
+        except Exception:  # noqa: BLE001
+            logger.exception("Forecast progress callback failed at stage=%s", stage)
+
+    def _store_residuals(self, product_id: int, residuals: Dict[str, Dict[int, List[float]]]) -> None:
+        """Persist backtest residuals as conformal calibration sets."""
+        if not residuals:
+            return
+        for model_id, scores_by_step in residuals.items():
+            self._residual_repo.replace_scores(product_id, model_id, scores_by_step)
+        self._db.commit()
+
     def _build_selection_reason(self, base_reason: str, model_params: Dict[str, Any]) -> str:
         if not model_params:
             return base_reason
@@ -669,12 +899,16 @@ class ForecastService:
         actual_sum = 0.0
         actual_values: List[float] = []
         predicted_values: List[float] = []
+        lower_values: List[Optional[float]] = []
+        upper_values: List[Optional[float]] = []
 
         for f in forecasts:
             actual = actual_by_period.get(str(f.period))
             if actual is None:
                 continue
             pred = float(f.predicted_qty)
+            lower_values.append(float(f.lower_bound) if f.lower_bound is not None else None)
+            upper_values.append(float(f.upper_bound) if f.upper_bound is not None else None)
             err = pred - actual
             abs_err = abs(err)
             abs_errors.append(abs_err)
@@ -705,11 +939,15 @@ class ForecastService:
             predicted_values=predicted_values,
         )
 
+        coverage = empirical_coverage(actual_values, lower_values, upper_values)
+
         return {
             **computed_metrics,
             "period_count": period_count,
             "sample_count": period_count,
             "avg_mape": computed_metrics["mape"],
+            "interval_coverage": coverage["interval_coverage"] if coverage else None,
+            "interval_samples": coverage["interval_samples"] if coverage else 0,
         }
 
     def _build_error_metrics(
@@ -0,0 +1,267 @@
+"""
+Forecast Worker
+
+Claims forecast jobs from the `forecast_jobs` table and runs them. Any number of
+worker processes can share one database: claiming is atomic, a heartbeat thread
+renews the claim lease while a job runs, and jobs whose lease expired (crashed or
+stalled worker) are requeued by whichever worker polls next.
+
+Run standalone (one process per worker):
+
+    python -m app.services.forecast_worker
+
+The API process also runs an embedded worker unless FORECAST_JOB_EMBEDDED_WORKER=false;
+it polls like a standalone worker and is also woken on every enqueue.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.forecast_job import JOB_LANES, ForecastJob
+from app.repositories.forecast_fingerprint_repository import ForecastFingerprintRepository
+from app.repositories.forecast_job_repository import ForecastJobRepository
+from app.services.forecast_service import ForecastService
+from app.utils.job_events import get_job_event_hub, publish_status
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelled(Exception):
+    """The running job was cancelled or reassigned while this worker held it."""
+
+
+def default_worker_id(suffix: Optional[str] = None) -> str:
+    base = f"{socket.gethostname()}:{os.getpid()}"
+    return f"{base}:{suffix}" if suffix else f"{base}:{uuid4().hex[:8]}"
+
+
+class ForecastWorker:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        worker_id: Optional[str] = None,
+        lease_seconds: Optional[int] = None,
+        heartbeat_seconds: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        poll_seconds: Optional[float] = None,
+        lanes: Optional[Sequence[str]] = None,
+    ):
+        self._session_factory = session_factory
+        self.worker_id = worker_id or default_worker_id()
+        self._lease_seconds = lease_seconds or settings.FORECAST_JOB_LEASE_SECONDS
+        self._heartbeat_seconds = heartbeat_seconds or settings.FORECAST_JOB_HEARTBEAT_SECONDS
+        self._max_attempts = max_attempts or settings.FORECAST_JOB_MAX_ATTEMPTS
+        self._poll_seconds = poll_seconds or settings.FORECAST_WORKER_POLL_SECONDS
+        # None serves every lane in priority order; a subset dedicates the worker.
+        self._lanes = list(lanes) if lanes else None
+        self._stop = threading.Event()
+
+    # ── Queue loop ───────────────────────────────────────────────────────────
+
+    def run_forever(self) -> None:
+        logger.info("Forecast worker started worker_id=%s", self.worker_id)
+        while not self._stop.is_set():
+            try:
+                processed = self.run_once()
+            except Exception:  # noqa: BLE001
+                logger.exception("Forecast worker poll failed worker_id=%s", self.worker_id)
+                processed = None
+            if processed is None:
+                self._stop.wait(self._poll_seconds)
+        logger.info("Forecast worker stopped worker_id=%s", self.worker_id)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def drain(self) -> int:
+        """Process queued jobs until the queue is empty. Returns the number processed."""
+        processed = 0
+        while self.run_once() is not None:
+            processed += 1
+        return processed
+
+    def run_once(self) -> Optional[str]:
+        """Requeue stale leases, claim one job and run it. Returns the job id or None."""
+        db = self._session_factory()
+        try:
+            repo = ForecastJobRepository(db)
+            recovered = repo.requeue_expired(self._max_attempts, self._lease_seconds)
+            if recovered["requeued"] or recovered["failed"]:
+                logger.warning("Recovered stalled forecast jobs %s", recovered)
+            job = repo.claim_next(self.worker_id, self._lease_seconds, lanes=self._lanes)
+            db.commit()
+            if job is None:
+                return None
+            job_id = job.job_id
+        finally:
+            db.close()
+
+        publish_status([job_id], "running", worker_id=self.worker_id)
+        self.process(job_id)
+        return job_id
+
+    # ── Job execution ────────────────────────────────────────────────────────
+
+    def process(self, job_id: str) -> None:
+        """Run a job this worker has claimed, heartbeating until it finishes."""
+        lost = threading.Event()
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(job_id, lost, done), name=f"forecast-heartbeat-{job_id[:8]}", daemon=True
+        )
+        heartbeat.start()
+
+        db = self._session_factory()
+        try:
+            job = ForecastJobRepository(db).get_by_job_id(job_id)
+            if job is None:
+                return
+            result_payload, resource_usage = self._run_job(db, job, lost)
+            completed = {
+                "status": "completed",
+                "error": None,
+                "result_json": json.dumps(result_payload),
+                "completed_at": datetime.utcnow(),
+            }
+            repo = ForecastJobRepository(db)
+            # Followers share the result but consumed no resources of their own.
+            owned = {**completed, "resource_usage_json": json.dumps(resource_usage) if resource_usage else None}
+            if not repo.finish(job_id, self.worker_id, owned):
+                raise JobCancelled(job_id)
+            fingerprints = ForecastFingerprintRepository(db)
+            finished_ids = [job_id, *repo.update_followers([job_id], completed)]
+            for finished_id in finished_ids:
+                fingerprints.mark_applied(finished_id)
+            db.commit()
+            publish_status(finished_ids, "completed", records_created=result_payload.get("records_created"))
+        except JobCancelled:
+            db.rollback()
+            logger.info("Forecast job %s was cancelled or reassigned; result discarded", job_id)
+        except Exception as exc:  # noqa: BLE001
+            db.rollback()
+            failed = {"status": "failed", "error": str(exc), "completed_at": datetime.utcnow()}
+            repo = ForecastJobRepository(db)
+            failed_ids: list = []
+            if repo.finish(job_id, self.worker_id, failed):
+                fingerprints = ForecastFingerprintRepository(db)
+                failed_ids = [job_id, *repo.update_followers([job_id], failed)]
+                for failed_id in failed_ids:
+                    fingerprints.clear_pending(failed_id)
+            db.commit()
+            publish_status(failed_ids, "failed", error=str(exc))
+        finally:
+            done.set()
+            heartbeat.join(timeout=5)
+            db.close()
+
+    def _run_job(
+        self, db: Session, job: ForecastJob, lost: threading.Event
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Run the forecast pipeline; returns the result payload and its resource usage."""
+        self._check(lost, job.job_id)
+        hub = get_job_event_hub()
+        service = ForecastService(
+            db, progress=lambda stage, **detail: hub.publish(job.job_id, "progress", stage=stage, **detail)
+        )
+        generated = service.generate_forecast_with_diagnostics(
+            product_id=job.product_id,
+            model_type=job.model_type,
+            horizon=job.horizon,
+            user_id=job.requested_by,
+            model_params=json.loads(job.model_params_json) if job.model_params_json else None,
+        )
+        forecasts = generated["forecasts"]
+        resource_usage = dict(generated["diagnostics"].get("resource_usage") or {})
+        self._check(lost, job.job_id)
+        anomalies_started = time.perf_counter()
+        anomalies = service.detect_anomalies(job.product_id)
+        if resource_usage:
+            anomalies_ms = round((time.perf_counter() - anomalies_started) * 1000, 2)
+            resource_usage["stages_ms"] = {**resource_usage.get("stages_ms", {}), "anomalies": anomalies_ms}
+            resource_usage["total_ms"] = round((resource_usage.get("total_ms") or 0) + anomalies_ms, 2)
+        payload = {
+            "product_id": job.product_id,
+            "horizon": job.horizon,
+            "model_type": forecasts[0].model_type if forecasts else job.model_type,
+            "records_created": len(forecasts),
+            "forecasts": [
+                {
+                    "period": str(f.period),
+                    "predicted_qty": float(f.predicted_qty),
+                    "lower_bound": float(f.lower_bound) if f.lower_bound else None,
+                    "upper_bound": float(f.upper_bound) if f.upper_bound else None,
+                    "confidence": float(f.confidence) if f.confidence else None,
+                }
+                for f in forecasts
+            ],
+            "anomalies": anomalies,
+        }
+        return payload, resource_usage or None
+
+    @staticmethod
+    def _check(lost: threading.Event, job_id: str) -> None:
+        if lost.is_set():
+            raise JobCancelled(job_id)
+
+    def _heartbeat(self, job_id: str, lost: threading.Event, done: threading.Event) -> None:
+        while not done.wait(self._heartbeat_seconds):
+            db = self._session_factory()
+            try:
+                renewed = ForecastJobRepository(db).renew_lease(job_id, self.worker_id, self._lease_seconds)
+                db.commit()
+            except Exception:  # noqa: BLE001
+                db.rollback()
+                logger.exception("Heartbeat failed for forecast job %s", job_id)
+                continue
+            finally:
+                db.close()
+            if not renewed:
+                # Cancelled from another process, or requeued after a missed lease.
+                lost.set()
+                return
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a GenXSOP forecast job worker.")
+    parser.add_argument("--worker-id", default=None, help="Stable worker identifier (default: host:pid:random)")
+    parser.add_argument("--once", action="store_true", help="Drain the queue and exit instead of polling")
+    parser.add_argument(
+        "--lane",
+        action="append",
+        choices=JOB_LANES,
+        help="Only claim jobs from this lane (repeatable; default: all lanes by priority)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    worker = ForecastWorker(worker_id=args.worker_id, lanes=args.lane)
+    if args.once:
+        logger.info("Processed %s forecast jobs", worker.drain())
+        return
+
+    def _shutdown(signum, _frame):
+        logger.info("Received signal %s; finishing current job", signum)
+        worker.stop()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+    worker.run_forever()
+
+
+if __name__ == "__main__":
+    main()
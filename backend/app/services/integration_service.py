@@ -11,6 +11,7 @@ from app.schemas.integration import (
     ERPDemandActualSyncRequest,
     IntegrationOperationResponse,
 )
+from app.utils.events import EntityUpdatedEvent, get_event_bus
 
 
 class IntegrationService:
@@ -22,10 +23,12 @@ class IntegrationService:
 
     def __init__(self, db: Session):
         self._db = db
+        self._bus = get_event_bus()
 
     def sync_products(self, payload: ERPProductSyncRequest) -> IntegrationOperationResponse:
         created = 0
         updated = 0
+        synced_ids = []
 
         if payload.meta.dry_run:
             return IntegrationOperationResponse(
@@ -50,6 +53,7 @@ class IntegrationService:
                 category_id = category.id
 
             if product:
+                synced_ids.append(product.id)
                 product.name = item.name
                 if category_id is not None:
                     product.category_id = category_id
@@ -72,6 +76,11 @@ class IntegrationService:
                 created += 1
 
         self._db.commit()
+        if synced_ids:
+            self._bus.publish(EntityUpdatedEvent(
+                entity_type="product", entity_id=0,
+                new_values={"product_ids": synced_ids, "batch_id": payload.meta.batch_id},
+            ))
         return IntegrationOperationResponse(
             success=True,
             source_system=payload.meta.source_system,
@@ -146,6 +155,7 @@ class IntegrationService:
     def sync_demand_actuals(self, payload: ERPDemandActualSyncRequest) -> IntegrationOperationResponse:
         updated = 0
         skipped = 0
+        synced_ids = set()
 
         if payload.meta.dry_run:
             return IntegrationOperationResponse(
@@ -179,9 +189,15 @@ class IntegrationService:
                 continue
 
             plan.actual_qty = item.actual_qty
+            synced_ids.add(product.id)
             updated += 1
 
         self._db.commit()
+        if synced_ids:
+            self._bus.publish(EntityUpdatedEvent(
+                entity_type="demand_actuals", entity_id=0,
+                new_values={"product_ids": sorted(synced_ids), "batch_id": payload.meta.batch_id, "updated": updated},
+            ))
         return IntegrationOperationResponse(
             success=True,
             source_system=payload.meta.source_system,
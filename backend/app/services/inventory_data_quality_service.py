@@ -0,0 +1,137 @@
+"""
+Inventory Data Quality Service
+
+Data quality scores are persisted per inventory row in `inventory_data_quality`.
+Reads first rescore the rows that need it, then serve the stored columns. A row
+needs rescoring when it has no score yet, when its `updated_at` differs from the
+watermark it was scored at, or when its freshness has decayed past `fresh_until`.
+Stale rows are scored vectorized in chunks, against one clock reading per refresh,
+and written back with one bulk upsert and one bulk UPDATE per chunk. The upsert
+lets concurrent first reads score the same new rows without a key conflict.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.repositories.inventory_data_quality_repository import InventoryDataQualityRepository
+from app.schemas.inventory import InventoryDataQualityView
+from app.services.inventory_quality_engine import QUALITY_TIERS, score_data_quality
+
+_REFRESH_CHUNK = 5000
+
+
+class InventoryDataQualityService:
+    def __init__(self, db: Session):
+        self._repo = InventoryDataQualityRepository(db)
+
+    def list_views(
+        self,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+    ) -> List[InventoryDataQualityView]:
+        self.refresh(product_id=product_id, location=location)
+        return [
+            InventoryDataQualityView(
+                inventory_id=quality.inventory_id,
+                product_id=inv_product_id,
+                location=inv_location,
+                completeness_score=quality.completeness_score,
+                freshness_score=quality.freshness_score,
+                consistency_score=quality.consistency_score,
+                overall_score=quality.overall_score,
+                quality_tier=quality.quality_tier,
+            )
+            for quality, inv_product_id, inv_location in self._repo.list_with_inventory(
+                product_id=product_id, location=location
+            )
+        ]
+
+    def scores(self, inventory_ids: Iterable[int]) -> Dict[int, Tuple[float, str]]:
+        """
+        (overall_score, quality_tier) per inventory row, rescoring stale rows first.
+        The rescored rows are left for the caller to commit, so rows it already holds
+        are not expired.
+        """
+        ids = list(inventory_ids)
+        self.refresh(inventory_ids=ids, commit=False)
+        return self._repo.scores_for(ids)
+
+    def refresh(
+        self,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+        inventory_ids: Optional[Sequence[int]] = None,
+        commit: bool = True,
+    ) -> int:
+        """Rescore the stale rows in scope, committing each chunk; returns how many were rescored."""
+        if inventory_ids is not None and not inventory_ids:
+            return 0
+        now = datetime.utcnow()
+        rescored = 0
+        after_id = 0
+        while True:
+            rows = self._repo.list_stale_inputs(
+                now,
+                product_id=product_id,
+                location=location,
+                inventory_ids=inventory_ids,
+                after_id=after_id,
+                limit=_REFRESH_CHUNK,
+            )
+            if not rows:
+                return rescored
+            self._write_scores(rows, now)
+            if commit:
+                self._repo.save()
+            rescored += len(rows)
+            after_id = rows[-1].id
+
+    def _write_scores(self, rows: List, now: datetime) -> None:
+        scores = score_data_quality(
+            np.array(
+                [
+                    [
+                        r.on_hand_qty is not None,
+                        r.safety_stock is not None,
+                        r.reorder_point is not None,
+                        r.max_stock is not None,
+                        r.valuation is not None,
+                    ]
+                    for r in rows
+                ],
+                dtype=bool,
+            ).reshape(len(rows), 5),
+            np.array([(r.on_hand_qty or 0) < 0 for r in rows], dtype=bool),
+            np.array(
+                [bool(r.max_stock and r.reorder_point and r.max_stock < r.reorder_point) for r in rows],
+                dtype=bool,
+            ),
+            np.array(
+                [(now - r.updated_at).total_seconds() / 3600 if r.updated_at else np.nan for r in rows],
+                dtype=np.float64,
+            ),
+        )
+
+        inserts: List[dict] = []
+        updates: List[dict] = []
+        for i, r in enumerate(rows):
+            fresh_for = scores.fresh_for_hours[i]
+            values = {
+                "inventory_id": r.id,
+                "completeness_score": float(scores.completeness[i]),
+                "freshness_score": float(scores.freshness[i]),
+                "consistency_score": float(scores.consistency[i]),
+                "overall_score": float(scores.overall[i]),
+                "quality_tier": QUALITY_TIERS[scores.tier[i]],
+                "source_updated_at": r.updated_at,
+                "fresh_until": r.updated_at + timedelta(hours=float(fresh_for)) if not np.isnan(fresh_for) else None,
+                "computed_at": now,
+            }
+            (updates if r.scored else inserts).append(values)
+        self._repo.bulk_upsert(inserts)
+        self._repo.bulk_update(updates)
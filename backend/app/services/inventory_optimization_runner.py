@@ -0,0 +1,154 @@
+"""
+Inventory Optimization Runner
+
+Runs inventory policy optimization in the background. Runs are rows in
+`inventory_policy_runs`: submitting one records it as `queued` and hands it to a
+local thread pool, which claims it and processes the scope in chunks, checkpointing
+after each (see `InventoryService._execute_run`). Without a pool
+(`INVENTORY_OPTIMIZATION_BACKGROUND=false`) a submitted run is processed inline.
+A run whose process died keeps its checkpoint; once its lease expires, the sweeper
+(`resume_stalled` every `INVENTORY_OPTIMIZATION_SWEEP_SECONDS`) claims it again and
+continues from the last committed chunk.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Set
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.inventory_policy_run import InventoryPolicyRun
+from app.repositories.inventory_policy_run_repository import InventoryPolicyRunRepository
+from app.schemas.inventory import InventoryOptimizationRunRequest
+from app.services.inventory_service import InventoryService
+
+logger = logging.getLogger(__name__)
+
+
+class InventoryOptimizationRunner:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_workers: int = 1,
+        background: Optional[bool] = None,
+    ):
+        self._session_factory = session_factory
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:inventory-{uuid4().hex[:8]}"
+        background = settings.INVENTORY_OPTIMIZATION_BACKGROUND if background is None else background
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inventory-optimization")
+            if background else None
+        )
+        self._inflight: Set[str] = set()
+        self._inflight_lock = threading.Lock()
+        self._sweep_stop = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+
+    def enqueue(self, payload: InventoryOptimizationRunRequest, user_id: int) -> InventoryPolicyRun:
+        db = self._session_factory()
+        try:
+            run = InventoryService(db).create_optimization_run(payload, user_id)
+            db.expunge(run)
+        finally:
+            db.close()
+        self.submit(run.run_id)
+        return run
+
+    def resume(self, run_id: str) -> InventoryPolicyRun:
+        """Requeue a failed or stalled run and process it from its checkpoint."""
+        db = self._session_factory()
+        try:
+            run = InventoryService(db).requeue_optimization_run(run_id)
+            db.expunge(run)
+        finally:
+            db.close()
+        self.submit(run.run_id)
+        return run
+
+    def submit(self, run_id: str) -> None:
+        """Process in the background, or inline without a local pool. Runs already in flight are skipped."""
+        with self._inflight_lock:
+            if run_id in self._inflight:
+                return
+            self._inflight.add(run_id)
+        if self._executor is not None:
+            self._executor.submit(self._process_logged, run_id)
+        else:
+            self._process_logged(run_id)
+
+    def process(self, run_id: str) -> Optional[InventoryPolicyRun]:
+        """Claim and run to completion in the calling thread. None when not claimable."""
+        db = self._session_factory()
+        try:
+            run = InventoryService(db).execute_optimization_run(run_id, self.worker_id)
+            if run is not None:
+                db.expunge(run)
+            return run
+        finally:
+            db.close()
+
+    def resume_stalled(self) -> List[str]:
+        """Submit queued runs and runs with expired leases; fail those out of attempts."""
+        db = self._session_factory()
+        try:
+            repo = InventoryPolicyRunRepository(db)
+            resumable: List[str] = []
+            for run in repo.list_resumable():
+                if run.status == "running" and (run.attempts or 0) >= settings.INVENTORY_OPTIMIZATION_MAX_ATTEMPTS:
+                    repo.abandon(run.run_id, f"Abandoned after {run.attempts} attempts")
+                    continue
+                resumable.append(run.run_id)
+            db.commit()
+        finally:
+            db.close()
+        if resumable:
+            logger.info("Resuming inventory optimization runs %s", resumable)
+        for run_id in resumable:
+            self.submit(run_id)
+        return resumable
+
+    def start_sweeper(self, interval_seconds: Optional[float] = None) -> bool:
+        """Call `resume_stalled` now and then every interval from a daemon thread. False when already running."""
+        interval = settings.INVENTORY_OPTIMIZATION_SWEEP_SECONDS if interval_seconds is None else interval_seconds
+        if interval <= 0 or (self._sweeper is not None and self._sweeper.is_alive()):
+            return False
+        self._sweep_stop.clear()
+        self._sweeper = threading.Thread(
+            target=self._sweep_forever, args=(interval,), name="inventory-optimization-sweeper", daemon=True
+        )
+        self._sweeper.start()
+        return True
+
+    def stop_sweeper(self, timeout: Optional[float] = None) -> None:
+        self._sweep_stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout)
+        self._sweeper = None
+
+    def _sweep_forever(self, interval: float) -> None:
+        while not self._sweep_stop.is_set():
+            try:
+                self.resume_stalled()
+            except Exception:  # noqa: BLE001
+                logger.exception("Inventory optimization sweep failed")
+            self._sweep_stop.wait(interval)
+
+    def _process_logged(self, run_id: str) -> None:
+        try:
+            self.process(run_id)
+        except Exception:  # noqa: BLE001
+            logger.exception("Inventory optimization run %s failed", run_id)
+        finally:
+            with self._inflight_lock:
+                self._inflight.discard(run_id)
+
+
+inventory_optimization_runner = InventoryOptimizationRunner()
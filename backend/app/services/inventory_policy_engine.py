@@ -0,0 +1,304 @@
+"""
+Inventory Policy Engine — set-based safety stock / reorder point / max stock
+
+Principles applied:
+- Single Responsibility Principle (SRP): Only turns demand and lead-time inputs into
+  policy quantities; loading rows and persisting results stay in the service layer.
+- Open/Closed Principle (OCP): `compute_policy` and `recommend_policy` are the
+  reference formulas; the vectorized `compute_policies` and `recommend_policies` must
+  agree with them for every row.
+
+Quantities are handled as integer cents, the storage precision of the inventory
+columns. Rounded steps are evaluated in float64 and rounded half-even like
+`Decimal.quantize`; rows whose float result lands too close to a half-cent tie to be
+decided reliably are recomputed with the Decimal reference formula, so results are
+identical to the row-by-row implementation.
+"""
+from __future__ import annotations
+
+from decimal import ROUND_CEILING, ROUND_HALF_UP, Decimal
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+CENT = Decimal("0.01")
+CONFIDENCE_STEP = Decimal("0.0001")
+INVENTORY_STATUSES = ("normal", "low", "critical", "excess")
+
+# Float results within this distance (in cents) of a half-cent are recomputed in
+# Decimal. float64 carries ~1e-16 relative error through the few operations below.
+_TIE_ABS_TOLERANCE = 1e-6
+_TIE_REL_TOLERANCE = 1e-12
+
+
+def service_level_to_z(service_level_target: float) -> float:
+    if service_level_target >= 0.99:
+        return 2.33
+    if service_level_target >= 0.98:
+        return 2.05
+    if service_level_target >= 0.95:
+        return 1.65
+    if service_level_target >= 0.90:
+        return 1.28
+    return 0.84
+
+
+def round_up_to_lot(value: Decimal, lot: Decimal) -> Decimal:
+    if lot <= 0:
+        return value
+    multiplier = (value / lot).to_integral_value(rounding=ROUND_CEILING)
+    return (multiplier * lot).quantize(CENT)
+
+
+def to_cents(value: Optional[Decimal]) -> int:
+    return int((Decimal(value or 0) * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def compute_policy(
+    demand_basis: Decimal,
+    lead_time: Decimal,
+    review_period_days: int,
+    z_factor: float,
+    moq_units: Optional[Decimal] = None,
+    lot_size_units: Optional[Decimal] = None,
+    capacity_max_units: Optional[Decimal] = None,
+) -> Tuple[Decimal, Decimal, Decimal]:
+    """Reference (safety_stock, reorder_point, max_stock) for one inventory row."""
+    review_days = max(1, review_period_days)
+    daily_demand = max(demand_basis / Decimal(str(review_days)), Decimal("1"))
+
+    safety_stock = (daily_demand * Decimal(str(z_factor)) * lead_time.sqrt()).quantize(CENT)
+    reorder_point = (daily_demand * lead_time + safety_stock).quantize(CENT)
+    target_max = (reorder_point * Decimal("1.50")).quantize(CENT)
+
+    # Constraint-aware policy shaping
+    if moq_units and moq_units > 0:
+        reorder_point = max(reorder_point, moq_units)
+    if lot_size_units and lot_size_units > 0:
+        reorder_point = round_up_to_lot(reorder_point, lot_size_units)
+        target_max = round_up_to_lot(target_max, lot_size_units)
+    if capacity_max_units and capacity_max_units > 0:
+        target_max = min(target_max, capacity_max_units)
+        reorder_point = min(reorder_point, target_max)
+    return safety_stock, reorder_point, target_max
+
+
+def compute_policies(
+    demand_basis_cents: np.ndarray,
+    lead_times: Sequence[Decimal],
+    review_period_days: int,
+    z_factor: float,
+    moq_units: Optional[Decimal] = None,
+    lot_size_units: Optional[Decimal] = None,
+    capacity_max_units: Optional[Decimal] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized `compute_policy` over many rows.
+
+    `demand_basis_cents` holds allocated + in-transit quantity per row in cents and
+    `lead_times` the effective lead time per row. Returns int64 cent arrays for
+    safety stock, reorder point and max stock.
+    """
+    demand_basis_cents = np.asarray(demand_basis_cents, dtype=np.int64)
+    n = demand_basis_cents.shape[0]
+    constraints = (moq_units, lot_size_units, capacity_max_units)
+    if not all(_is_whole_cents(c) for c in constraints if c):
+        # Sub-cent constraints can leave sub-cent results; the columns store cents.
+        return _compute_scalar(demand_basis_cents, lead_times, range(n), review_period_days, z_factor, constraints)
+
+    review_days = max(1, review_period_days)
+    lead_time = np.array([float(lt) for lt in lead_times], dtype=np.float64)
+    daily_demand = np.maximum(demand_basis_cents / 100.0 / review_days, 1.0)
+
+    safety_raw = daily_demand * z_factor * np.sqrt(lead_time) * 100.0
+    safety = np.rint(safety_raw).astype(np.int64)
+    reorder_raw = daily_demand * lead_time * 100.0 + safety
+    reorder = np.rint(reorder_raw).astype(np.int64)
+
+    ambiguous = np.flatnonzero(_near_half(safety_raw) | _near_half(reorder_raw))
+    if ambiguous.size:
+        exact_safety, exact_reorder, _ = _compute_scalar(
+            demand_basis_cents, lead_times, ambiguous, review_period_days, z_factor, (None, None, None)
+        )
+        safety[ambiguous] = exact_safety
+        reorder[ambiguous] = exact_reorder
+
+    # reorder * 1.5 in cents is exact or exactly half a cent; quantize rounds to even.
+    quotient, remainder = np.divmod(reorder * 3, 2)
+    target_max = quotient + (remainder & (quotient & 1))
+
+    moq, lot, capacity = (to_cents(c) if c and c > 0 else 0 for c in constraints)
+    if moq:
+        reorder = np.maximum(reorder, moq)
+    if lot:
+        reorder = -(-reorder // lot) * lot
+        target_max = -(-target_max // lot) * lot
+    if capacity:
+        target_max = np.minimum(target_max, capacity)
+        reorder = np.minimum(reorder, target_max)
+    return safety, reorder, target_max
+
+
+class RecommendedPolicies(NamedTuple):
+    demand_pressure: np.ndarray  # float
+    safety_stock: np.ndarray  # cents
+    reorder_point: np.ndarray  # cents
+    max_stock: np.ndarray  # cents
+    confidence: np.ndarray  # ten-thousandths
+
+
+def recommend_policy(
+    on_hand: Decimal,
+    allocated: Decimal,
+    in_transit: Decimal,
+    safety_stock: Decimal,
+    reorder_point: Decimal,
+    max_stock: Decimal,
+    at_risk: bool,
+    lead_time: Decimal,
+) -> Tuple[Decimal, Decimal, Decimal, Decimal, Decimal]:
+    """
+    Reference policy uplift for one row: (demand_pressure, safety_stock, reorder_point,
+    max_stock, confidence). `at_risk` marks critical or low inventory.
+    """
+    demand_pressure = (allocated + in_transit) / max(on_hand, Decimal("1"))
+    risk_boost = Decimal("0.10") if at_risk else Decimal("0")
+    pressure_boost = min(Decimal("0.30"), demand_pressure * Decimal("0.20"))
+    multiplier = Decimal("1.05") + risk_boost + pressure_boost
+
+    rec_ss = max(safety_stock * multiplier, Decimal("1")).quantize(CENT)
+    rec_rop = max(reorder_point * multiplier, rec_ss * Decimal("1.25")).quantize(CENT)
+    rec_max = max(max_stock * multiplier, rec_rop * Decimal("1.40")).quantize(CENT)
+
+    status_adj = Decimal("0.08") if at_risk else Decimal("0")
+    pressure_adj = min(Decimal("0.12"), demand_pressure * Decimal("0.10"))
+    lead_time_adj = Decimal("0.05") if lead_time > Decimal("20") else Decimal("0")
+    score = Decimal("0.72") + status_adj + pressure_adj - lead_time_adj
+    confidence = min(Decimal("0.95"), max(Decimal("0.40"), score)).quantize(CONFIDENCE_STEP)
+    return demand_pressure, rec_ss, rec_rop, rec_max, confidence
+
+
+def recommend_policies(
+    on_hand_cents: np.ndarray,
+    allocated_cents: np.ndarray,
+    in_transit_cents: np.ndarray,
+    safety_cents: np.ndarray,
+    reorder_cents: np.ndarray,
+    max_cents: np.ndarray,
+    at_risk: np.ndarray,
+    lead_times: Sequence[Decimal],
+) -> RecommendedPolicies:
+    """Vectorized `recommend_policy` over many rows; quantities in int64 cents."""
+    on_hand_cents, allocated_cents, in_transit_cents, safety_cents, reorder_cents, max_cents = (
+        np.asarray(a, dtype=np.int64)
+        for a in (on_hand_cents, allocated_cents, in_transit_cents, safety_cents, reorder_cents, max_cents)
+    )
+    at_risk = np.asarray(at_risk, dtype=bool)
+    lead_time = np.array([float(lt) for lt in lead_times], dtype=np.float64)
+
+    demand_pressure = (allocated_cents + in_transit_cents) / np.maximum(on_hand_cents, 100)
+    multiplier = 1.05 + np.where(at_risk, 0.10, 0.0) + np.minimum(0.30, demand_pressure * 0.20)
+
+    safety_raw = np.maximum(safety_cents * multiplier, 100.0)
+    safety = np.rint(safety_raw).astype(np.int64)
+    # safety * 1.25 is exact in float64 and reorder * 1.40 never lands on a half cent.
+    reorder_raw = np.maximum(reorder_cents * multiplier, safety * 1.25)
+    reorder = np.rint(reorder_raw).astype(np.int64)
+    max_raw = np.maximum(max_cents * multiplier, reorder * 1.40)
+    target_max = np.rint(max_raw).astype(np.int64)
+
+    score = (
+        0.72
+        + np.where(at_risk, 0.08, 0.0)
+        + np.minimum(0.12, demand_pressure * 0.10)
+        - np.where(lead_time > 20, 0.05, 0.0)
+    )
+    confidence_raw = np.clip(score, 0.40, 0.95) * 10_000
+    confidence = np.rint(confidence_raw).astype(np.int64)
+
+    ambiguous = np.flatnonzero(
+        _near_half(safety_raw) | _near_half(reorder_raw) | _near_half(max_raw) | _near_half(confidence_raw)
+    )
+    for i in ambiguous:
+        _, exact_safety, exact_reorder, exact_max, exact_confidence = recommend_policy(
+            from_cents(on_hand_cents[i]),
+            from_cents(allocated_cents[i]),
+            from_cents(in_transit_cents[i]),
+            from_cents(safety_cents[i]),
+            from_cents(reorder_cents[i]),
+            from_cents(max_cents[i]),
+            bool(at_risk[i]),
+            Decimal(lead_times[i]),
+        )
+        safety[i] = to_cents(exact_safety)
+        reorder[i] = to_cents(exact_reorder)
+        target_max[i] = to_cents(exact_max)
+        confidence[i] = int(exact_confidence.scaleb(4))
+    return RecommendedPolicies(demand_pressure, safety, reorder, target_max, confidence)
+
+
+def policy_status(
+    on_hand_cents: np.ndarray,
+    safety_cents: np.ndarray,
+    reorder_cents: np.ndarray,
+    max_cents: np.ndarray,
+) -> np.ndarray:
+    """Inventory status per row, same precedence as the single-row recalculation."""
+    return np.select(
+        [
+            on_hand_cents < reorder_cents,
+            on_hand_cents < safety_cents,
+            (max_cents != 0) & (on_hand_cents > max_cents),
+        ],
+        ["critical", "low", "excess"],
+        default="normal",
+    )
+
+
+def requires_maker_checker(current_reorder_cents: np.ndarray, recommended_reorder_cents: np.ndarray) -> np.ndarray:
+    """
+    High-impact changes per row: the reorder point moves by 20% or more. A missing or
+    zero current reorder point counts as one unit; a negative one never qualifies.
+    """
+    current = np.asarray(current_reorder_cents, dtype=np.int64)
+    base = np.where(current == 0, 100, current)
+    delta = np.abs(np.asarray(recommended_reorder_cents, dtype=np.int64) - base)
+    return (base > 0) & (delta * 5 >= base)
+
+
+def _near_half(raw: np.ndarray) -> np.ndarray:
+    distance = np.abs(raw - np.floor(raw) - 0.5)
+    return distance <= _TIE_ABS_TOLERANCE + _TIE_REL_TOLERANCE * np.abs(raw)
+
+
+def _is_whole_cents(value: Decimal) -> bool:
+    scaled = Decimal(value) * 100
+    return scaled == scaled.to_integral_value()
+
+
+def _compute_scalar(
+    demand_basis_cents: np.ndarray,
+    lead_times: Sequence[Decimal],
+    rows: Sequence[int],
+    review_period_days: int,
+    z_factor: float,
+    constraints: Tuple[Optional[Decimal], Optional[Decimal], Optional[Decimal]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    results = [
+        compute_policy(
+            from_cents(demand_basis_cents[i]),
+            Decimal(lead_times[i]),
+            review_period_days,
+            z_factor,
+            *constraints,
+        )
+        for i in rows
+    ]
+    if not results:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty.copy(), empty.copy()
+    return tuple(np.array([to_cents(r[k]) for r in results], dtype=np.int64) for k in range(3))
@@ -0,0 +1,322 @@
+"""
+Inventory Policy Simulation — simulation-optimized (s, S) policies
+
+Principles applied:
+- Single Responsibility Principle (SRP): Only searches reorder-point / order-up-to
+  candidates by simulation; loading demand and lead-time inputs and persisting the
+  chosen policies stay in the service layer.
+
+Every candidate policy of every row is simulated in one array of shape
+(rows, candidates, paths), one day at a time. Each day, due receipts arrive, demand is
+served from stock (unfilled demand is backordered), and cells whose inventory position
+is at or below `s` order up to `S`, with the order quantity raised to the MOQ and
+rounded up to the lot size. Lead times are sampled per order.
+
+Rows are simulated in batches sized so that both the cells and the receipt pipeline
+stay under fixed bounds; a row with a long lead time and many paths is simulated over
+several groups of paths whose totals are added up.
+
+Daily demand is gamma distributed with the row's mean and standard deviation, which
+keeps it non-negative and right-skewed for lumpy items. All candidates of a row see
+the same demand paths (common random numbers), so the comparison between candidates
+is not sampling noise. The chosen policy is the cheapest (holding plus ordering cost)
+whose simulated fill rate meets the target; when none does, the one with the best
+fill rate.
+"""
+from __future__ import annotations
+
+from typing import Callable, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+# Reorder point candidates: mean lead-time demand + k * its standard deviation.
+REORDER_POINT_SIGMAS = (-0.5, 0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0)
+# Order-up-to candidates: reorder point + m * demand over one review period.
+ORDER_QUANTITY_PERIODS = (0.5, 1.0, 2.0, 4.0)
+
+# Upper bounds on one simulated batch. Cells (rows * candidates * paths) bound the
+# per-cell state; pipeline slots (cells * pipeline width) bound the receipt pipeline,
+# which holds one slot per cell and lead-time day and so grows with the lead time.
+_MAX_CELLS = 250_000
+_MAX_PIPELINE_SLOTS = 5_000_000
+
+
+class SimulatedPolicies(NamedTuple):
+    reorder_point: np.ndarray
+    order_up_to: np.ndarray
+    safety_stock: np.ndarray
+    fill_rate: np.ndarray
+    average_on_hand: np.ndarray
+    orders_per_year: np.ndarray
+    meets_target: np.ndarray
+
+
+def candidate_policies(
+    mean_daily: np.ndarray,
+    std_daily: np.ndarray,
+    lead_time_mean: np.ndarray,
+    lead_time_std: np.ndarray,
+    review_period_days: int,
+    moq_units: float = 0.0,
+    lot_size_units: float = 0.0,
+    capacity_max_units: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(s, S) candidate grids of shape (rows, candidates)."""
+    mean_dlt = mean_daily * lead_time_mean
+    std_dlt = np.sqrt(lead_time_mean * std_daily ** 2 + mean_daily ** 2 * lead_time_std ** 2)
+    sigmas = np.repeat(REORDER_POINT_SIGMAS, len(ORDER_QUANTITY_PERIODS))
+    periods = np.tile(ORDER_QUANTITY_PERIODS, len(REORDER_POINT_SIGMAS))
+
+    reorder_point = np.maximum(mean_dlt[:, None] + sigmas * std_dlt[:, None], 0.0)
+    quantity = np.maximum(periods * (mean_daily * max(1, review_period_days))[:, None], max(moq_units, 1.0))
+    order_up_to = reorder_point + quantity
+    if lot_size_units > 0:
+        order_up_to = np.ceil(order_up_to / lot_size_units - 1e-9) * lot_size_units
+    if capacity_max_units > 0:
+        order_up_to = np.minimum(order_up_to, capacity_max_units)
+        reorder_point = np.minimum(reorder_point, order_up_to)
+    return np.round(reorder_point, 2), np.round(order_up_to, 2)
+
+
+def pipeline_widths(lead_time_mean: np.ndarray, lead_time_std: np.ndarray) -> np.ndarray:
+    """Receipt pipeline width per row: the longest sampled lead time plus one day."""
+    return np.maximum(1, np.ceil(lead_time_mean + 3 * lead_time_std)).astype(np.int64) + 1
+
+
+def simulate_policies(
+    reorder_point: np.ndarray,
+    order_up_to: np.ndarray,
+    mean_daily: np.ndarray,
+    std_daily: np.ndarray,
+    lead_time_mean: np.ndarray,
+    lead_time_std: np.ndarray,
+    horizon_days: int,
+    paths: int,
+    rng: np.random.Generator,
+    moq_units: float = 0.0,
+    lot_size_units: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate (rows, candidates) policies over `paths` demand paths. Returns fill rate,
+    average on-hand and orders per day, each of shape (rows, candidates).
+    """
+    totals = _simulate_totals(
+        reorder_point, order_up_to, mean_daily, std_daily, lead_time_mean, lead_time_std,
+        horizon_days, paths, rng, moq_units, lot_size_units,
+    )
+    return _rates(*totals, paths=paths, horizon_days=horizon_days)
+
+
+def _rates(
+    served: np.ndarray,
+    demand: np.ndarray,
+    on_hand: np.ndarray,
+    orders: np.ndarray,
+    paths: int,
+    horizon_days: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fill rate, average on-hand and orders per day from totals over all paths."""
+    fill_rate = np.where(demand[:, None] > 0, served / np.maximum(demand, 1e-12)[:, None], 1.0)
+    return fill_rate, on_hand / (paths * horizon_days), orders / (paths * horizon_days)
+
+
+def _simulate_totals(
+    reorder_point: np.ndarray,
+    order_up_to: np.ndarray,
+    mean_daily: np.ndarray,
+    std_daily: np.ndarray,
+    lead_time_mean: np.ndarray,
+    lead_time_std: np.ndarray,
+    horizon_days: int,
+    paths: int,
+    rng: np.random.Generator,
+    moq_units: float,
+    lot_size_units: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Served quantity, on-hand and orders summed over the measured days and paths, each
+    of shape (rows, candidates), and demand summed the same way, of shape (rows,).
+    """
+    rows, candidates = reorder_point.shape
+    max_lead_time = pipeline_widths(lead_time_mean, lead_time_std) - 1
+    width = int(max_lead_time.max()) + 1
+    warmup = width
+    cells = rows * candidates * paths
+
+    # Flat views over (rows, candidates, paths); the receipt pipeline is a ring buffer
+    # indexed by day modulo its width.
+    net = np.repeat(order_up_to.ravel(), paths)
+    on_order = np.zeros(cells)
+    pipeline = np.zeros((width, cells))
+    reorder_point_cell = np.repeat(reorder_point.ravel(), paths)
+    order_up_to_cell = net.copy()
+    row_of_cell = np.repeat(np.arange(rows), candidates * paths)
+
+    stochastic_rows = std_daily > 0
+    shape = np.where(stochastic_rows, (mean_daily / np.where(stochastic_rows, std_daily, 1.0)) ** 2, 1.0)
+    scale = np.where(stochastic_rows, std_daily ** 2 / np.maximum(mean_daily, 1e-12), 0.0)
+    served_total = np.zeros(cells)
+    on_hand_total = np.zeros(cells)
+    orders = np.zeros(cells)
+    demand_total = 0.0 * mean_daily
+    on_hand = np.empty(cells)
+    served = np.empty(cells)
+
+    for day in range(warmup + horizon_days):
+        receipts = pipeline[day % width]
+        net += receipts
+        on_order -= receipts
+        receipts[:] = 0.0
+
+        daily = rng.gamma(shape[:, None], scale[:, None], size=(rows, paths))
+        daily[~stochastic_rows] = mean_daily[~stochastic_rows, None]
+        # Every candidate of a row sees the same demand path.
+        demand = np.broadcast_to(daily[:, None, :], (rows, candidates, paths)).ravel()
+        np.maximum(net, 0.0, out=on_hand)
+        np.minimum(on_hand, demand, out=served)
+        net -= demand
+        measuring = day >= warmup
+        if measuring:
+            served_total += served
+            demand_total += daily.sum(axis=1)
+            np.maximum(net, 0.0, out=on_hand)
+            on_hand_total += on_hand
+
+        position = net + on_order
+        ordering = np.flatnonzero(position <= reorder_point_cell)
+        if not ordering.size:
+            continue
+        order_rows = row_of_cell[ordering]
+        quantity = order_up_to_cell[ordering] - position[ordering]
+        if moq_units > 0:
+            quantity = np.maximum(quantity, moq_units)
+        if lot_size_units > 0:
+            quantity = np.ceil(quantity / lot_size_units - 1e-9) * lot_size_units
+        lead_time = np.clip(
+            np.rint(rng.normal(lead_time_mean[order_rows], lead_time_std[order_rows])),
+            1,
+            max_lead_time[order_rows],
+        ).astype(np.int64)
+        pipeline[(day + lead_time) % width, ordering] += quantity
+        on_order[ordering] += quantity
+        if measuring:
+            orders[ordering] += 1.0
+
+    grid = (rows, candidates, paths)
+    return (
+        served_total.reshape(grid).sum(axis=2),
+        demand_total,
+        on_hand_total.reshape(grid).sum(axis=2),
+        orders.reshape(grid).sum(axis=2),
+    )
+
+
+def _batches(widths: np.ndarray, candidates: int, paths: int):
+    """
+    Yield (start, stop, paths) batches of consecutive rows whose cells and pipeline
+    slots stay within the bounds. A row that exceeds them on its own is yielded once
+    per group of paths.
+    """
+    n = len(widths)
+    start = 0
+    while start < n:
+        stop, width = start + 1, int(widths[start])
+        while stop < n:
+            grown = max(width, int(widths[stop]))
+            cells = (stop + 1 - start) * candidates * paths
+            if cells > _MAX_CELLS or cells * grown > _MAX_PIPELINE_SLOTS:
+                break
+            stop, width = stop + 1, grown
+        group = paths
+        if stop - start == 1:
+            group = max(1, min(_MAX_CELLS, _MAX_PIPELINE_SLOTS // width) // candidates)
+        for first in range(0, paths, group):
+            yield start, stop, min(group, paths - first)
+        start = stop
+
+
+def optimize_policies(
+    mean_daily: np.ndarray,
+    std_daily: np.ndarray,
+    lead_time_mean: np.ndarray,
+    lead_time_std: np.ndarray,
+    unit_cost: np.ndarray,
+    service_level_target: float,
+    review_period_days: int,
+    horizon_days: int,
+    paths: int,
+    holding_cost_rate: float,
+    ordering_cost: float,
+    moq_units: Optional[float] = None,
+    lot_size_units: Optional[float] = None,
+    capacity_max_units: Optional[float] = None,
+    seed: Union[int, Sequence[int], None] = None,
+    on_batch: Optional[Callable[[], None]] = None,
+) -> SimulatedPolicies:
+    """
+    Cheapest simulated (s, S) policy meeting `service_level_target` (fill rate) per row.
+    `on_batch` is called after each simulated batch, e.g. to renew a run lease.
+    """
+    mean_daily = np.asarray(mean_daily, dtype=float)
+    std_daily = np.asarray(std_daily, dtype=float)
+    lead_time_mean = np.asarray(lead_time_mean, dtype=float)
+    lead_time_std = np.asarray(lead_time_std, dtype=float)
+    unit_cost = np.asarray(unit_cost, dtype=float)
+    moq, lot, capacity = (float(c) if c and c > 0 else 0.0 for c in (moq_units, lot_size_units, capacity_max_units))
+
+    reorder_point, order_up_to = candidate_policies(
+        mean_daily, std_daily, lead_time_mean, lead_time_std, review_period_days, moq, lot, capacity
+    )
+    n = mean_daily.shape[0]
+    served = np.zeros_like(reorder_point)
+    demand = np.zeros(n)
+    on_hand = np.zeros_like(reorder_point)
+    orders = np.zeros_like(reorder_point)
+    rng = np.random.default_rng(seed)
+    widths = pipeline_widths(lead_time_mean, lead_time_std)
+    for start, stop, group in _batches(widths, reorder_point.shape[1], paths):
+        part = slice(start, stop)
+        totals = _simulate_totals(
+            reorder_point[part],
+            order_up_to[part],
+            mean_daily[part],
+            std_daily[part],
+            lead_time_mean[part],
+            lead_time_std[part],
+            horizon_days,
+            group,
+            rng,
+            moq,
+            lot,
+        )
+        served[part] += totals[0]
+        demand[part] += totals[1]
+        on_hand[part] += totals[2]
+        orders[part] += totals[3]
+        if on_batch is not None:
+            on_batch()
+    fill_rate, average_on_hand, orders_per_day = _rates(
+        served, demand, on_hand, orders, paths=paths, horizon_days=horizon_days
+    )
+
+    daily_cost = average_on_hand * (unit_cost * holding_cost_rate / 365.0)[:, None] + orders_per_day * ordering_cost
+    feasible = fill_rate >= service_level_target
+    meets_target = feasible.any(axis=1)
+    cheapest = np.argmin(np.where(feasible, daily_cost, np.inf), axis=1)
+    # Without a feasible candidate, the best fill rate wins (lexsort: last key is primary).
+    best_effort = np.lexsort((daily_cost, -fill_rate), axis=1)[:, 0]
+    chosen = np.where(meets_target, cheapest, best_effort)
+
+    picked = np.arange(n)
+    s = reorder_point[picked, chosen]
+    mean_dlt = mean_daily * lead_time_mean
+    return SimulatedPolicies(
+        reorder_point=s,
+        order_up_to=order_up_to[picked, chosen],
+        safety_stock=np.round(np.maximum(s - mean_dlt, 0.0), 2),
+        fill_rate=fill_rate[picked, chosen],
+        average_on_hand=average_on_hand[picked, chosen],
+        orders_per_year=orders_per_day[picked, chosen] * 365.0,
+        meets_target=meets_target,
+    )
+
@@ -0,0 +1,113 @@
+"""
+Inventory Position History Service
+
+Daily snapshots of every inventory row's position (`inventory_position_snapshots`)
+and downsampled range reads over them for trend charts.
+
+- `capture` copies the current inventory table into today's snapshot with one
+  INSERT ... SELECT. A day is written once; capturing it again is a no-op unless
+  forced, which replaces the day. It runs from the `inventory_position_snapshot`
+  batch job or on demand.
+- `history` totals the scope (all inventory, a product, a location or one row) per
+  day and averages the days into at most `max_points` equal buckets, both in SQL,
+  so a chart over years of history reads a few hundred rows.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import BusinessRuleViolationException, to_http_exception
+from app.models.inventory_position_snapshot import SNAPSHOT_STATUSES, UNKNOWN_STATUS
+from app.repositories.inventory_position_snapshot_repository import InventoryPositionSnapshotRepository
+from app.schemas.inventory import (
+    InventoryPositionCaptureResponse,
+    InventoryPositionHistoryPoint,
+    InventoryPositionHistoryResponse,
+)
+
+EPOCH = date(1970, 1, 1)
+DEFAULT_HISTORY_DAYS = 365
+
+
+def to_snapshot_day(value: date) -> int:
+    return (value - EPOCH).days
+
+
+def from_snapshot_day(day: int) -> date:
+    return EPOCH + timedelta(days=day)
+
+
+def _units(hundredths) -> Decimal:
+    return (Decimal(str(hundredths or 0)) / 100).quantize(Decimal("0.01"))
+
+
+class InventoryPositionHistoryService:
+    def __init__(self, db: Session):
+        self._repo = InventoryPositionSnapshotRepository(db)
+
+    def capture(self, force: bool = False) -> InventoryPositionCaptureResponse:
+        """Snapshot every inventory row for today (UTC)."""
+        captured_at = datetime.utcnow()
+        day = to_snapshot_day(captured_at.date())
+        exists = self._repo.day_exists(day)
+        if exists and not force:
+            return InventoryPositionCaptureResponse(
+                snapshot_date=captured_at.date(), rows_written=0, skipped=True, captured_at=captured_at
+            )
+        rows_written = self._repo.capture_day(day, replace=exists)
+        self._repo.save()
+        return InventoryPositionCaptureResponse(
+            snapshot_date=captured_at.date(), rows_written=rows_written, skipped=False, captured_at=captured_at
+        )
+
+    def history(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_points: int = 300,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+        inventory_id: Optional[int] = None,
+    ) -> InventoryPositionHistoryResponse:
+        end_date = end_date or datetime.utcnow().date()
+        start_date = start_date or end_date - timedelta(days=DEFAULT_HISTORY_DAYS - 1)
+        if start_date > end_date:
+            raise to_http_exception(BusinessRuleViolationException("start_date must not be after end_date."))
+        start_day, end_day = to_snapshot_day(start_date), to_snapshot_day(end_date)
+        bucket_days = max(1, math.ceil((end_day - start_day + 1) / max_points))
+
+        points = []
+        for row in self._repo.bucketed_history(
+            start_day, end_day, bucket_days, product_id=product_id, location=location, inventory_id=inventory_id
+        ):
+            bucket_start = start_day + row.bucket * bucket_days
+            points.append(
+                InventoryPositionHistoryPoint(
+                    period_start=from_snapshot_day(bucket_start),
+                    period_end=from_snapshot_day(min(bucket_start + bucket_days - 1, end_day)),
+                    snapshot_days=row.days,
+                    rows=round(float(row.rows), 2),
+                    on_hand_qty=_units(row.on_hand),
+                    on_hand_min_qty=_units(row.on_hand_min),
+                    on_hand_max_qty=_units(row.on_hand_max),
+                    available_qty=_units(row.available),
+                    in_transit_qty=_units(row.in_transit),
+                    safety_stock_qty=_units(row.safety_stock),
+                    valuation=_units(row.valuation),
+                    # On-hand weighted mean over rows that report days of supply.
+                    days_of_supply=_units(row.dos_weighted / row.dos_weight) if row.dos_weight else None,
+                    status_rows={
+                        status: round(float(getattr(row, f"{status}_rows") or 0), 2)
+                        for status in (*SNAPSHOT_STATUSES, UNKNOWN_STATUS)
+                    },
+                )
+            )
+        return InventoryPositionHistoryResponse(
+            start_date=start_date, end_date=end_date, bucket_days=bucket_days, points=points
+        )
@@ -0,0 +1,272 @@
+"""
+Inventory Projection Service
+
+Time-phased projected available balance for every product-location: opening
+available stock (on hand - allocated + in transit) netted period by period against
+scheduled supply (supply plans, per location) and planned demand (demand plans,
+per product) over `INVENTORY_PROJECTION_HORIZON_MONTHS` months from the current one.
+Demand plans are not location specific, so a product's demand is split across its
+locations in proportion to the stock each can bring to bear (opening available plus
+scheduled supply), or evenly when none has any.
+
+Projections are persisted. A refresh fingerprints each product's inputs with a few
+grouped aggregate queries and recomputes only the products whose fingerprint moved,
+so editing one product's plans recomputes that product alone. Reads never refresh:
+it runs from `POST /inventory/projections/refresh` or the
+`inventory_projection_refresh` batch job.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from math import ceil
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.inventory_projection import InventoryProjection
+from app.repositories.demand_repository import DemandPlanRepository
+from app.repositories.inventory_projection_repository import InventoryProjectionRepository
+from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.supply_repository import SupplyPlanRepository
+from app.schemas.inventory import (
+    InventoryProjectionListResponse,
+    InventoryProjectionPeriod,
+    InventoryProjectionRefreshResponse,
+    InventoryProjectionView,
+)
+from app.services.inventory_policy_engine import from_cents, to_cents
+from app.services.inventory_projection_engine import (
+    PERIOD_STATUSES,
+    add_months,
+    allocate_demand,
+    month_index,
+    project_available_balance,
+    summarize,
+)
+
+
+class InventoryProjectionService:
+    def __init__(self, db: Session):
+        self._repo = InventoryProjectionRepository(db)
+        self._inventory_repo = InventoryRepository(db)
+        self._supply_repo = SupplyPlanRepository(db)
+        self._demand_repo = DemandPlanRepository(db)
+
+    def list_projections(
+        self,
+        page: int = 1,
+        page_size: int = 50,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> InventoryProjectionListResponse:
+        """Stored projections with the earliest stockouts first; see `refresh` for recomputing them."""
+        items, total = self._repo.list_paginated(
+            page=page, page_size=page_size, product_id=product_id, location=location, status=status
+        )
+        return InventoryProjectionListResponse(
+            items=[self._to_view(p) for p in items],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=ceil(total / page_size) if total else 0,
+            status_counts=self._repo.status_counts(product_id=product_id, location=location),
+        )
+
+    def refresh(self, product_id: Optional[int] = None, force: bool = False) -> InventoryProjectionRefreshResponse:
+        horizon_start = date.today().replace(day=1)
+        horizon_months = max(1, settings.INVENTORY_PROJECTION_HORIZON_MONTHS)
+        horizon_end = add_months(horizon_start, horizon_months)
+
+        current = self._current_fingerprints(horizon_start, horizon_months, product_id)
+        stored = self._repo.fingerprints(product_id=product_id)
+        stale = sorted(
+            pid for pid, fingerprint in current.items() if force or stored.get(pid) != fingerprint
+        )
+        removed = [pid for pid in stored if pid not in current]
+        if removed:
+            self._repo.replace_for_products(removed, [])
+            self._repo.save()
+
+        rows_written = 0
+        chunk_size = max(1, settings.INVENTORY_PROJECTION_CHUNK_SIZE)
+        for start in range(0, len(stale), chunk_size):
+            chunk = stale[start:start + chunk_size]
+            projections = self._project(chunk, horizon_start, horizon_months, horizon_end, current)
+            self._repo.replace_for_products(chunk, projections)
+            self._repo.save()
+            rows_written += len(projections)
+
+        return InventoryProjectionRefreshResponse(
+            horizon_start=horizon_start,
+            horizon_months=horizon_months,
+            products_checked=len(current),
+            products_recomputed=len(stale),
+            rows_written=rows_written,
+        )
+
+    def _current_fingerprints(
+        self,
+        horizon_start: date,
+        horizon_months: int,
+        product_id: Optional[int],
+    ) -> Dict[int, str]:
+        horizon_end = add_months(horizon_start, horizon_months)
+        inventory = self._inventory_repo.projection_signatures(product_id=product_id)
+        supply = self._supply_repo.projection_signatures(horizon_start, horizon_end, product_id=product_id)
+        demand = self._demand_repo.projection_signatures(horizon_start, horizon_end, product_id=product_id)
+        product_ids: Set[int] = set(inventory) | set(supply) | set(demand)
+        return {
+            pid: self.compute_fingerprint(
+                {
+                    "horizon": [horizon_start.isoformat(), horizon_months],
+                    "inventory": inventory.get(pid),
+                    "supply": supply.get(pid),
+                    "demand": demand.get(pid),
+                }
+            )
+            for pid in product_ids
+        }
+
+    @staticmethod
+    def compute_fingerprint(inputs: Dict) -> str:
+        raw = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _project(
+        self,
+        product_ids: List[int],
+        horizon_start: date,
+        horizon_months: int,
+        horizon_end: date,
+        fingerprints: Dict[int, str],
+    ) -> List[InventoryProjection]:
+        inventory = self._inventory_repo.list_for_products(product_ids)
+        supply = self._supply_repo.scheduled_supply(product_ids, horizon_start, horizon_end)
+        demand = self._demand_repo.planned_demand(product_ids, horizon_start, horizon_end)
+
+        # Row per product-location: every inventory row, plus locations that only have supply.
+        keys: Dict[Tuple[int, str], int] = {}
+        for inv in inventory:
+            keys.setdefault((inv.product_id, inv.location or "Main"), len(keys))
+        for plan in supply:
+            keys.setdefault((plan.product_id, plan.location or "Main"), len(keys))
+        located = {key[0] for key in keys}
+        for pid in sorted({plan.product_id for plan in demand} - located):
+            keys[(pid, "Main")] = len(keys)
+        if not keys:
+            return []
+
+        n = len(keys)
+        first_month = month_index(horizon_start)
+        opening = np.zeros(n, dtype=np.int64)
+        safety = np.zeros(n, dtype=np.int64)
+        max_stock = np.zeros(n, dtype=np.int64)
+        has_max = np.zeros(n, dtype=bool)
+        for inv in inventory:
+            i = keys[(inv.product_id, inv.location or "Main")]
+            opening[i] += to_cents(inv.on_hand_qty) - to_cents(inv.allocated_qty) + to_cents(inv.in_transit_qty)
+            safety[i] += to_cents(inv.safety_stock)
+            if inv.max_stock is not None:
+                max_stock[i] += to_cents(inv.max_stock)
+                has_max[i] = True
+
+        supply_matrix = np.zeros((n, horizon_months), dtype=np.int64)
+        for plan in supply:
+            i = keys[(plan.product_id, plan.location or "Main")]
+            supply_matrix[i, month_index(plan.period) - first_month] += to_cents(plan.planned_prod_qty)
+
+        product_position = {pid: k for k, pid in enumerate(sorted({key[0] for key in keys}))}
+        row_product = np.empty(n, dtype=np.int64)
+        for (pid, _), i in keys.items():
+            row_product[i] = product_position[pid]
+        product_demand = np.zeros((len(product_position), horizon_months), dtype=np.int64)
+        for plan in demand:
+            product_demand[product_position[plan.product_id], month_index(plan.period) - first_month] += to_cents(plan.qty)
+        demand_matrix = allocate_demand(
+            product_demand, row_product, np.maximum(opening, 0) + supply_matrix.sum(axis=1)
+        )
+
+        balances = project_available_balance(opening, demand_matrix, supply_matrix, safety, max_stock)
+        summary = summarize(balances.status)
+        periods = [add_months(horizon_start, k) for k in range(horizon_months)]
+        computed_at = datetime.utcnow()
+
+        projections: List[InventoryProjection] = []
+        for (pid, location), i in keys.items():
+            first_stockout = int(summary.first_stockout[i])
+            projections.append(
+                InventoryProjection(
+                    product_id=pid,
+                    location=location,
+                    horizon_start=horizon_start,
+                    horizon_months=horizon_months,
+                    opening_available=from_cents(opening[i]),
+                    safety_stock=from_cents(safety[i]),
+                    max_stock=from_cents(max_stock[i]) if has_max[i] else None,
+                    total_demand=from_cents(demand_matrix[i].sum()),
+                    total_supply=from_cents(supply_matrix[i].sum()),
+                    min_projected_available=from_cents(balances.projected[i].min()),
+                    ending_projected_available=from_cents(balances.projected[i, -1]),
+                    status=PERIOD_STATUSES[summary.status[i]],
+                    first_stockout_period=periods[first_stockout] if first_stockout >= 0 else None,
+                    stockout_periods=int(summary.stockout_periods[i]),
+                    below_safety_periods=int(summary.below_safety_periods[i]),
+                    excess_periods=int(summary.excess_periods[i]),
+                    periods_json=json.dumps(
+                        [
+                            {
+                                "period": periods[k].isoformat(),
+                                "opening_available": str(from_cents(balances.opening[i, k])),
+                                "demand_qty": str(from_cents(demand_matrix[i, k])),
+                                "supply_qty": str(from_cents(supply_matrix[i, k])),
+                                "projected_available": str(from_cents(balances.projected[i, k])),
+                                "status": PERIOD_STATUSES[balances.status[i, k]],
+                            }
+                            for k in range(horizon_months)
+                        ]
+                    ),
+                    input_fingerprint=fingerprints[pid],
+                    computed_at=computed_at,
+                )
+            )
+        return projections
+
+    @staticmethod
+    def _to_view(projection: InventoryProjection) -> InventoryProjectionView:
+        return InventoryProjectionView(
+            product_id=projection.product_id,
+            location=projection.location,
+            horizon_start=projection.horizon_start,
+            horizon_months=projection.horizon_months,
+            opening_available=projection.opening_available,
+            safety_stock=projection.safety_stock,
+            max_stock=projection.max_stock,
+            total_demand=projection.total_demand,
+            total_supply=projection.total_supply,
+            min_projected_available=projection.min_projected_available,
+            ending_projected_available=projection.ending_projected_available,
+            status=projection.status,
+            first_stockout_period=projection.first_stockout_period,
+            stockout_periods=projection.stockout_periods,
+            below_safety_periods=projection.below_safety_periods,
+            excess_periods=projection.excess_periods,
+            periods=[
+                InventoryProjectionPeriod(
+                    period=date.fromisoformat(p["period"]),
+                    opening_available=Decimal(p["opening_available"]),
+                    demand_qty=Decimal(p["demand_qty"]),
+                    supply_qty=Decimal(p["supply_qty"]),
+                    projected_available=Decimal(p["projected_available"]),
+                    status=p["status"],
+                )
+                for p in json.loads(projection.periods_json or "[]")
+            ],
+            computed_at=projection.computed_at,
+        )
@@ -0,0 +1,76 @@
+"""
+Inventory Quality Engine — vectorized data quality scoring
+
+Principles applied:
+- Single Responsibility Principle (SRP): Only scores inventory rows from their
+  field presence, consistency and age; loading rows and persisting scores stay in
+  the service layer.
+
+A row's score combines completeness (share of the five policy and valuation fields
+set), freshness (1.0, then 0.75 after 72 hours without an update and 0.5 after 168)
+and consistency (0 for negative stock, 0.5 when max stock is below the reorder
+point, else 1), weighted 0.4 / 0.3 / 0.3. Each component takes only a few values,
+so the overall scores and tiers are precomputed for every combination with the
+same rounding as the row-by-row formula and looked up for all rows at once.
+"""
+from __future__ import annotations
+
+from itertools import product
+from typing import NamedTuple
+
+import numpy as np
+
+QUALITY_TIERS = ("high", "medium", "low")
+COMPLETENESS_FIELDS = 5
+FRESHNESS_LEVELS = (1.0, 0.75, 0.5)
+CONSISTENCY_LEVELS = (1.0, 0.5, 0.0)
+# Age in hours after which freshness drops to the next level.
+FRESHNESS_HORIZONS_HOURS = (72.0, 168.0)
+
+COMPLETENESS_SCORES = np.array([round(p / COMPLETENESS_FIELDS, 4) for p in range(COMPLETENESS_FIELDS + 1)])
+_OVERALL = np.zeros((COMPLETENESS_FIELDS + 1, len(FRESHNESS_LEVELS), len(CONSISTENCY_LEVELS)))
+_TIER = np.zeros(_OVERALL.shape, dtype=np.int64)
+for _p, _f, _c in product(range(COMPLETENESS_FIELDS + 1), range(len(FRESHNESS_LEVELS)), range(len(CONSISTENCY_LEVELS))):
+    _score = round(
+        (0.4 * COMPLETENESS_SCORES[_p]) + (0.3 * FRESHNESS_LEVELS[_f]) + (0.3 * CONSISTENCY_LEVELS[_c]), 4
+    )
+    _OVERALL[_p, _f, _c] = _score
+    _TIER[_p, _f, _c] = 0 if _score >= 0.85 else 1 if _score >= 0.60 else 2
+
+
+class QualityScores(NamedTuple):
+    completeness: np.ndarray
+    freshness: np.ndarray
+    consistency: np.ndarray
+    overall: np.ndarray
+    tier: np.ndarray  # index into QUALITY_TIERS
+    fresh_for_hours: np.ndarray  # age at which freshness next drops, nan when it cannot
+
+
+def score_data_quality(
+    fields_present: np.ndarray,
+    negative_on_hand: np.ndarray,
+    max_below_reorder: np.ndarray,
+    age_hours: np.ndarray,
+) -> QualityScores:
+    """
+    Score n rows. `fields_present` is (n, 5) bool; `age_hours` is the time since
+    each row's last update, nan when it has never been stamped (scored fresh).
+    """
+    points = np.asarray(fields_present, dtype=bool).sum(axis=1)
+    age = np.asarray(age_hours, dtype=np.float64)
+    stamped = ~np.isnan(age)
+    level = np.zeros(age.shape, dtype=np.int64)
+    for horizon in FRESHNESS_HORIZONS_HOURS:
+        level += stamped & (np.where(stamped, age, 0.0) > horizon)
+    consistency = np.where(negative_on_hand, 2, np.where(max_below_reorder, 1, 0))
+
+    horizons = np.array(FRESHNESS_HORIZONS_HOURS + (np.nan,))
+    return QualityScores(
+        completeness=COMPLETENESS_SCORES[points],
+        freshness=np.array(FRESHNESS_LEVELS)[level],
+        consistency=np.array(CONSISTENCY_LEVELS)[consistency],
+        overall=_OVERALL[points, level, consistency],
+        tier=_TIER[points, level, consistency],
+        fresh_for_hours=np.where(stamped, horizons[level], np.nan),
+    )
@@ -0,0 +1,297 @@
+"""
+Inventory Rebalance Engine — min-cost transportation of excess stock to short locations
+
+Principles applied:
+- Single Responsibility Principle (SRP): Only solves the transportation problem for one
+  product; choosing donors and receivers, lane costs and persistence-free reporting stay
+  in the service layer.
+
+The problem is a min-cost max-flow on a bipartite network: donors ship up to their
+excess over allowed lanes (cost per unit) to receivers, up to their shortage. It is
+solved as a balanced transportation problem by the primal network simplex method. A
+dummy donor supplies every receiver at a prohibitive cost (unmet shortage) and a dummy
+receiver absorbs every donor's stock at zero cost (unmoved excess). The prohibitive
+cost exceeds the cost of any augmenting path, so the optimum moves as much stock as the
+allowed lanes permit, and at the least total cost.
+
+Quantities are integer cents and lane costs integers, so all arithmetic is exact int64
+(`np.inf` marks a lane that is not allowed; it is priced out of every basis). Supplies
+are perturbed (scaled by K, plus one per donor) so that no basis is degenerate and the
+method cannot cycle; rounding the final flows back recovers the optimal basis flows.
+
+The basis is a spanning tree rooted at the dummy donor, kept in preorder so that a
+subtree is one contiguous slice: potential updates, subtree moves and size bookkeeping
+are vector operations over the nodes. The starting tree fills the cheapest few lanes of
+every donor and receiver greedily in cost order. Entering lanes are priced a block of
+donor rows at a time. Work per pivot is O(donors + receivers) plus the pricing block,
+whatever the number of distinct lane costs.
+"""
+from __future__ import annotations
+
+from typing import List, NamedTuple, Tuple
+
+import numpy as np
+
+# Lane costs are carried as integers in 1/10,000 of a currency unit per unit moved.
+COST_SCALE = 10_000
+# Cheapest lanes per donor and per receiver offered to the greedy starting solution.
+_STARTING_LANES = 4
+
+
+class TransportationPlan(NamedTuple):
+    flow: np.ndarray  # (donors, receivers) int64 cents
+    pivots: int
+
+
+def solve_transportation(supply: np.ndarray, demand: np.ndarray, cost: np.ndarray) -> TransportationPlan:
+    """
+    Min-cost max-flow from `supply` (donors) to `demand` (receivers), both int64 cents.
+    `cost` is (donors, receivers), non-negative and integral, `np.inf` where no lane.
+    """
+    supply = np.asarray(supply, dtype=np.int64)
+    demand = np.asarray(demand, dtype=np.int64)
+    cost = np.asarray(cost, dtype=np.float64)
+    flow = np.zeros(cost.shape, dtype=np.int64)
+    rows = np.flatnonzero(supply > 0)
+    columns = np.flatnonzero(demand > 0)
+    lanes = cost[np.ix_(rows, columns)]
+    if not np.isfinite(lanes).any():
+        return TransportationPlan(flow, 0)
+
+    simplex = _TransportationSimplex(supply[rows], demand[columns], lanes)
+    pivots = simplex.solve()
+    flow[np.ix_(rows, columns)] = simplex.lane_flow()
+    return TransportationPlan(flow, pivots)
+
+
+class _TransportationSimplex:
+    """
+    Spanning-tree basis over nodes 0..S-1 (donors), S (dummy donor, the root),
+    S+1..S+T (receivers) and S+T+1 (dummy receiver). Each non-root node stores its
+    parent, the flow on the lane to its parent, its potential, its preorder position
+    and its subtree size. Reduced cost of lane (i, j) is cost - pi[i] + pi[j].
+    """
+
+    def __init__(self, supply: np.ndarray, demand: np.ndarray, lanes: np.ndarray):
+        donors, receivers = lanes.shape
+        self._donors, self._receivers = donors, receivers
+        self._root = donors
+        self._sink = donors + receivers + 1
+        allowed = np.isfinite(lanes)
+        max_cost = int(lanes[allowed].max())
+        # Any augmenting path uses at most min(S, T) forward lanes.
+        unmet = (min(donors, receivers) + 1) * (max_cost + 1)
+        # Potentials stay within a tree path's cost: at most two unmet-shortage lanes.
+        bound = 2 * unmet + (donors + receivers + 2) * max_cost
+        blocked = 4 * bound + 1
+
+        cost = np.zeros((donors + 1, receivers + 1), dtype=np.int64)
+        cost[:donors, :receivers] = np.where(allowed, np.where(allowed, lanes, 0).astype(np.int64), blocked)
+        cost[donors, :receivers] = unmet
+        self._cost = cost
+
+        # Perturbed, balanced quantities: K * quantity, plus one per donor (dummy included)
+        # and donors + 1 on the dummy receiver. |perturbation| <= donors + 1 < K / 2.
+        self._scale = scale = 2 * (donors + 1) + 1
+        self._build_tree(self._starting_lanes(scale * supply + 1, scale * demand, allowed))
+
+        rows = donors + 1
+        self._block = max(1, int(np.ceil(np.sqrt(rows * (receivers + 1)) / (receivers + 1))))
+        self._next_row = 0
+
+    def _starting_lanes(self, supply: np.ndarray, demand: np.ndarray, allowed: np.ndarray) -> List[Tuple[int, int, int]]:
+        """
+        Least-cost start: the cheapest few lanes of every donor and receiver are filled
+        greedily in cost order, and what is left goes through the dummy lanes. Each fill
+        exhausts one end, so every filled component keeps one node with stock or
+        shortage left and the lanes form a spanning tree with positive flows.
+        """
+        donors, receivers = allowed.shape
+        lanes = self._cost[:donors, :receivers]
+        picks = min(_STARTING_LANES, receivers)
+        by_row = np.argpartition(lanes, picks - 1, axis=1)[:, :picks]
+        picks = min(_STARTING_LANES, donors)
+        by_column = np.argpartition(lanes, picks - 1, axis=0)[:picks]
+        rows = np.concatenate((np.repeat(np.arange(donors), by_row.shape[1]), by_column.ravel()))
+        columns = np.concatenate((by_row.ravel(), np.tile(np.arange(receivers), by_column.shape[0])))
+        keep = allowed[rows, columns]
+        candidates = np.unique(rows[keep] * receivers + columns[keep])
+        candidates = candidates[np.argsort(lanes.ravel()[candidates], kind="stable")]
+
+        supply_left = supply.tolist()
+        demand_left = demand.tolist()
+        tree: List[Tuple[int, int, int]] = []
+        for i, j in zip(*np.divmod(candidates, receivers)):
+            i, j = int(i), int(j)
+            amount = min(supply_left[i], demand_left[j])
+            if amount:
+                supply_left[i] -= amount
+                demand_left[j] -= amount
+                tree.append((i, donors + 1 + j, amount))
+        root, sink = self._root, self._sink
+        tree += [(i, sink, left) for i, left in enumerate(supply_left) if left]
+        tree += [(root, donors + 1 + j, left) for j, left in enumerate(demand_left) if left]
+        tree.append((root, sink, 1 + int(sum(demand)) - int(sum(demand_left))))
+        return tree
+
+    def _build_tree(self, lanes: List[Tuple[int, int, int]]) -> None:
+        """Parents, lane flows, potentials, preorder and subtree sizes of a spanning tree."""
+        nodes = self._donors + self._receivers + 2
+        adjacent: List[List[Tuple[int, int]]] = [[] for _ in range(nodes)]
+        for donor, receiver, amount in lanes:
+            adjacent[donor].append((receiver, amount))
+            adjacent[receiver].append((donor, amount))
+        cost = self._cost
+        first_receiver = self._donors + 1
+        parent = [-1] * nodes
+        flow_up = [0] * nodes
+        pi = [0] * nodes
+        order = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            for child, amount in adjacent[node]:
+                if child == parent[node]:
+                    continue
+                parent[child] = node
+                flow_up[child] = amount
+                # Tree lanes have zero reduced cost: cost - pi[donor] + pi[receiver] = 0.
+                if child < first_receiver:
+                    pi[child] = int(cost[child, node - first_receiver]) + pi[node]
+                else:
+                    pi[child] = pi[node] - int(cost[node, child - first_receiver])
+                stack.append(child)
+        size = [1] * nodes
+        for node in reversed(order[1:]):
+            size[parent[node]] += size[node]
+
+        self._parent = np.array(parent, dtype=np.int64)
+        self._flow_up = np.array(flow_up, dtype=np.int64)
+        self._pi = np.array(pi, dtype=np.int64)
+        self._order = np.array(order, dtype=np.int64)
+        self._pos = np.empty(nodes, dtype=np.int64)
+        self._pos[self._order] = np.arange(nodes)
+        self._size = np.array(size, dtype=np.int64)
+
+    def solve(self) -> int:
+        pivots = 0
+        while True:
+            entering = self._price()
+            if entering is None:
+                return pivots
+            self._pivot(*entering)
+            pivots += 1
+
+    def lane_flow(self) -> np.ndarray:
+        donors, receivers = self._donors, self._receivers
+        flow = np.zeros((donors, receivers), dtype=np.int64)
+        child = np.arange(len(self._parent))
+        parent = self._parent
+        donor = np.where(child <= donors, child, parent)
+        receiver = np.where(child <= donors, parent, child) - (donors + 1)
+        lane = (parent >= 0) & (donor < donors) & (receiver >= 0) & (receiver < receivers)
+        half = self._scale // 2
+        flow[donor[lane], receiver[lane]] = (self._flow_up[lane] + half) // self._scale
+        return flow
+
+    def _price(self):
+        """Most negative reduced cost in the first block of donor rows that has one."""
+        rows = self._cost.shape[0]
+        pi_receiver = self._pi[self._donors + 1:]
+        scanned = 0
+        while scanned < rows:
+            start = self._next_row
+            stop = min(start + self._block, rows)
+            self._next_row = stop % rows
+            scanned += stop - start
+            reduced = self._cost[start:stop] - self._pi[start:stop, None] + pi_receiver
+            k = int(reduced.argmin())
+            i, j = divmod(k, reduced.shape[1])
+            if reduced[i, j] < 0:
+                return start + i, j, int(reduced[i, j])
+        return None
+
+    def _ancestors(self, node: int) -> np.ndarray:
+        """Mask of `node` and its ancestors: the nodes whose preorder slice holds it."""
+        pos, size = self._pos, self._size
+        return (pos <= pos[node]) & (pos + size > pos[node])
+
+    def _pivot(self, donor: int, column: int, reduced: int) -> None:
+        parent, flow_up, pos, size = self._parent, self._flow_up, self._pos, self._size
+        receiver = self._donors + 1 + column
+
+        # Cycle: the entering lane plus the tree path receiver -> lca -> donor. Lanes
+        # along the path alternate, starting with less flow into the receiver.
+        above_receiver = self._ancestors(receiver)
+        above_donor = self._ancestors(donor)
+        common = above_receiver & above_donor
+        up_from_receiver = np.flatnonzero(above_receiver & ~common)
+        up_from_receiver = up_from_receiver[np.argsort(-pos[up_from_receiver])]
+        down_to_donor = np.flatnonzero(above_donor & ~common)
+        down_to_donor = down_to_donor[np.argsort(pos[down_to_donor])]
+        path = np.concatenate((up_from_receiver, down_to_donor))
+        decreasing = path[0::2]
+        k = int(flow_up[decreasing].argmin())
+        leaving = int(decreasing[k])
+        theta = int(flow_up[leaving])
+        flow_up[path[0::2]] -= theta
+        flow_up[path[1::2]] += theta
+
+        # The subtree cut off by the leaving lane hangs from the entering lane's endpoint
+        # inside it (`inner`) under the other endpoint (`outer`), rerooted at `inner`;
+        # `chain` runs from `inner` up to the leaving node.
+        # Sizes change only off the common part of the two root paths: the leaving
+        # node's ancestors below the lca lose the subtree, the other side gains it.
+        at = 2 * k
+        if at < len(up_from_receiver):
+            inner, outer, shift = receiver, donor, -reduced
+            chain = up_from_receiver[:at + 1]
+            size[up_from_receiver[at + 1:]] -= int(size[leaving])
+            size[down_to_donor] += int(size[leaving])
+        else:
+            at -= len(up_from_receiver)
+            inner, outer, shift = donor, receiver, reduced
+            chain = down_to_donor[at:][::-1]
+            size[down_to_donor[:at]] -= int(size[leaving])
+            size[up_from_receiver] += int(size[leaving])
+        cut = int(size[leaving])
+        start = int(pos[leaving])
+        order = self._order
+        subtree = order[start:start + cut]
+        self._pi[subtree] += shift
+
+        # Rerooted preorder: inner's subtree, then each chain node's subtree less the
+        # part already placed. A node's level is the first chain node holding it.
+        chain_start = pos[chain]
+        chain_size = size[chain].copy()
+        chain_flow = flow_up[chain].copy()
+        slots = np.arange(start, start + cut)
+        level = np.maximum(
+            np.searchsorted(-chain_start, -slots, side="left"),
+            np.searchsorted(chain_start + chain_size, slots, side="right"),
+        )
+        moved = subtree[np.argsort(level, kind="stable")]
+
+        parent[chain[1:]] = chain[:-1]
+        flow_up[chain[1:]] = chain_flow[:-1]
+        size[chain[1:]] = cut - chain_size[:-1]
+        parent[inner] = outer
+        flow_up[inner] = theta
+        size[inner] = cut
+
+        # Move the slice next to `outer`; only positions between the two places change.
+        target = int(pos[outer]) + 1
+        if target <= start:
+            order[target:start + cut] = np.concatenate((moved, order[target:start]))
+            changed = slice(target, start + cut)
+        else:
+            order[start:target] = np.concatenate((order[start + cut:target], moved))
+            changed = slice(start, target)
+        pos[order[changed]] = np.arange(changed.start, changed.stop)
+
+
+def transportation_cost(flow: np.ndarray, cost: np.ndarray) -> int:
+    """Total cost of a plan in cents × `COST_SCALE` units."""
+    used = flow > 0
+    return int((flow[used] * cost[used].astype(np.int64)).sum())
@@ -0,0 +1,217 @@
+"""
+Inventory Rollup Service
+
+Keeps `inventory_status_rollups` (row counts and valuation per status, overall and
+per location) in step with the inventory table, and serves summary reads from it.
+
+Maintenance is incremental and transactional, through two SQLAlchemy session hooks:
+
+- ORM unit of work (`before_flush` / `after_flush`): inserted rows add their
+  contribution, deleted rows remove it, and updated rows whose location, status or
+  valuation changed move it. The committed values are read back by primary key
+  before the flush, so a change made on an expired object is still accounted for.
+- Bulk statements (`do_orm_execute`): an ORM UPDATE or DELETE on `Inventory`, such
+  as the executemany policy write, snapshots the affected rows before and after the
+  statement and applies the difference.
+
+Deltas are added to the rollup rows on the same connection, so they commit or roll
+back with the inventory change. Writes made outside these hooks (raw SQL, another
+process without them) are repaired by `reconcile`, which rebuilds every rollup row
+from one grouped aggregate and reports the rows that had drifted.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.models.inventory import Inventory
+from app.models.inventory_status_rollup import InventoryStatusRollup
+from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.inventory_rollup_repository import InventoryRollupRepository, RollupDeltas
+from app.schemas.inventory import InventoryRollupReconcileResponse
+from app.services.inventory_policy_engine import INVENTORY_STATUSES
+
+OVERALL = ("overall", "")
+_TRACKED = ("location", "status", "valuation")
+_SNAPSHOT_CHUNK = 500
+_PENDING_KEY = "inventory_rollup_before_flush"
+
+# (location, status, valuation) of one inventory row.
+Contribution = Tuple[Optional[str], Optional[str], Optional[Decimal]]
+
+
+def add_contribution(deltas: RollupDeltas, contribution: Contribution, sign: int) -> None:
+    """Add (sign=1) or remove (sign=-1) one row's contribution to the overall and location rollups."""
+    location, status, valuation = contribution
+    if status not in INVENTORY_STATUSES:
+        return
+    value = Decimal(valuation) if valuation is not None else Decimal("0")
+    for key in (OVERALL, ("location", location or "")):
+        changes = deltas.setdefault(key, {})
+        changes[f"{status}_count"] = changes.get(f"{status}_count", 0) + sign
+        changes[f"{status}_value"] = changes.get(f"{status}_value", Decimal("0")) + sign * value
+
+
+def rollup_totals(rollup: Optional[InventoryStatusRollup]) -> Dict[str, Tuple[int, Decimal]]:
+    """(count, value) per status of one rollup row; zeros when there is none."""
+    if rollup is None:
+        return {status: (0, Decimal("0")) for status in INVENTORY_STATUSES}
+    return {
+        status: (getattr(rollup, f"{status}_count") or 0, Decimal(getattr(rollup, f"{status}_value") or 0))
+        for status in INVENTORY_STATUSES
+    }
+
+
+def _snapshot(session: Session, ids: Iterable[int]) -> Dict[int, Contribution]:
+    ids = list(ids)
+    snapshot: Dict[int, Contribution] = {}
+    for start in range(0, len(ids), _SNAPSHOT_CHUNK):
+        rows = session.execute(
+            select(Inventory.id, Inventory.location, Inventory.status, Inventory.valuation).where(
+                Inventory.id.in_(ids[start:start + _SNAPSHOT_CHUNK])
+            )
+        )
+        snapshot.update({row.id: (row.location, row.status, row.valuation) for row in rows})
+    return snapshot
+
+
+def _tracked_change(obj: Inventory) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in _TRACKED)
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    ids = [
+        obj.id
+        for obj in list(session.dirty) + list(session.deleted)
+        if isinstance(obj, Inventory) and obj.id is not None and (obj in session.deleted or _tracked_change(obj))
+    ]
+    if ids:
+        session.info[_PENDING_KEY] = _snapshot(session, ids)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    before: Dict[int, Contribution] = session.info.pop(_PENDING_KEY, {})
+    deltas: RollupDeltas = {}
+    for obj in session.new:
+        if isinstance(obj, Inventory):
+            add_contribution(deltas, (obj.location, obj.status, obj.valuation), 1)
+    for inventory_id, contribution in before.items():
+        add_contribution(deltas, contribution, -1)
+    for obj in session.dirty:
+        if isinstance(obj, Inventory) and obj.id in before and obj not in session.deleted:
+            add_contribution(deltas, (obj.location, obj.status, obj.valuation), 1)
+    if deltas:
+        InventoryRollupRepository(session).apply_deltas(deltas)
+
+
+def _on_orm_execute(orm_execute_state: ORMExecuteState):
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ is not Inventory:
+        return None
+    session = orm_execute_state.session
+    parameters = orm_execute_state.parameters
+    if isinstance(parameters, list) and parameters and all("id" in p for p in parameters):
+        # Bulk UPDATE by primary key (executemany).
+        ids = [p["id"] for p in parameters]
+    else:
+        q = select(Inventory.id)
+        if orm_execute_state.statement.whereclause is not None:
+            q = q.where(orm_execute_state.statement.whereclause)
+        ids = session.execute(q).scalars().all()
+    before = _snapshot(session, ids)
+    result = orm_execute_state.invoke_statement()
+    after = _snapshot(session, before)
+    deltas: RollupDeltas = {}
+    for inventory_id, contribution in before.items():
+        if after.get(inventory_id) != contribution:
+            add_contribution(deltas, contribution, -1)
+            if inventory_id in after:
+                add_contribution(deltas, after[inventory_id], 1)
+    if deltas:
+        InventoryRollupRepository(session).apply_deltas(deltas)
+    return result
+
+
+def register_inventory_rollup_hooks() -> None:
+    """Install the maintenance hooks on every Session (idempotent)."""
+    for name, handler in (
+        ("before_flush", _before_flush),
+        ("after_flush", _after_flush),
+        ("do_orm_execute", _on_orm_execute),
+    ):
+        if not event.contains(Session, name, handler):
+            event.listen(Session, name, handler)
+
+
+class InventoryRollupService:
+    def __init__(self, db: Session):
+        self._repo = InventoryRollupRepository(db)
+        self._inventory_repo = InventoryRepository(db)
+
+    def status_totals(self, location: Optional[str] = None) -> Dict[str, Tuple[int, Decimal]]:
+        """(count, value) per status, overall or for one location — a single-row lookup."""
+        rollup = self._repo.get_scope("location", location) if location else self._repo.get_scope(*OVERALL)
+        return rollup_totals(rollup)
+
+    def location_totals(self) -> List[Tuple[str, Dict[str, Tuple[int, Decimal]]]]:
+        """(location, status totals) for every location with inventory, by location."""
+        return [
+            (rollup.location, rollup_totals(rollup))
+            for rollup in self._repo.list_scope("location")
+            if any(getattr(rollup, f"{status}_count") for status in INVENTORY_STATUSES)
+        ]
+
+    def reconcile(self) -> InventoryRollupReconcileResponse:
+        """Rebuild every rollup row from the inventory table; report the rows that had drifted."""
+        expected: Dict[Tuple[str, str], Dict[str, Tuple[int, Decimal]]] = {}
+        for row in self._inventory_repo.location_status_totals():
+            if row.status not in INVENTORY_STATUSES:
+                continue
+            value = row.value if row.value is not None else Decimal("0")
+            for key in (OVERALL, ("location", row.location or "")):
+                totals = expected.setdefault(key, rollup_totals(None))
+                count, total = totals[row.status]
+                totals[row.status] = (count + row.count, (total + value).quantize(Decimal("0.01")))
+
+        stored = {(r.scope, r.location): rollup_totals(r) for r in self._repo.list_all()}
+        zero = rollup_totals(None)
+        drifted = sorted(
+            f"{scope}:{location}" if location else scope
+            for scope, location in set(stored) | set(expected)
+            if stored.get((scope, location), zero) != expected.get((scope, location), zero)
+        )
+
+        reconciled_at = datetime.utcnow()
+        self._repo.replace_all(
+            [
+                {
+                    "scope": scope,
+                    "location": location,
+                    **{f"{status}_count": totals[status][0] for status in INVENTORY_STATUSES},
+                    **{f"{status}_value": totals[status][1] for status in INVENTORY_STATUSES},
+                }
+                for (scope, location), totals in expected.items()
+            ],
+            reconciled_at,
+        )
+        self._repo.save()
+        return InventoryRollupReconcileResponse(
+            rollup_rows=len(expected),
+            drifted_rows=drifted,
+            reconciled_at=reconciled_at,
+        )
+
+    def ensure_seeded(self) -> bool:
+        """Build the rollups once when inventory exists but no overall rollup does (True when built)."""
+        if self._repo.get_scope(*OVERALL) is not None or not self._inventory_repo.count():
+            return False
+        self.reconcile()
+        return True
@@ -4,18 +4,21 @@ Inventory Service — Service Layer (SRP / DIP)
 from datetime import datetime, timedelta
 from uuid import uuid4
 from math import ceil
-from typing import Optional, List, Tuple
+from typing import Callable, Dict, Optional, List, Tuple
 import json
-import random
-from decimal import Decimal, ROUND_CEILING
+import logging
+import time
+from decimal import ROUND_HALF_UP, Decimal
 from statistics import NormalDist
+from types import SimpleNamespace
+import numpy as np
 from sqlalchemy.orm import Session
 
-from app.repositories.demand_repository import DemandPlanRepository
+from app.config import settings
+
 from app.repositories.inventory_repository import InventoryRepository
 from app.repositories.inventory_exception_repository import InventoryExceptionRepository
 from app.repositories.product_repository import ProductRepository
-from app.repositories.supply_repository import SupplyPlanRepository
 from app.repositories.inventory_recommendation_repository import InventoryRecommendationRepository
 from app.repositories.inventory_policy_run_repository import InventoryPolicyRunRepository
 from app.models.inventory import Inventory
@@ -24,6 +27,7 @@ from app.schemas.inventory import (
     InventoryUpdate,
     InventoryListResponse,
     InventoryHealthSummary,
+    InventoryLocationHealth,
     InventoryOptimizationRunRequest,
     InventoryOptimizationRunResponse,
     InventoryPolicyOverride,
@@ -34,7 +38,11 @@ from app.schemas.inventory import (
     InventoryRecommendationDecisionRequest,
     InventoryRecommendationApproveRequest,
     InventoryRebalanceRecommendationView,
+    InventoryRebalanceLane,
+    InventoryRebalanceRequest,
+    InventoryRebalancePlanResponse,
     InventoryAutoApplyRequest,
+    InventoryAutoApplyItem,
     InventoryAutoApplyResponse,
     InventoryControlTowerSummary,
     InventoryDataQualityView,
@@ -44,12 +52,58 @@ from app.schemas.inventory import (
     InventoryAssessmentAreaScore,
     InventoryServiceLevelAnalyticsRequest,
     InventoryServiceLevelAnalyticsResponse,
+    InventoryStatsCacheMetrics,
     InventoryServiceLevelDistributionPoint,
     InventoryServiceLevelSuggestion,
+    InventoryNetworkServiceLevelRequest,
+    InventoryNetworkServiceLevelResponse,
+    InventoryNetworkServiceLevelRow,
     InventoryPolicyRunView,
 )
 from app.core.exceptions import EntityNotFoundException, to_http_exception
-from app.utils.events import get_event_bus, EntityUpdatedEvent
+from app.services.inventory_policy_engine import (
+    INVENTORY_STATUSES,
+    compute_policies,
+    from_cents,
+    policy_status,
+    recommend_policies,
+    requires_maker_checker,
+    service_level_to_z,
+    to_cents,
+)
+from app.services.inventory_policy_simulation import optimize_policies
+from app.services.inventory_rebalance_engine import COST_SCALE, solve_transportation
+from app.services.inventory_data_quality_service import InventoryDataQualityService
+from app.services.inventory_rollup_service import InventoryRollupService
+from app.services.inventory_stats_cache import ProductStats, get_inventory_stats_cache, lead_time_stats
+from app.services.service_level_simulation import (
+    analytical_service_levels,
+    draw_lead_time_demand,
+    histogram,
+    histogram_points,
+    new_seed,
+    simulate_service_level,
+    simulated_service_levels,
+)
+from app.utils.events import get_event_bus, DomainEvent, EntityBatchUpdatedEvent, EntityUpdatedEvent
+
+logger = logging.getLogger(__name__)
+
+ANALYTICAL_HISTOGRAM_SAMPLES = 5000
+SERVICE_LEVEL_CURVE_TARGETS = (0.90, 0.95, 0.97, 0.99)
+NETWORK_SORT_KEYS = {
+    # sort key -> True when higher values are riskier
+    "stockout_probability": True,
+    "expected_shortage_units": True,
+    "fill_rate": False,
+    "cycle_service_level": False,
+}
+# Exception types a policy run raises and resolves; data quality exceptions are left alone.
+RUN_EXCEPTION_TYPES = ("stockout_risk", "excess_risk")
+
+
+class _RunTakenOver(Exception):
+    """Another worker claimed the optimization run while this one held it."""
 
 
 class InventoryService:
@@ -57,11 +111,12 @@ class InventoryService:
     def __init__(self, db: Session):
         self._repo = InventoryRepository(db)
         self._exception_repo = InventoryExceptionRepository(db)
-        self._demand_repo = DemandPlanRepository(db)
         self._product_repo = ProductRepository(db)
-        self._supply_repo = SupplyPlanRepository(db)
         self._recommendation_repo = InventoryRecommendationRepository(db)
         self._policy_run_repo = InventoryPolicyRunRepository(db)
+        self._rollups = InventoryRollupService(db)
+        self._quality = InventoryDataQualityService(db)
+        self._stats = get_inventory_stats_cache()
         self._bus = get_event_bus()
 
     def list_optimization_runs(self, limit: int = 50, status: Optional[str] = None) -> List[InventoryPolicyRunView]:
@@ -110,124 +165,400 @@ class InventoryService:
         ))
         return result
 
-    def run_optimization(
+    def create_optimization_run(
         self,
         payload: InventoryOptimizationRunRequest,
         user_id: int,
-    ) -> InventoryOptimizationRunResponse:
-        scope = self._repo.list_for_policy(product_id=payload.product_id, location=payload.location)
-        run_id = str(uuid4())
-        started_at = datetime.utcnow()
-
+        worker_id: Optional[str] = None,
+    ) -> InventoryPolicyRun:
+        """Record a run for `payload`: queued, or already claimed by `worker_id` when given."""
+        payload = self._with_simulation_seed(payload)
+        now = datetime.utcnow()
         run = InventoryPolicyRun(
-            run_id=run_id,
-            status="running",
+            run_id=str(uuid4()),
+            status="running" if worker_id else "queued",
             product_id=payload.product_id,
             location=payload.location,
             requested_by=user_id,
-            parameters_json=json.dumps(payload.model_dump()),
-            processed_count=len(scope),
-            started_at=started_at,
+            parameters_json=json.dumps(payload.model_dump(mode="json")),
+            total_count=self._repo.count_for_policy(product_id=payload.product_id, location=payload.location),
+            worker_id=worker_id,
+            attempts=1 if worker_id else 0,
+            started_at=now if worker_id else None,
+            lease_expires_at=(
+                now + timedelta(seconds=settings.INVENTORY_OPTIMIZATION_LEASE_SECONDS) if worker_id else None
+            ),
         )
-        self._policy_run_repo.create(run)
+        return self._policy_run_repo.create(run)
 
+    def run_optimization(
+        self,
+        payload: InventoryOptimizationRunRequest,
+        user_id: int,
+    ) -> InventoryOptimizationRunResponse:
+        worker_id = f"inline:{uuid4().hex[:12]}"
+        payload = self._with_simulation_seed(payload)
+        run = self.create_optimization_run(payload, user_id, worker_id=worker_id)
         exceptions: List[InventoryExceptionView] = []
-        updated = 0
+        self._execute_run(run, payload, worker_id, exceptions=exceptions)
+
+        if run.status == "failed":
+            raise ValueError(f"Inventory optimization run failed: {run.error}")
+
+        return InventoryOptimizationRunResponse(
+            run_id=run.run_id,
+            processed_count=run.processed_count,
+            updated_count=run.updated_count,
+            exception_count=len(exceptions),
+            generated_at=datetime.utcnow(),
+            exceptions=exceptions,
+        )
+
+    def execute_optimization_run(self, run_id: str, worker_id: str) -> Optional[InventoryPolicyRun]:
+        """
+        Claim a queued or stalled run and process it from its last checkpoint.
+        Returns None when the run is not claimable (finished, or owned by a live worker).
+        """
+        if not self._policy_run_repo.claim(run_id, worker_id, settings.INVENTORY_OPTIMIZATION_LEASE_SECONDS):
+            self._policy_run_repo.db.rollback()
+            return None
+        self._policy_run_repo.save()
+        run = self._policy_run_repo.get_by_run_id(run_id)
+        self._policy_run_repo.refresh(run)
+        payload = InventoryOptimizationRunRequest.model_validate(json.loads(run.parameters_json or "{}"))
+        self._execute_run(run, payload, worker_id)
+        return run
+
+    def requeue_optimization_run(self, run_id: str) -> InventoryPolicyRun:
+        """Put a failed or stalled run back in the queue; it resumes from its checkpoint."""
+        run = self._policy_run_repo.get_by_run_id(run_id)
+        if not run:
+            raise to_http_exception(EntityNotFoundException("InventoryPolicyRun", run_id))
+        stalled = run.status == "running" and (run.lease_expires_at is None or run.lease_expires_at < datetime.utcnow())
+        if run.status != "failed" and not stalled:
+            raise ValueError(f"Inventory optimization run {run_id} is {run.status} and cannot be resumed")
+        return self._policy_run_repo.update(
+            run,
+            {"status": "queued", "worker_id": None, "lease_expires_at": None, "error": None, "completed_at": None},
+        )
+
+    def _execute_run(
+        self,
+        run: InventoryPolicyRun,
+        payload: InventoryOptimizationRunRequest,
+        worker_id: str,
+        exceptions: Optional[List[InventoryExceptionView]] = None,
+    ) -> None:
+        """
+        Process a claimed run chunk by chunk from `run.last_inventory_id`. A chunk's
+        writes and its checkpoint commit together, and only while this worker still
+        owns the run; a worker that lost the run rolls the chunk back and stops.
+        Simulation chunks are sized from paths x horizon and renew the lease between
+        batches. A chunk replayed after a crash rewrites the same policies, so resuming
+        never double-counts.
+        """
+        lease_seconds = settings.INVENTORY_OPTIMIZATION_LEASE_SECONDS
+        chunk_size = max(1, settings.INVENTORY_OPTIMIZATION_CHUNK_SIZE)
+        if payload.method == "simulation":
+            path_days = payload.simulation_paths * payload.simulation_horizon_days
+            chunk_size = min(chunk_size, max(1, settings.INVENTORY_OPTIMIZATION_SIMULATION_CHUNK_PATH_DAYS // path_days))
+        progress = {
+            "processed_count": run.processed_count or 0,
+            "updated_count": run.updated_count or 0,
+            "exception_count": run.exception_count or 0,
+            "last_inventory_id": run.last_inventory_id or 0,
+            "active_seconds": run.active_seconds or 0.0,
+        }
+        renewed_at = time.monotonic()
+
+        def keep_lease() -> None:
+            # Called between simulation batches, before the chunk writes anything.
+            nonlocal renewed_at
+            if time.monotonic() - renewed_at < lease_seconds / 3:
+                return
+            if not self._policy_run_repo.renew_lease(run.run_id, worker_id, lease_seconds):
+                raise _RunTakenOver(run.run_id)
+            self._policy_run_repo.save()
+            renewed_at = time.monotonic()
+
         error: Optional[str] = None
         try:
-            for inv in scope:
-                old_values = {
-                    "safety_stock": self._serialize(inv.safety_stock),
-                    "reorder_point": self._serialize(inv.reorder_point),
-                    "max_stock": self._serialize(inv.max_stock),
-                    "status": inv.status,
+            while True:
+                chunk_started = time.perf_counter()
+                rows = self._repo.list_policy_inputs(
+                    product_id=payload.product_id,
+                    location=payload.location,
+                    after_id=progress["last_inventory_id"],
+                    limit=chunk_size,
+                )
+                if not rows:
+                    break
+                events: List[DomainEvent] = []
+                chunk_exceptions = self._optimize_policy_chunk(
+                    rows, payload, run.run_id, run.requested_by, events, keep_lease
+                )
+                progress["processed_count"] += len(rows)
+                progress["updated_count"] += len(rows)
+                progress["exception_count"] += len(chunk_exceptions)
+                progress["last_inventory_id"] = rows[-1].id
+                progress["active_seconds"] += time.perf_counter() - chunk_started
+                if not self._policy_run_repo.checkpoint(run.run_id, worker_id, progress, lease_seconds):
+                    raise _RunTakenOver(run.run_id)
+                self._policy_run_repo.save()
+                renewed_at = time.monotonic()
+                for event in events:
+                    self._bus.publish(event)
+                if exceptions is not None:
+                    exceptions.extend(chunk_exceptions)
+        except _RunTakenOver:
+            self._policy_run_repo.db.rollback()
+            logger.info("Inventory optimization run %s was taken over; stopping", run.run_id)
+            self._policy_run_repo.refresh(run)
+            return
+        except Exception as exc:  # noqa: BLE001
+            self._repo.db.rollback()
+            error = str(exc)
+
+        completed_at = datetime.utcnow()
+        result_payload = {
+            "run_id": run.run_id,
+            "method": payload.method,
+            "processed_count": progress["processed_count"],
+            "updated_count": progress["updated_count"],
+            "exception_count": progress["exception_count"],
+            "rows_per_second": self._rows_per_second(progress["processed_count"], progress["active_seconds"]),
+            "generated_at": completed_at.isoformat(),
+        }
+        self._policy_run_repo.finish(
+            run.run_id,
+            worker_id,
+            {
+                "status": "failed" if error else "completed",
+                "result_json": json.dumps(result_payload),
+                "error": error,
+                "completed_at": completed_at,
+            },
+        )
+        self._policy_run_repo.save()
+        self._policy_run_repo.refresh(run)
+
+    def _optimize_policy_chunk(
+        self,
+        rows: List,
+        payload: InventoryOptimizationRunRequest,
+        run_id: str,
+        user_id: int,
+        events: List[DomainEvent],
+        keep_lease: Optional[Callable[[], None]] = None,
+    ) -> List[InventoryExceptionView]:
+        """
+        Compute and write policies and exceptions for one chunk of inventory rows,
+        uncommitted. The events to publish once the caller commits go to `events`.
+        """
+        on_hand = np.array([to_cents(r.on_hand_qty) for r in rows], dtype=np.int64)
+        if payload.method == "simulation":
+            safety, reorder, target_max = self._simulate_policy_chunk(rows, payload, keep_lease)
+        else:
+            demand_basis = np.array(
+                [to_cents(r.allocated_qty) + to_cents(r.in_transit_qty) for r in rows], dtype=np.int64
+            )
+            # Persisted policies use lead times read now, not the per-process cache.
+            stats = self._product_stats((r.product_id for r in rows), fresh=True)
+            safety, reorder, target_max = compute_policies(
+                demand_basis,
+                self._resolve_effective_lead_times(rows, payload, stats=stats),
+                review_period_days=payload.review_period_days,
+                z_factor=service_level_to_z(payload.service_level_target),
+                moq_units=payload.moq_units,
+                lot_size_units=payload.lot_size_units,
+                capacity_max_units=payload.capacity_max_units,
+            )
+        statuses = policy_status(on_hand, safety, reorder, target_max)
+
+        policies = [
+            SimpleNamespace(
+                id=row.id,
+                product_id=row.product_id,
+                location=row.location,
+                on_hand_qty=row.on_hand_qty,
+                safety_stock=from_cents(safety[i]),
+                reorder_point=from_cents(reorder[i]),
+                max_stock=from_cents(target_max[i]),
+                status=str(statuses[i]),
+            )
+            for i, row in enumerate(rows)
+        ]
+        self._repo.bulk_update_policies(
+            [
+                {
+                    "id": p.id,
+                    "safety_stock": p.safety_stock,
+                    "reorder_point": p.reorder_point,
+                    "max_stock": p.max_stock,
+                    "status": p.status,
                 }
+                for p in policies
+            ]
+        )
 
-                demand_basis = (inv.allocated_qty or Decimal("0")) + (inv.in_transit_qty or Decimal("0"))
-                review_days = max(1, payload.review_period_days)
-                daily_demand = max(demand_basis / Decimal(str(review_days)), Decimal("1"))
-                z_factor = self._service_level_to_z(payload.service_level_target)
-                lead_time_days = self._resolve_effective_lead_time_days(inv, payload)
-                lead_time = Decimal(str(lead_time_days))
-
-                safety_stock = (daily_demand * Decimal(str(z_factor)) * lead_time.sqrt()).quantize(Decimal("0.01"))
-                reorder_point = (daily_demand * lead_time + safety_stock).quantize(Decimal("0.01"))
-                target_max = (reorder_point * Decimal("1.50")).quantize(Decimal("0.01"))
-
-                # Constraint-aware policy shaping
-                if payload.moq_units and payload.moq_units > 0:
-                    reorder_point = max(reorder_point, payload.moq_units)
-                if payload.lot_size_units and payload.lot_size_units > 0:
-                    reorder_point = self._round_up_to_lot(reorder_point, payload.lot_size_units)
-                    target_max = self._round_up_to_lot(target_max, payload.lot_size_units)
-                if payload.capacity_max_units and payload.capacity_max_units > 0:
-                    target_max = min(target_max, payload.capacity_max_units)
-                    reorder_point = min(reorder_point, target_max)
-
-                inv = self._repo.update(
-                    inv,
+        # One event per chunk; its entries keep the per-row audit content.
+        events.append(
+            EntityBatchUpdatedEvent(
+                entity_type="inventory_policy",
+                user_id=user_id,
+                entries=[
                     {
-                        "safety_stock": safety_stock,
-                        "reorder_point": reorder_point,
-                        "max_stock": target_max,
-                    },
-                )
-                inv = self._recalculate_status(inv)
-                updated += 1
+                        "entity_id": policy.id,
+                        "old_values": {
+                            "safety_stock": self._serialize(row.safety_stock),
+                            "reorder_point": self._serialize(row.reorder_point),
+                            "max_stock": self._serialize(row.max_stock),
+                            "status": row.status,
+                        },
+                        "new_values": {
+                            "safety_stock": str(policy.safety_stock),
+                            "reorder_point": str(policy.reorder_point),
+                            "max_stock": str(policy.max_stock),
+                            "status": policy.status,
+                            "policy_source": "system",
+                            "run_id": run_id,
+                        },
+                    }
+                    for row, policy in zip(rows, policies)
+                ],
+            )
+        )
+        return self._reconcile_run_exceptions(policies, run_id, user_id, events)
 
-                new_values = {
-                    "safety_stock": str(safety_stock),
-                    "reorder_point": str(reorder_point),
-                    "max_stock": str(target_max),
-                    "status": inv.status,
-                    "policy_source": "system",
-                    "run_id": run_id,
-                }
-                self._bus.publish(
-                    EntityUpdatedEvent(
-                        entity_type="inventory_policy",
-                        entity_id=inv.id,
-                        user_id=user_id,
-                        old_values=old_values,
-                        new_values=new_values,
-                    )
+    def _reconcile_run_exceptions(
+        self, policies: List, run_id: str, user_id: int, events: List[DomainEvent]
+    ) -> List[InventoryExceptionView]:
+        """
+        Bring the stockout and excess exceptions of a chunk in line with its new policies
+        as one set operation: the desired (inventory, type, severity) set is diffed
+        against the active exceptions loaded in one query, then new risks are inserted,
+        changed ones updated and cleared ones resolved in bulk, left for the caller to commit.
+        """
+        desired = {
+            (policy.id, exception_type): (policy, severity, action)
+            for policy in policies
+            for exception_type, severity, action in self._exception_risks(policy)
+        }
+        active = self._exception_repo.latest_active_by_inventory(
+            [policy.id for policy in policies], RUN_EXCEPTION_TYPES
+        )
+
+        today = datetime.utcnow().date()
+        now = datetime.utcnow()
+        inserts: List[Dict] = []
+        updates: List[Dict] = []
+        views: Dict[Tuple[int, str], InventoryExceptionView] = {}
+        for key, (policy, severity, action) in desired.items():
+            existing = active.get(key)
+            if existing is None:
+                inserts.append(
+                    {
+                        "inventory_id": policy.id,
+                        "exception_type": key[1],
+                        "severity": severity,
+                        "status": "open",
+                        "recommended_action": action,
+                        "due_date": today + timedelta(days=2 if severity == "high" else 5),
+                    }
                 )
+                continue
+            if (existing.severity, existing.recommended_action) != (severity, action):
+                updates.append({"id": existing.id, "severity": severity, "recommended_action": action, "updated_at": now})
+            views[key] = InventoryExceptionView(
+                id=existing.id,
+                inventory_id=policy.id,
+                product_id=policy.product_id,
+                location=policy.location,
+                exception_type=key[1],
+                severity=severity,
+                status=existing.status,
+                recommended_action=action,
+                owner_user_id=existing.owner_user_id,
+                due_date=existing.due_date,
+                notes=existing.notes,
+            )
+        resolved = [
+            {"id": existing.id, "status": "resolved", "updated_at": now}
+            for key, existing in active.items()
+            if key not in desired
+        ]
 
-                exceptions.extend(self._build_exceptions_for_inventory(inv, upsert=True))
-        except Exception as exc:  # noqa: BLE001
-            error = str(exc)
-        finally:
-            completed_at = datetime.utcnow()
-            result_payload = {
-                "run_id": run_id,
-                "processed_count": len(scope),
-                "updated_count": updated,
-                "exception_count": len(exceptions),
-                "generated_at": completed_at.isoformat(),
-            }
-            self._policy_run_repo.update(
-                run,
-                {
-                    "status": "failed" if error else "completed",
-                    "processed_count": len(scope),
-                    "updated_count": updated,
-                    "exception_count": len(exceptions),
-                    "result_json": json.dumps(result_payload),
-                    "error": error,
-                    "completed_at": completed_at,
-                },
+        inserted_ids = self._exception_repo.bulk_insert(inserts)
+        self._exception_repo.bulk_update(updates + resolved)
+        for exception_id, values in zip(inserted_ids, inserts):
+            policy = desired[(values["inventory_id"], values["exception_type"])][0]
+            views[(policy.id, values["exception_type"])] = InventoryExceptionView(
+                id=exception_id,
+                product_id=policy.product_id,
+                location=policy.location,
+                **values,
             )
+        if inserts or resolved:
+            events.append(
+                EntityUpdatedEvent(
+                    entity_type="inventory_policy_exception_batch",
+                    entity_id=0,
+                    user_id=user_id,
+                    new_values={
+                        "run_id": run_id,
+                        "created": len(inserts),
+                        "updated": len(updates),
+                        "resolved": len(resolved),
+                    },
+                )
+            )
+        return [views[key] for key in desired]
 
-        if error:
-            raise ValueError(f"Inventory optimization run failed: {error}")
+    @staticmethod
+    def _with_simulation_seed(payload: InventoryOptimizationRunRequest) -> InventoryOptimizationRunRequest:
+        """Fix the seed of a simulation run up front; it is stored with the run parameters for resumes."""
+        if payload.method == "simulation" and payload.seed is None:
+            return payload.model_copy(update={"seed": new_seed()})
+        return payload
 
-        return InventoryOptimizationRunResponse(
-            run_id=run_id,
-            processed_count=len(scope),
-            updated_count=updated,
-            exception_count=len(exceptions),
-            generated_at=datetime.utcnow(),
-            exceptions=exceptions,
+    def _simulate_policy_chunk(
+        self,
+        rows: List,
+        payload: InventoryOptimizationRunRequest,
+        keep_lease: Optional[Callable[[], None]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Simulation-optimized (s, S) policies for one chunk, as cent arrays like `compute_policies`."""
+        stats = self._product_stats((r.product_id for r in rows), fresh=True)
+        demand_stats = [self._daily_demand_stats(stats[r.product_id], r) for r in rows]
+        lead_time_mean = np.array(
+            [float(lt) for lt in self._resolve_effective_lead_times(rows, payload, include_variability=False, stats=stats)]
+        )
+        if payload.lead_time_variability_days is not None:
+            lead_time_std = np.full(len(rows), float(payload.lead_time_variability_days))
+        else:
+            lead_time_std = np.maximum(0.5, lead_time_mean * 0.15)
+        # Seeded per chunk, so a chunk replayed after a resume produces the same policies.
+        policies = optimize_policies(
+            mean_daily=np.array([float(mean) for mean, _ in demand_stats]),
+            std_daily=np.array([float(std) for _, std in demand_stats]),
+            lead_time_mean=lead_time_mean,
+            lead_time_std=lead_time_std,
+            unit_cost=np.array([float(r.product_unit_cost or 1) for r in rows]),
+            service_level_target=payload.service_level_target,
+            review_period_days=payload.review_period_days,
+            horizon_days=payload.simulation_horizon_days,
+            paths=payload.simulation_paths,
+            holding_cost_rate=payload.holding_cost_rate,
+            ordering_cost=payload.ordering_cost,
+            moq_units=payload.moq_units,
+            lot_size_units=payload.lot_size_units,
+            capacity_max_units=payload.capacity_max_units,
+            seed=[payload.seed or 0, rows[0].id],
+            on_batch=keep_lease,
+        )
+        return tuple(
+            np.rint(values * 100).astype(np.int64)
+            for values in (policies.safety_stock, policies.reorder_point, policies.order_up_to)
         )
 
     def _to_policy_run_view(self, run: InventoryPolicyRun) -> InventoryPolicyRunView:
@@ -240,23 +571,45 @@ class InventoryService:
             except Exception:
                 return {"raw": raw}
 
+        total = run.total_count or 0
+        processed = run.processed_count or 0
+        rows_per_second = self._rows_per_second(processed, run.active_seconds)
+        remaining = max(total - processed, 0)
+        if total:
+            progress_pct = round(min(processed / total, 1.0) * 100, 2)
+        else:
+            progress_pct = 100.0 if run.status == "completed" else 0.0
         return InventoryPolicyRunView(
             run_id=run.run_id,
             status=run.status,
             product_id=run.product_id,
             location=run.location,
             requested_by=run.requested_by,
-            processed_count=run.processed_count,
+            processed_count=processed,
             updated_count=run.updated_count,
             exception_count=run.exception_count,
+            total_count=total,
+            progress_pct=progress_pct,
+            rows_per_second=rows_per_second,
+            eta_seconds=(
+                round(remaining / rows_per_second, 2)
+                if rows_per_second and run.status in ("queued", "running")
+                else None
+            ),
+            attempts=run.attempts or 0,
             created_at=run.created_at,
             started_at=run.started_at,
+            checkpoint_at=run.checkpoint_at,
             completed_at=run.completed_at,
             error=run.error,
             parameters=_safe_load(run.parameters_json),
             result=_safe_load(run.result_json),
         )
 
+    @staticmethod
+    def _rows_per_second(processed: int, active_seconds: Optional[float]) -> Optional[float]:
+        return round(processed / active_seconds, 2) if processed and active_seconds else None
+
     def apply_policy_override(
         self,
         inventory_id: int,
@@ -298,16 +651,31 @@ class InventoryService:
         location: Optional[str] = None,
         status: Optional[str] = None,
         owner_user_id: Optional[int] = None,
+        severity: Optional[str] = None,
+        after_id: int = 0,
+        limit: Optional[int] = None,
     ) -> List[InventoryExceptionView]:
-        persisted = self._exception_repo.list_filtered(status=status, owner_user_id=owner_user_id)
-        if persisted:
-            inv_scope = {i.id: i for i in self._repo.list_for_policy(product_id=product_id, location=location)}
+        """
+        Persisted exceptions joined to their inventory, one page at a time (pass the last
+        id as `after_id`; no `limit` returns the rest). The generated preview is only served when no exception has
+        been persisted for the status and owner filters.
+        """
+        if self._exception_repo.any_filtered(status=status, owner_user_id=owner_user_id):
+            rows = self._exception_repo.list_with_inventory(
+                status=status,
+                owner_user_id=owner_user_id,
+                severity=severity,
+                product_id=product_id,
+                location=location,
+                after_id=after_id,
+                limit=limit,
+            )
             return [
                 InventoryExceptionView(
                     id=ex.id,
                     inventory_id=ex.inventory_id,
-                    product_id=inv_scope[ex.inventory_id].product_id,
-                    location=inv_scope[ex.inventory_id].location,
+                    product_id=inv_product_id,
+                    location=inv_location,
                     exception_type=ex.exception_type,
                     severity=ex.severity,
                     status=ex.status,
@@ -316,14 +684,13 @@ class InventoryService:
                     due_date=ex.due_date,
                     notes=ex.notes,
                 )
-                for ex in persisted
-                if ex.inventory_id in inv_scope
+                for ex, inv_product_id, inv_location in rows
             ]
 
         scope = self._repo.list_for_policy(product_id=product_id, location=location)
         exceptions: List[InventoryExceptionView] = []
         for inv in scope:
-            exceptions.extend(self._build_exceptions_for_inventory(inv, upsert=False))
+            exceptions.extend(self._build_exceptions_for_inventory(inv))
         return exceptions
 
     def update_exception(
@@ -380,97 +747,104 @@ class InventoryService:
         payload: InventoryRecommendationGenerateRequest,
         user_id: int,
     ) -> List[InventoryPolicyRecommendationView]:
-        scope = self._repo.list_for_policy(product_id=payload.product_id, location=payload.location)
-        recommendations: List[InventoryPolicyRecommendationView] = []
-
-        for inv in scope[: payload.max_items]:
-            quality = self._compute_data_quality(inv)
-            if payload.enforce_quality_gate and quality.overall_score < payload.min_quality_score:
+        """
+        Score the scope in one pass and upsert its pending recommendations: products,
+        supply lead times and pending recommendations are prefetched with one query
+        each, rows are scored with `recommend_policies`, and the writes are one bulk
+        UPDATE plus one bulk INSERT committed together.
+        """
+        scope = self._repo.list_for_policy(
+            product_id=payload.product_id, location=payload.location, limit=payload.max_items
+        )
+        quality = self._quality.scores(inv.id for inv in scope)
+        candidates = []
+        for inv in scope:
+            quality_score, quality_tier = quality[inv.id]
+            if payload.enforce_quality_gate and quality_score < payload.min_quality_score:
                 continue
+            candidates.append((inv, quality_score, quality_tier))
+        if not candidates:
+            self._repo.save()
+            return []
 
-            on_hand = inv.on_hand_qty or Decimal("0")
-            allocated = inv.allocated_qty or Decimal("0")
-            in_transit = inv.in_transit_qty or Decimal("0")
-
-            demand_pressure = (allocated + in_transit) / max(on_hand, Decimal("1"))
-            risk_boost = Decimal("0.10") if inv.status in ("critical", "low") else Decimal("0")
-            pressure_boost = min(Decimal("0.30"), demand_pressure * Decimal("0.20"))
-            multiplier = Decimal("1.05") + risk_boost + pressure_boost
-
-            rec_ss = max((inv.safety_stock or Decimal("0")) * multiplier, Decimal("1")).quantize(Decimal("0.01"))
-            rec_rop = max((inv.reorder_point or Decimal("0")) * multiplier, rec_ss * Decimal("1.25")).quantize(Decimal("0.01"))
-            rec_max = max((inv.max_stock or Decimal("0")) * multiplier, rec_rop * Decimal("1.40")).quantize(Decimal("0.01"))
-
-            lead_time_days = self._resolve_effective_lead_time_days(
-                inv,
-                payload=type("_P", (), {
-                    "lead_time_days": 14,
-                    "lead_time_variability_days": Decimal("0"),
-                })(),
-            )
-            confidence = self._recommendation_confidence(inv, demand_pressure, lead_time_days)
-            if confidence < Decimal(str(payload.min_confidence)):
+        rows = [inv for inv, _, _ in candidates]
+        lead_times = self._resolve_effective_lead_times(rows, InventoryOptimizationRunRequest())
+        scored = recommend_policies(
+            np.array([to_cents(inv.on_hand_qty) for inv in rows], dtype=np.int64),
+            np.array([to_cents(inv.allocated_qty) for inv in rows], dtype=np.int64),
+            np.array([to_cents(inv.in_transit_qty) for inv in rows], dtype=np.int64),
+            np.array([to_cents(inv.safety_stock) for inv in rows], dtype=np.int64),
+            np.array([to_cents(inv.reorder_point) for inv in rows], dtype=np.int64),
+            np.array([to_cents(inv.max_stock) for inv in rows], dtype=np.int64),
+            np.array([inv.status in ("critical", "low") for inv in rows], dtype=bool),
+            lead_times,
+        )
+        min_confidence = Decimal(str(payload.min_confidence))
+        pending = self._recommendation_repo.latest_pending_ids(inv.id for inv in rows)
+
+        updates: List[dict] = []
+        inserts: List[dict] = []
+        for i, (inv, quality_score, quality_tier) in enumerate(candidates):
+            confidence = Decimal(int(scored.confidence[i])).scaleb(-4)
+            if confidence < min_confidence:
                 continue
-
+            demand_pressure = float(scored.demand_pressure[i])
             signals = {
-                "demand_pressure": float(demand_pressure),
+                "demand_pressure": demand_pressure,
                 "inventory_status": inv.status,
-                "lead_time_days": float(lead_time_days),
-                "on_hand_qty": float(on_hand),
-                "allocated_qty": float(allocated),
-                "in_transit_qty": float(in_transit),
-                "quality_score": quality.overall_score,
-                "quality_tier": quality.quality_tier,
+                "lead_time_days": float(lead_times[i]),
+                "on_hand_qty": float(inv.on_hand_qty or 0),
+                "allocated_qty": float(inv.allocated_qty or 0),
+                "in_transit_qty": float(inv.in_transit_qty or 0),
+                "quality_score": quality_score,
+                "quality_tier": quality_tier,
             }
-            rationale = (
-                f"AI tuning detected demand pressure {float(demand_pressure):.2f} with status '{inv.status}'. "
-                "Recommended policy uplift to improve service and reduce stockout risk."
-            )
-
-            pending = self._recommendation_repo.get_latest_pending_by_inventory(inv.id)
-            if pending:
-                pending = self._recommendation_repo.update(
-                    pending,
-                    {
-                        "recommended_safety_stock": rec_ss,
-                        "recommended_reorder_point": rec_rop,
-                        "recommended_max_stock": rec_max,
-                        "confidence_score": confidence,
-                        "rationale": rationale,
-                        "signals_json": json.dumps(signals),
-                    },
-                )
-                rec = pending
+            values = {
+                "recommended_safety_stock": from_cents(scored.safety_stock[i]),
+                "recommended_reorder_point": from_cents(scored.reorder_point[i]),
+                "recommended_max_stock": from_cents(scored.max_stock[i]),
+                "confidence_score": confidence,
+                "rationale": (
+                    f"AI tuning detected demand pressure {demand_pressure:.2f} with status '{inv.status}'. "
+                    "Recommended policy uplift to improve service and reduce stockout risk."
+                ),
+                "signals_json": json.dumps(signals),
+            }
+            if inv.id in pending:
+                updates.append({"id": pending[inv.id], **values})
             else:
-                rec = self._recommendation_repo.create(
-                    self._recommendation_repo.model(
-                        inventory_id=inv.id,
-                        recommended_safety_stock=rec_ss,
-                        recommended_reorder_point=rec_rop,
-                        recommended_max_stock=rec_max,
-                        confidence_score=confidence,
-                        rationale=rationale,
-                        signals_json=json.dumps(signals),
-                        status="pending",
-                    )
-                )
+                inserts.append({"inventory_id": inv.id, "status": "pending", **values})
 
+        self._recommendation_repo.bulk_update(updates)
+        created_ids = self._recommendation_repo.bulk_insert(inserts)
+        self._recommendation_repo.save()
+
+        # Response order follows the scope (inventory id), as before.
+        recs = sorted(
+            self._recommendation_repo.get_many([u["id"] for u in updates] + created_ids),
+            key=lambda r: r.inventory_id,
+        )
+        inv_by_id = {inv.id: inv for inv in rows}
+        if recs:
             self._bus.publish(
                 EntityUpdatedEvent(
-                    entity_type="inventory_policy_recommendation",
-                    entity_id=rec.id,
+                    entity_type="inventory_policy_recommendation_batch",
+                    entity_id=0,
                     user_id=user_id,
                     new_values={
-                        "status": rec.status,
-                        "confidence_score": str(rec.confidence_score),
-                        "inventory_id": rec.inventory_id,
+                        "created": len(created_ids),
+                        "updated": len(updates),
+                        "recommendation_ids": [r.id for r in recs],
+                        "product_id": payload.product_id,
+                        "location": payload.location,
                     },
                 )
             )
-
-            recommendations.append(self._build_recommendation_view(rec, inv))
-
-        return recommendations
+        views = []
+        for rec in recs:
+            inv = inv_by_id[rec.inventory_id]
+            views.append(self._build_recommendation_view(rec, inv.product_id, inv.location))
+        return views
 
     def list_recommendations(
         self,
@@ -478,13 +852,19 @@ class InventoryService:
         inventory_id: Optional[int] = None,
         product_id: Optional[int] = None,
         location: Optional[str] = None,
+        before_id: Optional[int] = None,
+        limit: Optional[int] = None,
     ) -> List[InventoryPolicyRecommendationView]:
-        recs = self._recommendation_repo.list_filtered(status=status, inventory_id=inventory_id)
-        inv_scope = {
-            inv.id: inv
-            for inv in self._repo.list_for_policy(product_id=product_id, location=location)
-        }
-        return [self._build_recommendation_view(r, inv_scope[r.inventory_id]) for r in recs if r.inventory_id in inv_scope]
+        """Newest first, one page at a time (pass the last id as `before_id`; no `limit` returns the rest)."""
+        rows = self._recommendation_repo.list_with_inventory(
+            status=status,
+            inventory_id=inventory_id,
+            product_id=product_id,
+            location=location,
+            before_id=before_id,
+            limit=limit,
+        )
+        return [self._build_recommendation_view(rec, inv_product_id, inv_location) for rec, inv_product_id, inv_location in rows]
 
     def decide_recommendation(
         self,
@@ -534,7 +914,7 @@ class InventoryService:
                 },
             )
         )
-        return self._build_recommendation_view(rec, inv)
+        return self._build_recommendation_view(rec, inv.product_id, inv.location)
 
     def approve_recommendation(
         self,
@@ -558,60 +938,72 @@ class InventoryService:
             },
         )
         inv = self.get_inventory(rec.inventory_id)
-        return self._build_recommendation_view(rec, inv)
+        return self._build_recommendation_view(rec, inv.product_id, inv.location)
 
     def get_data_quality(
         self,
         product_id: Optional[int] = None,
         location: Optional[str] = None,
     ) -> List[InventoryDataQualityView]:
-        scope = self._repo.list_for_policy(product_id=product_id, location=location)
-        return [self._compute_data_quality(inv) for inv in scope]
+        return self._quality.list_views(product_id=product_id, location=location)
+
+    def get_stats_cache_metrics(self) -> InventoryStatsCacheMetrics:
+        return self._stats.metrics()
 
-    def get_escalations(self) -> List[InventoryEscalationItem]:
+    def get_escalations(
+        self,
+        level: Optional[str] = None,
+        severity: Optional[str] = None,
+        owner_user_id: Optional[int] = None,
+        product_id: Optional[int] = None,
+        location: Optional[str] = None,
+        after_id: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[InventoryEscalationItem]:
+        """
+        Escalating open and in-progress exceptions, one page at a time (pass the last
+        exception id as `after_id`; no `limit` returns the rest). Filtering, the inventory join and the escalation
+        level are all resolved in a single query.
+        """
         today = datetime.utcnow().date()
-        open_ex = self._exception_repo.list_filtered(status="open")
-        in_progress_ex = self._exception_repo.list_filtered(status="in_progress")
-        all_ex = open_ex + in_progress_ex
+        rows = self._exception_repo.list_escalations(
+            today,
+            level=level,
+            severity=severity,
+            owner_user_id=owner_user_id,
+            product_id=product_id,
+            location=location,
+            after_id=after_id,
+            limit=limit,
+        )
         escalations: List[InventoryEscalationItem] = []
-
-        for ex in all_ex:
-            inv = self.get_inventory(ex.inventory_id)
-            due = ex.due_date
-            overdue_days = (today - due).days if due else 0
-            if ex.severity == "high" and (due is None or overdue_days >= 0):
-                level = "L2"
+        for row in rows:
+            if row.high_severity_due:
                 reason = "High-severity exception requires immediate escalation"
-            elif overdue_days >= 3:
-                level = "L2"
-                reason = f"Exception overdue by {overdue_days} days"
-            elif overdue_days > 0:
-                level = "L1"
-                reason = f"Exception overdue by {overdue_days} days"
             else:
-                continue
-
+                reason = f"Exception overdue by {(today - row.due_date).days} days"
             escalations.append(
                 InventoryEscalationItem(
-                    exception_id=ex.id,
-                    inventory_id=ex.inventory_id,
-                    product_id=inv.product_id,
-                    location=inv.location,
-                    severity=ex.severity,
-                    status=ex.status,
-                    owner_user_id=ex.owner_user_id,
-                    due_date=ex.due_date,
-                    escalation_level=level,
+                    exception_id=row.id,
+                    inventory_id=row.inventory_id,
+                    product_id=row.product_id,
+                    location=row.location,
+                    severity=row.severity,
+                    status=row.status,
+                    owner_user_id=row.owner_user_id,
+                    due_date=row.due_date,
+                    escalation_level=row.escalation_level,
                     escalation_reason=reason,
                 )
             )
         return escalations
 
-    def get_working_capital_summary(self) -> InventoryWorkingCapitalSummary:
-        all_inv = self._repo.get_all_inventory()
-        total_value = sum(((inv.valuation or Decimal("0")) for inv in all_inv), Decimal("0"))
-        excess_value = sum(((inv.valuation or Decimal("0")) for inv in all_inv if inv.status == "excess"), Decimal("0"))
-        low_exposure = sum(((inv.valuation or Decimal("0")) for inv in all_inv if inv.status in ("low", "critical")), Decimal("0"))
+    def get_working_capital_summary(self, location: Optional[str] = None) -> InventoryWorkingCapitalSummary:
+        totals = self._rollups.status_totals(location=location)
+        status_value = {status: totals.get(status, (0, Decimal("0")))[1] for status in INVENTORY_STATUSES}
+        total_value = sum((value for _, value in totals.values()), Decimal("0"))
+        excess_value = status_value["excess"]
+        low_exposure = status_value["low"] + status_value["critical"]
 
         annual_carrying_rate = Decimal("0.18")
         annual_cost = (total_value * annual_carrying_rate).quantize(Decimal("0.01"))
@@ -633,38 +1025,36 @@ class InventoryService:
         )
 
     def get_assessment_scorecard(self) -> InventoryAssessmentScorecard:
-        inv = self._repo.get_all_inventory()
-        recs_pending = self._recommendation_repo.list_filtered(status="pending")
-        recs_applied = self._recommendation_repo.list_filtered(status="applied")
-        exceptions_open = self._exception_repo.list_filtered(status="open")
-        exceptions_in_progress = self._exception_repo.list_filtered(status="in_progress")
-        all_exceptions = exceptions_open + exceptions_in_progress
+        # Every check is an EXISTS probe or reads the status rollup.
+        statuses = {status for status, (count, _) in self._rollups.status_totals().items() if count}
+        live_recs = ("pending", "applied")
+        has_active_exceptions = self._exception_repo.any_active()
 
         checks = {
             "Policy Logic": [
-                any((i.safety_stock or Decimal("0")) > 0 for i in inv),
-                any((i.reorder_point or Decimal("0")) > 0 for i in inv),
-                len({i.status for i in inv}) >= 2,
+                self._repo.any_positive("safety_stock"),
+                self._repo.any_positive("reorder_point"),
+                len(statuses) >= 2,
             ],
             "Forecast Integration": [
-                any(r.signals_json and "demand_pressure" in r.signals_json for r in (recs_pending + recs_applied)),
-                any(r.signals_json and "quality_score" in r.signals_json for r in (recs_pending + recs_applied)),
-                any(r.confidence_score is not None for r in (recs_pending + recs_applied)),
+                self._recommendation_repo.any_in_statuses(live_recs, signal="demand_pressure"),
+                self._recommendation_repo.any_in_statuses(live_recs, signal="quality_score"),
+                self._recommendation_repo.any_in_statuses(live_recs, scored=True),
             ],
             "Supply Constraints": [
-                any((i.max_stock or Decimal("0")) > 0 for i in inv),
-                len(all_exceptions) > 0,
-                any(ex.exception_type in ("stockout_risk", "excess_risk") for ex in all_exceptions),
+                self._repo.any_positive("max_stock"),
+                has_active_exceptions,
+                self._exception_repo.any_active(exception_types=("stockout_risk", "excess_risk")),
             ],
             "Governance & Cadence": [
-                len(all_exceptions) > 0,
-                any(r.decided_by is not None for r in (recs_pending + recs_applied)),
-                any(r.decision_notes for r in (recs_pending + recs_applied)),
+                has_active_exceptions,
+                self._recommendation_repo.any_in_statuses(live_recs, decided=True),
+                self._recommendation_repo.any_in_statuses(live_recs, with_notes=True),
             ],
             "Outcome KPIs": [
-                len(recs_applied) > 0,
-                any(i.status == "normal" for i in inv),
-                any(i.status in ("low", "critical", "excess") for i in inv),
+                self._recommendation_repo.any_in_statuses(("applied",)),
+                "normal" in statuses,
+                bool(statuses & {"low", "critical", "excess"}),
             ],
         }
 
@@ -714,165 +1104,270 @@ class InventoryService:
         product_id: Optional[int] = None,
         min_transfer_qty: Decimal = Decimal("1"),
     ) -> List[InventoryRebalanceRecommendationView]:
-        scope = self._repo.list_for_policy(product_id=product_id)
-        grouped = {}
+        return self.plan_rebalance(
+            InventoryRebalanceRequest(product_id=product_id, min_transfer_qty=min_transfer_qty)
+        ).transfers
+
+    def plan_rebalance(self, payload: InventoryRebalanceRequest) -> InventoryRebalancePlanResponse:
+        """
+        Transfers from excess locations (stock above max) to critical or low ones (stock
+        below the reorder point), solved per product as a min-cost transportation
+        problem: as much shortage as possible is covered, at the least lane cost, and no
+        donor gives more than its excess.
+        """
+        scope = self._repo.list_for_policy(product_id=payload.product_id)
+        min_transfer = to_cents(payload.min_transfer_qty)
+        donors: Dict[int, List[Tuple[Inventory, int]]] = {}
+        receivers: Dict[int, List[Tuple[Inventory, int]]] = {}
         for inv in scope:
-            grouped.setdefault(inv.product_id, []).append(inv)
-
-        recommendations: List[InventoryRebalanceRecommendationView] = []
-        for pid, rows in grouped.items():
-            lows = [r for r in rows if r.status in ("critical", "low")]
-            excesses = [r for r in rows if r.status == "excess"]
-            if not lows or not excesses:
-                continue
-
-            product = self._product_repo.get_by_id(pid)
-            for low in lows:
-                required = max(
-                    Decimal("0"),
-                    (low.reorder_point or Decimal("0")) - (low.on_hand_qty or Decimal("0")),
-                )
-                if required < min_transfer_qty:
-                    continue
-
-                donor = max(
-                    excesses,
-                    key=lambda e: (e.on_hand_qty or Decimal("0")) - (e.max_stock or Decimal("0")),
-                )
-                donor_excess = max(
-                    Decimal("0"),
-                    (donor.on_hand_qty or Decimal("0")) - (donor.max_stock or Decimal("0")),
-                )
-                transfer_qty = min(required, donor_excess)
-                if transfer_qty < min_transfer_qty:
-                    continue
-
-                base_service = Decimal("60") if low.status == "critical" else Decimal("75")
-                uplift = min(Decimal("25"), (transfer_qty / max(required, Decimal("1"))) * Decimal("20"))
-
-                recommendations.append(
+            if inv.status == "excess":
+                excess = to_cents(inv.on_hand_qty) - to_cents(inv.max_stock)
+                if excess > 0:
+                    donors.setdefault(inv.product_id, []).append((inv, excess))
+            elif inv.status in ("critical", "low"):
+                shortage = to_cents(inv.reorder_point) - to_cents(inv.on_hand_qty)
+                if shortage > 0 and shortage >= min_transfer:
+                    receivers.setdefault(inv.product_id, []).append((inv, shortage))
+
+        lanes: Dict[str, Dict[str, Tuple[InventoryRebalanceLane, bool]]] = {}
+        for lane in payload.lanes:
+            allowed = payload.max_lead_time_days is None or (lane.lead_time_days or 0) <= payload.max_lead_time_days
+            lanes.setdefault(lane.from_location, {})[lane.to_location] = (lane, allowed)
+        default_units = self._lane_cost_units(payload.default_cost_per_unit, None, payload)
+
+        product_ids = sorted(set(donors) & set(receivers))
+        names = self._product_repo.names(product_ids)
+        transfers: List[InventoryRebalanceRecommendationView] = []
+        solve_seconds = 0.0
+        total_cost = Decimal("0")
+        for pid in product_ids:
+            sources = sorted(donors[pid], key=lambda d: d[0].id)
+            sinks = sorted(receivers[pid], key=lambda r: r[0].id)
+            sink_index = {inv.location: j for j, (inv, _) in enumerate(sinks)}
+            cost = np.full((len(sources), len(sinks)), np.inf if payload.restrict_to_lanes else float(default_units))
+            listed: Dict[Tuple[int, int], InventoryRebalanceLane] = {}
+            for i, (inv, _) in enumerate(sources):
+                for to_location, (lane, allowed) in lanes.get(inv.location, {}).items():
+                    j = sink_index.get(to_location)
+                    if j is None:
+                        continue
+                    cost[i, j] = self._lane_cost_units(lane.cost_per_unit, lane.lead_time_days, payload) if allowed else np.inf
+                    listed[(i, j)] = lane
+
+            started = time.perf_counter()
+            plan = solve_transportation(
+                np.array([excess for _, excess in sources], dtype=np.int64),
+                np.array([shortage for _, shortage in sinks], dtype=np.int64),
+                cost,
+            )
+            solve_seconds += time.perf_counter() - started
+
+            for i, j in zip(*np.nonzero(plan.flow >= max(min_transfer, 1))):
+                donor, _ = sources[i]
+                receiver, required = sinks[j]
+                qty = from_cents(plan.flow[i, j])
+                lane = listed.get((int(i), int(j)))
+                cost_per_unit = lane.cost_per_unit if lane else payload.default_cost_per_unit
+                transfer_cost = (qty * cost_per_unit).quantize(Decimal("0.01"))
+                total_cost += transfer_cost
+                base_service = Decimal("60") if receiver.status == "critical" else Decimal("75")
+                uplift = min(Decimal("25"), (qty / max(from_cents(required), Decimal("1"))) * Decimal("20"))
+                transfers.append(
                     InventoryRebalanceRecommendationView(
                         product_id=pid,
-                        product_name=getattr(product, "name", None),
+                        product_name=names.get(pid),
                         from_inventory_id=donor.id,
                         from_location=donor.location,
-                        to_inventory_id=low.id,
-                        to_location=low.location,
-                        transfer_qty=transfer_qty.quantize(Decimal("0.01")),
+                        to_inventory_id=receiver.id,
+                        to_location=receiver.location,
+                        transfer_qty=qty,
                         estimated_service_uplift_pct=float((base_service + uplift).quantize(Decimal("0.01"))),
+                        lane_cost_per_unit=cost_per_unit,
+                        lead_time_days=lane.lead_time_days if lane else None,
+                        transfer_cost=transfer_cost,
                     )
                 )
-        return recommendations
+
+        total_excess = sum(excess for rows in donors.values() for _, excess in rows)
+        total_shortage = sum(shortage for rows in receivers.values() for _, shortage in rows)
+        total_transfer = sum(to_cents(t.transfer_qty) for t in transfers)
+        return InventoryRebalancePlanResponse(
+            transfers=transfers,
+            products_solved=len(product_ids),
+            donor_count=sum(len(rows) for rows in donors.values()),
+            receiver_count=sum(len(rows) for rows in receivers.values()),
+            total_excess_qty=from_cents(total_excess),
+            total_shortage_qty=from_cents(total_shortage),
+            total_transfer_qty=from_cents(total_transfer),
+            unmet_shortage_qty=from_cents(total_shortage - total_transfer),
+            total_transfer_cost=total_cost,
+            solve_time_ms=round(solve_seconds * 1000, 3),
+        )
+
+    @staticmethod
+    def _lane_cost_units(cost_per_unit: Decimal, lead_time_days: Optional[int], payload: InventoryRebalanceRequest) -> int:
+        effective = Decimal(cost_per_unit) + payload.lead_time_cost_per_day * (lead_time_days or 0)
+        return int((effective * COST_SCALE).to_integral_value(rounding=ROUND_HALF_UP))
 
     def auto_apply_recommendations(
         self,
         payload: InventoryAutoApplyRequest,
         user_id: int,
     ) -> InventoryAutoApplyResponse:
-        pending = self._recommendation_repo.list_filtered(status="pending")
-        eligible = []
-        applied_ids: List[int] = []
-
-        for rec in pending[: payload.max_items]:
-            signals = {}
-            if rec.signals_json:
-                try:
-                    signals = json.loads(rec.signals_json)
-                except Exception:
-                    signals = {}
-            demand_pressure = Decimal(str(signals.get("demand_pressure", 0)))
-            confidence = Decimal(str(rec.confidence_score or 0))
-            quality_score = Decimal(str(signals.get("quality_score", 0)))
-            if confidence < Decimal(str(payload.min_confidence)):
-                continue
-            if demand_pressure > Decimal(str(payload.max_demand_pressure)):
-                continue
-            if quality_score < Decimal(str(payload.min_quality_score)):
-                continue
-            eligible.append(rec)
-
-        if not payload.dry_run:
-            for rec in eligible:
-                inv = self.get_inventory(rec.inventory_id)
-                if self._requires_maker_checker(rec, inv):
-                    # Guardrail: autonomous flow cannot bypass maker-checker.
-                    continue
-                view = self.decide_recommendation(
-                    rec.id,
-                    InventoryRecommendationDecisionRequest(
-                        decision="accepted",
-                        apply_changes=True,
-                        notes="Autonomous apply (Phase 5 guardrail policy)",
-                    ),
+        """
+        Apply eligible pending recommendations in one transaction. Eligibility and the
+        maker-checker guardrail are evaluated over columns of the whole window; the
+        inventory policies, their recalculated statuses and the recommendation
+        decisions are written with two bulk UPDATEs and one commit.
+        """
+        rows = self._recommendation_repo.list_pending_apply_inputs(limit=payload.max_items)
+        n = len(rows)
+        confidence = np.array([float(r.confidence_score or 0) for r in rows], dtype=np.float64)
+        demand_pressure = np.zeros(n)
+        quality_score = np.zeros(n)
+        for i, row in enumerate(rows):
+            try:
+                signals = json.loads(row.signals_json) if row.signals_json else {}
+            except Exception:
+                signals = {}
+            demand_pressure[i] = float(signals.get("demand_pressure", 0) or 0)
+            quality_score[i] = float(signals.get("quality_score", 0) or 0)
+
+        checks = {
+            "confidence": confidence >= payload.min_confidence,
+            "demand_pressure": demand_pressure <= payload.max_demand_pressure,
+            "quality_score": quality_score >= payload.min_quality_score,
+        }
+        eligible = checks["confidence"] & checks["demand_pressure"] & checks["quality_score"]
+        recommended_reorder = np.array([to_cents(r.recommended_reorder_point) for r in rows], dtype=np.int64)
+        maker_checker = requires_maker_checker(
+            np.array([to_cents(r.inventory_reorder_point) for r in rows], dtype=np.int64),
+            recommended_reorder,
+        )
+        # Guardrail: the autonomous flow cannot bypass maker-checker.
+        apply = eligible & ~maker_checker & (not payload.dry_run)
+
+        applied = np.flatnonzero(apply)
+        applied_ids = [rows[i].id for i in applied]
+        if applied.size:
+            safety = np.array([to_cents(rows[i].recommended_safety_stock) for i in applied], dtype=np.int64)
+            max_stock = np.array([to_cents(rows[i].recommended_max_stock) for i in applied], dtype=np.int64)
+            status = policy_status(
+                np.array([to_cents(rows[i].on_hand_qty) for i in applied], dtype=np.int64),
+                safety,
+                recommended_reorder[applied],
+                max_stock,
+            )
+            decided_at = datetime.utcnow()
+            self._repo.bulk_update_policies(
+                [
+                    {
+                        "id": rows[i].inventory_id,
+                        "safety_stock": rows[i].recommended_safety_stock,
+                        "reorder_point": rows[i].recommended_reorder_point,
+                        "max_stock": rows[i].recommended_max_stock,
+                        "status": str(status[k]),
+                    }
+                    for k, i in enumerate(applied)
+                ]
+            )
+            self._recommendation_repo.bulk_update(
+                [
+                    {
+                        "id": rec_id,
+                        "status": "applied",
+                        "decision_notes": "Autonomous apply (Phase 5 guardrail policy)",
+                        "decided_by": user_id,
+                        "decided_at": decided_at,
+                    }
+                    for rec_id in applied_ids
+                ]
+            )
+            self._recommendation_repo.save()
+            self._bus.publish(
+                EntityUpdatedEvent(
+                    entity_type="inventory_policy_recommendation_batch",
+                    entity_id=0,
                     user_id=user_id,
+                    new_values={
+                        "action": "auto_apply",
+                        "applied": len(applied_ids),
+                        "recommendation_ids": applied_ids,
+                        "inventory_ids": [rows[i].inventory_id for i in applied],
+                        "maker_checker_ids": [rows[i].id for i in np.flatnonzero(eligible & maker_checker)],
+                    },
                 )
-                if view.status == "applied":
-                    applied_ids.append(view.id)
+            )
+
+        items: List[InventoryAutoApplyItem] = []
+        for i, row in enumerate(rows):
+            if not eligible[i]:
+                outcome = "ineligible"
+            elif maker_checker[i]:
+                outcome = "maker_checker_required"
+            else:
+                outcome = "dry_run" if payload.dry_run else "applied"
+            items.append(
+                InventoryAutoApplyItem(
+                    recommendation_id=row.id,
+                    inventory_id=row.inventory_id,
+                    eligible=bool(eligible[i]),
+                    requires_maker_checker=bool(maker_checker[i]),
+                    outcome=outcome,
+                    reasons=[name for name, passed in checks.items() if not passed[i]],
+                )
+            )
 
+        eligible_count = int(eligible.sum())
         return InventoryAutoApplyResponse(
-            eligible_count=len(eligible),
-            applied_count=0 if payload.dry_run else len(applied_ids),
-            skipped_count=max(0, len(pending[: payload.max_items]) - len(eligible)),
+            eligible_count=eligible_count,
+            applied_count=len(applied_ids),
+            skipped_count=n - eligible_count,
             recommendation_ids=applied_ids,
+            maker_checker_count=int((eligible & maker_checker).sum()),
+            items=items,
         )
 
     def get_control_tower_summary(self) -> InventoryControlTowerSummary:
-        pending = self._recommendation_repo.list_filtered(status="pending")
-        accepted = self._recommendation_repo.list_filtered(status="accepted")
-        applied = self._recommendation_repo.list_filtered(status="applied")
-        rejected = self._recommendation_repo.list_filtered(status="rejected")
+        counts = self._recommendation_repo.status_counts()
+        pending = counts.get("pending", 0)
+        accepted = counts.get("accepted", 0)
+        applied = counts.get("applied", 0)
+        rejected = counts.get("rejected", 0)
 
-        total_decided = len(accepted) + len(applied) + len(rejected)
+        total_decided = accepted + applied + rejected
         acceptance_rate = 0.0
         if total_decided > 0:
-            acceptance_rate = round(((len(accepted) + len(applied)) / total_decided) * 100, 1)
-
-        now = datetime.utcnow().date()
-        open_ex = self._exception_repo.list_filtered(status="open")
-        in_progress_ex = self._exception_repo.list_filtered(status="in_progress")
-        open_total = len(open_ex) + len(in_progress_ex)
-        overdue = [
-            ex for ex in (open_ex + in_progress_ex)
-            if ex.due_date is not None and ex.due_date < now
-        ]
+            acceptance_rate = round(((accepted + applied) / total_decided) * 100, 1)
 
-        autonomous_24h = len([
-            rec for rec in applied
-            if rec.decision_notes and "Autonomous apply" in rec.decision_notes
-            and rec.decided_at and (datetime.utcnow() - rec.decided_at).total_seconds() <= 86400
-        ])
+        now = datetime.utcnow()
+        open_total, overdue = self._exception_repo.active_counts(now.date())
+        autonomous_24h = self._recommendation_repo.count_applied_since(now - timedelta(days=1), "Autonomous apply")
 
-        if len(pending) > 50 or len(overdue) > 20:
+        if pending > 50 or overdue > 20:
             backlog_risk = "high"
-        elif len(pending) > 20 or len(overdue) > 5:
+        elif pending > 20 or overdue > 5:
             backlog_risk = "medium"
         else:
             backlog_risk = "low"
 
         return InventoryControlTowerSummary(
-            pending_recommendations=len(pending),
-            accepted_recommendations=len(accepted),
-            applied_recommendations=len(applied),
+            pending_recommendations=pending,
+            accepted_recommendations=accepted,
+            applied_recommendations=applied,
             acceptance_rate_pct=acceptance_rate,
             autonomous_applied_24h=autonomous_24h,
             open_exceptions=open_total,
-            overdue_exceptions=len(overdue),
+            overdue_exceptions=overdue,
             recommendation_backlog_risk=backlog_risk,
         )
 
-    def get_health_summary(self) -> InventoryHealthSummary:
-        all_inv = self._repo.get_all_inventory()
-        total = len(all_inv)
-        if total == 0:
-            return InventoryHealthSummary(
-                total_products=0, normal_count=0, low_count=0, critical_count=0, excess_count=0,
-                total_value=Decimal("0"), normal_pct=0.0, low_pct=0.0, critical_pct=0.0, excess_pct=0.0,
-            )
-        counts = {"normal": 0, "low": 0, "critical": 0, "excess": 0}
-        total_value = Decimal("0")
-        for inv in all_inv:
-            counts[inv.status] = counts.get(inv.status, 0) + 1
-            total_value += inv.valuation or Decimal("0")
+    def get_health_summary(self, location: Optional[str] = None, by_location: bool = False) -> InventoryHealthSummary:
+        totals = self._rollups.status_totals(location=location)
+        counts = {status: totals.get(status, (0, Decimal("0")))[0] for status in INVENTORY_STATUSES}
+        total = sum(count for count, _ in totals.values())
+        total_value = sum((value for _, value in totals.values()), Decimal("0"))
+        pct = {status: round(counts[status] / total * 100, 1) if total else 0.0 for status in INVENTORY_STATUSES}
         return InventoryHealthSummary(
             total_products=total,
             normal_count=counts["normal"],
@@ -880,22 +1375,39 @@ class InventoryService:
             critical_count=counts["critical"],
             excess_count=counts["excess"],
             total_value=total_value,
-            normal_pct=round(counts["normal"] / total * 100, 1),
-            low_pct=round(counts["low"] / total * 100, 1),
-            critical_pct=round(counts["critical"] / total * 100, 1),
-            excess_pct=round(counts["excess"] / total * 100, 1),
+            normal_pct=pct["normal"],
+            low_pct=pct["low"],
+            critical_pct=pct["critical"],
+            excess_pct=pct["excess"],
+            locations=self._location_health(location) if by_location else None,
         )
 
+    def _location_health(self, location: Optional[str]) -> List[InventoryLocationHealth]:
+        return [
+            InventoryLocationHealth(
+                location=loc or None,
+                total_products=sum(count for count, _ in totals.values()),
+                normal_count=totals["normal"][0],
+                low_count=totals["low"][0],
+                critical_count=totals["critical"][0],
+                excess_count=totals["excess"][0],
+                total_value=sum((value for _, value in totals.values()), Decimal("0")),
+            )
+            for loc, totals in self._rollups.location_totals()
+            if not location or loc == location
+        ]
+
     def analyze_service_level_under_uncertainty(
         self,
         payload: InventoryServiceLevelAnalyticsRequest,
     ) -> InventoryServiceLevelAnalyticsResponse:
         inv = self._resolve_inventory_scope(payload)
 
-        demand_mean_daily, demand_std_daily = self._estimate_daily_demand_stats(inv)
+        stats = self._product_stats([inv.product_id])[inv.product_id]
+        demand_mean_daily, demand_std_daily = self._daily_demand_stats(stats, inv)
         if payload.demand_std_override is not None:
             demand_std_daily = max(Decimal("0.01"), Decimal(str(payload.demand_std_override)))
-        lead_time_mean_days, lead_time_std_days = self._estimate_lead_time_stats(inv, payload)
+        lead_time_mean_days, lead_time_std_days = self._lead_time_stats(stats, payload.lead_time_std_override)
 
         mean_dlt = demand_mean_daily * lead_time_mean_days
         variance_dlt = (
@@ -908,6 +1420,7 @@ class InventoryService:
         on_hand = inv.on_hand_qty or Decimal("0")
         safety_stock = inv.safety_stock or Decimal("0")
 
+        seed = payload.seed if payload.seed is not None else new_seed()
         if payload.method == "monte_carlo":
             cycle_service_level, expected_shortage_units, fill_rate, distribution = self._run_monte_carlo(
                 mean_dlt=mean_dlt,
@@ -915,6 +1428,7 @@ class InventoryService:
                 reorder_point=reorder_point,
                 simulation_runs=payload.simulation_runs,
                 bucket_count=payload.bucket_count,
+                seed=seed,
             )
         else:
             z_current = float((reorder_point - mean_dlt) / std_dlt)
@@ -922,20 +1436,22 @@ class InventoryService:
             cycle_service_level = normal.cdf(z_current)
             expected_shortage_units = self._expected_shortage_units(std_dlt, z_current)
             fill_rate = max(0.0, min(1.0, 1.0 - float(expected_shortage_units / max(mean_dlt, Decimal("1")))))
-            samples = [
-                max(0.0, random.normalvariate(float(mean_dlt), float(std_dlt)))
-                for _ in range(min(5000, max(1000, payload.simulation_runs)))
-            ]
-            distribution = self._build_distribution(samples, payload.bucket_count)
+            # The histogram is illustrative here; a bounded sample keeps it cheap.
+            samples = draw_lead_time_demand(
+                float(mean_dlt),
+                float(std_dlt),
+                min(ANALYTICAL_HISTOGRAM_SAMPLES, max(1000, payload.simulation_runs)),
+                seed,
+            )
+            distribution = self._build_distribution(*histogram(samples, payload.bucket_count))
 
         stockout_probability = max(0.0, min(1.0, 1.0 - cycle_service_level))
         z_target = Decimal(str(self._target_service_to_z(payload.target_service_level)))
         recommended_safety_stock = (z_target * std_dlt).quantize(Decimal("0.01"))
         recommended_reorder_point = (mean_dlt + recommended_safety_stock).quantize(Decimal("0.01"))
 
-        curve_targets = [0.90, 0.95, 0.97, 0.99]
         service_level_curve = []
-        for t in curve_targets:
+        for t in SERVICE_LEVEL_CURVE_TARGETS:
             z = Decimal(str(self._target_service_to_z(t)))
             req_ss = (z * std_dlt).quantize(Decimal("0.01"))
             service_level_curve.append(
@@ -969,24 +1485,154 @@ class InventoryService:
             recommended_reorder_point=recommended_reorder_point,
             service_level_curve=service_level_curve,
             distribution=distribution,
+            simulation_seed=seed,
         )
 
-    def get_alerts(self) -> dict:
-        return {
-            "critical": [
-                {"id": i.id, "product_id": i.product_id, "location": i.location, "on_hand_qty": float(i.on_hand_qty)}
-                for i in self._repo.get_critical()
-            ],
-            "low": [
-                {"id": i.id, "product_id": i.product_id, "location": i.location, "on_hand_qty": float(i.on_hand_qty)}
-                for i in self._repo.get_low()
-            ],
-            "excess": [
-                {"id": i.id, "product_id": i.product_id, "location": i.location, "on_hand_qty": float(i.on_hand_qty)}
-                for i in self._repo.get_excess()
-            ],
+    def analyze_network_service_levels(
+        self,
+        payload: InventoryNetworkServiceLevelRequest,
+    ) -> InventoryNetworkServiceLevelResponse:
+        """
+        Service-level analytics for every inventory row in scope, ranked by risk.
+        Inputs are loaded set-based (rows, lead times and demand actuals in a handful of
+        queries) and the metrics are computed across all rows at once.
+        """
+        rows = self._load_policy_inputs(payload.product_id, payload.location)
+        seed = None
+        if payload.method == "monte_carlo":
+            seed = payload.seed if payload.seed is not None else new_seed()
+        if not rows:
+            return InventoryNetworkServiceLevelResponse(
+                method=payload.method,
+                target_service_level=payload.target_service_level,
+                sort_by=payload.sort_by,
+                simulation_seed=seed,
+                below_target_count=0,
+                total_expected_shortage_units=Decimal("0.00"),
+                items=[],
+                total=0,
+                page=payload.page,
+                page_size=payload.page_size,
+                total_pages=0,
+            )
+
+        stats = self._product_stats(r.product_id for r in rows)
+        demand_stats = [self._daily_demand_stats(stats[r.product_id], r) for r in rows]
+        lead_time_stats = {
+            pid: self._lead_time_stats(product_stats, payload.lead_time_std_override)
+            for pid, product_stats in stats.items()
         }
 
+        demand_mean = np.array([float(m) for m, _ in demand_stats])
+        demand_std = np.array([float(sd) for _, sd in demand_stats])
+        lead_time_mean = np.array([float(lead_time_stats[r.product_id][0]) for r in rows])
+        lead_time_std = np.array([float(lead_time_stats[r.product_id][1]) for r in rows])
+        mean_dlt = demand_mean * lead_time_mean
+        std_dlt = np.maximum(
+            np.sqrt(lead_time_mean * demand_std ** 2 + demand_mean ** 2 * lead_time_std ** 2), 0.0001
+        )
+        reorder_point = np.array([float(r.reorder_point or 0) for r in rows])
+
+        if payload.method == "monte_carlo":
+            levels = simulated_service_levels(mean_dlt, std_dlt, reorder_point, payload.simulation_runs, seed)
+        else:
+            levels = analytical_service_levels(mean_dlt, std_dlt, reorder_point)
+        stockout_probability = np.clip(1.0 - levels.cycle_service_level, 0.0, 1.0)
+
+        metric = {
+            "stockout_probability": stockout_probability,
+            "expected_shortage_units": levels.expected_shortage_units,
+            "fill_rate": levels.fill_rate,
+            "cycle_service_level": levels.cycle_service_level,
+        }[payload.sort_by]
+        ranking_key = -metric if NETWORK_SORT_KEYS[payload.sort_by] else metric
+        order = np.lexsort((np.array([r.id for r in rows]), ranking_key))
+        page_rows = order[(payload.page - 1) * payload.page_size: payload.page * payload.page_size]
+
+        curve_z = [(t, Decimal(str(self._target_service_to_z(t)))) for t in SERVICE_LEVEL_CURVE_TARGETS]
+        z_target = Decimal(str(self._target_service_to_z(payload.target_service_level)))
+        items = []
+        for i in page_rows:
+            row = rows[i]
+            mean = Decimal(str(mean_dlt[i]))
+            std = Decimal(str(std_dlt[i]))
+            recommended_safety_stock = (z_target * std).quantize(Decimal("0.01"))
+            items.append(
+                InventoryNetworkServiceLevelRow(
+                    inventory_id=row.id,
+                    product_id=row.product_id,
+                    location=row.location,
+                    current_on_hand_qty=(row.on_hand_qty or Decimal("0")).quantize(Decimal("0.01")),
+                    current_reorder_point=(row.reorder_point or Decimal("0")).quantize(Decimal("0.01")),
+                    current_safety_stock=(row.safety_stock or Decimal("0")).quantize(Decimal("0.01")),
+                    demand_mean_daily=demand_stats[i][0].quantize(Decimal("0.0001")),
+                    demand_std_daily=demand_stats[i][1].quantize(Decimal("0.0001")),
+                    lead_time_mean_days=lead_time_stats[row.product_id][0].quantize(Decimal("0.01")),
+                    lead_time_std_days=lead_time_stats[row.product_id][1].quantize(Decimal("0.01")),
+                    mean_demand_during_lead_time=mean.quantize(Decimal("0.01")),
+                    std_demand_during_lead_time=std.quantize(Decimal("0.01")),
+                    cycle_service_level=round(float(levels.cycle_service_level[i]), 4),
+                    fill_rate=round(float(levels.fill_rate[i]), 4),
+                    stockout_probability=round(float(stockout_probability[i]), 4),
+                    expected_shortage_units=Decimal(str(levels.expected_shortage_units[i])).quantize(Decimal("0.01")),
+                    recommended_safety_stock=recommended_safety_stock,
+                    recommended_reorder_point=(mean + recommended_safety_stock).quantize(Decimal("0.01")),
+                    service_level_curve=[
+                        InventoryServiceLevelSuggestion(
+                            target_service_level=t,
+                            required_safety_stock=(z * std).quantize(Decimal("0.01")),
+                            required_reorder_point=(mean + (z * std).quantize(Decimal("0.01"))).quantize(Decimal("0.01")),
+                        )
+                        for t, z in curve_z
+                    ],
+                )
+            )
+
+        total = len(rows)
+        return InventoryNetworkServiceLevelResponse(
+            method=payload.method,
+            target_service_level=payload.target_service_level,
+            sort_by=payload.sort_by,
+            simulation_seed=seed,
+            below_target_count=int(np.count_nonzero(levels.cycle_service_level < payload.target_service_level)),
+            average_cycle_service_level=round(float(levels.cycle_service_level.mean()), 4),
+            total_expected_shortage_units=Decimal(str(float(levels.expected_shortage_units.sum()))).quantize(Decimal("0.01")),
+            items=items,
+            total=total,
+            page=payload.page,
+            page_size=payload.page_size,
+            total_pages=ceil(total / payload.page_size),
+        )
+
+    def _load_policy_inputs(self, product_id: Optional[int], location: Optional[str]) -> List:
+        rows: List = []
+        chunk_size = max(1, settings.INVENTORY_OPTIMIZATION_CHUNK_SIZE)
+        while True:
+            chunk = self._repo.list_policy_inputs(
+                product_id=product_id,
+                location=location,
+                after_id=rows[-1].id if rows else 0,
+                limit=chunk_size,
+            )
+            rows.extend(chunk)
+            if len(chunk) < chunk_size:
+                return rows
+
+    def get_alerts(self, page: int = 1, page_size: int = 100) -> dict:
+        """Low, critical and excess rows, one page per status, with the full count of each."""
+        totals = self._rollups.status_totals()
+        alerts: dict = {
+            status: [
+                {"id": row.id, "product_id": row.product_id, "location": row.location, "on_hand_qty": float(row.on_hand_qty)}
+                for row in self._repo.list_alert_rows(status, page=page, page_size=page_size)
+            ]
+            for status in ("critical", "low", "excess")
+        }
+        alerts["totals"] = {status: totals.get(status, (0, Decimal("0")))[0] for status in ("critical", "low", "excess")}
+        alerts["page"] = page
+        alerts["page_size"] = page_size
+        return alerts
+
     def _resolve_inventory_scope(self, payload: InventoryServiceLevelAnalyticsRequest) -> Inventory:
         if payload.inventory_id:
             return self.get_inventory(payload.inventory_id)
@@ -1003,41 +1649,30 @@ class InventoryService:
 
         raise ValueError("Provide inventory_id or valid product_id/location scope for service-level analytics")
 
-    def _estimate_daily_demand_stats(self, inv: Inventory) -> Tuple[Decimal, Decimal]:
-        history = self._demand_repo.get_with_actuals(inv.product_id)
-        actuals = [Decimal(str(h.actual_qty)) for h in history[-12:] if h.actual_qty is not None]
-
-        if not actuals:
-            basis = (inv.allocated_qty or Decimal("0")) + (inv.in_transit_qty or Decimal("0"))
-            mean = max(Decimal("1"), basis / Decimal("30"))
-            return mean, max(Decimal("0.25"), mean * Decimal("0.25"))
-
-        daily = [a / Decimal("30") for a in actuals]
-        mean = sum(daily, Decimal("0")) / Decimal(str(len(daily)))
-        if len(daily) == 1:
-            std = max(Decimal("0.25"), mean * Decimal("0.20"))
-        else:
-            var = sum(((d - mean) ** 2 for d in daily), Decimal("0")) / Decimal(str(len(daily) - 1))
-            std = Decimal(str(float(var) ** 0.5))
-
-        return max(Decimal("0.01"), mean), max(Decimal("0.01"), std)
-
-    def _estimate_lead_time_stats(
-        self,
-        inv: Inventory,
-        payload: InventoryServiceLevelAnalyticsRequest,
-    ) -> Tuple[Decimal, Decimal]:
-        product = self._product_repo.get_by_id(inv.product_id)
-        supply = self._supply_repo.get_latest_by_product(inv.product_id)
-
-        base = Decimal("14")
-        if product and getattr(product, "lead_time_days", None):
-            base = Decimal(str(product.lead_time_days))
-        if supply and getattr(supply, "lead_time_days", None):
-            base = Decimal(str(supply.lead_time_days))
-
-        std = Decimal(str(payload.lead_time_std_override)) if payload.lead_time_std_override is not None else max(Decimal("0.5"), base * Decimal("0.15"))
-        return max(Decimal("1"), base), max(Decimal("0.01"), std)
+    def _product_stats(self, product_ids, fresh: bool = False) -> Dict[int, ProductStats]:
+        """
+        Demand and lead-time statistics per product from the shared cache. `fresh`
+        reads them from the database instead: the cache is per process and its TTL
+        does not cover writes made by other processes.
+        """
+        if fresh:
+            return self._stats.refresh(self._repo.db, product_ids)
+        return self._stats.get_many(self._repo.db, product_ids)
+
+    @staticmethod
+    def _daily_demand_stats(stats: ProductStats, inv) -> Tuple[Decimal, Decimal]:
+        """The product's daily demand statistics, else an estimate from the row's open quantities."""
+        if stats.demand_mean_daily is not None:
+            return stats.demand_mean_daily, stats.demand_std_daily
+        basis = (inv.allocated_qty or Decimal("0")) + (inv.in_transit_qty or Decimal("0"))
+        mean = max(Decimal("1"), basis / Decimal("30"))
+        return mean, max(Decimal("0.25"), mean * Decimal("0.25"))
+
+    @staticmethod
+    def _lead_time_stats(stats: ProductStats, std_override: Optional[float]) -> Tuple[Decimal, Decimal]:
+        if std_override is None:
+            return stats.lead_time_mean_days, stats.lead_time_std_days
+        return lead_time_stats(stats.lead_time_days, std_override)
 
     def _target_service_to_z(self, service_level: float) -> float:
         # Clamp to avoid +/- inf.
@@ -1058,52 +1693,32 @@ class InventoryService:
         reorder_point: Decimal,
         simulation_runs: int,
         bucket_count: int,
+        seed: Optional[int] = None,
     ) -> Tuple[float, Decimal, float, List[InventoryServiceLevelDistributionPoint]]:
-        samples = [
-            max(0.0, random.normalvariate(float(mean_dlt), float(std_dlt)))
-            for _ in range(simulation_runs)
-        ]
-
-        no_stockout = sum(1 for d in samples if d <= float(reorder_point))
-        cycle_service_level = (no_stockout / max(1, simulation_runs))
-        shortages = [max(0.0, d - float(reorder_point)) for d in samples]
-        expected_shortage = Decimal(str(sum(shortages) / max(1, len(shortages))))
-        avg_demand = max(1.0, sum(samples) / max(1, len(samples)))
-        fill_rate = max(0.0, min(1.0, 1.0 - (float(expected_shortage) / avg_demand)))
-
-        distribution = self._build_distribution(samples, bucket_count)
-        return cycle_service_level, expected_shortage, fill_rate, distribution
-
-    def _build_distribution(self, samples: List[float], bucket_count: int) -> List[InventoryServiceLevelDistributionPoint]:
-        if not samples:
-            return []
+        simulation = simulate_service_level(
+            float(mean_dlt),
+            float(std_dlt),
+            float(reorder_point),
+            runs=simulation_runs,
+            bucket_count=bucket_count,
+            seed=seed,
+        )
+        return (
+            simulation.cycle_service_level,
+            Decimal(str(simulation.expected_shortage_units)),
+            simulation.fill_rate,
+            self._build_distribution(*simulation.histogram),
+        )
 
-        lo = min(samples)
-        hi = max(samples)
-        if hi <= lo:
-            hi = lo + 1.0
-        width = (hi - lo) / bucket_count
-        bins = [0 for _ in range(bucket_count)]
-
-        for s in samples:
-            idx = int((s - lo) / width) if width > 0 else 0
-            idx = max(0, min(bucket_count - 1, idx))
-            bins[idx] += 1
-
-        total = len(samples)
-        points: List[InventoryServiceLevelDistributionPoint] = []
-        for i, c in enumerate(bins):
-            start = lo + i * width
-            end = start + width
-            midpoint = (start + end) / 2
-            points.append(
-                InventoryServiceLevelDistributionPoint(
-                    bucket=f"{start:.1f}-{end:.1f}",
-                    midpoint=round(midpoint, 3),
-                    probability=round(c / total, 6),
-                )
+    def _build_distribution(self, counts, edges) -> List[InventoryServiceLevelDistributionPoint]:
+        return [
+            InventoryServiceLevelDistributionPoint(
+                bucket=f"{start:.1f}-{end:.1f}",
+                midpoint=round((start + end) / 2, 3),
+                probability=round(probability, 6),
             )
-        return points
+            for start, end, probability in histogram_points(counts, edges)
+        ]
 
     def _recalculate_status(self, inv: Inventory) -> Inventory:
         """Business rule: recalculate inventory status based on thresholds."""
@@ -1121,173 +1736,59 @@ class InventoryService:
             new_status = "normal"
         return self._repo.update(inv, {"status": new_status})
 
-    def _service_level_to_z(self, service_level_target: float) -> float:
-        if service_level_target >= 0.99:
-            return 2.33
-        if service_level_target >= 0.98:
-            return 2.05
-        if service_level_target >= 0.95:
-            return 1.65
-        if service_level_target >= 0.90:
-            return 1.28
-        return 0.84
-
-    def _build_exceptions_for_inventory(self, inv: Inventory, upsert: bool = False) -> List[InventoryExceptionView]:
-        exceptions: List[InventoryExceptionView] = []
+    def _build_exceptions_for_inventory(self, inv: Inventory) -> List[InventoryExceptionView]:
+        """Preview of the exceptions a row's current policy raises, without persisting them."""
+        return [
+            InventoryExceptionView(
+                inventory_id=inv.id,
+                product_id=inv.product_id,
+                location=inv.location,
+                exception_type=exception_type,
+                severity=severity,
+                status="open",
+                recommended_action=action,
+            )
+            for exception_type, severity, action in self._exception_risks(inv)
+        ]
+
+    @staticmethod
+    def _exception_risks(inv) -> List[Tuple[str, str, str]]:
+        """(exception_type, severity, recommended_action) for each policy risk of one row."""
+        risks: List[Tuple[str, str, str]] = []
         on_hand = inv.on_hand_qty or Decimal("0")
         reorder = inv.reorder_point or Decimal("0")
         max_stock = inv.max_stock or Decimal("0")
 
         if reorder > 0 and on_hand < reorder:
             severity = "high" if on_hand <= (inv.safety_stock or Decimal("0")) else "medium"
-            exceptions.append(
-                self._to_exception_view(
-                    inv,
-                    exception_type="stockout_risk",
-                    severity=severity,
-                    recommended_action="Advance replenishment or increase planned supply",
-                    upsert=upsert,
-                )
-            )
+            risks.append(("stockout_risk", severity, "Advance replenishment or increase planned supply"))
 
         if max_stock > 0 and on_hand > max_stock:
-            exceptions.append(
-                self._to_exception_view(
-                    inv,
-                    exception_type="excess_risk",
-                    severity="medium",
-                    recommended_action="Throttle replenishment or rebalance stock across locations",
-                    upsert=upsert,
-                )
-            )
+            risks.append(("excess_risk", "medium", "Throttle replenishment or rebalance stock across locations"))
 
-        return exceptions
+        return risks
 
-    def _to_exception_view(
+    def _resolve_effective_lead_times(
         self,
-        inv: Inventory,
-        exception_type: str,
-        severity: str,
-        recommended_action: str,
-        upsert: bool,
-    ) -> InventoryExceptionView:
-        if upsert:
-            existing = self._exception_repo.get_open_by_inventory_and_type(inv.id, exception_type)
-            if existing:
-                existing = self._exception_repo.update(
-                    existing,
-                    {
-                        "severity": severity,
-                        "recommended_action": recommended_action,
-                        "status": "open" if existing.status == "dismissed" else existing.status,
-                    },
-                )
-            else:
-                default_due = datetime.utcnow().date() + timedelta(days=2 if severity == "high" else 5)
-                existing = self._exception_repo.create(
-                    self._exception_repo.model(
-                        inventory_id=inv.id,
-                        exception_type=exception_type,
-                        severity=severity,
-                        status="open",
-                        recommended_action=recommended_action,
-                        due_date=default_due,
-                    )
-                )
-            return InventoryExceptionView(
-                id=existing.id,
-                inventory_id=inv.id,
-                product_id=inv.product_id,
-                location=inv.location,
-                exception_type=existing.exception_type,
-                severity=existing.severity,
-                status=existing.status,
-                recommended_action=existing.recommended_action,
-                owner_user_id=existing.owner_user_id,
-                due_date=existing.due_date,
-                notes=existing.notes,
-            )
-
-        return InventoryExceptionView(
-            inventory_id=inv.id,
-            product_id=inv.product_id,
-            location=inv.location,
-            exception_type=exception_type,
-            severity=severity,
-            status="open",
-            recommended_action=recommended_action,
-        )
-
-    def _resolve_effective_lead_time_days(self, inv: Inventory, payload: InventoryOptimizationRunRequest) -> Decimal:
-        product = self._product_repo.get_by_id(inv.product_id)
-        base = Decimal(str(payload.lead_time_days))
-        if product and getattr(product, "lead_time_days", None):
-            base = Decimal(str(product.lead_time_days))
-        supply = self._supply_repo.get_latest_by_product(inv.product_id)
-        if supply and getattr(supply, "lead_time_days", None):
-            base = Decimal(str(supply.lead_time_days))
-        variability = Decimal(str(payload.lead_time_variability_days or 0))
-        return max(Decimal("1"), base + variability)
-
-    def _round_up_to_lot(self, value: Decimal, lot: Decimal) -> Decimal:
-        if lot <= 0:
-            return value
-        multiplier = (value / lot).to_integral_value(rounding=ROUND_CEILING)
-        return (multiplier * lot).quantize(Decimal("0.01"))
-
-    def _recommendation_confidence(
-        self,
-        inv: Inventory,
-        demand_pressure: Decimal,
-        lead_time_days: Decimal,
-    ) -> Decimal:
-        base = Decimal("0.72")
-        status_adj = Decimal("0.08") if inv.status in ("critical", "low") else Decimal("0")
-        pressure_adj = min(Decimal("0.12"), demand_pressure * Decimal("0.10"))
-        lead_time_adj = Decimal("0.05") if lead_time_days > Decimal("20") else Decimal("0")
-        score = base + status_adj + pressure_adj - lead_time_adj
-        return min(Decimal("0.95"), max(Decimal("0.40"), score)).quantize(Decimal("0.0001"))
-
-    def _compute_data_quality(self, inv: Inventory) -> InventoryDataQualityView:
-        completeness_points = 0
-        if inv.on_hand_qty is not None:
-            completeness_points += 1
-        if inv.safety_stock is not None:
-            completeness_points += 1
-        if inv.reorder_point is not None:
-            completeness_points += 1
-        if inv.max_stock is not None:
-            completeness_points += 1
-        if inv.valuation is not None:
-            completeness_points += 1
-        completeness_score = round(completeness_points / 5, 4)
-
-        freshness_score = 1.0
-        if inv.updated_at:
-            age_hours = (datetime.utcnow() - inv.updated_at).total_seconds() / 3600
-            if age_hours > 168:
-                freshness_score = 0.5
-            elif age_hours > 72:
-                freshness_score = 0.75
-
-        consistency_score = 1.0
-        if (inv.on_hand_qty or Decimal("0")) < Decimal("0"):
-            consistency_score = 0.0
-        elif inv.max_stock and inv.reorder_point and inv.max_stock < inv.reorder_point:
-            consistency_score = 0.5
-
-        overall = round((0.4 * completeness_score) + (0.3 * freshness_score) + (0.3 * consistency_score), 4)
-        tier = "high" if overall >= 0.85 else "medium" if overall >= 0.60 else "low"
-        return InventoryDataQualityView(
-            inventory_id=inv.id,
-            product_id=inv.product_id,
-            location=inv.location,
-            completeness_score=completeness_score,
-            freshness_score=round(freshness_score, 4),
-            consistency_score=round(consistency_score, 4),
-            overall_score=overall,
-            quality_tier=tier,
-        )
+        rows: List,
+        payload: InventoryOptimizationRunRequest,
+        include_variability: bool = True,
+        stats: Optional[Dict[int, ProductStats]] = None,
+    ) -> List[Decimal]:
+        """
+        Effective lead time per row: the latest supply plan's lead time, else the
+        product's (from `stats`, else the statistics cache), else the payload default,
+        plus variability.
+        """
+        if stats is None:
+            stats = self._product_stats(r.product_id for r in rows)
+        variability = Decimal(str(payload.lead_time_variability_days or 0)) if include_variability else Decimal("0")
+        resolved: List[Decimal] = []
+        for row in rows:
+            lead_time = stats[row.product_id].lead_time_days
+            base = Decimal(str(lead_time)) if lead_time else Decimal(str(payload.lead_time_days))
+            resolved.append(max(Decimal("1"), base + variability))
+        return resolved
 
     def _requires_maker_checker(self, rec, inv: Inventory) -> bool:
         base = inv.reorder_point or Decimal("1")
@@ -1297,7 +1798,12 @@ class InventoryService:
         pct = delta / base
         return pct >= Decimal("0.20")
 
-    def _build_recommendation_view(self, rec, inv: Inventory) -> InventoryPolicyRecommendationView:
+    def _build_recommendation_view(
+        self,
+        rec,
+        product_id: int,
+        location: Optional[str],
+    ) -> InventoryPolicyRecommendationView:
         signals = None
         if rec.signals_json:
             try:
@@ -1308,8 +1814,8 @@ class InventoryService:
         return InventoryPolicyRecommendationView(
             id=rec.id,
             inventory_id=rec.inventory_id,
-            product_id=inv.product_id,
-            location=inv.location,
+            product_id=product_id,
+            location=location,
             recommended_safety_stock=rec.recommended_safety_stock,
             recommended_reorder_point=rec.recommended_reorder_point,
             recommended_max_stock=rec.recommended_max_stock,
@@ -0,0 +1,228 @@
+"""
+Inventory Statistics Cache
+
+Per-product inputs of the inventory analytics — daily demand mean and standard
+deviation from the last 12 demand actuals, and the effective lead time (latest
+supply plan's, else the product's) with its default mean and standard deviation —
+cached in process and shared by every `InventoryService`.
+
+Misses are loaded in bulk: one query each for recent actuals, latest supply lead
+times and product lead times, however many products are missing. Each entry keeps
+the time it was computed (`updated_at`) and is reloaded after
+`INVENTORY_STATS_CACHE_TTL_SECONDS`.
+
+Entries are invalidated through the event bus when demand plans (including actual
+syncs), supply plans or products change. An event that names no product clears the
+whole cache. The TTL bounds staleness from writes that publish no event, such as
+raw SQL or another process. Writers that must not act on stale inputs (optimization
+runs persisting policies) call `refresh`, which always reads the database.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.repositories.demand_repository import DemandPlanRepository
+from app.repositories.product_repository import ProductRepository
+from app.repositories.supply_repository import SupplyPlanRepository
+from app.schemas.inventory import InventoryStatsCacheMetrics
+from app.utils.events import (
+    DomainEvent,
+    EntityCreatedEvent,
+    EntityDeletedEvent,
+    EntityUpdatedEvent,
+    EventBus,
+    EventHandler,
+)
+
+DEMAND_HISTORY_PERIODS = 12
+DEFAULT_LEAD_TIME_DAYS = Decimal("14")
+# Entity types whose changes move the cached statistics.
+INVALIDATING_ENTITY_TYPES = ("demand_plan", "demand_actuals", "supply_plan", "product")
+
+
+@dataclass(frozen=True)
+class ProductStats:
+    # None when the product has no actuals; callers fall back to the inventory row.
+    demand_mean_daily: Optional[Decimal]
+    demand_std_daily: Optional[Decimal]
+    # Latest supply plan's lead time, else the product's; None when neither is set.
+    lead_time_days: Optional[int]
+    lead_time_mean_days: Decimal
+    lead_time_std_days: Decimal
+    updated_at: datetime
+
+
+def actual_demand_stats(actuals: List[Decimal]) -> Optional[Tuple[Decimal, Decimal]]:
+    """(mean, std) of daily demand from monthly actuals, oldest first; None without actuals."""
+    if not actuals:
+        return None
+    daily = [a / Decimal("30") for a in actuals]
+    mean = sum(daily, Decimal("0")) / Decimal(str(len(daily)))
+    if len(daily) == 1:
+        std = max(Decimal("0.25"), mean * Decimal("0.20"))
+    else:
+        var = sum(((d - mean) ** 2 for d in daily), Decimal("0")) / Decimal(str(len(daily) - 1))
+        std = Decimal(str(float(var) ** 0.5))
+    return max(Decimal("0.01"), mean), max(Decimal("0.01"), std)
+
+
+def lead_time_stats(lead_time_days: Optional[int], std_override: Optional[float] = None) -> Tuple[Decimal, Decimal]:
+    """(mean, std) lead time in days, defaulting to 14 days when no lead time is known."""
+    base = Decimal(str(lead_time_days)) if lead_time_days else DEFAULT_LEAD_TIME_DAYS
+    std = Decimal(str(std_override)) if std_override is not None else max(Decimal("0.5"), base * Decimal("0.15"))
+    return max(Decimal("1"), base), max(Decimal("0.01"), std)
+
+
+def load_product_stats(db: Session, product_ids: Iterable[int]) -> Dict[int, ProductStats]:
+    ids = list(set(product_ids))
+    actuals = DemandPlanRepository(db).recent_actuals(ids, limit=DEMAND_HISTORY_PERIODS)
+    supply_lead_times = SupplyPlanRepository(db).latest_lead_times(ids)
+    product_lead_times = ProductRepository(db).lead_times(ids)
+    now = datetime.utcnow()
+    loaded: Dict[int, ProductStats] = {}
+    for product_id in ids:
+        demand = actual_demand_stats(actuals.get(product_id, []))
+        lead_time = supply_lead_times.get(product_id) or product_lead_times.get(product_id) or None
+        lead_time_mean, lead_time_std = lead_time_stats(lead_time)
+        loaded[product_id] = ProductStats(
+            demand_mean_daily=demand[0] if demand else None,
+            demand_std_daily=demand[1] if demand else None,
+            lead_time_days=lead_time,
+            lead_time_mean_days=lead_time_mean,
+            lead_time_std_days=lead_time_std,
+            updated_at=now,
+        )
+    return loaded
+
+
+class InventoryStatsCache:
+    def __init__(self, ttl_seconds: int):
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._ttl_seconds = ttl_seconds
+        self._entries: Dict[int, ProductStats] = {}
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; a load that raced one is not stored.
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get_many(self, db: Session, product_ids: Iterable[int]) -> Dict[int, ProductStats]:
+        """Statistics for every product, loading the missing and expired ones in bulk."""
+        wanted: Set[int] = set(product_ids)
+        cutoff = datetime.utcnow() - self._ttl
+        with self._lock:
+            found = {
+                pid: self._entries[pid]
+                for pid in wanted
+                if pid in self._entries and self._entries[pid].updated_at > cutoff
+            }
+            missing = wanted - set(found)
+            self._hits += len(found)
+            self._misses += len(missing)
+            generation = self._generation
+        if not missing:
+            return found
+
+        loaded = load_product_stats(db, missing)
+        with self._lock:
+            if generation == self._generation:
+                self._entries.update(loaded)
+        found.update(loaded)
+        return found
+
+    def refresh(self, db: Session, product_ids: Iterable[int]) -> Dict[int, ProductStats]:
+        """Statistics read from the database now, bypassing cached entries; the cache is updated with them."""
+        wanted: Set[int] = set(product_ids)
+        with self._lock:
+            self._misses += len(wanted)
+            generation = self._generation
+        loaded = load_product_stats(db, wanted)
+        with self._lock:
+            if generation == self._generation:
+                self._entries.update(loaded)
+        return loaded
+
+    def get(self, db: Session, product_id: int) -> ProductStats:
+        return self.get_many(db, [product_id])[product_id]
+
+    def invalidate(self, product_ids: Optional[Iterable[int]] = None) -> None:
+        """Drop the given products' entries, or every entry when none are given."""
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+            if product_ids is None:
+                self._entries.clear()
+            else:
+                for pid in product_ids:
+                    self._entries.pop(pid, None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._hits = self._misses = self._invalidations = 0
+
+    def metrics(self) -> InventoryStatsCacheMetrics:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return InventoryStatsCacheMetrics(
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                hit_rate=round(self._hits / lookups, 4) if lookups else 0.0,
+                invalidations=self._invalidations,
+                ttl_seconds=self._ttl_seconds,
+            )
+
+
+class InventoryStatsInvalidationHandler(EventHandler):
+    """Invalidates cached statistics when demand, supply or product data changes."""
+
+    def __init__(self, cache: InventoryStatsCache):
+        self._cache = cache
+
+    def can_handle(self, event: DomainEvent) -> bool:
+        return (
+            isinstance(event, (EntityCreatedEvent, EntityUpdatedEvent, EntityDeletedEvent))
+            and event.entity_type in INVALIDATING_ENTITY_TYPES
+        )
+
+    def handle(self, event: DomainEvent) -> None:
+        if event.entity_type == "product" and event.entity_id:
+            self._cache.invalidate([event.entity_id])
+            return
+        values = getattr(event, "new_values", None) or {}
+        if values.get("product_ids") is not None:
+            self._cache.invalidate(values["product_ids"])
+        elif values.get("product_id") is not None:
+            self._cache.invalidate([values["product_id"]])
+        else:
+            self._cache.invalidate()
+
+
+_cache: Optional[InventoryStatsCache] = None
+
+
+def get_inventory_stats_cache() -> InventoryStatsCache:
+    """Process-wide cache shared by every inventory service."""
+    global _cache
+    if _cache is None:
+        _cache = InventoryStatsCache(settings.INVENTORY_STATS_CACHE_TTL_SECONDS)
+    return _cache
+
+
+def register_inventory_stats_invalidation(bus: EventBus) -> None:
+    """Subscribe the cache to a freshly configured `bus`, starting it empty."""
+    cache = get_inventory_stats_cache()
+    cache.clear()
+    bus.subscribe(InventoryStatsInvalidationHandler(cache))
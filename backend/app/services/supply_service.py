@@ -46,6 +46,7 @@ class SupplyService:
         result = self._repo.create(plan)
         self._bus.publish(EntityCreatedEvent(
             entity_type="supply_plan", entity_id=result.id, user_id=created_by,
+            new_values={"product_id": result.product_id},
         ))
         return result
 
@@ -55,7 +56,8 @@ class SupplyService:
         updates["version"] = plan.version + 1
         result = self._repo.update(plan, updates)
         self._bus.publish(EntityUpdatedEvent(
-            entity_type="supply_plan", entity_id=plan_id, user_id=user_id, new_values=updates,
+            entity_type="supply_plan", entity_id=plan_id, user_id=user_id,
+            new_values={**updates, "product_id": result.product_id},
         ))
         return result
 
@@ -0,0 +1,119 @@
+"""
+Minimal five-field cron expression support for the in-app batch scheduler.
+
+Supports `*`, lists (`1,15`), ranges (`1-5`), steps (`*/15`, `0-30/10`), month and
+weekday names (`jan`, `mon`) and the `@hourly`, `@daily`, `@weekly`, `@monthly`,
+`@yearly` macros. Day-of-month and day-of-week follow Vixie cron semantics: when
+both are restricted a day matches if either field matches. A field starting with
+`*` (including `*/n`) counts as unrestricted. All times are naive UTC.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import List, Set
+
+_MACROS = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+}
+_MONTH_NAMES = {name: idx for idx, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1
+)}
+_DOW_NAMES = {name: idx for idx, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+_SEARCH_LIMIT_DAYS = 366 * 5
+
+
+class CronExpression:
+    """Parsed cron expression able to compute the next fire time."""
+
+    def __init__(self, expression: str):
+        self.expression = (expression or "").strip()
+        fields = _MACROS.get(self.expression.lower(), self.expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: '{expression}'")
+        self.minutes = _parse_field(fields[0], 0, 59)
+        self.hours = _parse_field(fields[1], 0, 23)
+        self.days = _parse_field(fields[2], 1, 31)
+        self.months = _parse_field(fields[3], 1, 12, _MONTH_NAMES)
+        # 7 is an alias for Sunday.
+        self.weekdays = {d % 7 for d in _parse_field(fields[4], 0, 7, _DOW_NAMES)}
+        self._dom_restricted = not fields[2].startswith("*")
+        self._dow_restricted = not fields[4].startswith("*")
+
+    def matches_day(self, moment: datetime) -> bool:
+        dom_ok = moment.day in self.days
+        dow_ok = ((moment.weekday() + 1) % 7) in self.weekdays
+        if self._dom_restricted and self._dow_restricted:
+            return dom_ok or dow_ok
+        return dom_ok and dow_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """Earliest fire time strictly after `after` (minute resolution)."""
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = after + timedelta(days=_SEARCH_LIMIT_DAYS)
+        while moment <= limit:
+            if moment.month not in self.months:
+                year = moment.year + (1 if moment.month == 12 else 0)
+                month = 1 if moment.month == 12 else moment.month + 1
+                moment = moment.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self.matches_day(moment):
+                moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if moment.hour not in self.hours:
+                moment = (moment + timedelta(hours=1)).replace(minute=0)
+                continue
+            if moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+                continue
+            return moment
+        raise ValueError(f"Cron expression never fires: '{self.expression}'")
+
+
+def _parse_field(raw: str, low: int, high: int, names: dict | None = None) -> Set[int]:
+    values: Set[int] = set()
+    for part in raw.lower().split(","):
+        if not part:
+            raise ValueError(f"Empty cron field segment in '{raw}'")
+        step = 1
+        if "/" in part:
+            part, step_raw = part.split("/", 1)
+            step = _to_int(step_raw, None)
+            if step < 1:
+                raise ValueError(f"Cron step must be positive in '{raw}'")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_raw, end_raw = part.split("-", 1)
+            start, end = _to_int(start_raw, names), _to_int(end_raw, names)
+        else:
+            start = _to_int(part, names)
+            end = high if step > 1 else start
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron value out of range [{low}-{high}] in '{raw}'")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def _to_int(token: str, names: dict | None) -> int:
+    if names and token in names:
+        return names[token]
+    try:
+        return int(token)
+    except ValueError as exc:
+        raise ValueError(f"Invalid cron token '{token}'") from exc
+
+
+def next_fire_times(expression: str, after: datetime, count: int = 5) -> List[datetime]:
+    cron = CronExpression(expression)
+    times: List[datetime] = []
+    moment = after
+    for _ in range(count):
+        moment = cron.next_after(moment)
+        times.append(moment)
+    return times
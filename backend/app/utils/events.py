@@ -41,6 +41,17 @@ class EntityUpdatedEvent(DomainEvent):
     new_values: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class EntityBatchUpdatedEvent(DomainEvent):
+    """
+    Many updates of one entity type published together. Each entry carries
+    ``entity_id``, ``old_values`` and ``new_values``; audit logging expands the
+    entries into one row each.
+    """
+    entity_type: str = ""
+    entries: List[Dict[str, Any]] = field(default_factory=list)
+
+
 @dataclass
 class EntityDeletedEvent(DomainEvent):
     entity_type: str = ""
@@ -98,31 +109,47 @@ class AuditLogHandler(EventHandler):
 
     def handle(self, event: DomainEvent) -> None:
         from app.models.comment import AuditLog
+        db = None
         try:
             import json
-            db = self._db_factory()
+            from sqlalchemy import insert
             action = self._resolve_action(event)
             entity_type = getattr(event, "entity_type", "unknown")
-            entity_id = getattr(event, "entity_id", 0)
-            old_values = json.dumps(getattr(event, "old_values", None))
-            new_values = json.dumps(getattr(event, "new_values", None))
-            log = AuditLog(
-                user_id=event.user_id,
-                action=action,
-                entity_type=entity_type,
-                entity_id=entity_id,
-                old_values=old_values,
-                new_values=new_values,
-            )
-            db.add(log)
+            if isinstance(event, EntityBatchUpdatedEvent):
+                entries = event.entries
+            else:
+                entries = [{
+                    "entity_id": getattr(event, "entity_id", 0),
+                    "old_values": getattr(event, "old_values", None),
+                    "new_values": getattr(event, "new_values", None),
+                }]
+            if not entries:
+                return
+            rows = [
+                {
+                    "user_id": event.user_id,
+                    "action": action,
+                    "entity_type": entity_type,
+                    "entity_id": entry["entity_id"],
+                    "old_values": json.dumps(entry.get("old_values")),
+                    "new_values": json.dumps(entry.get("new_values")),
+                }
+                for entry in entries
+            ]
+            db = self._db_factory()
+            # One executemany INSERT however many entries the event carries.
+            db.execute(insert(AuditLog), rows)
             db.commit()
         except Exception as exc:
             logger.warning("AuditLogHandler failed: %s", exc)
+        finally:
+            if db is not None:
+                db.close()
 
     def _resolve_action(self, event: DomainEvent) -> str:
         if isinstance(event, EntityCreatedEvent):
             return "create"
-        if isinstance(event, EntityUpdatedEvent):
+        if isinstance(event, (EntityUpdatedEvent, EntityBatchUpdatedEvent)):
             return "update"
         if isinstance(event, EntityDeletedEvent):
             return "delete"
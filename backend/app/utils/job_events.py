@@ -0,0 +1,117 @@
+"""
+In-process pub/sub for forecast job status and progress events.
+
+Workers publish from their own threads; Server-Sent Event streams consume on the
+event loop. Each subscription owns an `asyncio.Queue` fed through
+`call_soon_threadsafe`, so publishers never block on slow clients (a full queue
+drops the event; the stream's periodic status poll still reports transitions).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+_SUBSCRIPTION_QUEUE_SIZE = 1000
+_LATEST_EVENTS_KEPT = 1000
+
+
+class JobEventSubscription:
+    def __init__(self, job_ids: Iterable[str], loop: asyncio.AbstractEventLoop):
+        self.job_ids: Set[str] = set(job_ids)
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=_SUBSCRIPTION_QUEUE_SIZE)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next event, or None when `timeout` elapses first."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # Event loop already closed; the stream is gone.
+            pass
+
+    def _put(self, event: Dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.debug("Dropping job event for slow subscriber job_id=%s", event.get("job_id"))
+
+
+class JobEventHub:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[JobEventSubscription]] = {}
+        self._latest: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def publish(self, job_id: str, event: str, **data: Any) -> Dict[str, Any]:
+        payload = {"job_id": job_id, "event": event, "ts": datetime.utcnow().isoformat(), **data}
+        with self._lock:
+            self._latest[job_id] = payload
+            self._latest.move_to_end(job_id)
+            while len(self._latest) > _LATEST_EVENTS_KEPT:
+                self._latest.popitem(last=False)
+            subscribers = list(self._subscribers.get(job_id, ()))
+        for subscription in subscribers:
+            subscription.deliver(payload)
+        return payload
+
+    def latest(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._latest.get(job_id)
+
+    def subscribe(self, job_ids: Iterable[str]) -> JobEventSubscription:
+        """Register a subscription. Must be called from the consuming event loop."""
+        subscription = JobEventSubscription(job_ids, asyncio.get_running_loop())
+        with self._lock:
+            for job_id in subscription.job_ids:
+                self._subscribers.setdefault(job_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: JobEventSubscription) -> None:
+        with self._lock:
+            for job_id in subscription.job_ids:
+                subscribers = self._subscribers.get(job_id)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[job_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subs) for subs in self._subscribers.values())
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def publish_status(job_ids: List[str], status: str, **data: Any) -> None:
+    hub = get_job_event_hub()
+    for job_id in job_ids:
+        hub.publish(job_id, "status", status=status, **data)
+
+
+_hub: Optional[JobEventHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_job_event_hub() -> JobEventHub:
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = JobEventHub()
+    return _hub
@@ -0,0 +1,107 @@
+"""
+Resource accounting for a single forecast run.
+
+Records wall time per stage, backtest time per candidate model, the number of model
+fits, CPU time of the running thread and peak memory. Memory comes from tracemalloc
+when FORECAST_PROFILE_TRACEMALLOC is enabled (accurate Python allocations, slower
+runs; shared across concurrently traced runs). Otherwise it is the growth of the
+process peak RSS during the run, which is cheap but reads 0 when an earlier run
+already pushed the high-water mark higher.
+"""
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+try:  # POSIX only
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+
+def _peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux.
+    return int(peak / 1024) if sys.platform == "darwin" else int(peak)
+
+
+class RunProfiler:
+    def __init__(self, trace_memory: bool = False):
+        self.stages_ms: Dict[str, float] = {}
+        self.backtest_ms_by_model: Dict[str, float] = {}
+        self.fit_count = 0
+        self._trace_memory = trace_memory
+        self._started_tracing = False
+        self._wall_start: Optional[float] = None
+        self._cpu_start: Optional[float] = None
+        self._rss_start: Optional[int] = None
+        self._result: Optional[Dict[str, Any]] = None
+
+    def start(self) -> "RunProfiler":
+        if self._trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+        self._rss_start = _peak_rss_kb()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+        return self
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage(name, (time.perf_counter() - started) * 1000)
+
+    def add_stage(self, name: str, elapsed_ms: float) -> None:
+        self.stages_ms[name] = self.stages_ms.get(name, 0.0) + elapsed_ms
+
+    def add_backtest(self, model_id: str, elapsed_ms: float, fits: int) -> None:
+        self.backtest_ms_by_model[model_id] = self.backtest_ms_by_model.get(model_id, 0.0) + elapsed_ms
+        self.fit_count += fits
+
+    def record_fits(self, count: int = 1) -> None:
+        self.fit_count += count
+
+    def finish(self) -> Dict[str, Any]:
+        """Stop measuring and return the usage summary (idempotent)."""
+        if self._result is not None:
+            return self._result
+        wall_ms = (time.perf_counter() - self._wall_start) * 1000 if self._wall_start is not None else None
+        cpu_ms = (time.thread_time() - self._cpu_start) * 1000 if self._cpu_start is not None else None
+
+        peak_memory_kb: Optional[int] = None
+        memory_method = None
+        if self._trace_memory and tracemalloc.is_tracing():
+            peak_memory_kb = int(tracemalloc.get_traced_memory()[1] / 1024)
+            memory_method = "tracemalloc"
+            if self._started_tracing:
+                tracemalloc.stop()
+        else:
+            rss_end = _peak_rss_kb()
+            if rss_end is not None and self._rss_start is not None:
+                peak_memory_kb = max(rss_end - self._rss_start, 0)
+                memory_method = "rss_delta"
+
+        self._result = {
+            "total_ms": _ms(wall_ms),
+            "cpu_ms": _ms(cpu_ms),
+            "stages_ms": {name: _ms(value) for name, value in self.stages_ms.items()},
+            "backtest_ms_by_model": {name: _ms(value) for name, value in self.backtest_ms_by_model.items()},
+            "fit_count": self.fit_count,
+            "peak_memory_kb": peak_memory_kb,
+            "memory_method": memory_method,
+        }
+        return self._result
+
+
+def _ms(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
@@ -18,10 +18,12 @@ from app.models.inventory import Inventory
 from app.models.sop_cycle import SOPCycle
 from app.models.kpi_metric import KPIMetric
 from app.utils.security import get_password_hash
+from app.services.inventory_rollup_service import register_inventory_rollup_hooks
 
 
 def seed():
     create_tables()
+    register_inventory_rollup_hooks()
     db = SessionLocal()
     try:
         # ── Users ────────────────────────────────────────────────────────────
@@ -7,6 +7,13 @@ Provides:
 - Pre-created admin user + JWT token
 - Helper factories for creating test entities
 """
+import os
+
+# Background threads started by the app use SessionLocal (the configured database),
+# not the in-memory test engine, so keep them off; tests drive workers directly.
+os.environ["FORECAST_JOB_EMBEDDED_WORKER"] = "false"
+os.environ["INVENTORY_OPTIMIZATION_SWEEP_SECONDS"] = "0"
+
 import pytest
 from decimal import Decimal
 from datetime import date
@@ -5,6 +5,7 @@ Covers:
 - POST /api/v1/forecasting/generate diagnostics contract
 - Persistence of advisor diagnostics metadata in forecast results
 - GET /api/v1/forecasting/accuracy/drift-alerts response contract
+- Conformal interval mode and empirical interval coverage
 """
 
 from datetime import date
@@ -14,8 +15,10 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.models.demand_plan import DemandPlan
+from app.models.forecast import Forecast
 from app.models.forecast_consensus import ForecastConsensus
 from app.models.forecast_run_audit import ForecastRunAudit
+from app.repositories.forecast_residual_repository import ForecastResidualRepository
 
 
 def _seed_actual_history(db: Session, product_id: int, months: int = 18) -> None:
@@ -219,6 +222,33 @@ class TestForecastingIntegration:
         assert "model_params" in row
         assert "warnings" in row
 
+    def test_generate_without_artifact_keeps_advisor_model_version(
+        self,
+        client: TestClient,
+        admin_headers: dict,
+        db: Session,
+        product,
+    ):
+        _seed_actual_history(db, product.id, months=18)
+
+        gen = client.post(
+            "/api/v1/forecasting/generate",
+            params={"product_id": product.id, "horizon": 3, "model_type": "moving_average"},
+            headers=admin_headers,
+        )
+        assert gen.status_code == 200
+        diagnostics = gen.json()["diagnostics"]
+        # Moving average is not persistable, so no registry version may be claimed.
+        assert diagnostics["artifact_status"] == "none"
+        assert diagnostics["model_version"] == "genxai-advisor-v1"
+
+        results = client.get(
+            "/api/v1/forecasting/results",
+            params={"product_id": product.id},
+            headers=admin_headers,
+        ).json()
+        assert {row["model_version"] for row in results} == {"genxai-advisor-v1"}
+
     def test_generate_with_model_params_persists_in_diagnostics_and_results(
         self,
         client: TestClient,
@@ -266,6 +296,152 @@ class TestForecastingIntegration:
         assert audit.history_months >= 3
         assert audit.records_created > 0
 
+    def test_generate_with_conformal_intervals(
+        self,
+        client: TestClient,
+        admin_headers: dict,
+        db: Session,
+        product,
+    ):
+        _seed_actual_history(db, product.id, months=18)
+
+        gen = client.post(
+            "/api/v1/forecasting/generate",
+            params={
+                "product_id": product.id,
+                "horizon": 8,
+                "model_type": "moving_average",
+                "interval_mode": "conformal",
+                "coverage": 0.8,
+            },
+            headers=admin_headers,
+        )
+        assert gen.status_code == 200
+        payload = gen.json()
+        diagnostics = payload["diagnostics"]
+        assert diagnostics["interval_mode"] == "conformal"
+        assert diagnostics["interval_coverage_target"] == 0.8
+        assert diagnostics["calibration_samples"]["1"] > 0
+        for row in payload["forecasts"]:
+            assert row["confidence"] == 80.0
+            assert row["upper_bound"] >= row["predicted_qty"]
+
+        results = client.get(
+            "/api/v1/forecasting/results",
+            params={"product_id": product.id, "model_type": "moving_average"},
+            headers=admin_headers,
+        )
+        assert results.status_code == 200
+        assert results.json()[0]["interval_mode"] == "conformal"
+
+    def test_conformal_uses_residuals_of_the_fallback_model(
+        self,
+        client: TestClient,
+        admin_headers: dict,
+        db: Session,
+        product,
+    ):
+        # Three months are too few for exponential smoothing, which falls back to moving average.
+        _seed_actual_history(db, product.id, months=3)
+        repo = ForecastResidualRepository(db)
+        repo.replace_scores(product.id, "exp_smoothing", {1: [500.0] * 20})
+        repo.replace_scores(product.id, "moving_average", {1: [5.0] * 20})
+        db.commit()
+
+        gen = client.post(
+            "/api/v1/forecasting/generate",
+            params={
+                "product_id": product.id,
+                "horizon": 2,
+                "model_type": "exp_smoothing",
+                "interval_mode": "conformal",
+                "coverage": 0.8,
+            },
+            headers=admin_headers,
+        )
+        assert gen.status_code == 200
+        payload = gen.json()
+        assert payload["diagnostics"]["selected_model"] == "exp_smoothing"
+        assert "conformal_calibrated_on_fallback_model:moving_average" in payload["diagnostics"]["warnings"]
+        for row in payload["forecasts"]:
+            assert row["upper_bound"] - row["predicted_qty"] <= 5.01
+
+    def test_generate_rejects_unknown_interval_mode(
+        self,
+        client: TestClient,
+        admin_headers: dict,
+        db: Session,
+        product,
+    ):
+        _seed_actual_history(db, product.id, months=18)
+        resp = client.post(
+            "/api/v1/forecasting/generate",
+            params={"product_id": product.id, "interval_mode": "bootstrap"},
+            headers=admin_headers,
+        )
+        assert resp.status_code == 422
+
+    def test_generate_records_resource_usage(
+        self,
+        client: TestClient,
+        admin_headers: dict,
+        db: Session,
+        product,
+    ):
+        _seed_actual_history(db, product.id, months=18)
+        resp = client.post(
+            "/api/v1/forecasting/generate",
+            params={"product_id": product.id, "horizon": 6, "model_type": "moving_average"},
+            headers=admin_headers,
+        )
+        assert resp.status_code == 200
+        usage = resp.json()["diagnostics"]["resource_usage"]
+        assert {"history_load", "backtest", "advisor", "final_fit", "persist"} <= set(usage["stages_ms"])
+        assert usage["fit_count"] > len(usage["backtest_ms_by_model"])
+        assert usage["cpu_ms"] is not None
+
+        audit = db.query(ForecastRunAudit).filter(
+            ForecastRunAudit.id == resp.json()["diagnostics"]["run_audit_id"]
+        ).one()
+        assert audit.fit_count == usage["fit_count"]
+
+        summary = client.get("/api/v1/forecasting/resource-usage", headers=admin_headers)
+        assert summary.status_code == 200
+        body = summary.json()
+        assert body["runs"] == 1
+        assert body["by_selected_model"]["moving_average"]["share_pct"] == 100.0
+        assert set(body["backtest_by_model"]) == set(usage["backtest_ms_by_model"])
+
+    def test_accuracy_reports_empirical_interval_coverage(
+        self,
+        client: TestClient,
+        admin_headers: dict,
+        db: Session,
+        product,
+    ):
+        _seed_actual_history(db, product.id, months=4)
+        # Actuals are 95, 96, 97, 98 — the first three fall inside their bounds.
+        for idx, (lower, upper) in enumerate([(90, 100), (90, 100), (90, 100), (80, 90)]):
+            db.add(Forecast(
+                product_id=product.id,
+                model_type="moving_average",
+                period=date(2024, idx + 1, 1),
+                predicted_qty=Decimal("95.00"),
+                lower_bound=Decimal(lower),
+                upper_bound=Decimal(upper),
+            ))
+        db.commit()
+
+        resp = client.get(
+            "/api/v1/forecasting/accuracy",
+            params={"product_id": product.id},
+            headers=admin_headers,
+        )
+        assert resp.status_code == 200
+        row = next(r for r in resp.json() if r["model_type"] == "moving_average")
+        assert row["interval_samples"] == 4
+        assert row["interval_coverage"] == 75.0
+
     def test_drift_alerts_endpoint_contract(
         self,
         client: TestClient,
@@ -7,8 +7,48 @@ Tests:
 - Reorder alerts
 - Inventory adjustment
 """
+import json
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.models.batch_schedule import BatchSchedule
+from app.models.comment import AuditLog
+from app.models.demand_plan import DemandPlan
+from app.models.inventory import Inventory
+from app.models.inventory_data_quality import InventoryDataQuality
+from app.models.inventory_policy_run import InventoryPolicyRun
+from app.models.inventory_policy_exception import InventoryPolicyException
+from app.models.inventory_position_snapshot import InventoryPositionSnapshot, InventorySnapshotLocation
+from app.models.product import Product
+from app.models.supply_plan import SupplyPlan
+from app.repositories import inventory_rollup_repository
+from app.repositories.inventory_data_quality_repository import InventoryDataQualityRepository
+from app.repositories.inventory_policy_run_repository import InventoryPolicyRunRepository
+from app.repositories.inventory_position_snapshot_repository import InventoryPositionSnapshotRepository
+from app.repositories.inventory_rollup_repository import InventoryRollupRepository
+from app.routers import inventory as inventory_router
+from app.schemas.inventory import InventoryOptimizationRunRequest
+from app.services.batch_scheduler import BatchScheduler
+from app.services.inventory_data_quality_service import InventoryDataQualityService
+from app.services.inventory_optimization_runner import InventoryOptimizationRunner
+from app.services.inventory_position_history_service import to_snapshot_day
+from app.services.inventory_service import InventoryService
+from app.services.inventory_policy_engine import compute_policy
+from app.services.inventory_projection_engine import add_months
+from app.utils.events import (
+    AuditLogHandler,
+    EntityBatchUpdatedEvent,
+    EntityUpdatedEvent,
+    EventHandler,
+    get_event_bus,
+)
 
 
 class TestInventoryCRUD:
@@ -54,6 +94,49 @@ class TestInventoryHealth:
         data = resp.json()
         assert isinstance(data, (list, dict))
 
+    def test_summaries_aggregate_by_status_and_location(self, client: TestClient, admin_headers, db, product):
+        seeded = [
+            ("East", "normal", "1000.10"),
+            ("East", "critical", "200.20"),
+            ("West", "low", "300.30"),
+            ("West", "excess", "400.40"),
+            ("North", "critical", None),
+        ]
+        other = Product(sku="SKU-HEALTH-2", name="Health Product", category_id=product.category_id, status="active")
+        db.add(other)
+        db.flush()
+        for k, (location, status, valuation) in enumerate(seeded):
+            db.add(Inventory(
+                product_id=(product.id, other.id)[k % 2], location=location, on_hand_qty=Decimal("10"),
+                status=status, valuation=Decimal(valuation) if valuation else None,
+            ))
+        db.commit()
+
+        health = client.get("/api/v1/inventory/health?by_location=true", headers=admin_headers).json()
+        assert (health["total_products"], health["critical_count"], health["low_count"]) == (5, 2, 1)
+        assert Decimal(str(health["total_value"])) == Decimal("1901.00")
+        assert health["critical_pct"] == 40.0
+        west = next(loc for loc in health["locations"] if loc["location"] == "West")
+        assert (west["total_products"], west["low_count"], west["excess_count"]) == (2, 1, 1)
+        assert Decimal(str(west["total_value"])) == Decimal("700.70")
+
+        east = client.get("/api/v1/inventory/health?location=East", headers=admin_headers).json()
+        assert (east["total_products"], east["normal_pct"], east["locations"]) == (2, 50.0, None)
+
+        capital = client.get("/api/v1/inventory/finance/working-capital", headers=admin_headers).json()
+        assert Decimal(str(capital["excess_inventory_value"])) == Decimal("400.40")
+        assert Decimal(str(capital["low_stock_exposure_value"])) == Decimal("500.50")
+
+        first = client.get("/api/v1/inventory/alerts?page=1&page_size=1", headers=admin_headers).json()
+        second = client.get("/api/v1/inventory/alerts?page=2&page_size=1", headers=admin_headers).json()
+        assert first["totals"] == {"critical": 2, "low": 1, "excess": 1}
+        assert [a["location"] for a in first["critical"] + second["critical"]] == ["East", "North"]
+        assert second["low"] == [] and len(first["low"]) == 1
+
+        dashboard = client.get("/api/v1/dashboard/alerts?limit=1", headers=admin_headers).json()
+        assert len(dashboard["inventory_critical"]) == 1
+        assert dashboard["total_alerts"] >= 3
+
     def test_filter_inventory_by_product(self, client: TestClient, admin_headers, inventory, product):
         resp = client.get(
             f"/api/v1/inventory/?product_id={product.id}",
@@ -66,6 +149,83 @@ class TestInventoryHealth:
             assert item["product_id"] == product.id
 
 
+class TestInventoryStatusRollups:
+
+    def test_rollups_follow_orm_and_bulk_writes(self, client: TestClient, admin_headers, db, network_inventory):
+        # ORM updates (directly and through the API), then a bulk policy write from an optimization run.
+        network_inventory[0].valuation = Decimal("125.50")
+        db.commit()
+        resp = client.put(
+            f"/api/v1/inventory/{network_inventory[0].id}",
+            headers=admin_headers,
+            json={"on_hand_qty": 0, "reorder_point": 50},
+        )
+        assert resp.status_code == 200
+        health_after_put = client.get("/api/v1/inventory/health", headers=admin_headers).json()
+        assert health_after_put["critical_count"] == 1
+        assert Decimal(str(health_after_put["total_value"])) == Decimal("125.50")
+
+        run = client.post(
+            "/api/v1/inventory/optimization/runs",
+            headers=admin_headers,
+            json={"service_level_target": 0.95, "lead_time_days": 14, "review_period_days": 7},
+        )
+        assert run.status_code == 200
+
+        # A rolled-back change leaves the rollups untouched.
+        network_inventory[1].valuation = Decimal("999")
+        db.flush()
+        db.rollback()
+
+        health = client.get("/api/v1/inventory/health?by_location=true", headers=admin_headers).json()
+        expected = {"normal": 0, "low": 0, "critical": 0, "excess": 0}
+        for inv in db.query(Inventory).all():
+            expected[inv.status] += 1
+        assert {s: health[f"{s}_count"] for s in expected} == expected
+        assert len(health["locations"]) == 5
+
+        reconcile = client.post("/api/v1/inventory/rollups/reconcile", headers=admin_headers)
+        assert reconcile.status_code == 200
+        assert reconcile.json()["drifted_rows"] == []
+        assert reconcile.json()["rollup_rows"] == 6
+
+    def test_apply_deltas_upserts_each_row_in_one_statement(self, db, monkeypatch):
+        repo = InventoryRollupRepository(db)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        bind = db.get_bind()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            repo.apply_deltas({("location", "Dock-9"): {"low_count": 2, "low_value": Decimal("10.50")}})
+            repo.apply_deltas({("location", "Dock-9"): {"low_count": -1, "excess_count": 1}})
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+        assert len(statements) == 2 and all("ON CONFLICT" in sql for sql in statements)
+
+        # Backends without ON CONFLICT fall back to UPDATE, then a savepointed INSERT.
+        monkeypatch.setattr(inventory_rollup_repository, "UPSERT_INSERTS", {})
+        repo.apply_deltas({("location", "Dock-9"): {"low_value": Decimal("1.25")}, ("overall", ""): {"normal_count": 3}})
+        db.commit()
+
+        dock = repo.get_scope("location", "Dock-9")
+        assert (dock.low_count, dock.excess_count, dock.low_value) == (1, 1, Decimal("11.75"))
+        assert repo.get_scope("overall").normal_count == 3
+
+    def test_reconcile_repairs_drift_from_raw_sql(self, client: TestClient, admin_headers, db, inventory):
+        db.execute(text("UPDATE inventory SET status = 'excess', valuation = 10 WHERE id = :id"), {"id": inventory.id})
+        db.commit()
+        assert client.get("/api/v1/inventory/health", headers=admin_headers).json()["excess_count"] == 0
+
+        resp = client.post("/api/v1/inventory/rollups/reconcile", headers=admin_headers)
+        assert resp.json()["drifted_rows"] == ["location:Warehouse A", "overall"]
+        health = client.get("/api/v1/inventory/health", headers=admin_headers).json()
+        assert (health["excess_count"], health["normal_count"]) == (1, 0)
+        assert Decimal(str(health["total_value"])) == Decimal("10")
+
+
 class TestInventoryAdjustment:
 
     def test_adjust_inventory_quantity_via_update(self, client: TestClient, admin_headers, inventory):
@@ -113,6 +273,131 @@ class TestInventoryOptimization:
         assert data["processed_count"] >= 1
         assert data["updated_count"] >= 1
 
+    def test_run_optimization_matches_reference_policy_across_chunks(
+        self, client: TestClient, admin_headers, db, product, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "INVENTORY_OPTIMIZATION_CHUNK_SIZE", 2)
+        db.add_all(
+            [
+                SupplyPlan(product_id=product.id, period=date(2026, 1, 1), lead_time_days=30, version=1),
+                SupplyPlan(product_id=product.id, period=date(2026, 3, 1), lead_time_days=40, version=1),
+                SupplyPlan(product_id=product.id, period=date(2026, 3, 1), lead_time_days=21, version=2),
+            ]
+        )
+        rows = [
+            Inventory(
+                product_id=product.id,
+                location=f"DC-{i}",
+                on_hand_qty=Decimal(on_hand),
+                allocated_qty=Decimal(allocated),
+                in_transit_qty=Decimal("12.35"),
+                status="normal",
+            )
+            for i, (on_hand, allocated) in enumerate([("0", "0"), ("40", "70.10"), ("500", "333.33"), ("90000", "4.99"), ("75", "7")])
+        ]
+        db.add_all(rows)
+        db.commit()
+
+        resp = client.post(
+            "/api/v1/inventory/optimization/runs",
+            headers=admin_headers,
+            json={
+                "product_id": product.id,
+                "service_level_target": 0.98,
+                "lead_time_days": 14,
+                "review_period_days": 7,
+                "moq_units": 20,
+                "lot_size_units": 5,
+                "capacity_max_units": 1000,
+                "lead_time_variability_days": 2,
+            },
+        )
+        assert resp.status_code == 200
+        assert resp.json()["updated_count"] == len(rows)
+
+        db.expire_all()
+        for inv in rows:
+            expected = compute_policy(
+                inv.allocated_qty + inv.in_transit_qty,
+                Decimal("23"),
+                7,
+                2.05,
+                moq_units=Decimal("20"),
+                lot_size_units=Decimal("5"),
+                capacity_max_units=Decimal("1000"),
+            )
+            assert (inv.safety_stock, inv.reorder_point, inv.max_stock) == expected
+
+    def test_run_reads_lead_times_written_without_an_event(
+        self, client: TestClient, admin_headers, db, product, inventory
+    ):
+        db.add(SupplyPlan(product_id=product.id, period=date(2026, 1, 1), lead_time_days=10, version=1))
+        db.commit()
+        payload = {"product_id": product.id, "service_level_target": 0.95, "lead_time_days": 14, "review_period_days": 7}
+        client.post("/api/v1/inventory/optimization/runs", headers=admin_headers, json=payload)
+        db.refresh(inventory)
+        first_reorder_point = inventory.reorder_point
+
+        # Written around the application (another process, raw SQL): no invalidation event.
+        db.execute(text("UPDATE supply_plans SET lead_time_days = 40 WHERE product_id = :pid"), {"pid": product.id})
+        db.commit()
+        client.post("/api/v1/inventory/optimization/runs", headers=admin_headers, json=payload)
+        db.refresh(inventory)
+
+        assert inventory.reorder_point > first_reorder_point
+
+    def test_run_publishes_one_policy_batch_per_chunk_covering_every_row(
+        self, client: TestClient, admin_headers, network_inventory, db, monkeypatch
+    ):
+        class Recorder(EventHandler):
+            def __init__(self):
+                self.events = []
+
+            def handle(self, event):
+                if isinstance(event, EntityBatchUpdatedEvent) and event.entity_type == "inventory_policy":
+                    self.events.append(event)
+
+        monkeypatch.setattr(settings, "INVENTORY_OPTIMIZATION_CHUNK_SIZE", 2)
+        audit_inserts = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("INSERT INTO AUDIT_LOGS"):
+                rows = parameters if executemany else [parameters]
+                if "inventory_policy" in rows[0]:
+                    audit_inserts.append(len(rows))
+
+        payload = {"service_level_target": 0.95, "lead_time_days": 14, "review_period_days": 7}
+        recorder = Recorder()
+        audit = AuditLogHandler(sessionmaker(bind=db.get_bind()))
+        get_event_bus().subscribe(recorder)
+        get_event_bus().subscribe(audit)
+        event.listen(db.get_bind(), "before_cursor_execute", record)
+        try:
+            first = client.post("/api/v1/inventory/optimization/runs", headers=admin_headers, json=payload)
+            # The second run recomputes identical policies; rows are still reported.
+            second = client.post("/api/v1/inventory/optimization/runs", headers=admin_headers, json=payload)
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", record)
+            get_event_bus().unsubscribe(audit)
+            get_event_bus().unsubscribe(recorder)
+
+        assert first.status_code == 200 and second.status_code == 200
+        ids = sorted(inv.id for inv in network_inventory)
+        for run in (first.json(), second.json()):
+            run_events = [
+                e for e in recorder.events if e.entries[0]["new_values"]["run_id"] == run["run_id"]
+            ]
+            # Five rows in chunks of two: three events, one audit INSERT each.
+            assert [len(e.entries) for e in run_events] == [2, 2, 1]
+            assert sorted(entry["entity_id"] for e in run_events for entry in e.entries) == ids
+        assert audit_inserts == [2, 2, 1, 2, 2, 1]
+
+        logs = db.query(AuditLog).filter(AuditLog.entity_type == "inventory_policy").all()
+        for run in (first.json(), second.json()):
+            run_logs = [log for log in logs if json.loads(log.new_values)["run_id"] == run["run_id"]]
+            assert sorted(log.entity_id for log in run_logs) == ids
+            assert all(log.action == "update" and json.loads(log.old_values) for log in run_logs)
+
     def test_get_inventory_exceptions(self, client: TestClient, admin_headers, inventory):
         # Ensure policies are populated before checking exception list
         client.post(
@@ -166,6 +451,62 @@ class TestInventoryOptimization:
         assert patched["status"] == "in_progress"
         assert patched["owner_user_id"] == 1
 
+    def test_run_reconciles_exceptions_in_bulk(self, client: TestClient, admin_headers, db, network_inventory):
+        network_inventory[2].on_hand_qty = Decimal("1000000")
+        network_inventory[3].on_hand_qty = Decimal("0")
+        network_inventory[4].on_hand_qty = Decimal("0")
+        due = date(2030, 1, 1)
+        tracked = InventoryPolicyException(
+            inventory_id=network_inventory[4].id,
+            exception_type="stockout_risk",
+            severity="low",
+            status="in_progress",
+            recommended_action="Old action",
+            owner_user_id=1,
+            due_date=due,
+        )
+        cleared = InventoryPolicyException(
+            inventory_id=network_inventory[2].id,
+            exception_type="stockout_risk",
+            severity="medium",
+            status="open",
+            recommended_action="Expedite",
+        )
+        db.add_all([tracked, cleared])
+        db.commit()
+
+        run = client.post(
+            "/api/v1/inventory/optimization/runs",
+            headers=admin_headers,
+            json={"service_level_target": 0.95, "lead_time_days": 14, "review_period_days": 7},
+        )
+        assert run.status_code == 200
+        returned = {(e["location"], e["exception_type"]): e for e in run.json()["exceptions"]}
+        assert {("Site-2", "excess_risk"), ("Site-3", "stockout_risk"), ("Site-4", "stockout_risk")} <= set(returned)
+        assert ("Site-2", "stockout_risk") not in returned
+        assert returned[("Site-4", "stockout_risk")]["id"] == tracked.id
+        assert all(e["id"] for e in returned.values())
+
+        db.expire_all()
+        assert (tracked.status, tracked.owner_user_id, tracked.due_date, tracked.severity) == (
+            "in_progress", 1, due, "high",
+        )
+        assert tracked.recommended_action == "Advance replenishment or increase planned supply"
+        assert cleared.status == "resolved"
+        created = db.query(InventoryPolicyException).filter_by(inventory_id=network_inventory[3].id).one()
+        assert (created.status, created.severity) == ("open", "high")
+        assert created.due_date == datetime.utcnow().date() + timedelta(days=2)
+
+        # A second run finds nothing to change and creates no duplicates.
+        total = db.query(InventoryPolicyException).count()
+        assert total == len(returned) + 1
+        client.post(
+            "/api/v1/inventory/optimization/runs",
+            headers=admin_headers,
+            json={"service_level_target": 0.95, "lead_time_days": 14, "review_period_days": 7},
+        )
+        assert db.query(InventoryPolicyException).count() == total
+
     def test_override_inventory_policy(self, client: TestClient, admin_headers, inventory):
         resp = client.put(
             f"/api/v1/inventory/policies/{inventory.id}/override",
@@ -184,6 +525,238 @@ class TestInventoryOptimization:
         assert float(data["max_stock"]) == 650.0
 
 
+@pytest.fixture
+def optimization_runner(db, monkeypatch):
+    runner = InventoryOptimizationRunner(session_factory=sessionmaker(bind=db.get_bind()), background=False)
+    # Leave submitted runs queued so tests drive `process` themselves.
+    monkeypatch.setattr(runner, "submit", lambda run_id: None)
+    monkeypatch.setattr(inventory_router, "inventory_optimization_runner", runner)
+    monkeypatch.setattr(settings, "INVENTORY_OPTIMIZATION_CHUNK_SIZE", 2)
+    return runner
+
+
+@pytest.fixture
+def network_inventory(db, product):
+    rows = [
+        Inventory(
+            product_id=product.id,
+            location=f"Site-{i}",
+            on_hand_qty=Decimal("100"),
+            allocated_qty=Decimal(str(10 * i)),
+            status="normal",
+        )
+        for i in range(5)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+class TestInventoryOptimizationRuns:
+
+    PAYLOAD = {"service_level_target": 0.95, "lead_time_days": 14, "review_period_days": 7}
+
+    def test_async_run_is_queued_then_processed_with_progress(
+        self, client: TestClient, admin_headers, optimization_runner, network_inventory
+    ):
+        resp = client.post("/api/v1/inventory/optimization/runs/async", headers=admin_headers, json=self.PAYLOAD)
+        assert resp.status_code == 202
+        queued = resp.json()
+        assert queued["status"] == "queued"
+        assert queued["total_count"] == len(network_inventory)
+        assert queued["progress_pct"] == 0.0
+
+        optimization_runner.process(queued["run_id"])
+
+        run = client.get(f"/api/v1/inventory/optimization/runs/{queued['run_id']}", headers=admin_headers).json()
+        assert run["status"] == "completed"
+        assert run["processed_count"] == run["updated_count"] == len(network_inventory)
+        assert run["progress_pct"] == 100.0
+        assert run["rows_per_second"] > 0
+        assert run["checkpoint_at"] is not None
+        assert run["eta_seconds"] is None
+
+    def test_interrupted_run_resumes_from_last_checkpoint(
+        self, client: TestClient, admin_headers, db, optimization_runner, network_inventory, monkeypatch
+    ):
+        run_id = client.post(
+            "/api/v1/inventory/optimization/runs/async", headers=admin_headers, json=self.PAYLOAD
+        ).json()["run_id"]
+
+        chunks = []
+        original_chunk = InventoryService._optimize_policy_chunk
+
+        def crash_on_second_chunk(self, rows, *args):
+            if len(chunks) == 1:
+                raise KeyboardInterrupt  # process killed mid-run
+            chunks.append([r.id for r in rows])
+            return original_chunk(self, rows, *args)
+
+        monkeypatch.setattr(InventoryService, "_optimize_policy_chunk", crash_on_second_chunk)
+        with pytest.raises(KeyboardInterrupt):
+            optimization_runner.process(run_id)
+
+        run = InventoryPolicyRunRepository(db).get_by_run_id(run_id)
+        db.refresh(run)
+        assert (run.status, run.processed_count) == ("running", 2)
+        # A live lease keeps other workers away until it expires.
+        assert optimization_runner.process(run_id) is None
+
+        run.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+        db.commit()
+        monkeypatch.setattr(InventoryService, "_optimize_policy_chunk", lambda self, rows, *a: (
+            chunks.append([r.id for r in rows]) or original_chunk(self, rows, *a)
+        ))
+        assert optimization_runner.resume_stalled() == [run_id]
+        finished = optimization_runner.process(run_id)
+
+        assert finished.status == "completed"
+        assert finished.attempts == 2
+        assert finished.processed_count == len(network_inventory)
+        processed_ids = [i for chunk in chunks for i in chunk]
+        assert sorted(processed_ids) == sorted(inv.id for inv in network_inventory)
+
+    def test_run_taken_over_mid_chunk_commits_none_of_its_writes(
+        self, client: TestClient, admin_headers, db, optimization_runner, network_inventory, monkeypatch
+    ):
+        run_id = client.post(
+            "/api/v1/inventory/optimization/runs/async", headers=admin_headers, json=self.PAYLOAD
+        ).json()["run_id"]
+        takeover = sessionmaker(bind=db.get_bind())
+        original_chunk = InventoryService._optimize_policy_chunk
+        calls = []
+
+        def taken_over_during_second_chunk(self, rows, *args):
+            calls.append(rows)
+            if len(calls) == 2:
+                # The lease ran out mid-chunk and another worker claimed the run.
+                other = takeover()
+                other.query(InventoryPolicyRun).filter_by(run_id=run_id).update({"worker_id": "other-worker"})
+                other.commit()
+                other.close()
+            return original_chunk(self, rows, *args)
+
+        monkeypatch.setattr(InventoryService, "_optimize_policy_chunk", taken_over_during_second_chunk)
+        optimization_runner.process(run_id)
+
+        run = InventoryPolicyRunRepository(db).get_by_run_id(run_id)
+        db.refresh(run)
+        assert (run.status, run.worker_id, run.processed_count) == ("running", "other-worker", 2)
+        assert len(calls) == 2
+        first_chunk, second_chunk = ({row.id for row in rows} for rows in calls)
+        for inv in network_inventory:
+            db.refresh(inv)
+        # Only the committed first chunk has policies; the second was rolled back and
+        # the run stopped before the third.
+        assert [inv.max_stock is not None for inv in network_inventory] == [
+            inv.id in first_chunk for inv in network_inventory
+        ]
+        assert db.query(InventoryPolicyException).filter(
+            InventoryPolicyException.inventory_id.in_(second_chunk)
+        ).count() == 0
+
+    def test_simulation_chunks_follow_paths_and_horizon_and_renew_the_lease(
+        self, client: TestClient, admin_headers, db, optimization_runner, network_inventory, monkeypatch
+    ):
+        payload = {**self.PAYLOAD, "method": "simulation", "simulation_paths": 50, "simulation_horizon_days": 60}
+        # Room for one row per chunk, and a lease short enough to renew after every batch.
+        monkeypatch.setattr(settings, "INVENTORY_OPTIMIZATION_SIMULATION_CHUNK_PATH_DAYS", 50 * 60)
+        monkeypatch.setattr(settings, "INVENTORY_OPTIMIZATION_LEASE_SECONDS", 0)
+        chunk_sizes = []
+        renewals = []
+        original_chunk = InventoryService._optimize_policy_chunk
+        original_renew = InventoryPolicyRunRepository.renew_lease
+        monkeypatch.setattr(InventoryService, "_optimize_policy_chunk", lambda self, rows, *a: (
+            chunk_sizes.append(len(rows)) or original_chunk(self, rows, *a)
+        ))
+        monkeypatch.setattr(InventoryPolicyRunRepository, "renew_lease", lambda self, *a, **k: (
+            renewals.append(a[0]) or original_renew(self, *a, **k)
+        ))
+        run_id = client.post(
+            "/api/v1/inventory/optimization/runs/async", headers=admin_headers, json=payload
+        ).json()["run_id"]
+        optimization_runner.process(run_id)
+
+        run = client.get(f"/api/v1/inventory/optimization/runs/{run_id}", headers=admin_headers).json()
+        assert run["status"] == "completed"
+        assert chunk_sizes == [1] * len(network_inventory)
+        assert renewals == [run_id] * len(network_inventory)
+
+    def test_without_a_pool_async_runs_are_processed_inline(
+        self, client: TestClient, admin_headers, db, network_inventory, monkeypatch
+    ):
+        runner = InventoryOptimizationRunner(session_factory=sessionmaker(bind=db.get_bind()), background=False)
+        monkeypatch.setattr(inventory_router, "inventory_optimization_runner", runner)
+
+        resp = client.post("/api/v1/inventory/optimization/runs/async", headers=admin_headers, json=self.PAYLOAD)
+
+        assert resp.status_code == 202
+        assert resp.json()["status"] == "completed"
+        assert resp.json()["processed_count"] == len(network_inventory)
+
+    def test_sweeper_processes_queued_runs(self, db, admin_user, network_inventory):
+        run = InventoryService(db).create_optimization_run(InventoryOptimizationRunRequest(**self.PAYLOAD), admin_user.id)
+        runner = InventoryOptimizationRunner(session_factory=sessionmaker(bind=db.get_bind()), background=False)
+
+        assert runner.start_sweeper(interval_seconds=0.05) is True
+        assert runner.start_sweeper(interval_seconds=0.05) is False
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            db.expire_all()
+            if InventoryPolicyRunRepository(db).get_by_run_id(run.run_id).status == "completed":
+                break
+            time.sleep(0.05)
+        runner.stop_sweeper(timeout=5)
+
+        assert InventoryPolicyRunRepository(db).get_by_run_id(run.run_id).status == "completed"
+
+    def test_resume_rejects_completed_run(self, client: TestClient, admin_headers, optimization_runner, inventory):
+        run_id = client.post(
+            "/api/v1/inventory/optimization/runs", headers=admin_headers, json=self.PAYLOAD
+        ).json()["run_id"]
+
+        resp = client.post(f"/api/v1/inventory/optimization/runs/{run_id}/resume", headers=admin_headers)
+        assert resp.status_code == 400
+
+    def test_simulation_run_sets_reproducible_s_s_policies(
+        self, client: TestClient, admin_headers, db, optimization_runner, network_inventory
+    ):
+        payload = {
+            **self.PAYLOAD,
+            "method": "simulation",
+            "simulation_paths": 50,
+            "simulation_horizon_days": 60,
+            "lot_size_units": "10",
+        }
+        run_id = client.post(
+            "/api/v1/inventory/optimization/runs/async", headers=admin_headers, json=payload
+        ).json()["run_id"]
+        optimization_runner.process(run_id)
+
+        run = client.get(f"/api/v1/inventory/optimization/runs/{run_id}", headers=admin_headers).json()
+        assert run["status"] == "completed"
+        assert run["rows_per_second"] > 0
+        assert run["parameters"]["seed"] is not None
+        policies = []
+        for inv in network_inventory:
+            db.refresh(inv)
+            assert inv.reorder_point > 0
+            assert inv.safety_stock <= inv.reorder_point <= inv.max_stock
+            assert inv.max_stock % Decimal("10") == 0
+            policies.append((inv.safety_stock, inv.reorder_point, inv.max_stock))
+
+        # Rerun with the stored seed reproduces the same policies.
+        rerun = client.post(
+            "/api/v1/inventory/optimization/runs",
+            headers=admin_headers,
+            json={**payload, "seed": run["parameters"]["seed"]},
+        )
+        assert rerun.status_code == 200
+        for inv, policy in zip(network_inventory, policies):
+            db.refresh(inv)
+            assert (inv.safety_stock, inv.reorder_point, inv.max_stock) == policy
+
+
 class TestInventoryRecommendations:
 
     def test_generate_and_list_recommendations(self, client: TestClient, admin_headers, inventory):
@@ -244,6 +817,45 @@ class TestInventoryRecommendations:
         assert float(inv["reorder_point"]) > 0
 
 
+    def test_bulk_generation_updates_pending_and_publishes_one_event(
+        self, client: TestClient, admin_headers, network_inventory
+    ):
+        class Recorder(EventHandler):
+            def __init__(self):
+                self.events = []
+
+            def handle(self, event):
+                if isinstance(event, EntityUpdatedEvent) and event.entity_type.startswith("inventory_policy_recommendation"):
+                    self.events.append(event)
+
+        recorder = Recorder()
+        get_event_bus().subscribe(recorder)
+        payload = {"min_confidence": 0.0, "max_items": 4, "enforce_quality_gate": False}
+        try:
+            first = client.post("/api/v1/inventory/recommendations/generate", headers=admin_headers, json=payload)
+            second = client.post("/api/v1/inventory/recommendations/generate", headers=admin_headers, json=payload)
+        finally:
+            get_event_bus().unsubscribe(recorder)
+
+        assert first.status_code == 200 and second.status_code == 200
+        created, updated = first.json(), second.json()
+        assert [r["inventory_id"] for r in created] == [inv.id for inv in network_inventory[:4]]
+        # Site-0 has no demand pressure: minimum safety stock of 1 and the uplift floors.
+        assert Decimal(str(created[0]["recommended_safety_stock"])) == Decimal("1.00")
+        assert Decimal(str(created[0]["recommended_reorder_point"])) == Decimal("1.25")
+        assert Decimal(str(created[0]["recommended_max_stock"])) == Decimal("1.75")
+        assert Decimal(str(created[0]["confidence_score"])) == Decimal("0.72")
+        assert created[3]["signals"]["demand_pressure"] == pytest.approx(0.30)
+
+        # The second pass updates the pending recommendations in place.
+        assert [r["id"] for r in updated] == [r["id"] for r in created]
+        assert [(e.new_values["created"], e.new_values["updated"]) for e in recorder.events] == [(4, 0), (0, 4)]
+        assert recorder.events[1].new_values["recommendation_ids"] == [r["id"] for r in created]
+
+        listed = client.get("/api/v1/inventory/recommendations?status=pending", headers=admin_headers).json()
+        assert len(listed) == 4
+
+
 class TestInventoryPhase45:
 
     def test_get_rebalance_recommendations(self, client: TestClient, admin_headers):
@@ -258,6 +870,60 @@ class TestInventoryPhase45:
             assert "to_location" in item
             assert "transfer_qty" in item
 
+    def test_rebalance_never_double_allocates_a_donor(self, client: TestClient, admin_headers, db, product):
+        def row(location, on_hand, reorder_point, max_stock, status):
+            return Inventory(
+                product_id=product.id,
+                location=location,
+                on_hand_qty=Decimal(on_hand),
+                reorder_point=Decimal(reorder_point),
+                max_stock=Decimal(max_stock),
+                status=status,
+            )
+
+        db.add_all(
+            [
+                row("Hub", "150", "20", "100", "excess"),  # 50 spare
+                row("Far", "130", "20", "100", "excess"),  # 30 spare
+                row("North", "10", "50", "200", "critical"),  # needs 40
+                row("South", "20", "60", "200", "low"),  # needs 40
+            ]
+        )
+        db.commit()
+
+        listed = client.get("/api/v1/inventory/rebalance/recommendations", headers=admin_headers).json()
+        moved_from = {}
+        for t in listed:
+            moved_from[t["from_location"]] = moved_from.get(t["from_location"], 0) + float(t["transfer_qty"])
+        assert moved_from == {"Hub": 50.0, "Far": 30.0}
+
+        lanes = [
+            {"from_location": "Hub", "to_location": "North", "cost_per_unit": "1", "lead_time_days": 2},
+            {"from_location": "Hub", "to_location": "South", "cost_per_unit": "4", "lead_time_days": 2},
+            {"from_location": "Far", "to_location": "South", "cost_per_unit": "2", "lead_time_days": 9},
+        ]
+        resp = client.post(
+            "/api/v1/inventory/rebalance/optimize",
+            headers=admin_headers,
+            json={"lanes": lanes, "restrict_to_lanes": True},
+        )
+        assert resp.status_code == 200
+        plan = resp.json()
+        moved = {(t["from_location"], t["to_location"]): float(t["transfer_qty"]) for t in plan["transfers"]}
+        assert moved == {("Hub", "North"): 40.0, ("Hub", "South"): 10.0, ("Far", "South"): 30.0}
+        assert float(plan["unmet_shortage_qty"]) == 0.0
+        assert float(plan["total_transfer_cost"]) == 40 * 1 + 10 * 4 + 30 * 2
+        assert plan["solve_time_ms"] >= 0
+
+        # A lane slower than max_lead_time_days is excluded: Far cannot ship, so South stays 30 short.
+        slow = client.post(
+            "/api/v1/inventory/rebalance/optimize",
+            headers=admin_headers,
+            json={"lanes": lanes, "restrict_to_lanes": True, "max_lead_time_days": 5},
+        ).json()
+        assert float(slow["total_transfer_qty"]) == 50.0
+        assert float(slow["unmet_shortage_qty"]) == 30.0
+
     def test_auto_apply_and_control_tower_summary(self, client: TestClient, admin_headers):
         gen_resp = client.post(
             "/api/v1/inventory/recommendations/generate",
@@ -291,6 +957,51 @@ class TestInventoryPhase45:
         assert "recommendation_backlog_risk" in summary
 
 
+    def test_auto_apply_reports_per_item_outcomes_in_one_batch(
+        self, client: TestClient, admin_headers, db, network_inventory
+    ):
+        from app.models.inventory_policy_recommendation import InventoryPolicyRecommendation
+
+        generated = client.post(
+            "/api/v1/inventory/recommendations/generate",
+            headers=admin_headers,
+            json={"min_confidence": 0.0, "max_items": 4, "enforce_quality_gate": False},
+        ).json()
+        recs = {r["inventory_id"]: db.get(InventoryPolicyRecommendation, r["id"]) for r in generated}
+        # Rows 0 and 1 already sit near the recommended reorder point; row 2 has none
+        # (a high-impact change); row 3's recommendation falls below the confidence bar.
+        for inv in network_inventory[:2]:
+            inv.reorder_point = recs[inv.id].recommended_reorder_point
+        recs[network_inventory[3].id].confidence_score = Decimal("0.5")
+        db.commit()
+
+        resp = client.post(
+            "/api/v1/inventory/recommendations/auto-apply",
+            headers=admin_headers,
+            json={"min_confidence": 0.6, "max_demand_pressure": 5, "min_quality_score": 0.0, "max_items": 10},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        outcomes = {item["inventory_id"]: (item["outcome"], item["reasons"]) for item in data["items"]}
+        ids = [inv.id for inv in network_inventory]
+        assert outcomes == {
+            ids[0]: ("applied", []),
+            ids[1]: ("applied", []),
+            ids[2]: ("maker_checker_required", []),
+            ids[3]: ("ineligible", ["confidence"]),
+        }
+        assert (data["eligible_count"], data["applied_count"], data["skipped_count"], data["maker_checker_count"]) == (3, 2, 1, 1)
+        assert sorted(data["recommendation_ids"]) == sorted(recs[i].id for i in ids[:2])
+
+        db.expire_all()
+        applied = network_inventory[0]
+        assert applied.safety_stock == recs[applied.id].recommended_safety_stock
+        assert applied.max_stock == recs[applied.id].recommended_max_stock
+        # 100 on hand is above the recommended max stock of 1.75.
+        assert applied.status == "excess"
+        assert [recs[i].status for i in ids[:4]] == ["applied", "applied", "pending", "pending"]
+
+
 class TestInventoryPhase6:
 
     def test_get_data_quality(self, client: TestClient, admin_headers, inventory):
@@ -304,6 +1015,59 @@ class TestInventoryPhase6:
         assert "overall_score" in item
         assert "quality_tier" in item
 
+    def test_data_quality_is_persisted_and_rescored_only_when_stale(
+        self, client: TestClient, admin_headers, db, network_inventory
+    ):
+        stamped = datetime.utcnow() - timedelta(hours=100)
+        db.execute(text("UPDATE inventory SET updated_at = :t"), {"t": stamped})
+        db.commit()
+
+        first = client.get("/api/v1/inventory/data-quality", headers=admin_headers).json()
+        assert [q["inventory_id"] for q in first] == [inv.id for inv in network_inventory]
+        assert {q["freshness_score"] for q in first} == {0.75}
+        stored = {q.inventory_id: q for q in db.query(InventoryDataQuality).all()}
+        assert stored[network_inventory[0].id].fresh_until == stamped + timedelta(hours=168)
+        computed_at = stored[network_inventory[0].id].computed_at
+
+        # Only the row whose updated_at moved is rescored.
+        db.execute(
+            text("UPDATE inventory SET updated_at = :t, valuation = 5 WHERE id = :id"),
+            {"t": datetime.utcnow(), "id": network_inventory[1].id},
+        )
+        db.commit()
+        second = {q["inventory_id"]: q for q in client.get("/api/v1/inventory/data-quality", headers=admin_headers).json()}
+        assert second[network_inventory[1].id]["freshness_score"] == 1.0
+        assert second[network_inventory[1].id]["completeness_score"] > first[1]["completeness_score"]
+        db.expire_all()
+        assert db.get(InventoryDataQuality, network_inventory[0].id).computed_at == computed_at
+        assert db.get(InventoryDataQuality, network_inventory[1].id).computed_at > computed_at
+
+        # Once freshness has decayed past fresh_until the row is rescored too.
+        aged = datetime.utcnow() - timedelta(hours=200)
+        db.execute(text("UPDATE inventory SET updated_at = :t WHERE id = :id"), {"t": aged, "id": network_inventory[2].id})
+        db.execute(
+            text("UPDATE inventory_data_quality SET source_updated_at = :t, fresh_until = :until WHERE inventory_id = :id"),
+            {"t": aged, "until": aged + timedelta(hours=168), "id": network_inventory[2].id},
+        )
+        db.commit()
+        third = {q["inventory_id"]: q for q in client.get("/api/v1/inventory/data-quality", headers=admin_headers).json()}
+        assert third[network_inventory[2].id]["freshness_score"] == 0.5
+
+    def test_concurrent_first_scoring_does_not_conflict(self, db, network_inventory):
+        service = InventoryDataQualityService(db)
+        now = datetime.utcnow()
+        # Two readers both saw the rows as unscored; the second writes after the first.
+        unscored = InventoryDataQualityRepository(db).list_stale_inputs(now)
+        assert not any(row.scored for row in unscored)
+        service._write_scores(unscored, now)
+        db.commit()
+        service._write_scores(unscored, now + timedelta(seconds=1))
+        db.commit()
+
+        stored = db.query(InventoryDataQuality).all()
+        assert len(stored) == len(network_inventory)
+        assert {q.computed_at for q in stored} == {now + timedelta(seconds=1)}
+
     def test_approve_then_apply_recommendation(self, client: TestClient, admin_headers, inventory):
         gen_resp = client.post(
             "/api/v1/inventory/recommendations/generate",
@@ -364,6 +1128,132 @@ class TestInventoryPhase7:
             assert "escalation_level" in item
             assert "escalation_reason" in item
 
+    def test_escalations_levels_filters_and_keyset_pages(self, client: TestClient, admin_headers, db, network_inventory):
+        today = datetime.utcnow().date()
+        cases = [
+            ("high", None, "open"),  # L2, undated high severity
+            ("high", today, "in_progress"),  # L2, high severity due today
+            ("medium", today - timedelta(days=5), "open"),  # L2, 5 days overdue
+            ("low", today - timedelta(days=1), "open"),  # L1, 1 day overdue
+            ("high", today + timedelta(days=2), "open"),  # not yet due
+            ("medium", today - timedelta(days=9), "resolved"),  # closed
+        ]
+        sites = network_inventory + network_inventory[:1]
+        db.add_all(
+            InventoryPolicyException(
+                inventory_id=inv.id,
+                exception_type="stockout_risk",
+                severity=severity,
+                status=status,
+                recommended_action="Expedite",
+                due_date=due,
+            )
+            for inv, (severity, due, status) in zip(sites, cases)
+        )
+        db.commit()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        bind = db.get_bind()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            resp = client.get("/api/v1/inventory/control-tower/escalations", headers=admin_headers)
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [(d["location"], d["escalation_level"]) for d in data] == [
+            ("Site-0", "L2"), ("Site-1", "L2"), ("Site-2", "L2"), ("Site-3", "L1"),
+        ]
+        assert data[0]["escalation_reason"] == "High-severity exception requires immediate escalation"
+        assert data[2]["escalation_reason"] == "Exception overdue by 5 days"
+        assert sum("inventory_policy_exceptions" in sql for sql in statements) == 1
+
+        first = client.get("/api/v1/inventory/control-tower/escalations?limit=2", headers=admin_headers).json()
+        rest = client.get(
+            f"/api/v1/inventory/control-tower/escalations?limit=2&after_id={first[-1]['exception_id']}",
+            headers=admin_headers,
+        ).json()
+        assert [d["exception_id"] for d in first + rest] == [d["exception_id"] for d in data]
+
+        level_one = client.get("/api/v1/inventory/control-tower/escalations?level=L1", headers=admin_headers).json()
+        assert [d["location"] for d in level_one] == ["Site-3"]
+        high = client.get("/api/v1/inventory/control-tower/escalations?severity=high", headers=admin_headers).json()
+        assert [d["location"] for d in high] == ["Site-0", "Site-1"]
+
+        exceptions = client.get("/api/v1/inventory/exceptions?location=Site-2", headers=admin_headers).json()
+        assert [(e["location"], e["severity"]) for e in exceptions] == [("Site-2", "medium")]
+        page = client.get("/api/v1/inventory/exceptions?limit=4", headers=admin_headers).json()
+        tail = client.get(
+            f"/api/v1/inventory/exceptions?after_id={page[-1]['id']}", headers=admin_headers
+        ).json()
+        assert len(page) == 4 and len(tail) == 2
+
+    def test_lists_are_unbounded_without_a_limit_and_summary_counts_in_sql(
+        self, client: TestClient, admin_headers, db, network_inventory
+    ):
+        from app.models.inventory_policy_recommendation import InventoryPolicyRecommendation
+
+        today = datetime.utcnow().date()
+        inv = network_inventory[0]
+        db.add_all(
+            InventoryPolicyException(
+                inventory_id=inv.id,
+                exception_type="stockout_risk",
+                severity="low",
+                status="open" if i % 2 else "in_progress",
+                recommended_action="Expedite",
+                due_date=today - timedelta(days=1) if i < 30 else None,
+            )
+            for i in range(520)
+        )
+        db.add_all(
+            InventoryPolicyRecommendation(
+                inventory_id=inv.id,
+                recommended_safety_stock=Decimal("1"),
+                recommended_reorder_point=Decimal("2"),
+                rationale="test",
+                status=status,
+                decision_notes=notes,
+                decided_at=decided_at,
+            )
+            for status, notes, decided_at in [
+                *[("pending", None, None)] * 501,
+                ("applied", "Autonomous apply: within guardrails", datetime.utcnow() - timedelta(hours=2)),
+                ("applied", "Autonomous apply: within guardrails", datetime.utcnow() - timedelta(days=3)),
+                ("accepted", None, datetime.utcnow()),
+                ("rejected", None, datetime.utcnow()),
+            ]
+        )
+        db.commit()
+
+        assert len(client.get("/api/v1/inventory/exceptions", headers=admin_headers).json()) == 520
+        assert len(client.get("/api/v1/inventory/control-tower/escalations", headers=admin_headers).json()) == 30
+        assert len(client.get("/api/v1/inventory/recommendations", headers=admin_headers).json()) == 505
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        bind = db.get_bind()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            summary = client.get("/api/v1/inventory/control-tower/summary", headers=admin_headers).json()
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+        assert summary["pending_recommendations"] == 501
+        assert (summary["accepted_recommendations"], summary["applied_recommendations"]) == (1, 2)
+        assert summary["acceptance_rate_pct"] == 75.0
+        assert summary["autonomous_applied_24h"] == 1
+        assert (summary["open_exceptions"], summary["overdue_exceptions"]) == (520, 30)
+        assert summary["recommendation_backlog_risk"] == "high"
+        summary_sql = [sql for sql in statements if "inventory_policy_" in sql]
+        assert len(summary_sql) == 3 and all("count(" in sql.lower() for sql in summary_sql)
+
     def test_get_working_capital_summary(self, client: TestClient, admin_headers, inventory):
         resp = client.get("/api/v1/inventory/finance/working-capital", headers=admin_headers)
         assert resp.status_code == 200
@@ -441,3 +1331,357 @@ class TestInventoryServiceLevelAnalytics:
         assert data["inventory_id"] == inventory.id
         assert data["method"] == "monte_carlo"
         assert len(data["distribution"]) == 10
+        assert data["simulation_seed"] is not None
+
+    def test_service_level_monte_carlo_is_reproducible_with_seed(self, client: TestClient, admin_headers, inventory):
+        payload = {
+            "inventory_id": inventory.id,
+            "method": "monte_carlo",
+            "simulation_runs": 200_000,
+            "seed": 1234,
+        }
+        first = client.post("/api/v1/inventory/analytics/service-level", headers=admin_headers, json=payload)
+        second = client.post("/api/v1/inventory/analytics/service-level", headers=admin_headers, json=payload)
+        assert first.status_code == 200
+        assert first.json() == second.json()
+        assert first.json()["simulation_seed"] == 1234
+
+    def test_network_service_levels_rank_every_row_by_risk(
+        self, client: TestClient, admin_headers, db, network_inventory
+    ):
+        for i, row in enumerate(network_inventory):
+            row.reorder_point = Decimal(str(40 * i))
+        db.commit()
+
+        resp = client.post(
+            "/api/v1/inventory/analytics/service-level/network",
+            headers=admin_headers,
+            json={"target_service_level": 0.95, "page_size": 2},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == len(network_inventory)
+        assert data["total_pages"] == 3
+        assert len(data["items"]) == 2
+        # No reorder point means a stockout on every cycle: Site-0 is the riskiest.
+        assert data["items"][0]["location"] == "Site-0"
+        assert data["items"][0]["stockout_probability"] == 1.0
+        assert data["items"][0]["stockout_probability"] >= data["items"][1]["stockout_probability"]
+        assert len(data["items"][0]["service_level_curve"]) == 4
+
+        last = client.post(
+            "/api/v1/inventory/analytics/service-level/network",
+            headers=admin_headers,
+            json={"target_service_level": 0.95, "page_size": 2, "page": 3},
+        ).json()
+        assert [item["location"] for item in last["items"]] == ["Site-4"]
+
+        single = client.post(
+            "/api/v1/inventory/analytics/service-level",
+            headers=admin_headers,
+            json={"inventory_id": network_inventory[4].id, "target_service_level": 0.95, "method": "analytical"},
+        ).json()
+        row = last["items"][0]
+        assert abs(row["cycle_service_level"] - single["cycle_service_level"]) < 1e-3
+        assert abs(float(row["recommended_reorder_point"]) - float(single["recommended_reorder_point"])) <= 0.01
+
+    def test_network_service_levels_monte_carlo_is_reproducible(
+        self, client: TestClient, admin_headers, network_inventory
+    ):
+        payload = {"method": "monte_carlo", "simulation_runs": 50_000, "seed": 99, "sort_by": "fill_rate"}
+        first = client.post("/api/v1/inventory/analytics/service-level/network", headers=admin_headers, json=payload)
+        second = client.post("/api/v1/inventory/analytics/service-level/network", headers=admin_headers, json=payload)
+        assert first.status_code == 200
+        assert first.json() == second.json()
+        assert first.json()["simulation_seed"] == 99
+        fill_rates = [item["fill_rate"] for item in first.json()["items"]]
+        assert fill_rates == sorted(fill_rates)
+
+    def test_product_stats_are_cached_and_invalidated_by_events(
+        self, client: TestClient, admin_headers, db, product, inventory
+    ):
+        plan = DemandPlan(product_id=product.id, period=date.today().replace(day=1), forecast_qty=Decimal("300"),
+                          actual_qty=Decimal("300"), version=1)
+        db.add(plan)
+        db.commit()
+        payload = {"inventory_id": inventory.id, "method": "analytical", "seed": 7}
+
+        def analyze():
+            resp = client.post("/api/v1/inventory/analytics/service-level", headers=admin_headers, json=payload)
+            assert resp.status_code == 200
+            return resp.json()
+
+        first = analyze()
+        assert Decimal(first["demand_mean_daily"]) == Decimal("10")
+        assert Decimal(first["lead_time_mean_days"]) == Decimal("14")
+        assert analyze() == first
+        metrics = client.get("/api/v1/inventory/analytics/stats-cache", headers=admin_headers).json()
+        assert (metrics["entries"], metrics["hits"], metrics["misses"]) == (1, 1, 1)
+        assert metrics["hit_rate"] == 0.5
+
+        resp = client.put(f"/api/v1/products/{product.id}", headers=admin_headers, json={"lead_time_days": 20})
+        assert resp.status_code == 200
+        assert Decimal(analyze()["lead_time_mean_days"]) == Decimal("20")
+
+        resp = client.put(f"/api/v1/demand/plans/{plan.id}", headers=admin_headers, json={"actual_qty": "600"})
+        assert resp.status_code == 200
+        assert Decimal(analyze()["demand_mean_daily"]) == Decimal("20")
+
+        metrics = client.get("/api/v1/inventory/analytics/stats-cache", headers=admin_headers).json()
+        assert metrics["invalidations"] >= 2
+        assert (metrics["hits"], metrics["misses"]) == (1, 3)
+
+
+
+class TestInventoryPositionHistory:
+
+    def test_capture_writes_each_day_once(self, client: TestClient, admin_headers, db, network_inventory):
+        first = client.post("/api/v1/inventory/positions/snapshots", headers=admin_headers, json={})
+        assert first.status_code == 200
+        assert (first.json()["rows_written"], first.json()["skipped"]) == (5, False)
+        again = client.post("/api/v1/inventory/positions/snapshots", headers=admin_headers, json={}).json()
+        assert (again["rows_written"], again["skipped"]) == (0, True)
+        forced = client.post("/api/v1/inventory/positions/snapshots", headers=admin_headers, json={"force": True}).json()
+        assert (forced["rows_written"], forced["skipped"]) == (5, False)
+
+        stored = db.query(InventoryPositionSnapshot).order_by(InventoryPositionSnapshot.inventory_id).all()
+        assert len(stored) == 5
+        assert {row.snapshot_day for row in stored} == {to_snapshot_day(datetime.utcnow().date())}
+        assert (stored[1].on_hand_hundredths, stored[1].allocated_hundredths, stored[1].status_code) == (10000, 1000, 0)
+
+        history = client.get("/api/v1/inventory/positions/history", headers=admin_headers).json()
+        assert history["bucket_days"] == 2
+        [point] = history["points"]
+        assert Decimal(point["on_hand_qty"]) == Decimal("500")
+        assert Decimal(point["available_qty"]) == Decimal("400")
+        assert point["status_rows"]["normal"] == 5.0
+
+    def test_unknown_status_and_large_days_of_supply(self, client: TestClient, admin_headers, db, network_inventory):
+        db.execute(text("UPDATE inventory SET status = NULL WHERE id = :id"), {"id": network_inventory[0].id})
+        db.commit()
+        client.post("/api/v1/inventory/positions/snapshots", headers=admin_headers, json={})
+        unknown = db.query(InventoryPositionSnapshot).filter_by(inventory_id=network_inventory[0].id).one()
+        assert unknown.status_code == -1
+        [point] = client.get("/api/v1/inventory/positions/history", headers=admin_headers).json()["points"]
+        assert (point["status_rows"]["unknown"], point["status_rows"]["normal"]) == (1.0, 4.0)
+
+        # Two rows whose hundredths products sum past 2**63 must not overflow SQLite's SUM.
+        day = to_snapshot_day(date.today()) - 1
+        db.execute(insert(InventoryPositionSnapshot), [
+            dict(
+                snapshot_day=day, inventory_id=inv.id, product_id=inv.product_id, status_code=0,
+                on_hand_hundredths=999_999_999_999, allocated_hundredths=0, in_transit_hundredths=0,
+                safety_stock_hundredths=0, valuation_cents=None, days_of_supply_hundredths=9_999_999,
+            )
+            for inv in network_inventory[:2]
+        ])
+        db.commit()
+        resp = client.get(
+            "/api/v1/inventory/positions/history",
+            headers=admin_headers,
+            params={"start_date": (date.today() - timedelta(days=1)).isoformat(), "max_points": 2},
+        )
+        assert resp.status_code == 200
+        assert Decimal(resp.json()["points"][0]["days_of_supply"]) == Decimal("99999.99")
+
+    def test_history_is_downsampled_in_sql(self, client: TestClient, admin_headers, db, network_inventory):
+        growing, flat = network_inventory[0], network_inventory[1]
+        sites = [InventorySnapshotLocation(name=growing.location), InventorySnapshotLocation(name=flat.location)]
+        db.add_all(sites)
+        db.flush()
+        end = date.today()
+        start = end - timedelta(days=99)
+        rows = []
+        for k in range(100):
+            if k == 5:
+                continue  # a missed capture
+            day = to_snapshot_day(start) + k
+            rows.append(dict(
+                snapshot_day=day, inventory_id=growing.id, product_id=growing.product_id, location_id=sites[0].id,
+                status_code=0, on_hand_hundredths=(100 + k) * 100, allocated_hundredths=0, in_transit_hundredths=0,
+                safety_stock_hundredths=0, valuation_cents=None, days_of_supply_hundredths=1000,
+            ))
+            rows.append(dict(
+                snapshot_day=day, inventory_id=flat.id, product_id=flat.product_id, location_id=sites[1].id,
+                status_code=2, on_hand_hundredths=5000, allocated_hundredths=1000, in_transit_hundredths=0,
+                safety_stock_hundredths=0, valuation_cents=25000, days_of_supply_hundredths=None,
+            ))
+        db.execute(insert(InventoryPositionSnapshot), rows)
+        db.commit()
+
+        params = {"start_date": start.isoformat(), "end_date": end.isoformat(), "max_points": 10}
+        resp = client.get("/api/v1/inventory/positions/history", headers=admin_headers, params=params)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["bucket_days"] == 10
+        assert len(data["points"]) == 10
+        first = data["points"][0]
+        assert (first["period_start"], first["period_end"]) == (start.isoformat(), (start + timedelta(days=9)).isoformat())
+        assert first["snapshot_days"] == 9
+        assert Decimal(first["on_hand_qty"]) == Decimal("154.44")
+        assert (Decimal(first["on_hand_min_qty"]), Decimal(first["on_hand_max_qty"])) == (Decimal("150"), Decimal("159"))
+        assert Decimal(first["available_qty"]) == Decimal("144.44")
+        assert Decimal(first["valuation"]) == Decimal("250")
+        assert Decimal(first["days_of_supply"]) == Decimal("10")
+        assert first["status_rows"] == {"normal": 1.0, "low": 0.0, "critical": 1.0, "excess": 0.0, "unknown": 0.0}
+        assert data["points"][-1]["snapshot_days"] == 10
+
+        daily = client.get(
+            "/api/v1/inventory/positions/history",
+            headers=admin_headers,
+            params={**params, "max_points": 1000, "location": "Site-1"},
+        ).json()
+        assert daily["bucket_days"] == 1
+        assert len(daily["points"]) == 99
+        assert {Decimal(p["on_hand_qty"]) for p in daily["points"]} == {Decimal("50")}
+        assert all(p["days_of_supply"] is None for p in daily["points"])
+
+        one_row = client.get(
+            "/api/v1/inventory/positions/history",
+            headers=admin_headers,
+            params={**params, "inventory_id": growing.id},
+        ).json()
+        assert Decimal(one_row["points"][-1]["on_hand_qty"]) == Decimal("194.5")
+
+        bad = client.get(
+            "/api/v1/inventory/positions/history",
+            headers=admin_headers,
+            params={"start_date": end.isoformat(), "end_date": start.isoformat()},
+        )
+        assert bad.status_code == 400
+
+    def test_location_history_keeps_moved_and_deleted_rows(self, client: TestClient, admin_headers, db, network_inventory):
+        deleted, moved = network_inventory[0], network_inventory[1]
+        today = date.today()
+        repo = InventoryPositionSnapshotRepository(db)
+        assert repo.capture_day(to_snapshot_day(today) - 1) == 5
+        db.commit()
+        db.delete(deleted)
+        db.commit()
+        moved.location = "Site-0"
+        db.commit()
+        assert client.post("/api/v1/inventory/positions/snapshots", headers=admin_headers, json={}).json()["rows_written"] == 4
+        assert db.query(InventorySnapshotLocation).count() == 5  # codes are reused, not re-added
+
+        params = {"start_date": (today - timedelta(days=1)).isoformat(), "max_points": 10}
+
+        def history(location):
+            resp = client.get("/api/v1/inventory/positions/history", headers=admin_headers, params={**params, "location": location})
+            assert resp.status_code == 200
+            return [(p["period_start"], Decimal(p["available_qty"])) for p in resp.json()["points"]]
+
+        # Available is 100 for the deleted row and 90 for the moved one. Yesterday Site-0
+        # held the deleted row and Site-1 the moved one; today Site-0 holds the moved row.
+        yesterday = (today - timedelta(days=1)).isoformat()
+        assert history("Site-0") == [(yesterday, Decimal("100")), (today.isoformat(), Decimal("90"))]
+        assert history("Site-1") == [(yesterday, Decimal("90"))]
+        assert history("Nowhere") == []
+
+    def test_snapshot_batch_job(self, client: TestClient, admin_headers, db, network_inventory):
+        body = {"name": "nightly-positions", "job_type": "inventory_position_snapshot", "cron_expression": "5 0 * * *"}
+        bad = client.post("/api/v1/scheduler/schedules", headers=admin_headers, json={**body, "parameters": {"force": "yes"}})
+        assert bad.status_code == 400
+        created = client.post("/api/v1/scheduler/schedules", headers=admin_headers, json=body)
+        assert created.status_code == 201
+
+        scheduler = BatchScheduler(session_factory=sessionmaker(bind=db.get_bind()), worker_id="positions", inline=True)
+        schedule = db.get(BatchSchedule, created.json()["id"])
+        run = scheduler.run_now(db, schedule)
+        assert run.status == "completed", run.error
+        assert json.loads(run.result_json)["rows_written"] == 5
+        assert db.query(InventoryPositionSnapshot).count() == 5
+
+@pytest.fixture
+def projection_inputs(db, product, inventory, admin_user):
+    start = date.today().replace(day=1)
+    demand = [
+        DemandPlan(product_id=product.id, period=start, forecast_qty=Decimal("150"), version=1),
+        DemandPlan(product_id=product.id, period=start, forecast_qty=Decimal("150"), consensus_qty=Decimal("180"), version=2),
+        DemandPlan(product_id=product.id, period=add_months(start, 1), forecast_qty=Decimal("200"), version=1),
+    ]
+    supply = SupplyPlan(
+        product_id=product.id,
+        period=add_months(start, 1),
+        location=inventory.location,
+        planned_prod_qty=Decimal("100"),
+        created_by=admin_user.id,
+        version=1,
+    )
+    other = Product(sku="SKU-PROJ-2", name="Other Product", category_id=product.category_id, status="active")
+    db.add_all([*demand, supply, other])
+    db.flush()
+    db.add(Inventory(product_id=other.id, location="Warehouse B", on_hand_qty=Decimal("40"), status="normal"))
+    db.commit()
+    return start, supply
+
+
+class TestInventoryProjections:
+
+    def test_projects_available_balance_period_by_period(
+        self, client: TestClient, admin_headers, projection_inputs, inventory
+    ):
+        start, _ = projection_inputs
+        empty = client.get(f"/api/v1/inventory/projections?product_id={inventory.product_id}", headers=admin_headers)
+        assert empty.json()["total"] == 0  # reads never compute projections
+        client.post("/api/v1/inventory/projections/refresh", headers=admin_headers, json={})
+
+        resp = client.get(f"/api/v1/inventory/projections?product_id={inventory.product_id}", headers=admin_headers)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 1
+        assert data["status_counts"] == {"stockout": 1}
+        item = data["items"][0]
+        assert item["location"] == inventory.location
+        assert item["status"] == "stockout"
+        assert item["first_stockout_period"] == add_months(start, 1).isoformat()
+        periods = item["periods"]
+        assert len(periods) == settings.INVENTORY_PROJECTION_HORIZON_MONTHS
+        # 200 on hand - 180 (latest demand version) leaves 20, below the safety stock of 50.
+        assert (float(periods[0]["demand_qty"]), float(periods[0]["projected_available"])) == (180.0, 20.0)
+        assert periods[0]["status"] == "below_safety"
+        assert float(periods[1]["supply_qty"]) == 100.0
+        assert float(periods[1]["projected_available"]) == -80.0
+        assert float(item["ending_projected_available"]) == -80.0
+
+    def test_refresh_recomputes_only_changed_products(
+        self, client: TestClient, admin_headers, db, projection_inputs, inventory
+    ):
+        first = client.post("/api/v1/inventory/projections/refresh", headers=admin_headers, json={}).json()
+        assert (first["products_checked"], first["products_recomputed"]) == (2, 2)
+
+        unchanged = client.post("/api/v1/inventory/projections/refresh", headers=admin_headers, json={}).json()
+        assert unchanged["products_recomputed"] == 0
+
+        _, supply = projection_inputs
+        supply.planned_prod_qty = Decimal("400")
+        db.commit()
+        changed = client.post("/api/v1/inventory/projections/refresh", headers=admin_headers, json={}).json()
+        assert (changed["products_checked"], changed["products_recomputed"]) == (2, 1)
+
+        item = client.get(
+            f"/api/v1/inventory/projections?product_id={inventory.product_id}", headers=admin_headers
+        ).json()["items"][0]
+        assert float(item["ending_projected_available"]) == 220.0
+        assert item["status"] == "below_safety"
+
+    def test_reads_are_stale_until_the_refresh_job_runs(
+        self, client: TestClient, admin_headers, db, projection_inputs, inventory
+    ):
+        client.post("/api/v1/inventory/projections/refresh", headers=admin_headers, json={})
+        _, supply = projection_inputs
+        supply.planned_prod_qty = Decimal("400")
+        db.commit()
+        url = f"/api/v1/inventory/projections?product_id={inventory.product_id}"
+        assert float(client.get(url, headers=admin_headers).json()["items"][0]["ending_projected_available"]) == -80.0
+
+        body = {"name": "projections", "job_type": "inventory_projection_refresh", "cron_expression": "*/15 * * * *"}
+        bad = client.post("/api/v1/scheduler/schedules", headers=admin_headers, json={**body, "parameters": {"force": 1}})
+        assert bad.status_code == 400
+        created = client.post("/api/v1/scheduler/schedules", headers=admin_headers, json=body)
+        assert created.status_code == 201
+        scheduler = BatchScheduler(session_factory=sessionmaker(bind=db.get_bind()), worker_id="projections", inline=True)
+        run = scheduler.run_now(db, db.get(BatchSchedule, created.json()["id"]))
+        assert run.status == "completed", run.error
+        assert json.loads(run.result_json)["products_recomputed"] == 1
+
+        assert float(client.get(url, headers=admin_headers).json()["items"][0]["ending_projected_available"]) == 220.0
@@ -0,0 +1,139 @@
+"""
+Integration Tests — Batch Scheduler
+
+Covers:
+- Schedule CRUD and validation via /api/v1/scheduler
+- Leader lease: only one scheduler instance dispatches a due occurrence
+- Run windows and concurrency caps
+"""
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.batch_schedule import BatchSchedule, BatchScheduleRun
+from app.services.batch_scheduler import BatchScheduler
+
+
+def _create_cleanup_schedule(client: TestClient, headers: dict, **overrides) -> dict:
+    body = {
+        "name": "nightly-cleanup",
+        "job_type": "forecast_job_cleanup",
+        "cron_expression": "0 2 * * *",
+        "parameters": {"retention_days": 30},
+        **overrides,
+    }
+    resp = client.post("/api/v1/scheduler/schedules", json=body, headers=headers)
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+def _inline_scheduler(db: Session, worker_id: str) -> BatchScheduler:
+    scheduler = BatchScheduler(session_factory=sessionmaker(bind=db.get_bind()), worker_id=worker_id, inline=True)
+    # The real cleanup handler goes through the shared job service session.
+    scheduler._handlers["forecast_job_cleanup"] = lambda _db, _schedule: {"deleted": 0}
+    return scheduler
+
+
+def _make_due(db: Session, schedule_id: int, due_at: datetime) -> None:
+    schedule = db.query(BatchSchedule).filter(BatchSchedule.id == schedule_id).first()
+    schedule.next_run_at = due_at
+    db.commit()
+
+
+class TestSchedulerEndpoints:
+
+    def test_create_list_update_and_delete(self, client: TestClient, admin_headers: dict):
+        created = _create_cleanup_schedule(client, admin_headers)
+        assert created["next_run_at"] is not None
+        assert len(created["upcoming_runs"]) == 3
+
+        listed = client.get("/api/v1/scheduler/schedules", headers=admin_headers)
+        assert [s["name"] for s in listed.json()] == ["nightly-cleanup"]
+
+        updated = client.patch(
+            f"/api/v1/scheduler/schedules/{created['id']}",
+            json={"enabled": False},
+            headers=admin_headers,
+        )
+        assert updated.status_code == 200
+        assert updated.json()["next_run_at"] is None
+
+        deleted = client.delete(f"/api/v1/scheduler/schedules/{created['id']}", headers=admin_headers)
+        assert deleted.status_code == 204
+
+    def test_rejects_invalid_cron_and_parameters(self, client: TestClient, admin_headers: dict):
+        bad_cron = client.post(
+            "/api/v1/scheduler/schedules",
+            json={"name": "bad", "job_type": "forecast_refresh", "cron_expression": "not a cron"},
+            headers=admin_headers,
+        )
+        assert bad_cron.status_code == 422
+
+        bad_params = client.post(
+            "/api/v1/scheduler/schedules",
+            json={
+                "name": "bad-params",
+                "job_type": "forecast_refresh",
+                "cron_expression": "0 1 * * *",
+                "parameters": {"horizon": 99},
+            },
+            headers=admin_headers,
+        )
+        assert bad_params.status_code == 400
+
+    def test_planner_cannot_manage_schedules(self, client: TestClient, planner_headers: dict):
+        resp = client.get("/api/v1/scheduler/schedules", headers=planner_headers)
+        assert resp.status_code == 403
+
+
+class TestSchedulerDispatch:
+
+    def test_only_leader_dispatches_due_schedule(self, client: TestClient, admin_headers: dict, db: Session):
+        created = _create_cleanup_schedule(client, admin_headers)
+        now = datetime.utcnow().replace(second=0, microsecond=0)
+        _make_due(db, created["id"], now - timedelta(minutes=1))
+
+        leader = _inline_scheduler(db, "worker-a")
+        follower = _inline_scheduler(db, "worker-b")
+
+        first = leader.tick(now)
+        second = follower.tick(now)
+
+        assert first["leader"] is True
+        assert len(first["dispatched"]) == 1
+        assert second["leader"] is False
+
+        db.expire_all()
+        runs = db.query(BatchScheduleRun).filter(BatchScheduleRun.schedule_id == created["id"]).all()
+        assert len(runs) == 1
+        assert runs[0].status == "completed"
+        schedule = db.query(BatchSchedule).filter(BatchSchedule.id == created["id"]).first()
+        assert schedule.next_run_at > now
+        assert schedule.last_status == "completed"
+
+    def test_due_run_outside_window_is_skipped(self, client: TestClient, admin_headers: dict, db: Session):
+        now = datetime(2026, 10, 19, 12, 0)
+        created = _create_cleanup_schedule(client, admin_headers, window_start="01:00", window_end="05:00")
+        _make_due(db, created["id"], now - timedelta(hours=10))
+
+        scheduler = _inline_scheduler(db, "worker-a")
+        summary = scheduler.tick(now)
+
+        assert summary["skipped"] == [{"schedule_id": created["id"], "reason": "outside_run_window"}]
+        db.expire_all()
+        run = db.query(BatchScheduleRun).filter(BatchScheduleRun.schedule_id == created["id"]).one()
+        assert run.status == "skipped"
+
+    def test_concurrency_cap_defers_run(self, client: TestClient, admin_headers: dict, db: Session):
+        now = datetime.utcnow().replace(second=0, microsecond=0)
+        created = _create_cleanup_schedule(client, admin_headers)
+        _make_due(db, created["id"], now - timedelta(minutes=1))
+        db.add(BatchScheduleRun(schedule_id=created["id"], status="running", trigger="manual", started_at=now))
+        db.commit()
+
+        scheduler = _inline_scheduler(db, "worker-a")
+        summary = scheduler.tick(now)
+
+        assert summary["dispatched"] == []
+        assert summary["deferred"][0]["reason"] == "schedule_concurrency_limit"
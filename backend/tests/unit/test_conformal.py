@@ -0,0 +1,48 @@
+"""
+Unit Tests — Split-Conformal Intervals
+
+Tests:
+- Finite-sample conformal quantile rank
+- Step resolution beyond the calibrated horizon
+- Interval application and empirical coverage
+"""
+from datetime import date
+
+from app.ml.conformal import ConformalCalibration, empirical_coverage
+
+
+class TestConformalCalibration:
+
+    def test_quantile_uses_finite_sample_rank(self):
+        calibration = ConformalCalibration({1: [5, -1, 3, -2, 4, 0, 6, -7, 8, 9]})
+        # n=10, coverage 0.8 -> rank ceil(11 * 0.8) = 9 -> 9th smallest |residual|
+        assert calibration.quantile(1, 0.8) == 8.0
+
+    def test_quantile_clamps_to_max_on_small_calibration_set(self):
+        calibration = ConformalCalibration({1: [1, 2, 3]})
+        assert calibration.quantile(1, 0.95) == 3.0
+
+    def test_steps_beyond_range_reuse_furthest_step(self):
+        calibration = ConformalCalibration({1: [1.0], 2: [4.0]})
+        assert calibration.quantile(5, 0.9) == 4.0
+        assert calibration.sample_count(5) == 1
+
+    def test_apply_replaces_bounds(self):
+        calibration = ConformalCalibration({1: [2.0, 2.0, 2.0], 2: [10.0, 10.0, 10.0]})
+        rows = [
+            {"period": date(2025, 1, 1), "predicted_qty": 5.0, "lower_bound": 0.0, "upper_bound": 99.0, "confidence": 85.0},
+            {"period": date(2025, 2, 1), "predicted_qty": 5.0, "lower_bound": 0.0, "upper_bound": 99.0, "confidence": 85.0},
+        ]
+        adjusted = calibration.apply(rows, 0.9)
+        assert (adjusted[0]["lower_bound"], adjusted[0]["upper_bound"]) == (3.0, 7.0)
+        assert (adjusted[1]["lower_bound"], adjusted[1]["upper_bound"]) == (0.0, 15.0)
+        assert adjusted[0]["confidence"] == 90.0
+
+    def test_empty_calibration_leaves_rows_untouched(self):
+        rows = [{"predicted_qty": 5.0, "lower_bound": 1.0, "upper_bound": 9.0}]
+        assert ConformalCalibration().apply(rows, 0.9) == rows
+
+
+def test_empirical_coverage_skips_missing_bounds():
+    result = empirical_coverage([10, 20, 30], [5, None, 31], [15, 25, 40])
+    assert result == {"interval_coverage": 50.0, "interval_samples": 2}
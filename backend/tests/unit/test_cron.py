@@ -0,0 +1,52 @@
+"""
+Unit Tests — Cron expressions and scheduler run windows
+"""
+from datetime import datetime
+
+import pytest
+
+from app.services.batch_scheduler import in_run_window
+from app.utils.cron import CronExpression, next_fire_times
+
+
+class TestCronExpression:
+
+    def test_nightly_expression(self):
+        cron = CronExpression("30 2 * * *")
+        assert cron.next_after(datetime(2026, 10, 19, 1, 0)) == datetime(2026, 10, 19, 2, 30)
+        assert cron.next_after(datetime(2026, 10, 19, 2, 30)) == datetime(2026, 10, 20, 2, 30)
+
+    def test_steps_ranges_and_names(self):
+        cron = CronExpression("*/15 8-10 * * mon-fri")
+        # 2026-10-17 is a Saturday -> next fire is Monday 08:00
+        assert cron.next_after(datetime(2026, 10, 17, 9, 0)) == datetime(2026, 10, 19, 8, 0)
+        assert next_fire_times("*/15 8-10 * * mon-fri", datetime(2026, 10, 19, 8, 0), count=2) == [
+            datetime(2026, 10, 19, 8, 15),
+            datetime(2026, 10, 19, 8, 30),
+        ]
+
+    def test_macros_and_month_rollover(self):
+        assert CronExpression("@monthly").next_after(datetime(2026, 12, 15)) == datetime(2027, 1, 1, 0, 0)
+
+    def test_dom_and_dow_are_ored_when_both_restricted(self):
+        cron = CronExpression("0 0 1 * sun")
+        # 2026-10-19 is a Monday; next Sunday (Oct 25) precedes Nov 1
+        assert cron.next_after(datetime(2026, 10, 19)) == datetime(2026, 10, 25, 0, 0)
+
+    def test_starred_step_field_is_not_restricted(self):
+        # "*/2" in day-of-month is unrestricted, so only Sundays match (not odd days or Sundays).
+        cron = CronExpression("0 0 */2 * sun")
+        assert cron.next_after(datetime(2026, 10, 19)) == datetime(2026, 10, 25, 0, 0)
+        assert not cron.matches_day(datetime(2026, 10, 21))
+
+    @pytest.mark.parametrize("expression", ["", "* * * *", "61 * * * *", "* * * * mon-xyz", "*/0 * * * *"])
+    def test_invalid_expressions_raise(self, expression):
+        with pytest.raises(ValueError):
+            CronExpression(expression)
+
+
+def test_run_window_wraps_midnight():
+    assert in_run_window(datetime(2026, 10, 19, 23, 30), "22:00", "04:00")
+    assert in_run_window(datetime(2026, 10, 19, 3, 59), "22:00", "04:00")
+    assert not in_run_window(datetime(2026, 10, 19, 12, 0), "22:00", "04:00")
+    assert in_run_window(datetime(2026, 10, 19, 12, 0), None, None)
@@ -0,0 +1,118 @@
+"""
+Unit Tests — Delta forecast refresh
+
+Tests:
+- First run enqueues every product with enough history
+- In-flight and unchanged products are skipped and counted
+- Actuals, lead-time and param changes re-enqueue only the affected product
+"""
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+from app.models.demand_plan import DemandPlan
+from app.models.forecast_job import ForecastJob
+from app.models.product import Product
+from app.repositories.forecast_fingerprint_repository import ForecastFingerprintRepository
+from app.services.forecast_delta_service import ForecastDeltaService
+
+
+class _RecordingJobService:
+    """Stands in for the thread-pool job service; persists jobs in the test session."""
+
+    def __init__(self, db):
+        self._db = db
+        self.enqueued = []
+
+    def enqueue_forecast(self, *, product_id, horizon, model_type, requested_by,
+                         model_params=None, input_fingerprint=None, fingerprint_inputs=None,
+                         lane="interactive"):
+        job = ForecastJob(
+            job_id=str(uuid4()),
+            status="queued",
+            lane=lane,
+            product_id=product_id,
+            horizon=horizon,
+            model_type=model_type,
+            requested_by=requested_by,
+        )
+        self._db.add(job)
+        ForecastFingerprintRepository(self._db).set_pending(
+            product_id, input_fingerprint, job.job_id, fingerprint_inputs or {}
+        )
+        self._db.commit()
+        self.enqueued.append(job)
+        return job
+
+    def complete_all(self):
+        repo = ForecastFingerprintRepository(self._db)
+        for job in self.enqueued:
+            job.status = "completed"
+            repo.mark_applied(job.job_id)
+        self._db.commit()
+        self.enqueued = []
+
+
+def _seed(db, sku: str, months: int, lead_time_days: int = 14) -> Product:
+    product = Product(sku=sku, name=sku, lead_time_days=lead_time_days, status="active")
+    db.add(product)
+    db.flush()
+    for idx in range(months):
+        db.add(DemandPlan(
+            product_id=product.id,
+            period=date(2024, idx + 1, 1),
+            forecast_qty=Decimal("100"),
+            actual_qty=Decimal("90") + idx,
+        ))
+    db.commit()
+    return product
+
+
+def test_delta_run_only_enqueues_changed_products(db, admin_user):
+    p1 = _seed(db, "DELTA-1", months=6)
+    p2 = _seed(db, "DELTA-2", months=6)
+    _seed(db, "DELTA-SHORT", months=2)
+    jobs = _RecordingJobService(db)
+    service = ForecastDeltaService(db, job_service=jobs)
+
+    first = service.run(horizon=6, model_type=None, requested_by=admin_user.id)
+    assert first["enqueued"] == 2
+    assert first["skipped_insufficient_history"] == 1
+    assert first["change_reasons"] == {"new_product": 2}
+
+    in_flight = service.run(horizon=6, model_type=None, requested_by=admin_user.id)
+    assert in_flight["enqueued"] == 0
+    assert in_flight["skipped_in_flight"] == 2
+
+    jobs.complete_all()
+    unchanged = service.run(horizon=6, model_type=None, requested_by=admin_user.id)
+    assert unchanged["enqueued"] == 0
+    assert unchanged["skipped_unchanged"] == 2
+    assert unchanged["skipped"] == 3
+
+    db.add(DemandPlan(product_id=p1.id, period=date(2024, 7, 1), forecast_qty=Decimal("100"), actual_qty=Decimal("120")))
+    p2.lead_time_days = 30
+    db.commit()
+    changed = service.run(horizon=6, model_type=None, requested_by=admin_user.id)
+    assert changed["enqueued"] == 2
+    reasons = {row["product_id"]: row["reasons"] for row in changed["jobs"]}
+    assert reasons[p1.id] == ["actuals"]
+    assert reasons[p2.id] == ["lead_time"]
+
+
+def test_param_change_and_force(db, admin_user):
+    _seed(db, "DELTA-P", months=6)
+    jobs = _RecordingJobService(db)
+    service = ForecastDeltaService(db, job_service=jobs)
+
+    service.run(horizon=6, model_type="ewma", requested_by=admin_user.id, model_params={"alpha": 0.3})
+    jobs.complete_all()
+
+    changed = service.run(horizon=6, model_type="ewma", requested_by=admin_user.id, model_params={"alpha": 0.5})
+    assert changed["jobs"][0]["reasons"] == ["model_params"]
+    jobs.complete_all()
+
+    forced = service.run(horizon=6, model_type="ewma", requested_by=admin_user.id,
+                         model_params={"alpha": 0.5}, force=True)
+    assert forced["mode"] == "full"
+    assert forced["enqueued"] == 1
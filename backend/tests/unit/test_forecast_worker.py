@@ -0,0 +1,225 @@
+"""
+Unit Tests — Durable forecast job queue
+
+Tests:
+- Concurrent workers claim distinct jobs
+- Expired leases are requeued, then failed once attempts run out
+- The embedded worker polls, so expired leases are recovered without an enqueue
+- Cancellation from another process discards the running job's result
+"""
+import json
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.forecast_job import ForecastJob
+from app.repositories.forecast_job_repository import ForecastJobRepository
+from app.services.forecast_job_service import ForecastJobService
+from app.services.forecast_worker import ForecastWorker
+
+
+class _StubWorker(ForecastWorker):
+    """Skips the forecast pipeline; optionally runs a hook mid-job."""
+
+    def __init__(self, *args, during_job=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._during_job = during_job
+
+    def _run_job(self, db, job, lost):
+        if self._during_job:
+            self._during_job(job)
+        return {"product_id": job.product_id, "records_created": 0}, {"total_ms": 1.0, "fit_count": 0}
+
+
+def _queue_job(db: Session, product_id: int, user_id: int, **overrides) -> ForecastJob:
+    fields = {"status": "queued", "horizon": 3, **overrides}
+    job = ForecastJob(job_id=str(uuid4()), product_id=product_id, requested_by=user_id, **fields)
+    db.add(job)
+    db.commit()
+    return job
+
+
+class TestForecastJobQueue:
+
+    def test_workers_claim_distinct_jobs(self, db: Session, product, admin_user):
+        first = _queue_job(db, product.id, admin_user.id)
+        second = _queue_job(db, product.id, admin_user.id)
+        repo = ForecastJobRepository(db)
+
+        claimed_a = repo.claim_next("worker-a", lease_seconds=60)
+        claimed_b = repo.claim_next("worker-b", lease_seconds=60)
+        db.commit()
+
+        assert {claimed_a.job_id, claimed_b.job_id} == {first.job_id, second.job_id}
+        assert claimed_a.worker_id == "worker-a"
+        assert claimed_a.attempts == 1
+        assert claimed_a.lease_expires_at is not None
+        assert repo.claim_next("worker-c", lease_seconds=60) is None
+
+    def test_expired_lease_is_requeued_then_failed(self, db: Session, product, admin_user):
+        now = datetime.utcnow()
+        stalled = _queue_job(
+            db, product.id, admin_user.id,
+            status="running", worker_id="dead", attempts=1, lease_expires_at=now - timedelta(seconds=1),
+        )
+        exhausted = _queue_job(
+            db, product.id, admin_user.id,
+            status="running", worker_id="dead", attempts=3, lease_expires_at=now - timedelta(seconds=1),
+        )
+
+        result = ForecastJobRepository(db).requeue_expired(max_attempts=3, lease_seconds=60, now=now)
+        db.commit()
+        db.expire_all()
+
+        assert result == {"requeued": 1, "failed": 1}
+        assert db.get(ForecastJob, stalled.id).status == "queued"
+        assert db.get(ForecastJob, stalled.id).worker_id is None
+        assert db.get(ForecastJob, exhausted.id).status == "failed"
+
+    def test_worker_completes_claimed_job(self, db: Session, product, admin_user):
+        job = _queue_job(db, product.id, admin_user.id)
+        worker = _StubWorker(session_factory=sessionmaker(bind=db.get_bind()), worker_id="worker-a")
+
+        assert worker.run_once() == job.job_id
+        assert worker.run_once() is None
+
+        db.expire_all()
+        stored = db.get(ForecastJob, job.id)
+        assert stored.status == "completed"
+        assert stored.worker_id == "worker-a"
+        assert stored.lease_expires_at is None
+        assert json.loads(stored.result_json)["product_id"] == product.id
+
+    def test_embedded_poller_recovers_expired_leases_without_enqueue(self, db: Session, product, admin_user):
+        exhausted = _queue_job(
+            db, product.id, admin_user.id,
+            status="running", worker_id="dead", attempts=3,
+            lease_expires_at=datetime.utcnow() - timedelta(seconds=1),
+        )
+        service = ForecastJobService(session_factory=sessionmaker(bind=db.get_bind()), embedded_worker=True)
+
+        assert service.start_embedded_worker(poll_seconds=0.05) is True
+        assert service.start_embedded_worker(poll_seconds=0.05) is False
+        time.sleep(0.3)
+        service.stop_embedded_worker(timeout=5)
+
+        db.expire_all()
+        assert db.get(ForecastJob, exhausted.id).status == "failed"
+        assert ForecastJobService(session_factory=sessionmaker(bind=db.get_bind()), embedded_worker=False).start_embedded_worker() is False
+
+    def test_cancel_from_other_process_discards_result(self, db: Session, product, admin_user):
+        factory = sessionmaker(bind=db.get_bind())
+        job = _queue_job(db, product.id, admin_user.id)
+        api_side = ForecastJobService(session_factory=factory, embedded_worker=False)
+        worker = _StubWorker(
+            session_factory=factory,
+            worker_id="worker-a",
+            during_job=lambda running: api_side.cancel_job(running.job_id),
+        )
+
+        worker.run_once()
+
+        db.expire_all()
+        stored = db.get(ForecastJob, job.id)
+        assert stored.status == "cancelled"
+        assert stored.result_json is None
+        repo = ForecastJobRepository(db)
+        assert repo.renew_lease(job.job_id, "worker-a", lease_seconds=60) is False
+
+
+class TestCoalescingAndLanes:
+
+    def _service(self, db: Session) -> ForecastJobService:
+        return ForecastJobService(session_factory=sessionmaker(bind=db.get_bind()), embedded_worker=False)
+
+    def test_identical_requests_follow_one_job(self, db: Session, product, admin_user):
+        service = self._service(db)
+        leader = service.enqueue_forecast(product_id=product.id, horizon=6, model_type=None, requested_by=admin_user.id)
+        follower = service.enqueue_forecast(product_id=product.id, horizon=6, model_type=None, requested_by=admin_user.id)
+        other = service.enqueue_forecast(product_id=product.id, horizon=3, model_type=None, requested_by=admin_user.id)
+
+        assert leader.coalesced_into is None
+        assert follower.coalesced_into == leader.job_id
+        assert other.coalesced_into is None
+
+        worker = _StubWorker(session_factory=sessionmaker(bind=db.get_bind()), worker_id="worker-a")
+        assert worker.drain() == 2
+
+        db.expire_all()
+        stored = {job.job_id: job for job in db.query(ForecastJob).all()}
+        assert stored[follower.job_id].status == "completed"
+        assert stored[follower.job_id].result_json == stored[leader.job_id].result_json
+
+    def test_interactive_lane_is_claimed_before_bulk(self, db: Session, product, admin_user):
+        service = self._service(db)
+        bulk = service.enqueue_forecast(
+            product_id=product.id, horizon=6, model_type=None, requested_by=admin_user.id, lane="bulk"
+        )
+        interactive = service.enqueue_forecast(
+            product_id=product.id, horizon=3, model_type=None, requested_by=admin_user.id
+        )
+
+        repo = ForecastJobRepository(db)
+        assert repo.claim_next("worker-a", lease_seconds=60).job_id == interactive.job_id
+        assert repo.claim_next("worker-a", lease_seconds=60, lanes=["interactive"]) is None
+        assert repo.claim_next("worker-a", lease_seconds=60).job_id == bulk.job_id
+
+        metrics = service.get_job_metrics()
+        assert set(metrics["lanes"]) == {"interactive", "bulk"}
+        assert metrics["lanes"]["bulk"]["queued"] == 0
+
+    def test_cancelling_leader_promotes_follower(self, db: Session, product, admin_user):
+        service = self._service(db)
+        leader = service.enqueue_forecast(
+            product_id=product.id, horizon=6, model_type=None, requested_by=admin_user.id, lane="bulk"
+        )
+        follower = service.enqueue_forecast(product_id=product.id, horizon=6, model_type=None, requested_by=admin_user.id)
+        assert service.get_job_metrics()["coalesced_jobs"] == 1
+
+        service.cancel_job(leader.job_id)
+
+        db.expire_all()
+        promoted = db.query(ForecastJob).filter(ForecastJob.job_id == follower.job_id).one()
+        assert promoted.coalesced_into is None
+        assert promoted.status == "queued"
+        assert promoted.lane == "interactive"
+
+
+class TestJobMetrics:
+
+    def test_sql_aggregates_match_job_rows(self, db: Session, product, admin_user):
+        start = datetime(2026, 10, 1, 12, 0, 0)
+        for seconds in range(1, 11):
+            _queue_job(
+                db, product.id, admin_user.id,
+                status="completed", model_type="arima",
+                created_at=start - timedelta(seconds=2), started_at=start,
+                completed_at=start + timedelta(seconds=seconds),
+            )
+        _queue_job(
+            db, product.id, admin_user.id,
+            status="failed", started_at=start, completed_at=datetime.utcnow(),
+        )
+        leader = _queue_job(db, product.id, admin_user.id, lane="bulk")
+        _queue_job(db, product.id, admin_user.id, coalesced_into=leader.job_id)
+
+        service = ForecastJobService(session_factory=sessionmaker(bind=db.get_bind()), embedded_worker=False)
+        metrics = service.get_job_metrics()
+
+        assert metrics["total_jobs"] == 13
+        assert metrics["by_status"]["completed"] == 10
+        assert metrics["failed_last_24h"] == 1
+        assert metrics["coalesced_jobs"] == 1
+        assert metrics["lanes"]["bulk"]["queued"] == 1
+        assert metrics["lanes"]["interactive"]["queued"] == 0
+        assert metrics["lanes"]["interactive"]["avg_wait_ms"] is not None
+
+        arima = metrics["by_model"]["arima"]
+        assert arima["total_jobs"] == 10
+        assert arima["avg_processing_time_ms"] == 5500.0
+        assert arima["p50_ms"] == 5000.0
+        assert arima["p95_ms"] == 10000.0
+        assert metrics["by_model"]["auto"]["failed"] == 1
+        assert metrics["processing_time_ms"]["samples"] == 11
@@ -0,0 +1,114 @@
+"""
+Unit Tests — Vectorized inventory policy engine
+"""
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.services.inventory_policy_engine import (
+    compute_policies,
+    compute_policy,
+    from_cents,
+    policy_status,
+    recommend_policies,
+    recommend_policy,
+    requires_maker_checker,
+    to_cents,
+)
+
+
+def _reference(demand_cents, lead_times, review_days, z, **constraints):
+    rows = [
+        compute_policy(from_cents(d), lt, review_days, z, **constraints)
+        for d, lt in zip(demand_cents, lead_times)
+    ]
+    return [tuple(to_cents(v) for v in row) for row in rows]
+
+
+def _vectorized(demand_cents, lead_times, review_days, z, **constraints):
+    safety, reorder, target_max = compute_policies(
+        np.array(demand_cents, dtype=np.int64), lead_times, review_days, z, **constraints
+    )
+    return list(zip(safety.tolist(), reorder.tolist(), target_max.tolist()))
+
+
+@pytest.mark.parametrize(
+    "constraints",
+    [
+        {},
+        {"moq_units": Decimal("20"), "lot_size_units": Decimal("5"), "capacity_max_units": Decimal("1000")},
+        {"moq_units": Decimal("150.25"), "lot_size_units": Decimal("12.50")},
+        {"lot_size_units": Decimal("0.003")},
+    ],
+)
+def test_matches_reference_formula_on_random_rows(constraints):
+    rng = random.Random(7)
+    demand = [rng.randrange(0, 5_000_000) for _ in range(2000)]
+    lead_times = [Decimal(rng.randrange(1, 120)) + Decimal(rng.choice(["0", "0.5", "1.25", "2"])) for _ in demand]
+
+    for review_days, z in ((7, 1.65), (3, 2.33), (30, 0.84)):
+        assert _vectorized(demand, lead_times, review_days, z, **constraints) == _reference(
+            demand, lead_times, review_days, z, **constraints
+        )
+
+
+def test_half_cent_ties_round_like_decimal_quantize():
+    # The last row's float safety stock lands on a half cent, and odd reorder points
+    # (2.65, 13.95) make `reorder * 1.5` a half-cent tie as well.
+    demand = [100, 1, 3, 5, 7, 12345, 1_000_000_001]
+    lead_times = [Decimal("1"), Decimal("1"), Decimal("4"), Decimal("0.25"), Decimal("9"), Decimal("2.5"), Decimal("1")]
+    for z in (1.65, 1.28, 2.05):
+        assert _vectorized(demand, lead_times, 2, z) == _reference(demand, lead_times, 2, z)
+
+
+def test_recommendations_match_reference_formula():
+    rng = random.Random(11)
+    n = 3000
+    # Small quantities make half-cent ties frequent; large ones exercise float error.
+    columns = [
+        [rng.choice([rng.randrange(-500, 100), rng.randrange(0, 2000), rng.randrange(0, 10_000_000)]) for _ in range(n)]
+        for _ in range(6)
+    ]
+    at_risk = [rng.random() < 0.4 for _ in range(n)]
+    lead_times = [Decimal(rng.randrange(1, 40)) + Decimal(rng.choice(["0", "0.5"])) for _ in range(n)]
+
+    scored = recommend_policies(*(np.array(c, dtype=np.int64) for c in columns), np.array(at_risk), lead_times)
+    vectorized = list(
+        zip(
+            scored.safety_stock.tolist(),
+            scored.reorder_point.tolist(),
+            scored.max_stock.tolist(),
+            scored.confidence.tolist(),
+        )
+    )
+    reference = []
+    for i in range(n):
+        _, safety, reorder, target_max, confidence = recommend_policy(
+            *(from_cents(c[i]) for c in columns), at_risk[i], lead_times[i]
+        )
+        reference.append((to_cents(safety), to_cents(reorder), to_cents(target_max), int(confidence.scaleb(4))))
+    assert vectorized == reference
+
+
+def test_policy_status_precedence():
+    on_hand = np.array([5, 15, 30, 50, 30])
+    safety = np.array([10, 20, 10, 10, 10])
+    reorder = np.array([10, 10, 20, 20, 20])
+    max_stock = np.array([40, 40, 40, 40, 0])
+
+    assert policy_status(on_hand, safety, reorder, max_stock).tolist() == [
+        "critical",
+        "low",
+        "normal",
+        "excess",
+        "normal",
+    ]
+
+
+def test_maker_checker_threshold_is_exact_at_twenty_percent():
+    current = np.array([10_000, 10_000, 10_000, 0, 0, -500])
+    recommended = np.array([12_000, 11_999, 8_000, 119, 120, 10_000])
+
+    assert requires_maker_checker(current, recommended).tolist() == [True, False, True, False, True, False]
@@ -0,0 +1,111 @@
+"""
+Unit Tests — Simulation-optimized (s, S) policies
+"""
+import tracemalloc
+
+import numpy as np
+
+from app.services import inventory_policy_simulation
+from app.services.inventory_policy_simulation import candidate_policies, optimize_policies
+
+
+def _optimize(mean, std, lead_time, target, **kwargs):
+    n = len(mean)
+    options = dict(
+        unit_cost=np.full(n, 10.0),
+        service_level_target=target,
+        review_period_days=7,
+        horizon_days=120,
+        paths=100,
+        holding_cost_rate=0.25,
+        ordering_cost=0.0,
+        seed=5,
+    )
+    options.update(kwargs)
+    return optimize_policies(
+        np.array(mean, dtype=float),
+        np.array(std, dtype=float),
+        np.array(lead_time, dtype=float),
+        np.zeros(n),
+        **options,
+    )
+
+
+def test_deterministic_demand_needs_only_lead_time_demand():
+    result = _optimize([10.0], [0.0], [5.0], 0.99)
+
+    assert result.meets_target.tolist() == [True]
+    assert result.fill_rate[0] == 1.0
+    assert result.reorder_point[0] == 50.0
+    assert result.safety_stock[0] == 0.0
+
+
+def test_higher_target_buys_more_protection_for_lumpy_demand():
+    mean, std, lead_time = [4.0, 20.0], [9.0, 30.0], [10.0, 21.0]
+    low = _optimize(mean, std, lead_time, 0.85)
+    high = _optimize(mean, std, lead_time, 0.99)
+
+    assert (high.reorder_point >= low.reorder_point).all()
+    assert (low.fill_rate >= 0.85).all()
+    assert (high.fill_rate[high.meets_target] >= 0.99).all()
+
+
+def test_ordering_cost_favors_larger_orders():
+    cheap_orders = _optimize([10.0], [3.0], [7.0], 0.95)
+    costly_orders = _optimize([10.0], [3.0], [7.0], 0.95, ordering_cost=500.0)
+
+    assert costly_orders.orders_per_year[0] < cheap_orders.orders_per_year[0]
+    assert costly_orders.order_up_to[0] > cheap_orders.order_up_to[0]
+
+
+def test_candidates_respect_lot_size_and_capacity():
+    reorder_point, order_up_to = candidate_policies(
+        np.array([10.0, 40.0]),
+        np.array([4.0, 10.0]),
+        np.array([7.0, 14.0]),
+        np.array([1.0, 2.0]),
+        review_period_days=7,
+        moq_units=30.0,
+        lot_size_units=25.0,
+        capacity_max_units=600.0,
+    )
+
+    assert (order_up_to <= 600.0).all()
+    assert (reorder_point <= order_up_to).all()
+    assert np.allclose(order_up_to[order_up_to < 600.0] % 25.0, 0.0)
+    assert ((order_up_to - reorder_point)[order_up_to < 600.0] >= 30.0).all()
+
+
+def test_same_seed_reproduces_policies():
+    first = _optimize([4.0, 20.0], [9.0, 30.0], [10.0, 21.0], 0.95, seed=[11, 3])
+    second = _optimize([4.0, 20.0], [9.0, 30.0], [10.0, 21.0], 0.95, seed=[11, 3])
+
+    assert np.array_equal(first.reorder_point, second.reorder_point)
+    assert np.array_equal(first.fill_rate, second.fill_rate)
+
+
+def test_memory_stays_bounded_for_long_lead_times():
+    # Unbatched, 10 rows x 32 candidates x 200 paths with a 365-day pipeline would
+    # hold about 190 MB of receipts alone.
+    tracemalloc.start()
+    try:
+        result = _optimize([5.0] * 10, [2.0] * 10, [365] * 10, 0.95, paths=200, horizon_days=30)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 64 * 1024 * 1024
+    assert result.reorder_point.shape == (10,)
+    assert np.all(result.order_up_to > result.reorder_point)
+
+
+def test_paths_split_into_groups_add_up(monkeypatch):
+    whole = _optimize([5.0, 8.0], [0.0, 0.0], [10, 20], 0.95)
+    # Room for fewer than 100 paths of one row: each row runs over several groups.
+    monkeypatch.setattr(inventory_policy_simulation, "_MAX_PIPELINE_SLOTS", 32 * 30 * 22)
+    split = _optimize([5.0, 8.0], [0.0, 0.0], [10, 20], 0.95)
+
+    np.testing.assert_allclose(split.fill_rate, whole.fill_rate)
+    np.testing.assert_allclose(split.average_on_hand, whole.average_on_hand)
+    np.testing.assert_allclose(split.orders_per_year, whole.orders_per_year)
+    np.testing.assert_array_equal(split.reorder_point, whole.reorder_point)
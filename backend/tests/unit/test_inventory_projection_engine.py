@@ -0,0 +1,55 @@
+"""
+Unit Tests — Projected available balance engine
+"""
+from datetime import date
+
+import numpy as np
+
+from app.services.inventory_projection_engine import (
+    PERIOD_STATUSES,
+    add_months,
+    allocate_demand,
+    project_available_balance,
+    summarize,
+)
+
+
+def test_nets_supply_and_demand_and_classifies_periods():
+    balances = project_available_balance(
+        opening_available=np.array([200, 1000]),
+        demand=np.array([[150, 200, 100], [100, 100, 100]]),
+        supply=np.array([[0, 100, 0], [500, 0, 0]]),
+        safety_stock=np.array([60, 0]),
+        max_stock=np.array([0, 1200]),
+    )
+
+    assert balances.projected.tolist() == [[50, -50, -150], [1400, 1300, 1200]]
+    assert balances.opening.tolist() == [[200, 50, -50], [1000, 1400, 1300]]
+    assert [[PERIOD_STATUSES[s] for s in row] for row in balances.status] == [
+        ["below_safety", "stockout", "stockout"],
+        ["excess", "excess", "ok"],
+    ]
+
+    summary = summarize(balances.status)
+    assert [PERIOD_STATUSES[s] for s in summary.status] == ["stockout", "excess"]
+    assert summary.first_stockout.tolist() == [1, -1]
+    assert summary.stockout_periods.tolist() == [2, 0]
+    assert summary.excess_periods.tolist() == [0, 2]
+
+
+def test_allocates_product_demand_exactly_by_weight():
+    product_demand = np.array([[1000, 333], [90, 0]])
+    row_product = np.array([0, 1, 0, 0])
+    weights = np.array([1.0, 0.0, 2.0, 0.0])
+
+    allocated = allocate_demand(product_demand, row_product, weights)
+
+    assert allocated[[0, 2, 3]].sum(axis=0).tolist() == [1000, 333]
+    assert allocated[2].tolist() == [667, 222]
+    assert allocated[3].tolist() == [0, 0]
+    # A product whose rows carry no weight is split evenly.
+    assert allocated[1].tolist() == [90, 0]
+
+
+def test_add_months_rolls_over_years():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
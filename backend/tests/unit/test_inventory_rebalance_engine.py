@@ -0,0 +1,104 @@
+"""
+Unit Tests — Min-cost transportation rebalance engine
+"""
+import time
+
+import numpy as np
+import pytest
+
+from app.services.inventory_rebalance_engine import solve_transportation, transportation_cost
+
+
+def _assert_optimal(supply, demand, cost, flow):
+    """Feasible, maximal (no augmenting path) and min-cost (no negative residual cycle)."""
+    sources, sinks = cost.shape
+    assert (flow >= 0).all()
+    assert (flow.sum(axis=1) <= supply).all() and (flow.sum(axis=0) <= demand).all()
+    assert not ((flow > 0) & ~np.isfinite(cost)).any()
+
+    # Residual graph: 0 = source, donors, receivers, last = sink; Floyd-Warshall.
+    n = sources + sinks + 2
+    sink = n - 1
+    dist = np.full((n, n), np.inf)
+    np.fill_diagonal(dist, 0.0)
+    for i in range(sources):
+        if flow[i].sum() < supply[i]:
+            dist[0, 1 + i] = 0.0
+        if flow[i].sum() > 0:
+            dist[1 + i, 0] = 0.0
+        for j in range(sinks):
+            if np.isfinite(cost[i, j]):
+                dist[1 + i, 1 + sources + j] = cost[i, j]
+                if flow[i, j] > 0:
+                    dist[1 + sources + j, 1 + i] = -cost[i, j]
+    for j in range(sinks):
+        if flow[:, j].sum() < demand[j]:
+            dist[1 + sources + j, sink] = 0.0
+        if flow[:, j].sum() > 0:
+            dist[sink, 1 + sources + j] = 0.0
+    for k in range(n):
+        dist = np.minimum(dist, dist[:, k:k + 1] + dist[k:k + 1, :])
+    assert (np.diag(dist) >= 0).all(), "negative residual cycle"
+    assert not np.isfinite(dist[0, sink]), "augmenting path left"
+
+
+@pytest.mark.parametrize("cost_range", [1, 4, 1000])
+def test_random_networks_are_solved_optimally(cost_range):
+    rng = np.random.default_rng(cost_range)
+    for trial in range(150):
+        sources, sinks = rng.integers(1, 7, size=2)
+        supply = rng.integers(0, 60, sources)
+        demand = rng.integers(0, 60, sinks)
+        cost = rng.integers(0, cost_range, (sources, sinks)).astype(float)
+        if trial % 3 == 0:
+            cost[rng.random((sources, sinks)) < 0.3] = np.inf
+
+        plan = solve_transportation(supply, demand, cost)
+
+        _assert_optimal(supply, demand, cost, plan.flow)
+
+
+def test_does_not_overdraw_a_donor_and_prefers_cheap_lanes():
+    # Donor 0 is the cheapest for both receivers but can only cover one of them.
+    supply = np.array([5000, 8000])
+    demand = np.array([4000, 4000])
+    cost = np.array([[1.0, 2.0], [5.0, 3.0]])
+
+    plan = solve_transportation(supply, demand, cost)
+
+    assert plan.flow.tolist() == [[4000, 1000], [0, 3000]]
+    assert transportation_cost(plan.flow, cost) == 4000 * 1 + 1000 * 2 + 3000 * 3
+
+
+def test_blocked_lanes_limit_what_can_move():
+    plan = solve_transportation(np.array([100, 100]), np.array([150]), np.array([[np.inf], [7.0]]))
+
+    assert plan.flow.tolist() == [[0], [100]]
+
+
+def test_many_distinct_lane_costs_are_solved_optimally():
+    rng = np.random.default_rng(7)
+    supply = rng.integers(1, 5_000, 120)
+    demand = rng.integers(1, 5_000, 150)
+    cost = rng.integers(0, 100_000, (120, 150)).astype(float)
+    cost[rng.random(cost.shape) < 0.2] = np.inf
+
+    plan = solve_transportation(supply, demand, cost)
+
+    _assert_optimal(supply, demand, cost, plan.flow)
+
+
+def test_large_networks_with_many_distinct_costs_solve_quickly():
+    # One product with 800 donors and 800 receivers and about as many distinct lane costs.
+    rng = np.random.default_rng(11)
+    supply = rng.integers(1, 100_000, 800)
+    demand = rng.integers(1, 100_000, 800)
+    cost = rng.integers(0, 1_000, (800, 800)).astype(float) * 100
+
+    started = time.perf_counter()
+    plan = solve_transportation(supply, demand, cost)
+    elapsed = time.perf_counter() - started
+
+    assert plan.flow.sum() == min(supply.sum(), demand.sum())
+    assert (plan.flow.sum(axis=1) <= supply).all() and (plan.flow.sum(axis=0) <= demand).all()
+    assert elapsed < 5.0
@@ -0,0 +1,107 @@
+"""
+Unit Tests — Inventory statistics cache
+
+Tests:
+- Demand and lead-time statistics match the analytics formulas
+- Hits, misses and TTL expiry; misses are loaded in bulk
+- Event invalidation: by product, by product list, whole cache
+- A load that races an invalidation is not stored
+- refresh reads the database even over a live entry
+"""
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from app.models.demand_plan import DemandPlan
+from app.models.supply_plan import SupplyPlan
+from app.services import inventory_stats_cache
+from app.services.inventory_stats_cache import (
+    InventoryStatsCache,
+    InventoryStatsInvalidationHandler,
+    actual_demand_stats,
+    lead_time_stats,
+)
+from app.utils.events import EntityUpdatedEvent, PlanStatusChangedEvent
+
+
+def test_actual_demand_stats():
+    assert actual_demand_stats([]) is None
+    mean, std = actual_demand_stats([Decimal("300")])
+    assert (mean, std) == (Decimal("10"), Decimal("2.0"))
+    mean, std = actual_demand_stats([Decimal("300"), Decimal("900")])
+    assert mean == Decimal("20")
+    assert abs(std - Decimal(str(200 ** 0.5))) < Decimal("0.0001")
+
+
+def test_lead_time_stats_defaults_and_override():
+    assert lead_time_stats(None) == (Decimal("14"), Decimal("2.10"))
+    assert lead_time_stats(2) == (Decimal("2"), Decimal("0.5"))
+    assert lead_time_stats(10, std_override=3.0) == (Decimal("10"), Decimal("3.0"))
+
+
+def test_cache_hits_misses_and_expiry(db, product):
+    db.add(DemandPlan(product_id=product.id, period=date(2026, 1, 1), forecast_qty=Decimal("300"),
+                      actual_qty=Decimal("300"), version=1))
+    db.add(SupplyPlan(product_id=product.id, period=date(2026, 1, 1), lead_time_days=9))
+    db.commit()
+    cache = InventoryStatsCache(ttl_seconds=60)
+
+    stats = cache.get(db, product.id)
+    assert stats.demand_mean_daily == Decimal("10")
+    assert stats.lead_time_days == 9
+    assert cache.get_many(db, [product.id, 999_999])[999_999].demand_mean_daily is None
+    metrics = cache.metrics()
+    assert (metrics.entries, metrics.hits, metrics.misses) == (2, 1, 2)
+
+    expired = cache._entries[product.id].updated_at - timedelta(seconds=61)
+    cache._entries[product.id] = replace(cache._entries[product.id], updated_at=expired)
+    cache.get(db, product.id)
+    assert cache.metrics().misses == 3
+    assert cache._entries[product.id].updated_at > datetime.utcnow() - timedelta(seconds=5)
+
+
+def test_handler_invalidates_named_products_or_everything(db, product):
+    cache = InventoryStatsCache(ttl_seconds=60)
+    handler = InventoryStatsInvalidationHandler(cache)
+    cache.get_many(db, [product.id, 2, 3])
+
+    assert not handler.can_handle(PlanStatusChangedEvent(entity_type="demand_plan", entity_id=1))
+    assert not handler.can_handle(EntityUpdatedEvent(entity_type="inventory", entity_id=1))
+
+    handler.handle(EntityUpdatedEvent(entity_type="product", entity_id=product.id))
+    assert set(cache._entries) == {2, 3}
+    handler.handle(EntityUpdatedEvent(entity_type="demand_actuals", entity_id=0, new_values={"product_ids": [2]}))
+    assert set(cache._entries) == {3}
+    cache.get_many(db, [product.id, 2])
+    handler.handle(EntityUpdatedEvent(entity_type="supply_plan", entity_id=5))
+    assert cache._entries == {}
+    assert cache.metrics().invalidations == 3
+
+
+def test_load_racing_an_invalidation_is_not_stored(db, product, monkeypatch):
+    cache = InventoryStatsCache(ttl_seconds=60)
+    load = inventory_stats_cache.load_product_stats
+
+    def load_during_invalidation(session, ids):
+        loaded = load(session, ids)
+        cache.invalidate([product.id])
+        return loaded
+
+    monkeypatch.setattr(inventory_stats_cache, "load_product_stats", load_during_invalidation)
+    assert cache.get(db, product.id).lead_time_days == 14
+    assert product.id not in cache._entries
+
+
+def test_refresh_bypasses_live_entries(db, product):
+    supply = SupplyPlan(product_id=product.id, period=date(2026, 1, 1), lead_time_days=9)
+    db.add(supply)
+    db.commit()
+    cache = InventoryStatsCache(ttl_seconds=900)
+    assert cache.get(db, product.id).lead_time_days == 9
+
+    # Another process changes the plan; no event reaches this cache.
+    supply.lead_time_days = 30
+    db.commit()
+    assert cache.get(db, product.id).lead_time_days == 9
+    assert cache.refresh(db, [product.id])[product.id].lead_time_days == 30
+    assert cache.get(db, product.id).lead_time_days == 30
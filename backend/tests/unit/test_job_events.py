@@ -0,0 +1,129 @@
+"""
+Unit Tests — Forecast job event streaming
+
+Tests:
+- Hub delivers events published from worker threads to async subscribers
+- SSE stream: snapshot, live progress, terminal status, end event
+- Status changes made by another process are picked up by the stream's poll
+- ForecastService reports backtest split progress
+"""
+import asyncio
+import json
+import threading
+from datetime import date
+from uuid import uuid4
+
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.forecast_job import ForecastJob
+from app.services.forecast_job_events import stream_job_events
+from app.services.forecast_job_service import ForecastJobService
+from app.services.forecast_service import ForecastService
+from app.utils.job_events import JobEventHub
+
+
+def _parse(chunks):
+    events = []
+    for chunk in chunks:
+        if chunk.startswith(":"):
+            continue
+        name, data = chunk.strip().split("\n")
+        events.append((name.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def _collect(generator):
+    async def run():
+        return [chunk async for chunk in generator]
+    return asyncio.run(run())
+
+
+def _queue_job(db: Session, product, user) -> ForecastJob:
+    job = ForecastJob(job_id=str(uuid4()), status="queued", product_id=product.id, horizon=3, requested_by=user.id)
+    db.add(job)
+    db.commit()
+    return job
+
+
+class TestJobEventHub:
+
+    def test_delivers_events_from_other_threads(self):
+        hub = JobEventHub()
+
+        async def run():
+            subscription = hub.subscribe(["job-1"])
+            threading.Thread(target=hub.publish, args=("job-1", "progress"), kwargs={"stage": "fit"}).start()
+            event = await subscription.get(timeout=2)
+            hub.unsubscribe(subscription)
+            return event
+
+        event = asyncio.run(run())
+        assert event["stage"] == "fit"
+        assert hub.latest("job-1")["event"] == "progress"
+        assert hub.subscriber_count() == 0
+
+
+class TestJobEventStream:
+
+    def test_streams_progress_and_terminal_status(self, db: Session, product, admin_user):
+        job = _queue_job(db, product, admin_user)
+        service = ForecastJobService(session_factory=sessionmaker(bind=db.get_bind()), embedded_worker=False)
+        hub = JobEventHub()
+
+        def worker_side():
+            hub.publish(job.job_id, "progress", stage="backtest", split=1, splits=6)
+            hub.publish(job.job_id, "status", status="completed")
+
+        async def run():
+            chunks = []
+            async for chunk in stream_job_events([job.job_id], service, hub=hub, poll_seconds=5):
+                chunks.append(chunk)
+                if len(chunks) == 1:
+                    threading.Thread(target=worker_side).start()
+            return chunks
+
+        events = _parse(asyncio.run(run()))
+        assert [name for name, _ in events] == ["status", "progress", "status", "end"]
+        assert events[0][1]["status"] == "queued"
+        assert events[1][1]["split"] == 1
+        assert events[3][1]["statuses"] == {job.job_id: "completed"}
+
+    def test_poll_picks_up_changes_from_other_processes(self, db: Session, product, admin_user):
+        job = _queue_job(db, product, admin_user)
+        service = ForecastJobService(session_factory=sessionmaker(bind=db.get_bind()), embedded_worker=False)
+        original = service.get_job_states
+        calls = {"n": 0}
+
+        def get_job_states(job_ids):
+            calls["n"] += 1
+            if calls["n"] == 2:
+                db.query(ForecastJob).filter(ForecastJob.id == job.id).update({"status": "failed"})
+                db.commit()
+            return original(job_ids)
+
+        service.get_job_states = get_job_states
+        events = _parse(_collect(
+            stream_job_events([job.job_id, "missing"], service, hub=JobEventHub(), poll_seconds=0.01)
+        ))
+
+        assert ("status", {"job_id": "missing", "status": "not_found", "source": "snapshot"}) in events
+        assert ("status", {"job_id": job.job_id, "status": "failed", "source": "poll"}) in events
+        assert events[-1][0] == "end"
+
+
+def test_forecast_service_reports_backtest_progress(db: Session):
+    reports = []
+    service = ForecastService(db, progress=lambda stage, **detail: reports.append((stage, detail)))
+    df = pd.DataFrame([
+        {"ds": pd.Timestamp(date(2024, 1, 1) + relativedelta(months=i)), "y": 100.0 + i}
+        for i in range(12)
+    ])
+
+    service._run_backtests(df, test_months=4, models=["moving_average", "ewma"])
+
+    splits = [detail for stage, detail in reports if stage == "backtest"]
+    assert len(splits) == 8
+    assert splits[0] == {"model": "moving_average", "split": 1, "splits": 4, "models_completed": 0, "models_total": 2}
+    assert splits[-1]["models_completed"] == 1
@@ -111,6 +111,7 @@ class TestExponentialSmoothingStrategy:
         result = ExponentialSmoothingStrategy().forecast(df, horizon=3)
         # Should still return results (fallback to MA)
         assert len(result) == 3
+        assert {item["fallback_model"] for item in result} == {"moving_average"}
 
     def test_forecast_with_adequate_data(self):
         df = make_df(24)
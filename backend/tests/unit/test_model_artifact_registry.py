@@ -0,0 +1,147 @@
+"""
+Unit Tests — Model Artifact Registry
+
+Tests:
+- Keys are stable and sensitive to product, params and data
+- Save/load roundtrip and LRU eviction under a size budget
+- ForecastContext reuses a persisted fit instead of refitting
+"""
+import os
+import time
+from datetime import date
+
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+from app.ml.artifact_registry import ModelArtifactRegistry, data_fingerprint
+from app.ml.strategies import BaseForecastStrategy, ForecastContext, MovingAverageStrategy
+
+
+def make_df(months: int, base: float = 100.0) -> pd.DataFrame:
+    start = date(2024, 1, 1)
+    return pd.DataFrame([
+        {"ds": pd.Timestamp(start + relativedelta(months=i)), "y": base + i}
+        for i in range(months)
+    ])
+
+
+class _MeanStrategy(BaseForecastStrategy):
+    """Minimal persistable strategy that counts fits."""
+
+    artifact_format = "pickle"
+
+    def __init__(self):
+        self.fit_calls = 0
+
+    @property
+    def model_id(self) -> str:
+        return "mean_test"
+
+    @property
+    def display_name(self) -> str:
+        return "Mean (test)"
+
+    @property
+    def min_data_months(self) -> int:
+        return 1
+
+    def forecast(self, df, horizon, params=None):
+        return self.predict(self.fit(df, params), df, horizon, params)
+
+    def fit(self, df, params=None):
+        self.fit_calls += 1
+        return {"mean": float(df["y"].mean())}
+
+    def predict(self, fitted, df, horizon, params=None):
+        return [
+            {"period": p, "predicted_qty": fitted["mean"], "lower_bound": None,
+             "upper_bound": None, "confidence": 50.0, "mape": None}
+            for p in self._build_future_periods(df, horizon)
+        ]
+
+
+class TestModelArtifactRegistry:
+
+    def test_key_is_stable_and_input_sensitive(self):
+        fp = data_fingerprint(make_df(12))
+        key = ModelArtifactRegistry.build_key(1, "arima", {"p": 1, "d": 1}, fp)
+        assert key == ModelArtifactRegistry.build_key(1, "arima", {"d": 1, "p": 1}, fp)
+        assert key != ModelArtifactRegistry.build_key(2, "arima", {"p": 1, "d": 1}, fp)
+        assert key != ModelArtifactRegistry.build_key(1, "arima", {"p": 2, "d": 1}, fp)
+        assert key != ModelArtifactRegistry.build_key(1, "arima", {"p": 1, "d": 1}, data_fingerprint(make_df(13)))
+
+    def test_model_version_fits_column(self):
+        key = ModelArtifactRegistry.build_key(1, "exp_smoothing", {}, data_fingerprint(make_df(12)))
+        assert len(ModelArtifactRegistry.model_version("exp_smoothing", key)) <= 50
+
+    def test_save_load_roundtrip(self, tmp_path):
+        registry = ModelArtifactRegistry(str(tmp_path), max_bytes=10 * 1024 * 1024)
+        assert registry.load("ab" * 32, "pickle") is None
+        assert registry.save("ab" * 32, {"coef": [1.0, 2.0]}, "pickle")
+        assert registry.load("ab" * 32, "pickle") == {"coef": [1.0, 2.0]}
+        stats = registry.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["artifact_count"] == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        registry = ModelArtifactRegistry(str(tmp_path), max_bytes=0)
+        payload = {"blob": "x" * 2048}
+        keys = ["a1" * 32, "b2" * 32, "c3" * 32]
+        for key in keys:
+            registry.save(key, payload, "pickle")
+        now = time.time()
+        for age, key in enumerate(keys):
+            stamp = now - 100 * (len(keys) - age)
+            path = next((tmp_path / key[:2]).glob(f"{key}.*"))
+            os.utime(path, (stamp, stamp))
+
+        registry._max_bytes = registry.stats()["total_bytes"] - 1
+        registry.load(keys[0], "pickle")  # touch the oldest so it becomes most recent
+        registry._evict()
+
+        assert registry.load(keys[0], "pickle") is not None
+        assert registry.load(keys[1], "pickle") is None
+        assert registry.stats()["evictions"] == 1
+
+    def test_json_artifacts_are_stored_as_text(self, tmp_path):
+        registry = ModelArtifactRegistry(str(tmp_path), max_bytes=1024 * 1024)
+        key = "cd" * 32
+        assert registry.save(key, '{"model": "prophet"}', "json") is True
+        path = tmp_path / key[:2] / f"{key}.json"
+        assert path.read_text(encoding="utf-8") == '{"model": "prophet"}'
+        assert registry.load(key, "json") == '{"model": "prophet"}'
+        assert registry.stats()["artifact_count"] == 1
+
+    def test_disabled_registry_is_noop(self, tmp_path):
+        registry = ModelArtifactRegistry(str(tmp_path), max_bytes=1024, enabled=False)
+        assert registry.save("ab" * 32, {"x": 1}, "pickle") is False
+        assert registry.load("ab" * 32, "pickle") is None
+        assert registry.stats()["artifact_count"] == 0
+
+
+class TestForecastContextArtifacts:
+
+    def test_reuses_persisted_fit_for_longer_horizon(self, tmp_path):
+        registry = ModelArtifactRegistry(str(tmp_path), max_bytes=10 * 1024 * 1024)
+        strategy = _MeanStrategy()
+        context = ForecastContext(strategy)
+        df = make_df(12)
+        key = registry.build_key(1, strategy.model_id, {}, data_fingerprint(df))
+
+        first, status_first = context.execute_with_artifacts(df, 3, {}, registry, key)
+        second, status_second = context.execute_with_artifacts(df, 6, {}, registry, key)
+
+        assert status_first == "fitted"
+        assert status_second == "reused"
+        assert strategy.fit_calls == 1
+        assert len(first) == 3
+        assert len(second) == 6
+        assert second[0]["predicted_qty"] == first[0]["predicted_qty"]
+
+    def test_non_persistable_strategy_runs_directly(self, tmp_path):
+        registry = ModelArtifactRegistry(str(tmp_path), max_bytes=1024)
+        df = make_df(12)
+        rows, status = ForecastContext(MovingAverageStrategy()).execute_with_artifacts(df, 3, {}, registry, "ab" * 32)
+        assert status == "none"
+        assert len(rows) == 3
@@ -0,0 +1,36 @@
+"""
+Unit Tests — Forecast run resource profiler
+"""
+import tracemalloc
+
+from app.utils.run_profiler import RunProfiler
+
+
+def test_accumulates_stages_backtests_and_fits():
+    profiler = RunProfiler().start()
+    with profiler.stage("backtest"):
+        sum(range(10000))
+    with profiler.stage("backtest"):
+        pass
+    profiler.add_backtest("arima", 12.5, fits=6)
+    profiler.add_backtest("arima", 2.5, fits=6)
+    profiler.record_fits()
+
+    usage = profiler.finish()
+
+    assert set(usage["stages_ms"]) == {"backtest"}
+    assert usage["backtest_ms_by_model"] == {"arima": 15.0}
+    assert usage["fit_count"] == 13
+    assert usage["total_ms"] >= usage["stages_ms"]["backtest"]
+    assert profiler.finish() is usage
+
+
+def test_tracemalloc_reports_peak_and_stops_tracing():
+    profiler = RunProfiler(trace_memory=True).start()
+    blob = [bytearray(1024) for _ in range(512)]
+    usage = profiler.finish()
+    del blob
+
+    assert usage["memory_method"] == "tracemalloc"
+    assert usage["peak_memory_kb"] >= 512
+    assert not tracemalloc.is_tracing()
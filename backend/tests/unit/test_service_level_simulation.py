@@ -0,0 +1,93 @@
+"""
+Unit Tests — Vectorized service-level Monte Carlo
+"""
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+from app.services.service_level_simulation import (
+    analytical_service_levels,
+    histogram,
+    histogram_points,
+    normal_cdf,
+    simulate_service_level,
+    simulated_service_levels,
+)
+
+
+def test_same_seed_reproduces_the_simulation():
+    first = simulate_service_level(100.0, 20.0, 120.0, runs=10_000, bucket_count=10, seed=42)
+    second = simulate_service_level(100.0, 20.0, 120.0, runs=10_000, bucket_count=10, seed=42)
+    other = simulate_service_level(100.0, 20.0, 120.0, runs=10_000, bucket_count=10, seed=43)
+
+    assert first.cycle_service_level == second.cycle_service_level
+    assert np.array_equal(first.histogram[0], second.histogram[0])
+    assert first.cycle_service_level != other.cycle_service_level
+
+
+def test_million_paths_converge_to_the_normal_model():
+    mean, std, reorder_point = 500.0, 50.0, 565.0
+    result = simulate_service_level(mean, std, reorder_point, runs=1_000_000, bucket_count=20, seed=7)
+
+    z = (reorder_point - mean) / std
+    normal = NormalDist()
+    expected_shortage = std * (normal.pdf(z) - z * (1 - normal.cdf(z)))
+
+    assert abs(result.cycle_service_level - normal.cdf(z)) < 0.002
+    assert abs(result.expected_shortage_units - expected_shortage) < 0.05
+    assert abs(result.fill_rate - (1 - expected_shortage / mean)) < 0.001
+    assert int(result.histogram[0].sum()) == 1_000_000
+
+
+def test_histogram_spans_sample_range_and_handles_constant_samples():
+    counts, edges = histogram(np.array([0.0, 1.0, 2.0, 3.0]), 3)
+    assert counts.tolist() == [1, 1, 2]
+    assert (edges[0], edges[-1]) == (0.0, 3.0)
+
+    counts, edges = histogram(np.zeros(5), 4)
+    assert counts.sum() == 5
+    assert edges[-1] == 1.0
+
+    points = histogram_points(*histogram(np.array([0.0, 0.0, 4.0, 4.0]), 2))
+    assert points == [(0.0, 2.0, 0.5), (2.0, 4.0, 0.5)]
+
+
+def test_analytical_network_matches_normal_loss_per_row():
+    mean = np.array([500.0, 40.0, 0.5])
+    std = np.array([50.0, 12.0, 0.2])
+    reorder_point = np.array([565.0, 30.0, 2.0])
+    levels = analytical_service_levels(mean, std, reorder_point)
+
+    normal = NormalDist()
+    for i in range(3):
+        z = (reorder_point[i] - mean[i]) / std[i]
+        expected_shortage = std[i] * (normal.pdf(z) - z * (1 - normal.cdf(z)))
+        assert abs(levels.cycle_service_level[i] - normal.cdf(z)) < 1e-9
+        assert abs(levels.expected_shortage_units[i] - expected_shortage) < 1e-9
+    assert levels.fill_rate[2] > 0.999_999
+
+
+def test_common_random_numbers_match_per_row_simulation():
+    mean = np.array([500.0, 40.0, 10.0])
+    std = np.array([50.0, 12.0, 8.0])
+    reorder_point = np.array([565.0, 30.0, 0.0])
+    levels = simulated_service_levels(mean, std, reorder_point, runs=200_000, seed=11)
+
+    for i in range(3):
+        # Same seed, same standard-normal draws: the per-row simulation sees identical paths.
+        single = simulate_service_level(mean[i], std[i], reorder_point[i], runs=200_000, bucket_count=5, seed=11)
+        assert abs(levels.cycle_service_level[i] - single.cycle_service_level) < 1e-12
+        assert abs(levels.expected_shortage_units[i] - single.expected_shortage_units) < 1e-6
+        assert abs(levels.fill_rate[i] - single.fill_rate) < 1e-9
+
+
+def test_normal_cdf_matches_erfc_including_tails():
+    z = np.linspace(-12.0, 12.0, 4801)
+    expected = np.array([0.5 * math.erfc(-v / math.sqrt(2.0)) for v in z])
+    got = normal_cdf(z)
+
+    assert np.max(np.abs(got - expected)) < 1e-15
+    # Lower tail keeps relative precision where 1 - cdf(-z) would round to 0.
+    assert np.max(np.abs(got[:400] / expected[:400] - 1.0)) < 1e-12
+    assert normal_cdf(np.array([np.inf, -np.inf])).tolist() == [1.0, 0.0]